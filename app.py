@@ -1,9 +1,10 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
-import plotly.express as px
-import plotly.graph_objects as go
-import json
+from concurrent.futures import ThreadPoolExecutor
+
+from case_base_store import case_base_stamp, case_source, compact_case_base, file_stamp, load_shared_case_base
+from cbr_engine import ScreeningEngine, answer_table_files, case_base_fingerprint, open_answer_table
 
 # ============================================================================
 # KONFIGURASI
@@ -76,8 +77,7 @@ st.markdown("""
 # ============================================================================
 # GENERATE CASE BASE DARI DATA LAB
 # ============================================================================
-@st.cache_data
-def generate_case_base_from_lab_data():
+def load_case_base(source=None):
     """
     Generate case base berdasarkan POLA GEJALA PROBABILISTIK dari data lab.
     
@@ -88,114 +88,62 @@ def generate_case_base_from_lab_data():
     """
     
     try:
-        with open('case_base.json', 'r', encoding='utf-8') as f:
-            lab_data = json.load(f)
+        # Case base hasil generate dibagi antar proses lewat file memory-mapped;
+        # kolom tetap berupa view ke file (label sebagai kode), tanpa copy DataFrame
+        return load_shared_case_base(decode_labels=False, source=source)
     except:
         # Fallback ke sample data
-        return generate_sample_cases()
-    
-    cases = []
-    
-    for data in lab_data:
-        platelet = data['platelet']
-        hct = data['hematokrit']
-        wbc = data['wbc']
-        hb = data['hemoglobin']
-        diagnosis = data['diagnosis']
-        
-        case = {
-            'case_id': data['case_id'],
-            'diagnosis': diagnosis,
-            'age': data['age'],
-            'gender': data['gender'],
-            'platelet': platelet,
-            'hematokrit': hct,
-            'wbc': wbc,
-            'hemoglobin': hb
-        }
-        
-        # ============================================================
-        # GENERATE GEJALA DENGAN PROBABILITAS MEDIS
-        # ============================================================
-        
-        if diagnosis == 'DBD_POSITIF':
-            # GEJALA UMUM DBD (hampir selalu ada)
-            case['demam_tinggi'] = np.random.choice([0, 1], p=[0.05, 0.95])  # 95% DBD punya demam
-            case['lemah_lesu'] = np.random.choice([0, 1], p=[0.10, 0.90])
-            case['kehilangan_nafsu_makan'] = np.random.choice([0, 1], p=[0.15, 0.85])
-            
-            # GEJALA KARAKTERISTIK DBD (sering ada)
-            case['sakit_kepala'] = np.random.choice([0, 1], p=[0.20, 0.80])
-            case['nyeri_sendi'] = np.random.choice([0, 1], p=[0.25, 0.75])
-            case['nyeri_otot'] = np.random.choice([0, 1], p=[0.25, 0.75])
-            case['nyeri_belakang_mata'] = np.random.choice([0, 1], p=[0.30, 0.70])
-            
-            # GEJALA PERDARAHAN (tergantung platelet)
-            if platelet < 20000:  # SEVERE
-                case['bintik_merah'] = np.random.choice([0, 1], p=[0.10, 0.90])
-                case['mimisan'] = np.random.choice([0, 1], p=[0.30, 0.70])
-                case['gusi_berdarah'] = np.random.choice([0, 1], p=[0.35, 0.65])
-                case['trombosit_rendah'] = 1
-                case['pembesaran_hati'] = np.random.choice([0, 1], p=[0.20, 0.80])
-                case['severity'] = 'BERAT'
-            elif platelet < 50000:  # MODERATE-SEVERE
-                case['bintik_merah'] = np.random.choice([0, 1], p=[0.20, 0.80])
-                case['mimisan'] = np.random.choice([0, 1], p=[0.50, 0.50])
-                case['gusi_berdarah'] = np.random.choice([0, 1], p=[0.55, 0.45])
-                case['trombosit_rendah'] = 1
-                case['pembesaran_hati'] = np.random.choice([0, 1], p=[0.40, 0.60]) if hct > 45 else np.random.choice([0, 1], p=[0.70, 0.30])
-                case['severity'] = 'SEDANG'
-            elif platelet < 100000:  # MILD-MODERATE
-                case['bintik_merah'] = np.random.choice([0, 1], p=[0.40, 0.60])
-                case['mimisan'] = np.random.choice([0, 1], p=[0.70, 0.30])
-                case['gusi_berdarah'] = np.random.choice([0, 1], p=[0.75, 0.25])
-                case['trombosit_rendah'] = 1
-                case['pembesaran_hati'] = np.random.choice([0, 1], p=[0.70, 0.30])
-                case['severity'] = 'RINGAN' if platelet > 70000 else 'SEDANG'
-            else:  # VERY MILD (platelet normal tapi DBD)
-                case['bintik_merah'] = np.random.choice([0, 1], p=[0.70, 0.30])
-                case['mimisan'] = np.random.choice([0, 1], p=[0.85, 0.15])
-                case['gusi_berdarah'] = np.random.choice([0, 1], p=[0.90, 0.10])
-                case['trombosit_rendah'] = 0
-                case['pembesaran_hati'] = np.random.choice([0, 1], p=[0.85, 0.15])
-                case['severity'] = 'RINGAN'
-            
-            # GEJALA GI (variabel)
-            case['mual_muntah'] = np.random.choice([0, 1], p=[0.40, 0.60])
-            case['nyeri_perut'] = np.random.choice([0, 1], p=[0.50, 0.50])
-            
-            # GEJALA KULIT
-            case['ruam_kulit'] = np.random.choice([0, 1], p=[0.50, 0.50])
-            
-        else:  # BUKAN DBD
-            # Demam bisa ada (penyakit lain)
-            case['demam_tinggi'] = np.random.choice([0, 1], p=[0.40, 0.60])
-            
-            # Gejala umum (bisa ada di penyakit lain)
-            case['sakit_kepala'] = np.random.choice([0, 1], p=[0.50, 0.50])
-            case['lemah_lesu'] = np.random.choice([0, 1], p=[0.40, 0.60])
-            case['mual_muntah'] = np.random.choice([0, 1], p=[0.60, 0.40])
-            case['nyeri_perut'] = np.random.choice([0, 1], p=[0.65, 0.35])
-            case['kehilangan_nafsu_makan'] = np.random.choice([0, 1], p=[0.55, 0.45])
-            
-            # Gejala yang JARANG di non-DBD
-            case['nyeri_sendi'] = np.random.choice([0, 1], p=[0.70, 0.30])
-            case['nyeri_otot'] = np.random.choice([0, 1], p=[0.70, 0.30])
-            case['nyeri_belakang_mata'] = np.random.choice([0, 1], p=[0.85, 0.15])
-            case['ruam_kulit'] = np.random.choice([0, 1], p=[0.80, 0.20])
-            
-            # Gejala DBD-spesifik (hampir TIDAK ADA di non-DBD)
-            case['bintik_merah'] = np.random.choice([0, 1], p=[0.95, 0.05])
-            case['mimisan'] = np.random.choice([0, 1], p=[0.95, 0.05])
-            case['gusi_berdarah'] = np.random.choice([0, 1], p=[0.97, 0.03])
-            case['pembesaran_hati'] = 0
-            case['trombosit_rendah'] = 0
-            
-            case['severity'] = 'NON_DBD'
-        
-        cases.append(case)
-    
-    return pd.DataFrame(cases)
+        return compact_case_base(generate_sample_cases())
+
+def build_engine():
+    """
+    Case base + index screening + answer table (python cbr_engine.py) jika masih cocok.
+    File sumber di-hash sekali (case_source) untuk key file shared dan answer table.
+    """
+    try:
+        source_file, source_checksum = case_source()
+    except OSError:
+        # Tidak ada case base: load_case_base memakai sample data
+        source_file, source_checksum = None, None
+    case_base = load_case_base((source_file, source_checksum) if source_file else None)
+    fingerprint = case_base_fingerprint(case_base)
+    answer_table = None
+    if source_file:
+        answer_table = open_answer_table(case_base, source_file=source_file, fingerprint=fingerprint,
+                                         source_checksum=source_checksum)
+    return ScreeningEngine(case_base, version=fingerprint, answer_table=answer_table)
+
+def engine_key():
+    """
+    Key cache engine: stamp (mtime, ukuran) file case base dan answer table,
+    hanya os.stat per rerun. Converter (mis. --incremental) atau compile
+    answer table mengubah key, jadi engine dan cache hasil dibangun ulang.
+    """
+    return case_base_stamp() + file_stamp(answer_table_files())
+
+@st.cache_resource(max_entries=1)
+def start_engine_warmup(key):
+    """Bangun engine di background thread, sekali per proses per key (tanpa Streamlit API)"""
+    executor = ThreadPoolExecutor(max_workers=1)
+    future = executor.submit(build_engine)
+    # Tidak ada tugas lain: thread selesai sendiri setelah engine jadi
+    executor.shutdown(wait=False)
+    return future
+
+@st.cache_resource(max_entries=1)
+def load_engine(key):
+    """
+    Engine hasil warm-up; menunggu thread background jika belum selesai.
+    cache_resource: satu objek dipakai bersama semua sesi dan rerun (tanpa copy),
+    engine tidak diubah setelah dibuat jadi aman dipakai lintas thread.
+    key (engine_key) berubah = engine baru; max_entries=1 melepas engine lama.
+    """
+    try:
+        return start_engine_warmup(key).result()
+    except Exception:
+        # Future yang gagal jangan disimpan: rerun berikutnya memulai warm-up baru
+        start_engine_warmup.clear()
+        raise
 
 def generate_sample_cases():
     """Fallback jika JSON tidak ada"""
@@ -257,95 +205,6 @@ def generate_sample_cases():
 # ============================================================================
 # FUNGSI CBR
 # ============================================================================
-def calculate_similarity(new_case, case_base):
-    """Hitung similarity HANYA berdasarkan gejala klinis"""
-    
-    symptoms = [
-        'demam_tinggi', 'sakit_kepala', 'nyeri_sendi', 'nyeri_otot',
-        'mual_muntah', 'ruam_kulit', 'nyeri_perut', 'mimisan',
-        'gusi_berdarah', 'bintik_merah', 'lemah_lesu', 'kehilangan_nafsu_makan',
-        'nyeri_belakang_mata', 'pembesaran_hati', 'trombosit_rendah'
-    ]
-    
-    # Bobot berdasarkan spesifisitas DBD
-    weights = {
-        'trombosit_rendah': 0.15,      # Paling spesifik (tapi jarang user tahu)
-        'bintik_merah': 0.13,           # Sangat spesifik DBD
-        'mimisan': 0.11,                # Tanda perdarahan
-        'gusi_berdarah': 0.11,          # Tanda perdarahan
-        'demam_tinggi': 0.10,           # Umum tapi penting
-        'nyeri_sendi': 0.08,            # Break-bone fever
-        'nyeri_otot': 0.07,             # Myalgia
-        'nyeri_belakang_mata': 0.07,    # Khas DBD
-        'pembesaran_hati': 0.06,        # Warning sign
-        'sakit_kepala': 0.04,           # Umum
-        'nyeri_perut': 0.03,            # Warning sign
-        'ruam_kulit': 0.02,             # Bisa ada
-        'mual_muntah': 0.02,            # Umum
-        'lemah_lesu': 0.01,             # Sangat umum
-        'kehilangan_nafsu_makan': 0.01  # Sangat umum
-    }
-    
-    similarities = []
-    
-    for idx, case in case_base.iterrows():
-        distance = 0
-        matched = 0
-        
-        for sym in symptoms:
-            new_val = new_case.get(sym, 0)
-            case_val = case[sym]
-            distance += abs(new_val - case_val) * weights[sym]
-            
-            if new_val == case_val and new_val == 1:
-                matched += 1
-        
-        similarity = (1 - distance) * 100
-        
-        similarities.append({
-            'case_id': case['case_id'],
-            'similarity': similarity,
-            'matched_symptoms': matched,
-            'diagnosis': case['diagnosis'],
-            'severity': case['severity']
-        })
-    
-    return pd.DataFrame(similarities).sort_values('similarity', ascending=False)
-
-def diagnose(similar_cases, total_symptoms):
-    """Diagnosa dengan validasi minimum gejala"""
-    
-    # Validasi: minimal 3 gejala
-    if total_symptoms < 3:
-        return 'DATA_INSUFFICIENT', 0, {
-            'DBD_POSITIF': 0, 'SUSPEK_DBD': 0, 'BUKAN_DBD': 0
-        }, 'INSUFFICIENT'
-    
-    total_sim = similar_cases['similarity'].sum()
-    votes = {'DBD_POSITIF': 0, 'SUSPEK_DBD': 0, 'BUKAN_DBD': 0}
-    severity_votes = {}
-    
-    for _, case in similar_cases.iterrows():
-        weight = case['similarity'] / total_sim
-        votes[case['diagnosis']] += weight * 100
-        
-        if case['severity'] not in severity_votes:
-            severity_votes[case['severity']] = 0
-        severity_votes[case['severity']] += weight
-    
-    # RULE SCREENING: Gejala sedikit = tidak bisa DBD POSITIF
-    if total_symptoms <= 4:
-        votes['DBD_POSITIF'] = 0
-        final_diag = 'SUSPEK_DBD' if votes['SUSPEK_DBD'] > votes['BUKAN_DBD'] else 'BUKAN_DBD'
-        conf = max(votes['SUSPEK_DBD'], votes['BUKAN_DBD'])
-        sev = 'OBSERVASI' if final_diag == 'SUSPEK_DBD' else 'NON_DBD'
-    else:
-        final_diag = max(votes, key=votes.get)
-        conf = votes[final_diag]
-        sev = max(severity_votes, key=severity_votes.get) if severity_votes else 'UNKNOWN'
-    
-    return final_diag, conf, votes, sev
-
 def get_recommendations(diagnosis, severity):
     """Generate rekomendasi"""
     recs = {
@@ -459,6 +318,10 @@ def get_recommendations(diagnosis, severity):
 # ============================================================================
 # MAIN APP
 # ============================================================================
+# Mulai load case base di background selagi header & form dirender
+case_base_key = engine_key()
+start_engine_warmup(case_base_key)
+
 st.markdown('<div class="main-header">🏥 Sistem Screening Awal Penyakit Demam Berdarah Dengue</div>', unsafe_allow_html=True)
 st.markdown('<div class="sub-header">Deteksi Dini Berbasis Gejala Klinis | Tidak Menggantikan Pemeriksaan Medis</div>', unsafe_allow_html=True)
 
@@ -470,16 +333,8 @@ st.markdown("""
     diagnosis medis profesional dan pemeriksaan laboratorium.
 </div>
 """, unsafe_allow_html=True)
-# Load case base
-case_base = generate_case_base_from_lab_data()
-
-st.sidebar.success(f"✅ Knowledge Base: {len(case_base)} kasus")
-with st.sidebar.expander("📊 Basis Pengetahuan"):
-    dbd_count = len(case_base[case_base['diagnosis'] == 'DBD_POSITIF'])
-    non_count = len(case_base[case_base['diagnosis'] == 'BUKAN_DBD'])
-    st.write(f"**Kasus DBD:** {dbd_count} ({dbd_count/len(case_base)*100:.1f}%)")
-    st.write(f"**Kasus Non-DBD:** {non_count} ({non_count/len(case_base)*100:.1f}%)")
-    st.write("*Data diambil dari hasil lab 1523 pasien yang telah terdiagnosa*")
+# Placeholder info knowledge base; diisi setelah form tampil
+kb_status = st.sidebar.container()
 
 # ============================================================================
 # SIDEBAR INPUT
@@ -523,6 +378,26 @@ with st.sidebar.form("symptom_form"):
     st.markdown("---")
     diagnose_btn = st.form_submit_button("🔬 CEK SEKARANG", use_container_width=True)
 
+# ============================================================================
+# KNOWLEDGE BASE
+# ============================================================================
+# Case base sudah di-load di background sejak awal script
+engine = load_engine(case_base_key)
+
+kb_status.success(f"✅ Knowledge Base: {len(engine)} kasus")
+with kb_status.expander("📊 Basis Pengetahuan"):
+    dbd_count = engine.diagnosis_counts['DBD_POSITIF']
+    non_count = engine.diagnosis_counts['BUKAN_DBD']
+    st.write(f"**Kasus DBD:** {dbd_count} ({dbd_count/len(engine)*100:.1f}%)")
+    st.write(f"**Kasus Non-DBD:** {non_count} ({non_count/len(engine)*100:.1f}%)")
+    st.write("*Data diambil dari hasil lab 1523 pasien yang telah terdiagnosa*")
+    stats = engine.cache_stats()
+    if engine.answer_table is not None:
+        # Hasil dilayani answer table, cache LRU tidak terpakai
+        st.caption(f"Answer table: {stats['table_lookups']} lookup (semua kombinasi gejala sudah dihitung)")
+    else:
+        st.caption(f"Cache hasil: {stats['hits']} hit / {stats['misses']} miss ({stats['size']} pola)")
+
 # ============================================================================
 # TABS
 # ============================================================================
@@ -553,9 +428,9 @@ if diagnose_btn:
     total_symp = sum(new_case.values())
     
     with st.spinner("🔬 Menganalisis gejala Anda..."):
-        sims = calculate_similarity(new_case, case_base)
-        top10 = sims.head(10)
-        diag, conf, votes, sev = diagnose(top10, total_symp)
+        result = engine.screen(new_case, k=10)
+        top10 = engine.frame(result)
+        diag, conf, votes, sev = result['diagnosis'], result['confidence'], result['votes'], result['severity']
         recs = get_recommendations(diag, sev)
     
     # TAB 1: HASIL
@@ -593,6 +468,9 @@ if diagnose_btn:
             st.markdown("---")
             st.subheader("📊 Analisis Probabilitas")
             
+            # Plotly baru di-import saat grafik benar-benar digambar
+            import plotly.graph_objects as go
+            
             fig = go.Figure(data=[go.Bar(
                 x=['Kemungkinan DBD', 'Perlu Pemeriksaan', 'Kemungkinan Bukan DBD'],
                 y=[votes['DBD_POSITIF'], votes['SUSPEK_DBD'], votes['BUKAN_DBD']],
@@ -662,8 +540,9 @@ if diagnose_btn:
         st.header("🔍 10 Kasus Paling Mirip dengan Gejala Anda")
         st.markdown("*Kasus-kasus ini diambil dari database pasien yang telah didiagnosa secara medis*")
         
-        for idx, (_, case) in enumerate(top10.iterrows(), 1):
-            case_detail = case_base[case_base['case_id'] == case['case_id']].iloc[0]
+        # Index top10 = posisi baris di case base, jadi detail kasus diambil langsung
+        for idx, (row, case) in enumerate(top10.iterrows(), 1):
+            case_detail = engine.case_detail(row)
             
             border_color = {
                 'DBD_POSITIF': '#e74c3c',
@@ -865,7 +744,7 @@ st.markdown("---")
 col1, col2, col3, col4 = st.columns(4)
 
 with col1:
-    st.markdown(f"**📊 Knowledge Base:** {len(case_base)} kasus")
+    st.markdown(f"**📊 Knowledge Base:** {len(engine)} kasus")
 with col2:
     st.markdown("**🎯 Metode:** Case-Based Reasoning")
 with col3:
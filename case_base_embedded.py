@@ -1,1531 +1,449 @@
 # Auto-generated case base
 # Total cases: 1523
 
+import base64
+import io
+
+import numpy as np
+
+_KEYS = ['case_id', 'diagnosis', 'age', 'gender', 'platelet', 'hematokrit', 'wbc', 'hemoglobin', 'demam_tinggi', 'sakit_kepala', 'nyeri_sendi', 'nyeri_otot', 'lemah_lesu', 'kehilangan_nafsu_makan', 'bintik_merah', 'mimisan', 'gusi_berdarah', 'nyeri_belakang_mata', 'pembesaran_hati', 'mual_muntah', 'nyeri_perut', 'ruam_kulit', 'trombosit_rendah', 'severity']
+_LABEL_COLUMNS = ['diagnosis', 'severity', 'gender']
+
+_DATA = (
+    "UEsDBC0AAAAIAAAAIQDs2GQW//////////8LABQAY2FzZV9pZC5ucHkBABAA4L4AAAAAAABTDgAA"
+    "AAAAAJ3XwWoleRmH4bj1KnrXCrPwpJKTRNwJ7hRBRnAlg9PiQhzpETfiVXjDtuALfyTf84ENRdF5"
+    "uxPynHOq6vevX339y1//7gcPf3/4x8dvP33/h88ff/rh48++fv341YePf/zu898+f/OX33/3+dtP"
+    "//n6L7758/efvnz9+z9989dPX/7+o9vz4/XVj7/68M8P/++fH/784eHhN1+O3345fv/l+Mlx3L4c"
+    "6o9Lv5b+tPTnpd+X/rL016W/od/+e1aX323xuy1+t8XvtvjdFr/b4ndb/G6L3+Pi97j4PS5+j4vf"
+    "4+L3uPg9Ln6Pi9/j4ve4+F2L37X4XYvftfhdi9+1+F2L37X4XYvftfg9LX5Pi9/T4ve0+D0tfk+L"
+    "39Pi97T4PS1+T4vf8+L3vPg9L37Pi9/z4ve8+D0vfs+L3/Pi97z43Re/++J3X/zui9998bsvfvfF"
+    "77743Re/++L3svi9LH4vi9/L4vey+L0sfi+L38vi97L4vSx+r4vf6+L3uvi9Ln6vi9/r4ve6+L0u"
+    "fq+L3+vi97b4vS1+b4vf2+L3tvi9LX5vi9/b4ve2+L3B73b8O/XJrz751Se/+uRXn/zqk1998qtP"
+    "fnX5aX/cHrw/avLT/qjLT/ujLj/tj7r8tD/63eWn/VGXn/ZHXX7aH3X5aX/U5af90XtDftofdflp"
+    "f9Tlp/1Rl5/2R11+2h99duSn/VGXn/ZHXX7aH3X5aX/U5af90bVFftofdflpf9Tlp/1Rl5/2R11+"
+    "2h9de+Wn/VGXn/ZHXX7aH3X5aX/U5af90b1Jftofdflpf9Tlp/1Rl5/2R11+2h/du+Wn/VGXn/ZH"
+    "XX7aH3X5aX/U5af90bON/LQ/6vLT/qjLT/ujLj/tj7r8tD969pv8Ho/voz751Se/+uRXn/zqk199"
+    "8qtPfnX5aX/U5af9UZef9kddftofdflpf9Tlp/3xeHwPdflpf9Tlp/1Rl5/2R11+2h/9bvLT/qjL"
+    "T/ujLj/tj7r8tD/q8tP+6LWXn/ZHXX7aH3X5aX/U5af9UZef9kefDflpf9Tlp/1Rl5/2R11+2h91"
+    "+Wl/dO2Qn/ZHXX7aH3X5aX/U5af9UZef9kfXVvlpf9Tlp/1Rl5/2R11+2h91+Wl/dO+Rn/ZHXX7a"
+    "H3X5aX/U5af9UZef9kf3Zvlpf9Tlp/1Rl5/2R11+2h91+Wl/9Owy+dUnv+v4OeqTX33yq09+9cmv"
+    "PvnVJ7+6/LQ/6vLT/qjLT/ujLj/tj7r8tD/q8tP+qMtP+6MuP+2Puvy0P+ry0/6oy6/3qLr8+hnq"
+    "8rsWv2vxuxa/a/G7Fr9r8dP+qMtP+6MuP+2Puvy0P+ry0/6oy0/7oy4/7Y+6/LQ/6vLT/qjLT/uj"
+    "Lj/tj7r8tD/q8tP+qMtP+6MuP+2Puvy0P+ry0/6oy0/7oy4/7Y+6/LQ/6vLT/qjLT/ujLj/tj7r8"
+    "tD/q8tP+qMtP+6MuP+2Puvy0P+ry0/6oy0/7oz75de+d/OqTX33yq09+T8dZffKrT371ya8++dXl"
+    "p/1Rl5/2R11+2h91+Wl/1OWn/VGXn/ZHXX7aH3X5aX/U5af9UZef9kddftfidy1+1+J3LX7X4nct"
+    "fj1jqMuve4S6/LQ/6vLT/qjLT/ujJj/tj7r8tD/q8tP+qMtP+6MuP+2Puvy0P+ry0/6oy0/7oy4/"
+    "7Y+6/LQ/6vLT/qjLT/ujLj/tj7r8tD/q8tP+qMtP+6MuP+2Puvy0P+ry0/6oy0/7oy4/7Y+6/LQ/"
+    "6vLT/qjLT/ujLj/tj7r8tD/q8tP+qE9+3Tsmv/rkV5/86pNfffJ7Ps7qk1998qtPfnX5aX/U5af9"
+    "UZef9kddftofdflpf9Tlp/1Rl5/2R11+2h91+Wl/1OWn/VGXn/ZHXX7aH3X5aX/U5af9UZef9kdd"
+    "ftofdflpf9Tlp/1Rl5/2R11+2h91+Wl/1OWn/VGXn/bH83Goy0/7oy4/7Y9+tvy0P+ry0/6oy0/7"
+    "oy4/7Y+6/LQ/em3kp/1Rl5/2R11+2h91+Wl/1OWn/dF7V37aH3X5aX/U5af9UZef9kddftoffbbl"
+    "p/1Rl5/2R11+2h91+Wl/1OWn/dG1b/KrT371ya8++dUnv/rkdz/O6pNfffKry0/7oy4/7Y+6/LQ/"
+    "6vLT/qjLT/ujLj/tj7r8tD/q8tP+qMtP+6MuP+2Puvy0P+ry0/6oy0/7oy4/7Y+6/LQ/6vLT/qjL"
+    "T/ujLj/tj7r8tD/q8tP+qMtP+6MuP+2Puvy0P+ry0/6oy0/7oy6/7jHq8usaoS6/XmN1+XWoy+++"
+    "+N0XP+2Puvy0P+ry0/6oy0/7oy4/7Y+6/LQ/6vLT/qjLT/ujLj/tj7r8tD/q8tP+qMtP+6MuP+2P"
+    "uvy0P+ry0/6oT359die/+uRXn/zqk1998qtPfvXJ7+U4q09+dflpf9Tlp/1Rl5/2R11+2h91+Wl/"
+    "1OWn/VGXn/ZHXX7aH3X5aX/U5af9UZef9kddftofdflpf9Tlp/1Rl5/2R11+2h91+Wl/1OWn/VGX"
+    "n/ZHXX7aH3X5aX/U5af9UZef9kddftofdflpf9Tld1/87ovfffG7L373xe+++N0Xv56B1eXXM8zU"
+    "tT/q8tP+qMtP+6MuP+2Pl+NQl5/2R/9Xftofdflpf9Tlp/1Rl5/2R11+2h/Zyk/7oy4/7Y+6/LQ/"
+    "6vLT/qjLT/uj997kV5/86pNfffKrT371ya8++dUnv9fjrC4/7Y+6/LQ/6vLT/qjLT/ujLj/tj7r8"
+    "tD/q8tP+qMtP+6MuP+2Puvy0P+ry0/6oy0/7oy4/7Y+6/LQ/6vLT/qjLT/ujLj/tj7r8tD/q8tP+"
+    "qMtP+6MuP+2Puvy0P+ry0/6oy0/7oy4/7Y+6/LQ/6vLT/qjLT/ujLj/tj7r8tD/q8tP+qMtP+6Mu"
+    "P+2Puvy0P+ry0/6oy0/7oy4/7Y+6/LQ/6vLT/qjLT/ujJj/tj7r8tD/q8tP+qMtP+6MuP+2P+uSX"
+    "3eRXn/zqk1998qtPfvXJrz751Se/+uT3dpynrv1Rl5/2R11+2h91+Wl/1OWn/VGXn/ZHXX7aH3X5"
+    "aX/U5af9UZef9kddftofdflpf9Tlp/1Rl5/2R11+2h91+Wl/1OWn/VGXn/ZHXX7aH3X5aX/U5af9"
+    "UZef9kddftofdflpf9Tlp/1Rl5/2R11+2h91+Wl/1OWn/VGXn/ZHXX7aH3X5aX/U5af9UZef9kdd"
+    "ftofdflpf9Tlp/1Rl5/2R11+2h91+Wl/1OWn/VGXn/ZHXX7aH3X5aX/U5af98XYc/9t7bp72x9nf"
+    "8zv7e35nf8/v7O/5nf09v7O/53f29/zO/p7f2eU37Y+zy2/aH2eX37Q/zi6/aX+cXX7T/ji7/Kb9"
+    "cXb5Tfvj7PKb9sfZ5Tftj7PLb9ofZ5fftD/OLr9pf5xdftP+OLv8pv1xdvlN++Ps8pv2x9nlN+2P"
+    "s8tv2h9nl9+0P84uv2l/nF1+0/44u/ym/XF2+U374+zym/bH2eU37Y+zy2/aH2eX37Q/zi6/aX+c"
+    "XX7T/ji7/Kb9cXb5Tfvj7PKb9sfZ5Tftj7PLb9ofZ5fftD/OLr9pf5xdftP+OLv8pv1xdvlN++Ps"
+    "8pv2x9nlN+2Ps8tv2h9nl9+0P84uv2l/nF1+0/44++R3PmOrT37nM5L65Hfe49Qnv/MapT75ne8x"
+    "dfn1b9Tld1v8bovfbfG7LX63xe+2+N0Wv9vip/1Rl5/2R11+2h91+Wl/1OWn/VGXn/ZHXX7aH3X5"
+    "aX/U5af9UZef9kddftofdflpf9Tlp/1Rl5/2R11+2h91+Wl/1OWn/VGXn/ZHXX7aH3X5aX/U5af9"
+    "UZef9kddftofdflpf9Tlp/1Rl5/2R11+2h91+Wl/1OWn/VGXn/ZHXX7aH3X5aX/U5af9UZef9kdd"
+    "ftofdflpf9Tlp/1Rl5/2R11+2h91+Wl/1Ce/nv0mv/rkV5/86pNfffKrT371ya8++dUnv7r8botf"
+    "r4O6/G6LX88I6vLrGq8uvz6j6vLT/ng8voe6/LQ/6vLT/qjLT/ujLj/tj343+Wl/1OWn/VGXn/ZH"
+    "XX7aH3X5aX/02stP+6MuP+2Puvy0P+ry0/6oy0/7o8+G/LQ/6vLT/qjLT/ujLj/tj7r8tD+6dshP"
+    "+6MuP+2Puvy0P+ry0/6oy0/7o2ur/LQ/6vLT/qjLT/ujLj/tj7r8tD+698hP+6MuP+2Puvy0P+ry"
+    "0/6oy0/7o3uz/LQ/6vLT/qjLT/ujLj/tj7r8tD96dpn86pNfffKrT371ya8++dUnv/rkV5/86vLT"
+    "/qjLT/vjOs7q8tP+qMtP+6MuP+2Pnn3lp/1Rl5/2R11+2h91+Wl/1OWn/XE9eH/U5dfPUJfftfhd"
+    "i9+1+F2L37X4XYuf9kddftofdflpf9Tlp/1Rl5/2R11+2h91+Wl/1OWn/VGXn/ZHXX7aH3X5aX/U"
+    "5af9UZef9kddftofdflpf9Tlp/1Rl5/2R11+2h91+Wl/1OWn/VGXn/ZHXX7aH3X5aX/U5af9UZef"
+    "9kddftofdflpf9Tlp/1Rl5/2R11+2h/1ya977+RXn/zqk1998qtPfvXJrz751Se/+uRXl5/2R11+"
+    "2h91+Wl/1OWn/VGXn/ZHXX7aH3X5aX/U5af9UZef9kddftofdfldi9+1+F2L37X4XYvftfj1jKEu"
+    "v+4R6vLT/qjLT/ujLj/tj5r8tD/q8tP+qMtP+6MuP+2Puvy0P+ry0/6oy0/7oy4/7Y+6/LQ/6vLT"
+    "/qjLT/ujLj/tj7r8tD/q8tP+qMtP+6MuP+2Puvy0P+ry0/6oy0/7oy4/7Y+6/LQ/6vLT/qjLT/uj"
+    "Lj/tj7r8tD/q8tP+qMtP+6M++XXvmPzqk1998qtPfvXJrz751Se/+uRXn/zq8tP+qMtP+6MuP+2P"
+    "5+OsLj/tj7r8tD969pCf9kddfu2PfwNQSwMELQAAAAgAAAAhACQfvdT//////////wwAFABzeW1w"
+    "dG9tcy5ucHkBABAAvVkAAAAAAABYBAAAAAAAANVYy24UQQycufIVe1uQcgkoFz6AG4gLB04oIotA"
+    "QgRtEBfgK/hhlgi0sx132eVHT9KncbptV5Xtntn8fvXm5eu38/R9+rG92t2832+fb7Y/P51vzzbb"
+    "D9f7b/vLL++u91e7v39/cfn5Znf4+83Hy6+7g/34/OLps7PN+cWTs82vjWs9mg9rul23D7fmPC0e"
+    "wDocWJ5ofLGJI7eJoG8DwxDq/9Mdk0fVDYUjU1pJJpWIgtFE7suu0x9SfWq32Z9PHijMVFEiWkUS"
+    "cWroBJ0gpcgRNShfShyrsDgvkjXmy0d2mokrUm4t9N1EVOfkTBnGjF9Pbd7TwzyFLkgpL0UwYg67"
+    "RXNMA8gSzDivtBuJ7PWF/YxXWMm+bwAVD7KLOZvvwmQI4s6J+NbpXAcy8gMBR8a+uEWpUAbMZjWY"
+    "BqZC4cMGCl0YWFjlq16nb71VpFALVDgRtQsTSeL01YBrnolE1MK3GRdKnxTquh7xEsEUBHFmK0iO"
+    "PtVIgcORpcxRXVF0YY+oMvNSF2PZCxdPqGFwjoelRNbd8O+jfiLmsAJSZ2T9koncSFSiNm+gkTiC"
+    "DObIJUPdG2N/ICxQMQ2shILC6lq1rxhvZPy5xaICu1T1fXml6aZuJOl/UMdQ2Jcaduo7tg9fpIQ3"
+    "mbcVFJYDhWsU0RkLi80ojMbXejEaLgrve0GHYd6lbgYj/X8BiJGktDL4Hs0uSLGgTB14zH1UWCum"
+    "vSWQiVqV+PKDkxMZYw7tCq+YyL0hmV1fa9fhFdKZalHhsFOrEAV6rMyRo5i9zQ+FzQaJTXNeWIVi"
+    "kCNM/PFJMXoQfEswh/niFa6Cd2DXMuHQ8QTNu2XD3u5igsxIlvRzuEUTE0WKEirZqCpQh+v4jkAl"
+    "LcU3Uv28zuHVwHdOJFETuZ9IoO9EpYA06myVDlNwYk4smZO+syjz8tjU+lopGHwxSKuSeLWHZ2KX"
+    "oxAxe/TT805IseJu75oRGHecUSj+DZtzfRnqu0gUnW4vyKhpvVXqGDWrmJE1L48qqesonaM3QwQz"
+    "1fzFI5ndk+MqGGhRxXf2+0ZMjLnd1RuY6hzz7EfEESpYAvKelCw7lJM+D7KbiFpOVEeT59vNO6Rz"
+    "ou2daC7yCqgMVTCUTPJdn68BpDMyVX0FBiwKZRr44mZYq2QrmJI4NXnz6jsub8CXE7ZMHAUGzjuM"
+    "vmAmzSBFYa0WpYQ9FbdOjWathjkQOURB1yqpRZND3ZNESVXISxSCMQkRYKhG567s1FJalJluqjcM"
+    "fJ2HVzN9Wh0PO+coURy8cvhapbOqEaIfoBDKW2s6G+keJ1pfumZhX8PhHFNJlDihulbegdVBOtuM"
+    "T+SNzBzGvkrkMq04+qdAi/uqD0PQaoUZHNY5fDOMQIV9pd1FfRMvqMRQD8HEK3I402SKshpIejSo"
+    "Bo7cSENuM4ZCsbBJjMpgUKtOOt7swlDoU73BDPtaNcoUtozvw+iNsoLyedeYskD1E7+fw0rmSPcH"
+    "UEsDBC0AAAAIAAAAIQDzvmW+//////////8RABQAc3ltcHRvbV9uYW1lcy5ucHkBABAAqAUAAAAA"
+    "AAA0AQAAAAAAAJ1UTUvEMBAdr/6K3qLQiwtexLM3xcsePIWuybbSj5SkK4j4K/zDJvCGTsV1Nx0Y"
+    "ppk0b17mI99P28fnlwt6p09lbHj16q5Q99vNRpWF2js/+WrQzhubNh6qLtjoD0012ri+urktr8vi"
+    "q1gtl4aIbNQ+agWro05R36IOUWtoWp8rAXgtzk3AbRFvxH4He64kPh/A8MDWiGexbzK5/ofrwJ1t"
+    "rqR8Hmi+qxa+AZhpr8nE9QKXa9bC19Gc81w5lodR+A4rsHtgseX+GFZwlFKDTxBcd4KrQRxPeXne"
+    "0dz/PAstzfVj/NzadbSctwaY7A+4T67wXDXgynPF88vfGjat9yIe34tnlv8/1g+c4+6PM/UvPO5x"
+    "KdxPvcDinvC05NsInFNzPeG8E9iO5v7gd8jT8r04VccfUEsDBC0AAAAIAAAAIQBbogTp////////"
+    "//8UABQAZGlhZ25vc2lzX2xhYmVscy5ucHkBABAA2AAAAAAAAABvAAAAAAAAAJvsF+obEMnIUMZQ"
+    "rZ6SWpxcpG6loG4TamiorqOgnpZfVFKUmBefX5SSCpJwS8wpTgWKF2ckFqQC+RpGOpo6CrUK5AMu"
+    "JwYGhlAg9gZiRyD2A+J4IHYBYicoDQPIYiA1AUDsD8TBQOwJxCFQ2g2IAVBLAwQtAAAACAAAACEA"
+    "HWhtWf//////////EwAUAGRpYWdub3Npc19jb2Rlcy5ucHkBABAAcwYAAAAAAABrAQAAAAAAAJ1U"
+    "O07EUAwct5wiXUDaZkE0HIAORENBhSI2CCTEogTRAKfgwuwm/oydFQVvtcn72DNj+zk/17dXN3eC"
+    "D3y2m358GNqLpv16Xrerpn3cDu9D93q/HTb9fv+yexn73f741L31u/Xx+vz0bHWyar6b/44jEQAy"
+    "PzFNdS3TgPhistj/4KdmAp3E1uwgCjl7w2HcDpDiS8jwt2lwEMYLJA2Bp+IhARLTmdcit7DsxHxY"
+    "upMpEoLNHH2EbNgDnifyMs/CIGHvTKp9zoWJ9yPKj3iycsEi7e5hGRLyoZQjJ95L7RRcOSpFBUPY"
+    "lnOLJ/OmLAQW8stOgtMgCT/4AiSrY3ubWs6WrEIWQoAphsSAxEUlYNG8IEeQ/iVDSrzdkEN9pLcl"
+    "haxOUYUykF41Q3Y/Ml3pXBSZyygWZHB12rAHkQPVlKP8/xwohDrnOlOrJYXFxZfJvgoAXaZ8kVLF"
+    "y9VQ49qTYbz45tIyFZS6QXd/AVBLAwQtAAAACAAAACEAxYHQ5f//////////EwAUAHNldmVyaXR5"
+    "X2xhYmVscy5ucHkBABAA1AAAAAAAAABqAAAAAAAAAJvsF+obEMnIUMZQrZ6SWpxcpG6loG4Taq6u"
+    "o6Cell9UUpSYF59flJIKEndLzClOBYoXZyQWpAL5GsY6mjoKtQoUAC4/BgYGfyAG0fFA7ALETlA6"
+    "CIg9oXLuQOwIZYNAMBC7QtU5IqkBAQBQSwMELQAAAAgAAAAhAEGTJDv//////////xIAFABzZXZl"
+    "cml0eV9jb2Rlcy5ucHkBABAAcwYAAAAAAABvAQAAAAAAAJ1Uu07DQBCcTclXuDOR3AREwwfQgWgo"
+    "qJBFjEBCBNkoDfAV/DCOfbs7u44ouCj23t3O7Ns/N3fXt/eCPT7rbTc89vVlVX+9bOqmqp92/Uff"
+    "vj3s+m13OL9qX4duPB+e2/du3J9uLs7Om3VTfVf/XSciAGR+YhLLXqYFsc2kcfjBblUFRfCjGSCF"
+    "ckbDaEwPkIQlZthbfTAS5nOmEgKLYiEB4uJsVyPXsPRGMez6KK8mY4UJbk2Bttxt6AOWJ0IpUgin"
+    "Kqtwpcmcc6HO2xXlRyxZsWCedkNohoQwlHLExFupzQRXjkqRyeC66V7jiXY5C8SF+NIbt6mUxE99"
+    "ZOjoHeurqDlbWhXSECIMMQQLCLaoBOw0bwgI8n9pISReO+TYHJVuCSEXkFchLYRXzpD2RzSXJhfJ"
+    "zWUUC2Mw78rAHmV2VvUc6f/nQjJYZK4zjVrwMEFsG/SzA6Bmio0UKp5aoyjnmXTlxTeXtqGgNA3l"
+    "9BdQSwMELQAAAAgAAAAhAF73qI///////////xEAFABnZW5kZXJfbGFiZWxzLm5weQEAEACwAAAA"
+    "AAAAAFQAAAAAAAAAm+wX6hsQychQxlCtnpJanFykbqWgbhNqpq6joJ6WX1RSlJgXn1+UkgoSd0vM"
+    "KU4FihdnJBakAvkaRjqaOgq1ChQArjQGBoZUIM4F4kQgzsHBhwEAUEsDBC0AAAAIAAAAIQB9HMaK"
+    "//////////8QABQAZ2VuZGVyX2NvZGVzLm5weQEAEABzBgAAAAAAAIEBAAAAAAAAnVO7TsNAENxt"
+    "+Qp3B5KbgGj4ADoQDQUVsogRSIggG9EkfAU/zAXfzswmHZco8a33Mbsz+3N7f3P34PZl27Ie56ep"
+    "XHVl97oqfVeeN9PnNLw/bqb1uLdfD2/zWO3zy/Ax1vvp6vL8oj/ru+/uv+fE3a1+66k/3k572BvC"
+    "Fi+tuYvbEr6kaGZjBP+W9+ZRyton0rWoPzczIwjEAkB4MLdHzsXbWMmkjmcDMISDJjaPpiKzw5Ju"
+    "Edkwmxynv7VGIwZVJAL9J1iBRmZIVrQOm0cJi9Iubko0mLcDdGgrmnMTd3hzToqJLGQiwpnzakbV"
+    "HCaMCsfdAAy4UkkYdEMvZzSwiigJPmhiFhFuuAilfKMS5A4kdpE3iHftQhbD9RF7p6sgqsuDwkIn"
+    "1RxNP+gnEbKMugyJiYzrcOXTKuj8XFsT1QZ5TA2a5YbkUBJgZXVlfQCjzgO1hE7OWDBKbdMrlSe7"
+    "60AfA4QUuLSYhBArao42hQLZFZeKXBEpyoFxCUE+qtbzC1BLAwQtAAAACAAAACEAdkS29v//////"
+    "////BwAUAGFnZS5ucHkBABAATBgAAAAAAAB3BwAAAAAAAJ2Y229jSRHGiwcktLvMzMZxEt8vcWzH"
+    "8SW+xLf4mjijlYAVLzzwhEbsIJAQi2YQL4i/gn+YU5rfp+oZ7QMiUis+p7urvvqquqr6/Of73/3m"
+    "t7//mf3T/tX54f3HP37orOudzV9mnX6986cfP/zjw7u//eHHDz+89/dv3/314/vs/cc/v/v7++y5"
+    "O36YTPu3/fq/6//v31d5M6tmY5qNYjaus/GcjUE2mtlY8n6RjW42LrMxykYjGzfZGGajko1yNmrZ"
+    "GGejlY15NrbsvchGLht1/l8jJ4ce/3/OyCPLMb1F5zXPV8xXwDPg/QO/f87aCjpv0eM4H9k/Yt5t"
+    "ew1G19dh3dfZ6LPmAXlt5EjfGXb1sck52iHH9bxBVxmeltj2yPpr3jWR3UT/EA61v836c3RX0F+G"
+    "5yv2FXh/y7NjXSd8N9hbAHsVHmrYkYPXJnJ9vsf7Ej4oI/ce/D3W37HXsU7sk+/FXwkdFWxoJjZc"
+    "I6uGHSXsvuR3BYwPFrFVQfYNmORHxUWD/27TCg78eca6Ivz00D+Ej0vsziUYfN236D6DO+EfodPt"
+    "8DibsreFnXX2XSAnD+489siH58y3kF2wiP0CctqJnBEcNxM9V/D4mucStp0nvPrzwn76nLgenRPH"
+    "uEW+9HwD91vkv4H/Z7C5TUt0dRP+Kl/4sIEexUcefpVbxFMD3akPX9mnc1mxyCM99g8tzof7aZbo"
+    "GCCzhi0abtMRHYpt33uHLNej3DPi/yuLGFTu+DIGv+H9T8Xg1/Dyko1fJTrTGMzDq3P4BCeOR+ex"
+    "ZJEPLtBbTX47d1/Z5zF4Ax/PzJfBrZgqoG8JhgLYq8mccvi3iU+Vr1/B86VFnnPuv8dXVYvzrPj3"
+    "OPiFxZmX7+/h8QWcU/Q6P7+2z/NhlXVtfi/571g8tjfYqfrmmBb4aJDsl9w+2JSrdCYvLHKWcuRr"
+    "7PW5uf3vNazO/jw2vUV2Hbxv8NN3yDmDG7ethhzVBfn9Dc/Kkb+0TzFwYVEzFH8ni3pzbp/XsDv0"
+    "uowva1gNXGWLvK684TrWcDdHvmLogGw/a3v7dB6ukX9jkSdy6GqAa2cRR89ws8J/E4uzXkDnGB0b"
+    "nt3eEfL3+HIMJvUqe/Sdoa/NHvVCefS4znuwOKc9sE1Y08OWKRz6mhl7h+h8Qc4zmByP+o4cPG0t"
+    "+qU23LpM5YAKMkfoObJuwPOE5xn6pvjlhPxri7N/RK7iW1hG+KuPnAm2NSxq3AxfDJCrvFFkrfzS"
+    "tTgLPdYuLGraDB84Vo8vnb2055zhjzr4T2BSreryf4qsRSKrYFEL1Os4vifwrOC4Bn/qbzvw00Lm"
+    "yaJ3a4FrgCyPmyuLPqqFnbJJNXeFXSPWTVjTY10ZrGueRxZ1Q3FYgP81uDr8dt8Mseto0d/OLOJc"
+    "tVq9xBH8c2zbWtTcon3eM03haZz4dgdXB2xTrd9bnPk1fNxh6xDMK3Cc4Ed3iBN6r7BXtbuDbOWE"
+    "DnhzFmekj7409ly2+jj1e+rfLsHVZ30L/6oe7+BTsV7j95E5xVEVPU/Y/oS8DWsm6Fli8xN6NuAt"
+    "YsOcuTUYbxOOlrxXfZNPWxY1Zg+uM/BumVd/J59VsGHCs7A51xes68HL3qL/2eHXLjgP2HfN0P1B"
+    "/anuTXOLMzEAm7ibgMdtrCc25vCBP5d4PiW26k6hfFBMbDi3qCv9RNaCuQYYV8w10aPzsrGoB3X4"
+    "UU1zzPfw08VHuoO22XuN7TNkqLcd4ROP1bFFnzCw6KvXyF1h65G1D3B1i51T9jku3Xvm4D5LfNPC"
+    "dvX/g8TGg0VNK2PbE1gVB1MwvFjct8/Yl2e92/jMnhEYz5G5Y53O2R7d/vsR36ke1tn/iC3z5PfM"
+    "4rtDHluK6Hf7qhY5t4le9QPqK9WnrS3O7ZS1HeSneV5+2vH+CR/v8VfbomYu0XGCnwE8qHYdkFfG"
+    "lydwzrBlBQbdjeYW+aJgcTabzD1Y3G8kV+ezYtELLr/Ye2NRO5QDm+BRnj5a9CEvcHCJzgVyFYtd"
+    "i16hnPhTMmvMKfbUhxws8vzOIq8WsfeF97qrKVeMLXK1zvNFwrHb5bHZAMfY4puK/9+wp4SP2xbf"
+    "RVRX5bcR42DRQzyj/w5MK4vvSVcW/bpz1bM4k3V+V9lTAHcxWT8DwwpeixY9Tc0it94nfpgh65w1"
+    "VYvYV2yLq0YiXzX9kfcL5nLYJj7vWac7neqq/DpkbokdyqXqodvob8FHB5lN5IzxRcmiX3Pf3zD3"
+    "bHHvGFj0irdwqu8hut91kaHvGvq2NOWdzory/RNy7i1yyR1rFTuLBO+tRQy4DN3/tuwdWNzpNxa9"
+    "os7p1uL+q7vgCewtMLjMo0VdnCf679AzQaa+BxyYV3+3Qebc4qwqV+nueWC/+tG2Rc1Q36AcrLxz"
+    "tMgpbv8MOUfsUY+0Zf6K//rWpzPwAOf6LqmeU3Hdsegh1GfuGPpGfYsfrhI+VU8vLXKY7kcri7Mm"
+    "jpSfn+Bxiz3+e59wuEBfzuLO9IC9JeToTniwiBnnUPE6RGePvbpvnMH7AC4O7NX9St87H5nTvWAK"
+    "tks4GDP+C1BLAwQtAAAACAAAACEAtxbMYP//////////DAAUAHBsYXRlbGV0Lm5weQEAEABMGAAA"
+    "AAAAAHAPAAAAAAAAvZcJtM7V3se/ewgRUYQGHTIcw+KYpSOS8QonKjNH5inHOQ5KZMo8D6GMSSGF"
+    "FEIcQ0kIJUmGc6ubIXOFMt3Pfp7r9r7var237rrrtlbLc57n/9/7t3+/77SnNHiyfkIzoz7qX6R9"
+    "h5R2yUUqxxSJ71KuSImYIh17JvdObvtMm57J7TuE72u17Z7Sge9TOrdN6sDfsaXLlylbomiJmAEx"
+    "/+5/mQe9Z6S+RmmfWjUda9WvlVVMHaPETkYT2xh1XmmV2MIpaYjToEo828sqTw+r7DNs5PM8Z5W2"
+    "z2jeIN49aHX5ld++W17Mas/PVpVqGOVJMerXjn2aGM1YYTSojNXyN6xiX46uGX77uLCN7HnuI967"
+    "En0moZrRmiE8c4bf9kfXr5bXaE8/G1krz0mrGeV4J81FakrKYSL1h31bPsye6UaVHrbq/D7rLzaR"
+    "d8Pvi1oYZdrO++dY/wZ7LXaRdY73tpGzLo/j98dMZP9Q0/FL0TWnjmSNO6N1hjMlVKam+Sby/PK3"
+    "jOoc5/k9Tgf2GMWdiq4d9g+1hPr77XO6nI/zDYyuN+85pzptnJZesTq302jrNWoJM/kp+m6mD5zW"
+    "9OGZbzh3Vhfpw7zhJrJnqDfU8UQ685jsFPc954yP1hV+D3scaGyU/R6r9AI20ovQs9CnPJ2cFtX1"
+    "yp7fKOmW6HlHZrSq081EZpeUxWrkQBeZSZhR6FP4HGoKfQwzDD1sequLnC30MuyT+J2JzD/sV2kT"
+    "64ynRx+AowrRd8P6x5+LfhfqCd+HvcLakV7we8Bg6Hf4Lfwbzh2wENYP74Tnmg53Sp/pdPw8+6yz"
+    "kfoDTkJv0hdGexMwFc4WsBlwE5vDReoNPQm/HXreqOUozn0liu2w981z7KPuc1W85l2L4j/0MvQ3"
+    "NouPcCL0uU4H5vqejWAm1JywOvp56TB6FOM00kT3DmuHnq953urAJ1HeBK6EWgOXDvWJ1hcwHc6x"
+    "6MnoWjEVfLTnv9gIP0PdoZ6JzaIcDXMZtMzqsfG8P81F5j72rShO4rqAp7o20rfOb7n/xZNTu3/j"
+    "Sdjv/+NJ0IY/wpM/O8Obe/euTF97Gt2WGn2m+zcmwrEww/BuWOfmDNMOSqcKRzEc5vF7M4wD938E"
+    "gzEb7e9i8CYObtZ/uaD5wxgMuP5vYTA91kQwGPgfMBj2/TMYjOCshfm3MBjRnf+DwVDbTQzOamX+"
+    "icF5t5p/YvBCk+h+NzEY9r+5Rqj3z2DQx/+GwYiWg8GrL5iIh83+hy7+Tw8Lswn7PE0ff8/DDg3/"
+    "B6b+hIeVaBM9z3/Cw8Is/6WHxf9xDwvY796BXDH5P+dhq/m+Shuv/IleWz7ju1+MRtHXTW8bjcjv"
+    "lAhOf53jtLC7V9d4Pu+x+mC10z0LwSO4Tyvr1TbOaXN7I5/idaKx1a0HnbL0ddo70Op9epezv1HO"
+    "T52q3eVk6zs9O8VoI3iIa0u9H3H+253ur2/14cvoW2GvqXhpBrRj+A2rM8edUl9xepnnR6zCyyo5"
+    "Nejp9cgkq1r46dtg5PEnnL7o5dQrl1dqP6/z45j1DqMM5ZzGVTEqPtFp/WWjBwZ7jW1tNaGLUcOK"
+    "VqlHrfxep5RxRgubeHXo7VX6bc4Kr74Hy6vZb8Muq0s/Gy173ajZWqO17L+zulfx5VbJyU7NUr1W"
+    "WadVr4JB+JVxrJHL57RvBtyoblTuIj341uq1ScxhmNfmWU6Tv4VP1Zz2l0cHSjpd9F5lqTc2u9dd"
+    "q+ljUa+PvmAWs61uGeMVN8VpGnsmsddO5lJvhNNQejUgyWnbMqeqU60KtvUquN7pxkCvpQeplf4V"
+    "AQeJs8DMJbgwx6r3GPSGGfYZwHdlnDL94GSOOG2o5dQGjr0z2+nH0V7nLhjNSTa6j7k+2NJoyGR+"
+    "g4fJjxqtfol5xVmNymP1Sx6nksW9miWgRdaqFeeodLfXQvpe5VGrT3+1qpkODsg71WaAs21WFXvQ"
+    "gzivieD3Or521nhl9E7rwGhSA6s3mEMCnKuSEw0AB1noZ8ve6Cucu8B+3yZ4/USPyt8Bllt5HTpv"
+    "lPkro3X1wC+z3DXG6i10euEkp3ienTjeaVMTq9qssQAsbwcfEzqDi+tGu8llM1LQkRfoJ9i/912r"
+    "6zuZe2OnFxsxT7RuIDwqjH5os9GFqladmM3D9HQNWl4dXKSxXtoOp+//Qk/hVxv6Pq+/VSlmOQ0f"
+    "aZXgdDq/1dBGRk+BxQrUXTwz52E2Wd5xSnjPqXcDML2B2tDwp/9mdLEumKTusq85HaJv9TqiKehM"
+    "2gr6vs8qxymrt3lvU32v2h3Zp77RF7w/E741m8BcwUDOglZH6nillPI6icbcAib74snjhqPxx6w+"
+    "ov+5H8LXS1h9wuwupVo9NdToLBr4zkQrk8mrADqYwpo/f2nU4ip9KGTVLTe9ordVwW7dcfSpNjp6"
+    "Gi5V5JzfO32D/iVtsuoK3uqOsnp+ldNPT3kdfcKqS3H+78r8weelEUbjk5nPV07N8ZUL5NQ7wOkO"
+    "6vgyo1eNl51yHzY6uMJpWRan8dRRcrRRB7h+/Qc4fYfXX/GQz8d6VUUbFsHvoz2ttpC7hzX0+qWm"
+    "UUbWngaPT3T2Gr7EKVca2MA3ZqNn300zuv0zMJod7aLGl66DF/qzHb0ehn83wJP30vsZDdAd/KU1"
+    "3M1JZh/cx2jaYqttcHr/Deb9iNc29HzLMKeN4OHwr0Z7a8HNUk7lwEZLatnPfNLltPJd+EI+38tz"
+    "5YugIfhCOhjMgAZeQMu+ftBr0GWrvlWNOr5h1LaZU+FGVpOpZ85yo51g7vLTRtMXWW0t6/TUT06N"
+    "qoDR+5zW0p/zE736vsp8OcP9YLry804tanLWZl6x5JkxnKnOeqteaPxF9DszWTJ9Hl7Q3WjxbfTz"
+    "R6Na+Mmc5kZlv7YazLOF4MrcmnAkm9MLd8HVrWCMOlo96XWc+fUf4nX9KpkE3Neuyt/TmSv1toWL"
+    "TZh5+hbepc4NXbw6rSEHpjpdxaMKNPXa96HRo3joOTBf6pTTbvbvx3xbZ2cPclgVdOrHdk4Fgo68"
+    "QS6rh8+t47kXvJ7Bw1/vbpUfvHYZRE6Bb1fINtnQyUeWsze6uZqzLOcsX6PP6oFXHTN65Vc05HGr"
+    "O9GJUtS/bQJa+SKYL+BVLJvX8jfJEfQkljnXcuB8l1E89Y0Z6fQMPTyGJ+25iHb1gktbnOYXsVoP"
+    "3hPmO73K+2ldmQXe1Kup0QLO1ADPuyOnV7LzWkwm2NqRv5vDSXr+OnPaOhntR7vHwLmS3znVw5cW"
+    "sMY1eriXXicdQnsnePVMdFrCnOcnGvVcB55eIqfHOuVo4XUVbh+6RP7imWHgYDoe3XKvVdVqVmtn"
+    "Wi2k1hj4MQqPLojX9kfnEveDnyZ4MVng2kmj0ejwdGb3JbmkFrp0Hj5Mpfbejb1Gwcumtb1KbqZG"
+    "9Dwbcy2O1nXCPzsdw3fhWZU30ZjXjNoXR5fYv94TcLC0k3vH6iU8amw3dH2wUz48dUKs1yJm36yE"
+    "V4tceEdfrzNo5Rg8o/19XhfJrRXR29J4y5ThzDOD06d8LjTaKlc/px8ehqtoeWk4fBS/Wot/T6lk"
+    "9QB5/dqtYA68ZMvBDMisPfJ7We4Eh1ozvzVOB4/g+fhQvp1kBuZU4Dr6tsGpVnX081mvn9GoQbOM"
+    "Gr3pNJycseNDfDrW6jAZvjLnWI/nzsKPj5xzmtSfc6DLqX+zcnPJvmjVrzXoT/CnekZVR6DP3EMa"
+    "wPWOaPW0tWg3urabHGkexI/whSknjDZvRA9/droPvV/VmeyFHjzdzmtm8NMMPEsmTEZ751NTWzQ7"
+    "FYyuPsOzeOIUPGUFGv/5g+D2fad3wWBWPP0MuaMbmlWMPbvmtKpCHqlHXjt7CMwx68HUXB5NP8xd"
+    "pBjzjOfMhZjnUnT82gNWZeBl0aecptPD+8izBdt79WN+5XJ4ZV5mtCvd6idy3O5JXisykXfgXAWw"
+    "WwHvHopWJZZwKg9n1vPOmce8dp12+gxveg68+lxwENx3R5+Kb0Nv0IiL6PDhvGjsVjTya6PZo/F/"
+    "zl4CT9r+uFdzuNeQvXa2s2oH5vYtciqBz/ZGi4896jRwKtl9GzjJ6tW4Jv3Aj0tQXwVyVOVFZKoB"
+    "RqmsnQoXr1T0mtvQ6kW4f5h720wwMnYAHDrqVANfm9GauyuYbNLSq/WXTlOqefVZSdaa6/QQnM1Z"
+    "AL9aig+RieIfsmpcjhl/DH74rSi1ZUZjOnO3GL2W3EqGOUzNny01mr8A3OLN+zlrObQ/7R6wCder"
+    "w4N7pnjNZn7lud/UYB7nbvXK9iP6y/2lfkOjrOTsSiloOj6fNBdPIge+wFnuoMa55J978YNFcHMs"
+    "Wf5uPKEv/JnM2fLike9ynjLkz4L83rONVSZwOnCHVQuyXZvd5AzOXp57XjL9PYrm18jrlLGO0yW8"
+    "2pKXc590KnbY6V7uCGXQzaLcP/NxZ3keP3m4kVfes+gQM382aBYYXkOGGg5nz5Ldl5ETdxcm4+KH"
+    "l5jVOs48L/gU+eoCM77B2YaQ8YaSK4eCvZHkkuxoSfbO8Jj5TznK2bkLT0PPy4L5l+n1khrURY5s"
+    "wmwPowUj0Lwv0JkD06z6k9PP4X33ku+KkA1S4W8KujeV+XQke+emF3XQjIeywY8EMMGc8h7AD0I2"
+    "3QvvwMICvKYLOWYBOpTKPX9gmlGuF9FuOFAH3ejQCt/Fh7Yx0y7o50nuPbeRcT4/4NSO/iwhf3YD"
+    "i6+RQVrj9zPupNYO7P8k2KnuFMv95GN6XBR8LH4GLr5CVhlpdRRfWH+/17jJ7En2njrAK/djTo83"
+    "B+tCz8mEG+lFXvzp/qzUTxZYA78ulmTeeGA5skMMs1x5Hn2qbZSDPbNUcCpD5jnAfaV7U7x1AT7w"
+    "EP4JXlbie/MvOvVg74zo31X43vUCveOul4saG4/Hd/GQeDJ5HLiYRR46gf9doo459KEca+QnA92A"
+    "+wO/5d5UCIxS03fg1r1NBrod7dpI7sD3XoUHNeFPX3LFaTxsG9k9J3e93vz77EayI3lnPVgogFct"
+    "4/6fLdx1qecWsP4MWplAHthyxmhuQTS2JXg4YnR3Ed5LtBp/2ugKZ73wutOT3Ge7cMfvT0bs96zV"
+    "SPLQfPLfx0vwhApeVaY6LUUvGnOP38b9rUUz3kPjJjvu+tPxJu7Wn8DjEyXJOmA8ZqTXdu7ik2rg"
+    "FWj/ALR0yT6nFf3ALffBTnB77TfkCrD7Fvq58S9eH+LNWUOuQwPr/hVtwAfzcY9oid6fKE9+QHef"
+    "A8/vFPOadYtXN+7G2WLoI3eCr+h7Pfg8g/tPPHnx71BLAwQtAAAACAAAACEAjx+M/v//////////"
+    "DgAUAGhlbWF0b2tyaXQubnB5AQAQABgwAAAAAAAA8Q0AAAAAAADtWmuwVmUZBckwcFATQx2hgxcO"
+    "AuMlJJUR2/re9hZFCk0lQC4eZIqRe15x8oJYNAIDlJQwJCEKjmFpAkPMCRIbIzRFCZNGcBALUhg0"
+    "QdHpO3ut9ew+fvav4vw433z78r7PdT3red5vzoBrrxp4Q+tW3211Z+NNTZNGTWzs29B4yeiLGns1"
+    "NI4eN3HyxBG33Dhu4k1NLdfjiLGTmmrXJ40ZMb6p9r37+X2+0rvX2b0apjb8p3/tWpV/eTa65e+d"
+    "PPvjxtrfsUWG6zH7+fh+7bY4fv9e4qfLfjK/9neKx/cs8ro+8+wbK7tM2/11Z/fz7Xd0fGq6z3q3"
+    "/M3hes159s/uQ2auOylh/w0R625N2cx1H3Yf8hLvvxbx/Tju1xyxTm/ul1HuK3n9V8H2bbdl8fh+"
+    "yzz2fyFw/5hNqKm1+DzKMTxh39vzbEjLRo8kPpdnpRoXJTw/MMfnipg9lWoLnpPwOYB2OiNlLbfH"
+    "D82zlm3bfZRntbdXdgnSI/D9nPrFrGPLAhdwn5UBevzQwR7dLs/ubHngjYD3n43Zntpy02Zo/Zid"
+    "3SLwMQn3p+SQYzHl6pDwfHvaoUfC57dT9uWW7e6OkG9ahNz96N9WRba+Jt7Me2nvVh7yPJBzf8r9"
+    "QcpazJq2B3y/hnaaFU3/cp2jKHf7nPHhoe9tlPMpyrk7hz5jIvReTb+Pq+RSXJbr30p92vH9GQn7"
+    "jdR6CXJNTtmuT57Y98rUKk4RF3k2aczsf9xV88POl0//y8FhtOPRlOMY2rNNsve2PXv/XS/P0DqS"
+    "K8/mNT04auj9weIf8VTdL+PvZsp3b8qmfq3PsNXzg9lTfum6YuKY2dtSvb1apexHbsbYXe2rfUv7"
+    "nBph/3uC6fvV5Zde960v5CaH7C05VhfHHtVzabJ9y/dbp2zh+0s39P+okld6w5/SPyCvZzPuHs+z"
+    "cV+8r/nFESF7NPx6/6dnxqz2f/NtT1TrlPp0zrPb/9bt/GNOq67POflz3+ywILfv0vPxDf0v/P5l"
+    "0j/ALn9P2Svjbmy76Xz6/blk6/qaWT7ZGu192eeXC2oK9azsUPqjZu8y7g5Ucrx61cjjrz+bdvgZ"
+    "82Bodb/Mk78Sv5ZqPeb7KOLWY8SL3lWcaB3l4+HyTWkxwEPR4kL2Lb8nxsvSiHi8NmU1r03/0r/Z"
+    "FXlDHDs+ZWsm1xZ8Pdp94EqyfCqf35SyRaeeu+3M1w/fV3IG+l3rUJ5GPt/IuPvYAyffrOKxlGNv"
+    "ND2Uj+Xzg3n/ZcZNd34/vsJN3A+2Xmn3S5nfy+j3TqE+XuSHNpT/vsT6lZscsnu5XpdocpRm7hpM"
+    "L+B+FUfAdz63XetHqwelfztHw3HpVcr7g8C8Ut1K2WM//V3Dih2VHevstkLvK5/l55h12rrpo0H7"
+    "K7mAu6yTN1TPlevuSv8b9eRIHloeHsHBIzh4BAf//3BQfZh44JE+7Egf9t/Uh5V6LCgMJ0u/Xqy4"
+    "YB90OuPhZsrVk/F6QmF9XLnvL/j8Dgd7LSwg73sOfhqb0z8ecj9YUB7ONSL1eZBynEI5BhHPRvH9"
+    "1Q5xt4Zy9y1w/22P/dflVh/L5y5R/AerP+X102jft4LVl9K/O1U3FJ8O148uEDd9WOde84xPj/1G"
+    "8HqfgnVWeaX65+h35tPeAus2qQ+l/PdGfD7qsf+2YPFarjua8f+wZ9/M/bqxfj4eDP+hv+Ilmh9h"
+    "Z933lmelP16kn3c7y0/Ec0G70g7ziA/7ndkb7zvWlQL75B56Ps84/nOgPeiPWYynGl/CpyeP8ZYf"
+    "pdxtGYeJ+fuh+mLizCzFI+N+UUH+5ev16RwMp8EzGD9t6I/nnemJvFTcOMh/cjS8xvsR8g7jcwNp"
+    "hytY3zpSrkeVf7T7GuLSddxnC+vEKuLLp/TvNc7yHu9T3jM8847xc1DxUVie4f2C/CQwnogXg7nu"
+    "AGd4g7yg///gyecUH8Sv1o64ybh+yFEP7vdMYFxTz7uC7V9+ri0gx1Tq08MZ7pV+aygoR2A8O+h5"
+    "dW64C/vw+eHEg0P8HKJ5EuNlesWj8Jyn/PT3TurRQXhN/FrrEN+TJBdxaavk84a/qEPB5kngN5Ve"
+    "5f09Hna6UHlBXGkqIO9m1fdg9QP1lM89X9DfkicYfwO+E2f3EA+iY54mw1PpjfrpLd5gx2jzKejh"
+    "GCfe6hD8lROXvfFZ8EDauy3Xf7gwXIB8zLvF3PcG5tl2xs1c4vIa+ukR6rEhMJ7Jt8ZyvR9T7reY"
+    "B+dS/v7Mz33EiXnM8wHk+f2ZZ7dXfBj8hHxrEHnIzsLqGPCdON9VdY3y9CKe/l77Mo+GSA/W+8nR"
+    "eIbsB7nkj2T1u1znadq/byJuOuM74lXlc39iXnVh3V/krC9CPWecviu5pTfjNDGOlrE+baa+rYPh"
+    "H/aVvsSL5ayzv2V93U99bnHGG4Sz5XsbKV8zcWUK4/O1ZPNN7K9+jDgyzRu/AC6p7nvjleiTWW8b"
+    "WC9eIA/bkBseCa8hH/MsMh7nk3+rXxvOuNysuCQevcvPnHrPoX+fYd3rQbmXqB4nsyfyOVpeqe6j"
+    "nyKPjYVdr6vzH9CebzvDGeAE42Gvs74S8RqMd+LcSPWZdntIfawzP6JvqPJK8Qf8IG5/yvi4LBlP"
+    "hx08/cz3BjM+Z4d6nJvLOrQg0K/K79zkQn+SWFeIq6vUH6gOF4YD0Ivr3EEcWM73OzmTX/GBOqn5"
+    "CnH+xGi4UH5/lfHUzHzcx/VXF+Qpmqewj1jvrG9C/vPzUDRcVP6C53Hf/axrU73VedgxWl2APxzj"
+    "z5k/xXNQb5jHVwSbRyAeWK/eZD05UFi8ia8hT9nnrOUc6TP680nxUuWRM/6H+hONX8LOudV98SBc"
+    "T9af4r7iT3EuPHCMG9Ud5usO9gfvJquPwNVgcYg4pl+vPxyPktVH9DHCe+Le5Nx4qvpp4bzqAOwY"
+    "jM8hD6pzofL9s8QPlWfqp8gDniRP65YbTgDX3GF9H/W+vICdxovfOvMT/OYsz7CO+lz1c+yfj3NW"
+    "59QHCe8gP/fZm+r7v3XU9yhnPLUU5zf09yr1F8zrztU8EPjtzB+o9+QPJ1bzEuQb5XuPeX0rca8j"
+    "6+DHrJMHFJfJ+hfNrcR3wROD8Vbwcm/zC+CT8IL2OE/9Gr8PLCyf1UeAd0fjs+j3OE/ZWNicsPTv"
+    "5wvrUzT/Ub1DvEfDO/Wx4H/E4auFs+Sl31E9r+o28qIwvBOfR30KNtdV3opvI/6IL9fwvPAE8qot"
+    "5HGNzI9Xmb/zhZucp15CXD9L/M9ZnwbccdafwM9Vnw9+kltdB87Trncnw3nNDUv5JpBv3FOdpyJe"
+    "hRPJ5mGqD9A72PxA/Ad5QBx/WjiquYvmueI3hemjfkP9puZMsHsyHo341/OcW/Tl/ufIburHcrMf"
+    "cKmw/kt9PeoG+eha1fNg/kEfUtkD/WAVP+IFwmXkI/P5QvFwze85h1pX4S78Lb3Vl4kPR5Mf9Yt5"
+    "MKuaTyB/ybfeKWw/1SfgFXGln+aheo+890lnPE/zI+Gd+DD4ibM+VTwVfMMZv1afDB7KeF+arD4r"
+    "z2B/b3itvhTxEY0HYL4kHGH97FLVCfWLqHeaM3Gfg+IV3vTXfEnxgP00f+X1/sn0Ah5Trs90PdXj"
+    "3cecwyyh/1c6+/0E6in9/6F4AJ8PwXgY4pf1dCTxchHxPlX9HuwQLb6AJ4XxMc0d1c8pTzHnVH1m"
+    "XTtB/U+0+SDqVrTfPWDd3Pxe+nlmYf7TPA3reKubqOeUbxf56QXUcxPzt7myE+yYG89FHms/bziL"
+    "uqi5ofpAb+c26Eu89aeaAyG+2R/cwXq+XDhP+5yc2/kL/J1bvwy8ZL+2J1pfh7kf5dtJvJ9Au5xe"
+    "1MfnedV8G/bS3Jn17iTlZTTeDL8540PiJ+LxwCnG9RTxWvF4Z/MM6Mn6Nl1zZsWF+kzG3VuM94Xq"
+    "j5zlh3gSPr3N73QOirhk//FSYf0Y6myw+iLehP04Z7uYfHHuYXnZXPWX6IfId5/lfHm6eAjtNMLZ"
+    "uYziW/Mh9JvO5tnQ3xsfk/yIQ8ZrB295jHjgfLGTzgU0d86N5+k65PbEs8LOCYCH3HcH57ILWbev"
+    "Zn7uK6wvAQ9VP6Q403mK5vTB6ovqEPiAq+dZ61XPnfFj+R04QFw9lIy3aR6pvELcqR6SR7WnvGNy"
+    "48Oo86x7Ixm3vZL1ceJF6FOd/b4K8as+K9h8X/ML9Tnic8ALb3mtuaVwWv2T5u2aq6DPJF+Z4Oyc"
+    "DXVMeVfxEfEqzIf0e1FvvAq4WOGd5pXAceF3MvzW/BI8RvOGao6Oeq56Sj7Y1RuuAe+FF+SVk4j/"
+    "V6pe6pwuGc/UHAR66LzaG1/VOST659zmcTr3wzlCXj8Hna/zAG/6Y3311976D80VEQeFnT/p3Epz"
+    "NPiTcTelwkfFAep1Xj8feUM8vsIX4HG030Mq/1Df+fzNyr/qfEznJ+oXEXfR5tvCA+WP6pHOYzC/"
+    "rM6VoA/fX6LzqWD8XPNjzT1Q/3KbW4Lnsd4dot5jK7xF3VXceJuHl/ffT/Y7Ds3VNMfSPBy4Vtj8"
+    "RnMxzQUhX2H9gPSHnsH6P82j0SdFOx9BHUjmL83NkRfCYfr5VPbjw8Sfg80BUJ/Z9x8bbU6D/Mht"
+    "Lgq+R/80e5vHCF8w5yJ/Hi3eKb7H/e9WnGgOpXkw7blUdT63c02d6+tcSb9XrZ/XFHZOAP00x3N2"
+    "PqS+tU7e54i3uzXfDnaeJX9ovoi6rLyTfpo35Xb+rrkteHRh8xPNZYAf3vAE8eiNnwsf0afKnsnm"
+    "D8IJnROBZ1bxpb5D59//AlBLAwQtAAAACAAAACEAFvSdk///////////BwAUAHdiYy5ucHkBABAA"
+    "TBgAAAAAAABUCwAAAAAAAL2YB3CVVRbHP5cssLS8mpf3EmmCASESIKE3xVVZ0WVBpeNmJQguNUgT"
+    "EQKoSBEUsaIUQV3KCqOAZlk6IhikCYKCdAQWKaIIDpL9/fd83yRSnFm3ZObOOfd/6nfvufeel8n3"
+    "3Hd3q/bXOQOdoSlds/o/mJ3SoHxKox7pKdXLp3Trk/1IdmbvB/pkd80Sfntmz/5Z4P27Z/bNYl6l"
+    "Zkat2tWrVi8/rPwv/StxIug4z/sdp2/EccbAn4eP8zlOp4DjdIc+Fi6QbY13nPdCjrMCWSL4bQmO"
+    "k+Y3+65R02mXZJh8yJd08gr5k674Sq6uMNkqjnDZtLzefMifcOlWjznO1ETHWYrN9HjjJf8oWpB/"
+    "eoOCGPKZVuhblIPm8i/ew6UrvJ3rd2m64zQrZ7znK8+lyku44nqY1kJzUeWquLJXzvuYPxMwTLrp"
+    "FRynyg2Wq+bifSmOk1zZbKTn5Sd7Ly/Pp3jF0lDuaW58+SvsV1S5ePskf+I9e+UhzNuvSm4NeHLP"
+    "h2J6e6C5vt3z/by7P96aJLrYC9ECH56t58/z4ck09/be0xUVply8WMrD+zbVwV8LxffqzvMj/6rp"
+    "7oX23ZPLz75wQX14dbDg+oJ1ku4Jdz/lQ/U+KfbT7/H2yjsvylU29+Pn00hBjUjHOyPe+nj1Ilnh"
+    "nL11inP33tsv5asa977f21f5Pe/69c6w51u8sES3HmX7S89JbvDnz4nWx7snCtfKv7OH80qbzzzX"
+    "z5vuHkim9Sy8h74yP937y/fwWjXo1d/VatC5Rg16dpfn3yr0/6lBxZMPr55+rgYfCxfUoJfD1Wpw"
+    "X7igTi7P+T+pQY8Kz72sBnPdPb68Bgt/k3ffd3Lv0dzglTXo6V2rBhvFG+7ZXu0NE80N/vfeMG+P"
+    "/tdvWG7wyrPp5SGaG/zpumieG7zyDVO8q71hsl0RKLiXrvaGNYYPoF+PURa+NPl2gRZHfgSfZ/U+"
+    "8E0z8buRPWmO/QfMq6J/C/Y7wH5gDapi14419WMXp/MNvwWdvchmwLfEbg94KvrHmA8DL8K8WIKd"
+    "u/nYNYHPxee32L2N7F3ijGS0Z5wEb8XYyaghW3SOQ19CLwX+AKM49s2RDwbrKJ6c56BzPb4XgHVG"
+    "1gLsLGMAWCrYHPIqjW4lnQ/Wqxz6O5C1Bz+J/AK4w7wsYwnYQHLtzjdUJKci+Ps9NhnozAffBL4U"
+    "uoU164MsB74b9CTyfGQN8VGFWEewfRFfp8Drg51G/xyx3kI2A+xx7Tu0DfP25BODv8j3zcRXCrIZ"
+    "+O2MfgC6WbWH77SYrWsG+GywPcjGYpMDvgybzsRJINe56M7VHkNroPN+2Gx+YHyP/kKdC+zLID9F"
+    "XgexqxawtW/mt9pYiO52fMZDn0aWDZ1Ijl8Tq17E6uJ78HPQWfgbp73AdhB+u4J/CH4D2DFiTEZ/"
+    "H3Z3gD+JThnVATEexV9f8OSorU1PsE+YN2DeGp0Jurd0BzHvgt3H+K4Ln6DzAF8xYvs+ljhVY1ZD"
+    "X4ONwE8mviPQZYm2R9novOyzfV3i+vpGZxi7HsxbQ0ui1wu6jjV5A74kOrOw+Q22w7GbT+ws1RpY"
+    "L+a5jO2qH/RSwI5B24SNzyOvs+rxsK2FTlFiJbE3f0QeAw+CN4LOx8c87T18DnlMUH3hpyjY3egu"
+    "UQ2j+wzz0cSuxPgU3I+/S+TTEd0I/DTVns4t+gvBm0NToDWx7Y/+LuhUdJqCX8RHP2RH4FeAbcHu"
+    "Db45AZ2zyELk++uIre9s5IvJ60Zy341eEXxV1jlBfw2yPHftdFYHyU69JbpfMl+KThxxSsHnR+3+"
+    "WYXNDvEh2/+W5J8PPjdoa34B3wfCVuvd3Tv4TNDO/b2MdlG7t3KwDcD/jRgjkb+jtxtsJL62M/z4"
+    "XUs+WfBP4Ou3yO6D9gQvrfeLeVHkJ8jjHvUryF5R/YM1JP+Z4P2IV1/+sDkYMZ9D3TGYvIZgM55x"
+    "D/oVdFeqR4eO093PGEiMJPQmku/njAH4vI7xDnFqJ9m9oHoaj+/FYOuxWYP+V9hVRn5byO6d5Xo/"
+    "0V2Lbhq6a8DqIG/FvFPQ9uUEdk2x/w4/b6KTAfYtazLb1UlFXgN8Jt9URecM7Fnoj+gPg7aI2hhO"
+    "nMUxu4fKE/8lxmi9E9hVJO4oaCvGAZ/docuIuT9i52Yv+DL4EL67IG+C7BOwscgWQUcwNiJrn2Bn"
+    "eCNjesjuk916j+BPq6ZC1oO8DvYE/O3o7yef5XxPvmoZWgz8M2IMRtYP+z8QI4zsBcXT3aCzwrwu"
+    "Y2XAzs9EZB9iFw8/FH+b0NvMfCXzPrrrk+xuPKz6YQwFX4mfrYzixLjI/HX0HkSWCj0fb+c6BR+v"
+    "IP8G2znIaqN/P75S9a3M16J3XnmqJ4za2/wIsmRkX8Tsfv7X++q3s1gNOgn95fhcAf9QzPb4I/VQ"
+    "6FZQHUGzyGEZsjro/plxH99ZK9H4Z9HdhP0M5Dcx7sImDnkH+M/hI8qLeT38lmCsB2+OzyrkXQ36"
+    "F0YH9Cao58LPIcYpv70pccQYHbY3qabOKLaVkTVVvQettjojb4v/KYw5fPNQ3eu6c9Fpp15OuSTY"
+    "G1YR/Rohu/M+Ru8i69Ub7A5kCWCT0F8asXooRn6locvRe5SYW/VWQFczf1p3C7a3YrsafmLMamR1"
+    "2M7AHuKX0puie1l3kM5myOq2I7qPMw6jNxI6jfFUwPqTMT6756f77KxeYOQkWD/UGh8++Lrk0Ehv"
+    "OVhpfF/CbkPIdJpAnwQ7hr9BQTsHv8KuVMDujDRkfwLbFbXvVq+T77PzXh98L/PG0LeZJzKWh6zO"
+    "1N/cgl5NYtSCPxOz++MM87l+u9OfwecGsK34nYXdOfjPonYHHmTkY3Mz+Hrwm4hxNGz9VCZYA+WE"
+    "/yH4Loe/qczf0+Dbvgra/aDeZR42RxOs3xyongFsFHavRmw91JfJ71zyeQ7aJmA1OgX+cLy9s90T"
+    "LfcQsre0bqojsDuT7Ps3kHOy6k59jH5TMIarxwALEGuE387UdMbxRDtjd8N30Dkj1jT0b0R/P/Rm"
+    "5c+YAh7U7wlsL5DHOvX5OguM1sRZBZ3g/oZKIsbOiO3JQ2G7Y/Sm6Y0dx/xLfJ0j7234WRu2O3WM"
+    "eiNsIsQ4jLwv8sHYTYtYD6K+TWv7KvhMnVXiZSB/A35S2N6n/ugddn+rbGO8Bl9f9Z1o71QA/pjf"
+    "+vKp0Fl6l5EVU334rB/Zqr0jVh6yLtAoMRu653sAdukx68PO6H8F4FOwv5E4590+f53WH9uj6LRW"
+    "DxW29+qS3/qJJuSwAHm8zrBqBr1VyP8O/gDYvTqjykm/PRU/Zveqzub7EXvH5+mdRicT39Go9TSV"
+    "ItZT9EJWCqwY8ru0z/pfAfJDYes3dMfdodrXG8B8M7ovE/c4/ptjf9xv66deYBc5lPFZ3VdDd7zu"
+    "2bDtje65DX7reUugk5No51a5+9FJxuZdxu16f2PWQyaDr0K/TtTqWedlk/pcnYWYxYvD9071A3rL"
+    "0N0btd9JPsXSGxxv98gWrQV7+io2q7XPYEWIcRSfmfp9DV2cYLWkHmoU+b+m3zbg6YwMsA4Bsyup"
+    "3zr4v1N3NnhGkp13/a7qg+9y+HhRdazenBi93fd7EPSg22/rbtabddp9//3gLdHfFrb+NRm+rOzR"
+    "raC+AL1FOpfEuRWffaH/4JvrIvvRZ78RGuO/BfpH1Fcjex06RX0jvrvpNx0yn89qZ27UfOq30hn1"
+    "DqzT70J2fzvk8DB8js4cNs10pvH9ATYj4HeH7HfvJWzmqHd030/1z/vBhiCrh5+7mKeyNof0LmLb"
+    "FtqG+PuhD6PTA/5R6Gz9lohaP6WeuVHE3tu2+J7MfBq0SMx6m+9094Atgk5lTCafL/Q72GdvsX4D"
+    "P0c+T0FPgP8TUEsDBC0AAAAIAAAAIQBDP9S+//////////8OABQAaGVtb2dsb2Jpbi5ucHkBABAA"
+    "GDAAAAAAAABSCgAAAAAAAO1aa4yeRRVeE1GzMWIaIi7BupG6723eeeezVuqFMLYpSFwMxTshyGK7"
+    "NkrauqXVFNA1hEQ0BggaXWs0eEHihaBrDCFIKhACuho1mIYgUSRgSEWLWo0mGr/3m3nO6Xm+5Y//"
+    "iLt/pu/czu05z5yZrze97Z3nX/De500cmLiy2LFz3/sXijdMF2+a31y46WJ+z8IVC3O737dnYcfO"
+    "vv+cucv37Rz279s1t3fn8LscbHrNRle56aun/9e/yS8u9X9tnBj9+fizleHfbIipv0ztVMjjTRpf"
+    "KXNbx/nRXxs3jv5c/u7yeJFbn9e38Y/b71h/7bdD7u/y/IHIfcfj3zh03++87HPx9fccL38T0v7L"
+    "WZ+lOstr87fPrYvXHu0FtPHre8+aPPI1F/9eDnfYX8d7jw//sQXjPn64H94bZN7o86yQ57WxF3vx"
+    "9S4OJx/dvtnHC/t//NLHtzx28JTbzsX+bV7n46j5VBtvO7ef0ImctE9I+9yR7T/axf889NGnZp7J"
+    "+m0KqT3ush0z2T8bsh9cfGW//Mul+DO1M0nOSU3S5wwXq36bW9t4Sq/IZ5u8voi9epPvhr5ttsPn"
+    "eT77Kcdxucv2NjluM7ntxJ/JriLbW8bRdnO5/+RW4pvi18Qre0H/6sTfIz1LyPO5P+T58Bv07ZJf"
+    "Hoaf2qxHl/fNdjwUsh5V3ifHw/scx4y3J9vcdsmuwyG+9D2v/8EDLwvxlkP3Td/+ly5+4nNbP335"
+    "B2ZS+4cc30ngrc375/UTQeRsPf3o7193Wohf2L3umsOTXvyB+Ude++fN217ocr+T/o/c/ZXTukd9"
+    "itOpIT54oO+YiYMXfef0izaU8faFXTc+fRdwX8Ytlz7xi1cdauMj//zYB++6wsW//XsIqPkm6+Hi"
+    "sW/e/9Yzz6vi/pte/vx3vQTyfNYrxE2X3Hnei7cAR63k9zk//OtwJ5fxEpKcR4CrTvZP/gtp/mbE"
+    "wcVbh2Kv+7GPfRpPH3PxS0N3LuyaiVNDLdrvK35TntfiP+AcPHTj01edvWl9G/cNzb7q4z5ec/gn"
+    "N287UMdTH/75P95+RhsvGwWsiiN1n6pjP+3s/S72w4+/uoq/HqbX4IEQ+1kH7vbx0Q0vGIYyxD8N"
+    "t73kYCs4++q2fods56E6vuKiHW/87cmKr5Ffb1Fcwi8/vXm4cIhL5NsFn/n87nVbs392B/FPytvM"
+    "Z/fjO+fz+pxn20PWt8v84+OZ17350iduQFzrxBsfAu/4ZP8n67iud8xJymMjf1RVxomPo/B/t0z7"
+    "PAkermX+1UN33PlglfjwWJ146XtO7AU/GZ78UcbnnlLyKsmrs12txHXULHrhH+wLHH/rmV+df9kN"
+    "Kg88nvwLfV3Cz4VBvnE+4XuU94/Vwts8nvg+y10Gzuqk1xE9VxKfKQ7N/nNN5nGX4nSP+nEU/3t9"
+    "xoOuB18mOU78xHiHnNRfp3w62AneEH/kYdJD/ZFw0z3nz5O1PLR5uMaDazy4xoP/fzy4dg9bu4c9"
+    "l+9hwAdwC5ykFv6AXYXMN36dHeR+rC/kPEnf2iI+aX1D+wH/lfBd+gbvBMFtaou874DaIHmCeyD0"
+    "TPuUYhfkpe9K8jh9e9kPvId8TuOB8qmRuIM34cfUPxC+hB1pv/AsPIDzoBA58B/0hN3gFfgN/JHG"
+    "cf8tRS/LW078BF6Cf9O6iuRWMo64My+h38RxdiB+ht6j4UXEifhtpSU/OqkT4CfECevSeCV6WBwO"
+    "RA/gHOuAL9gL3EEv2IE4IM52fkv830o+2Dbjfmog+LM4quS8gB/BD2l9SedHQXkCP5aCN+QbcGj9"
+    "XojeNi8wP8g6E7cJL/bYPKnFH3Y/L/YiTnZf4L0VP8A+tFg3apaD2Le6Xo6+W7JT85Nxgu+03ol9"
+    "1s+t4NnKwXdD+VFRfheCA+wHeeCXFCetJ8ATsMP6tSQ+aclOxcvq9Uoh8o2/lgrJG4vXWlrL24Xg"
+    "1Z4PGNf3OMsTTvaz/uvEH/AvcIU4mXw/IZ8tjjlvS+E9m+cV4dkLLuy5UwsfWX9ofGy+tsQ7jY3/"
+    "YrDxxT5LwNtAxg0fLAfRx/qhEnxb/AwIl52Nl/Cu4tKebxXlQyfjwBfsSfMKK0f41wluMI4487lt"
+    "zyONl7Vfed+slzqjlPmr1+W1jAMn2C99Yx69xy7yOVPIentOaj7auryRfREnG49G+AJ+57xObSfr"
+    "IRc4Qzzt/QL6eeIxrbeAX8hbnU8GpF9L8QBuS7Knk7hDLvyBecA19AP/2v7xehR5iTxHa/O4pvz0"
+    "FF8vchBXW0fW4neLXy+4sus94VXPPeDRxgnxDxQfve9BvvVXIfMsbh3t31CeKj8jrtAv9ReEN/Rz"
+    "feDIbmfz9QT94C9bV9XExyXFn+uhgtZVIh/95ryVursjnHCdrLxseTUIb9u8riiPWc9W9EBewm/W"
+    "Hy3hW8856JnG9T7F/rP4cDIPuLb1Z2HtWmK86L0v7U91AerkKcWLrSvcWD6l/kpayx+KQ4v/QPnG"
+    "9a3GG/62/myktbgPZB/XubQO9ov/AuVxI7jAfOBjNG1Z7TB6yLkTKG6Iq/oFfkKc7Tla0vxC8onx"
+    "aOeVlE+cbxX5saR8aymfajr/9L5t7jlyPnjymyM/tMSzHelP65YDnW+t+Ad6Wn/pe52VU0lckYfo"
+    "X1XuRn0XXJ139B3O4GCipnzrRG/gxOYp30eaMV4ATux8vfcj7iY+J9ybrf0FrVec2/uBvmNa+3V/"
+    "xDXZpfd9e+9VvIEHmT/t+0Uncvm84fuH9Ru9405x/VgQn/G7UCC7EN9S5Nk81ncG61/dD/639whP"
+    "flV9gCfgl/2S1nMdVY/lI3AM+cA3cAS8ID9s3T9eN1u5qoc9P5+tXqpIjv5OhHnWv8TnU1zXcF43"
+    "xC8F6VuQn2vBBcYtnmp7H12hezv8uah1Bb+TIZ72PCztugl9l1n1vW1R7+lWT3435PtBGMvD1d9t"
+    "+L3I07fe/zBu34O0Doa9aNO43t/BY4w3q4+3eJI6BLhsLb4XByLH3hsC5QvyqhA9EG/wtvUf9NZz"
+    "wc5TfkrfNeWrJ3zzvVjlw7+Qh7ggjvAz1mO+OZdm9d0YfGjvZyXFTesjxMvqy/dOxV1qS+IxzhPK"
+    "82UdT/uBtzrrv1nFPeQi3wz+5B3BSb4gz5BX9nzBfppf9r2Ozs0VPWcsr/J9SOsz42foN6XxsfxE"
+    "9k7w7yf6+0Ua598fujE9YZ+9fzZj7ySw19T7S/rOa/MH8/V3TFtXKX/bc5jPrZr8zzym9zjzHnPC"
+    "/cjaob+/Ih8sD+j7t8WbyrH2ONqH/cbvbk7iCz9BDvgDeW/t8aSHp3jre6LNI81fyydcX1Vkh57P"
+    "tq7jOFK9KPL5XZXro4r0rMby3uIXvFNY/85qfZ/GA+nnLJ43loQ34ot5ro/09wmLS2fzdEX3Rb6C"
+    "55JfKa9PeHcBD1g99PeDtI+em9AH/cAj8y78D31YHs4L+Mniie8ffF/S+zvX9Rb34/8vwp7bmre2"
+    "HuT3Tn5PbiW/+V4K+4FbgzOpC2riIa3fgFfkoz2nOsJJHf8LUEsDBC0AAAAIAAAAIQAHb/it////"
+    "//////8NABQAanNvbl9maWxlLm5weQEAEAC4AAAAAAAAAF4AAAAAAAAAm+wX6hsQychQxlCtnpJa"
+    "nFykbqWgbhNqaKKuo6Cell9UUpSYF59flJIKknBLzClOBYoXZyQWpAL5Gpo6CrUKlACuZAYGhkQg"
+    "LgbiVCCOB+IkNDE9IM6C8vOBOA+IAVBLAwQtAAAACAAAACEAyWW/+v//////////DwAUAGpzb25f"
+    "c2hhMjU2Lm5weQEAEACAAQAAAAAAAKUAAAAAAAAApY4xDgIhEEWx9RR0aLKFK4i7xtpOY7OFlRkW"
+    "NhbG3YCxMZ7CCzsknxNI8jLD/8xnvqfueL7MxEu8lQ+pj2on1b6zRlVSDWN8Rnpcx+hDNg50T4H1"
+    "dKMp8H2xrORH/nPmJIRomJ4xTM0EZoCeq2bWjEVdgewRtDy3RU7uN4xDb5HV4I2GV3TPtMgqGiHD"
+    "wPPYq+zh0GtkllyCZzDjsUP522HvGvwAUEsBAi0DLQAAAAgAAAAhAOzYZBZTDgAA4L4AAAsAAAAA"
+    "AAAAAAAAAIABAAAAAGNhc2VfaWQubnB5UEsBAi0DLQAAAAgAAAAhACQfvdRYBAAAvVkAAAwAAAAA"
+    "AAAAAAAAAIABkA4AAHN5bXB0b21zLm5weVBLAQItAy0AAAAIAAAAIQDzvmW+NAEAAKgFAAARAAAA"
+    "AAAAAAAAAACAASYTAABzeW1wdG9tX25hbWVzLm5weVBLAQItAy0AAAAIAAAAIQBbogTpbwAAANgA"
+    "AAAUAAAAAAAAAAAAAACAAZ0UAABkaWFnbm9zaXNfbGFiZWxzLm5weVBLAQItAy0AAAAIAAAAIQAd"
+    "aG1ZawEAAHMGAAATAAAAAAAAAAAAAACAAVIVAABkaWFnbm9zaXNfY29kZXMubnB5UEsBAi0DLQAA"
+    "AAgAAAAhAMWB0OVqAAAA1AAAABMAAAAAAAAAAAAAAIABAhcAAHNldmVyaXR5X2xhYmVscy5ucHlQ"
+    "SwECLQMtAAAACAAAACEAQZMkO28BAABzBgAAEgAAAAAAAAAAAAAAgAGxFwAAc2V2ZXJpdHlfY29k"
+    "ZXMubnB5UEsBAi0DLQAAAAgAAAAhAF73qI9UAAAAsAAAABEAAAAAAAAAAAAAAIABZBkAAGdlbmRl"
+    "cl9sYWJlbHMubnB5UEsBAi0DLQAAAAgAAAAhAH0cxoqBAQAAcwYAABAAAAAAAAAAAAAAAIAB+xkA"
+    "AGdlbmRlcl9jb2Rlcy5ucHlQSwECLQMtAAAACAAAACEAdkS29ncHAABMGAAABwAAAAAAAAAAAAAA"
+    "gAG+GwAAYWdlLm5weVBLAQItAy0AAAAIAAAAIQC3FsxgcA8AAEwYAAAMAAAAAAAAAAAAAACAAW4j"
+    "AABwbGF0ZWxldC5ucHlQSwECLQMtAAAACAAAACEAjx+M/vENAAAYMAAADgAAAAAAAAAAAAAAgAEc"
+    "MwAAaGVtYXRva3JpdC5ucHlQSwECLQMtAAAACAAAACEAFvSdk1QLAABMGAAABwAAAAAAAAAAAAAA"
+    "gAFNQQAAd2JjLm5weVBLAQItAy0AAAAIAAAAIQBDP9S+UgoAABgwAAAOAAAAAAAAAAAAAACAAdpM"
+    "AABoZW1vZ2xvYmluLm5weVBLAQItAy0AAAAIAAAAIQAHb/itXgAAALgAAAANAAAAAAAAAAAAAACA"
+    "AWxXAABqc29uX2ZpbGUubnB5UEsBAi0DLQAAAAgAAAAhAMllv/qlAAAAgAEAAA8AAAAAAAAAAAAA"
+    "AIABCVgAAGpzb25fc2hhMjU2Lm5weVBLBQYAAAAAEAAQAMcDAADvWAAAAAA="
+)
+
+def get_case_columns():
+    """Return embedded case base sebagai dict kolom (array bertipe)"""
+    with np.load(io.BytesIO(base64.b64decode(_DATA))) as data:
+        columns = {name: data[name] for name in data.files}
+    columns.pop('json_file', None)
+    columns.pop('json_sha256', None)
+    for col in _LABEL_COLUMNS:
+        codes = columns.pop(f'{col}_codes')
+        columns[col] = columns.pop(f'{col}_labels')[codes]
+    return columns
+
 def get_case_base():
     """Return embedded case base"""
-    cases = [
-        {'case_id': 'CSV_0001', 'diagnosis': 'DBD_POSITIF', 'age': 21, 'gender': 'male', 'platelet': 112000, 'hematokrit': 48.0, 'wbc': 5100, 'hemoglobin': 14.8, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0002', 'diagnosis': 'DBD_POSITIF', 'age': 30, 'gender': 'male', 'platelet': 96000, 'hematokrit': 49.8, 'wbc': 4500, 'hemoglobin': 15.0, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0003', 'diagnosis': 'BUKAN_DBD', 'age': 51, 'gender': 'male', 'platelet': 184000, 'hematokrit': 50.1, 'wbc': 6000, 'hemoglobin': 16.3, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0004', 'diagnosis': 'BUKAN_DBD', 'age': 26, 'gender': 'female', 'platelet': 167000, 'hematokrit': 44.0, 'wbc': 5000, 'hemoglobin': 12.3, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0005', 'diagnosis': 'BUKAN_DBD', 'age': 35, 'gender': 'male', 'platelet': 155000, 'hematokrit': 50.53, 'wbc': 4600, 'hemoglobin': 16.1, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0006', 'diagnosis': 'DBD_POSITIF', 'age': 67, 'gender': 'male', 'platelet': 84000, 'hematokrit': 47.0, 'wbc': 4100, 'hemoglobin': 13.5, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0007', 'diagnosis': 'DBD_POSITIF', 'age': 45, 'gender': 'female', 'platelet': 92000, 'hematokrit': 39.0, 'wbc': 4700, 'hemoglobin': 12.4, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0008', 'diagnosis': 'DBD_POSITIF', 'age': 34, 'gender': 'female', 'platelet': 90000, 'hematokrit': 40.2, 'wbc': 4200, 'hemoglobin': 13.4, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0009', 'diagnosis': 'BUKAN_DBD', 'age': 56, 'gender': 'female', 'platelet': 177000, 'hematokrit': 44.5, 'wbc': 5500, 'hemoglobin': 14.7, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0010', 'diagnosis': 'BUKAN_DBD', 'age': 26, 'gender': 'female', 'platelet': 220000, 'hematokrit': 45.0, 'wbc': 6000, 'hemoglobin': 14.1, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0011', 'diagnosis': 'BUKAN_DBD', 'age': 55, 'gender': 'male', 'platelet': 230000, 'hematokrit': 49.0, 'wbc': 5000, 'hemoglobin': 15.7, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0012', 'diagnosis': 'DBD_POSITIF', 'age': 40, 'gender': 'female', 'platelet': 80000, 'hematokrit': 38.64, 'wbc': 4050, 'hemoglobin': 11.9, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0013', 'diagnosis': 'BUKAN_DBD', 'age': 23, 'gender': 'female', 'platelet': 160000, 'hematokrit': 44.5, 'wbc': 5300, 'hemoglobin': 15.4, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0014', 'diagnosis': 'BUKAN_DBD', 'age': 47, 'gender': 'male', 'platelet': 159000, 'hematokrit': 41.06, 'wbc': 4800, 'hemoglobin': 14.5, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0015', 'diagnosis': 'BUKAN_DBD', 'age': 33, 'gender': 'male', 'platelet': 170000, 'hematokrit': 51.15, 'wbc': 5400, 'hemoglobin': 16.67, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0016', 'diagnosis': 'BUKAN_DBD', 'age': 37, 'gender': 'male', 'platelet': 160000, 'hematokrit': 49.5, 'wbc': 5700, 'hemoglobin': 15.9, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0017', 'diagnosis': 'DBD_POSITIF', 'age': 46, 'gender': 'male', 'platelet': 132000, 'hematokrit': 46.17, 'wbc': 4400, 'hemoglobin': 17.4, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0018', 'diagnosis': 'DBD_POSITIF', 'age': 29, 'gender': 'male', 'platelet': 120000, 'hematokrit': 45.55, 'wbc': 4500, 'hemoglobin': 16.3, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0019', 'diagnosis': 'BUKAN_DBD', 'age': 28, 'gender': 'male', 'platelet': 164000, 'hematokrit': 47.7, 'wbc': 6500, 'hemoglobin': 15.439, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0020', 'diagnosis': 'BUKAN_DBD', 'age': 31, 'gender': 'male', 'platelet': 187000, 'hematokrit': 49.62, 'wbc': 5000, 'hemoglobin': 15.7, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0021', 'diagnosis': 'BUKAN_DBD', 'age': 49, 'gender': 'male', 'platelet': 171000, 'hematokrit': 45.67, 'wbc': 7000, 'hemoglobin': 16.86, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0022', 'diagnosis': 'DBD_POSITIF', 'age': 36, 'gender': 'female', 'platelet': 132000, 'hematokrit': 40.12, 'wbc': 4400, 'hemoglobin': 12.35, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0023', 'diagnosis': 'DBD_POSITIF', 'age': 54, 'gender': 'male', 'platelet': 120000, 'hematokrit': 45.5, 'wbc': 4100, 'hemoglobin': 13.3, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0024', 'diagnosis': 'DBD_POSITIF', 'age': 61, 'gender': 'male', 'platelet': 142000, 'hematokrit': 44.4, 'wbc': 4600, 'hemoglobin': 14.6, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0025', 'diagnosis': 'BUKAN_DBD', 'age': 26, 'gender': 'male', 'platelet': 194000, 'hematokrit': 48.5, 'wbc': 5700, 'hemoglobin': 15.3, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0026', 'diagnosis': 'DBD_POSITIF', 'age': 22, 'gender': 'male', 'platelet': 83000, 'hematokrit': 44.6, 'wbc': 4300, 'hemoglobin': 14.3, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0027', 'diagnosis': 'DBD_POSITIF', 'age': 19, 'gender': 'male', 'platelet': 95000, 'hematokrit': 43.4, 'wbc': 4700, 'hemoglobin': 14.76, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0028', 'diagnosis': 'DBD_POSITIF', 'age': 32, 'gender': 'male', 'platelet': 91000, 'hematokrit': 44.5, 'wbc': 4200, 'hemoglobin': 14.32, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0029', 'diagnosis': 'DBD_POSITIF', 'age': 19, 'gender': 'female', 'platelet': 88000, 'hematokrit': 41.33, 'wbc': 4500, 'hemoglobin': 13.23, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0030', 'diagnosis': 'DBD_POSITIF', 'age': 35, 'gender': 'female', 'platelet': 111000, 'hematokrit': 43.56, 'wbc': 4700, 'hemoglobin': 14.13, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0031', 'diagnosis': 'DBD_POSITIF', 'age': 23, 'gender': 'male', 'platelet': 144000, 'hematokrit': 45.15, 'wbc': 4900, 'hemoglobin': 15.26, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0032', 'diagnosis': 'BUKAN_DBD', 'age': 19, 'gender': 'male', 'platelet': 174000, 'hematokrit': 50.38, 'wbc': 7000, 'hemoglobin': 16.44, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0033', 'diagnosis': 'DBD_POSITIF', 'age': 45, 'gender': 'female', 'platelet': 105000, 'hematokrit': 46.75, 'wbc': 4200, 'hemoglobin': 14.32, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0034', 'diagnosis': 'BUKAN_DBD', 'age': 19, 'gender': 'male', 'platelet': 160000, 'hematokrit': 48.95, 'wbc': 6500, 'hemoglobin': 16.24, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0035', 'diagnosis': 'DBD_POSITIF', 'age': 20, 'gender': 'male', 'platelet': 91000, 'hematokrit': 47.22, 'wbc': 5500, 'hemoglobin': 14.63, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0036', 'diagnosis': 'DBD_POSITIF', 'age': 20, 'gender': 'male', 'platelet': 141000, 'hematokrit': 49.15, 'wbc': 4700, 'hemoglobin': 14.28, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0037', 'diagnosis': 'DBD_POSITIF', 'age': 21, 'gender': 'male', 'platelet': 90000, 'hematokrit': 46.44, 'wbc': 4600, 'hemoglobin': 15.11, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0038', 'diagnosis': 'BUKAN_DBD', 'age': 28, 'gender': 'male', 'platelet': 182000, 'hematokrit': 48.63, 'wbc': 7500, 'hemoglobin': 15.41, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0039', 'diagnosis': 'DBD_POSITIF', 'age': 30, 'gender': 'male', 'platelet': 130000, 'hematokrit': 45.38, 'wbc': 4400, 'hemoglobin': 14.64, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0040', 'diagnosis': 'DBD_POSITIF', 'age': 70, 'gender': 'male', 'platelet': 144000, 'hematokrit': 46.36, 'wbc': 5000, 'hemoglobin': 14.82, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0041', 'diagnosis': 'DBD_POSITIF', 'age': 40, 'gender': 'female', 'platelet': 82000, 'hematokrit': 44.61, 'wbc': 5500, 'hemoglobin': 15.12, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0042', 'diagnosis': 'DBD_POSITIF', 'age': 35, 'gender': 'female', 'platelet': 99000, 'hematokrit': 46.28, 'wbc': 4900, 'hemoglobin': 14.77, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0043', 'diagnosis': 'BUKAN_DBD', 'age': 30, 'gender': 'male', 'platelet': 192000, 'hematokrit': 48.73, 'wbc': 6700, 'hemoglobin': 15.84, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0044', 'diagnosis': 'BUKAN_DBD', 'age': 24, 'gender': 'male', 'platelet': 186000, 'hematokrit': 49.93, 'wbc': 6300, 'hemoglobin': 15.26, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0045', 'diagnosis': 'BUKAN_DBD', 'age': 21, 'gender': 'male', 'platelet': 171000, 'hematokrit': 48.54, 'wbc': 7100, 'hemoglobin': 16.56, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0046', 'diagnosis': 'DBD_POSITIF', 'age': 29, 'gender': 'male', 'platelet': 72000, 'hematokrit': 43.67, 'wbc': 4000, 'hemoglobin': 14.86, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0047', 'diagnosis': 'BUKAN_DBD', 'age': 55, 'gender': 'male', 'platelet': 162000, 'hematokrit': 49.38, 'wbc': 6300, 'hemoglobin': 15.96, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0048', 'diagnosis': 'DBD_POSITIF', 'age': 45, 'gender': 'male', 'platelet': 88000, 'hematokrit': 45.62, 'wbc': 5000, 'hemoglobin': 14.471, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0049', 'diagnosis': 'BUKAN_DBD', 'age': 30, 'gender': 'female', 'platelet': 191000, 'hematokrit': 48.41, 'wbc': 6600, 'hemoglobin': 16.21, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0050', 'diagnosis': 'DBD_POSITIF', 'age': 53, 'gender': 'male', 'platelet': 79000, 'hematokrit': 43.44, 'wbc': 4500, 'hemoglobin': 14.48, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0051', 'diagnosis': 'BUKAN_DBD', 'age': 45, 'gender': 'female', 'platelet': 246000, 'hematokrit': 39.1, 'wbc': 6000, 'hemoglobin': 11.3, 'demam_tinggi': 0, 'sakit_kepala': 1, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0052', 'diagnosis': 'BUKAN_DBD', 'age': 5, 'gender': 'male', 'platelet': 170000, 'hematokrit': 36.3, 'wbc': 14900, 'hemoglobin': 10.4, 'demam_tinggi': 0, 'sakit_kepala': 1, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0053', 'diagnosis': 'DBD_POSITIF', 'age': 35, 'gender': 'male', 'platelet': 70000, 'hematokrit': 43.71, 'wbc': 4200, 'hemoglobin': 14.2, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0054', 'diagnosis': 'DBD_POSITIF', 'age': 29, 'gender': 'female', 'platelet': 84000, 'hematokrit': 45.42, 'wbc': 4500, 'hemoglobin': 12.31, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0055', 'diagnosis': 'BUKAN_DBD', 'age': 22, 'gender': 'female', 'platelet': 194000, 'hematokrit': 49.09, 'wbc': 6500, 'hemoglobin': 15.4, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0056', 'diagnosis': 'DBD_POSITIF', 'age': 41, 'gender': 'female', 'platelet': 81500, 'hematokrit': 45.93, 'wbc': 4400, 'hemoglobin': 11.4, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0057', 'diagnosis': 'DBD_POSITIF', 'age': 23, 'gender': 'male', 'platelet': 123000, 'hematokrit': 46.07, 'wbc': 4100, 'hemoglobin': 13.51, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0058', 'diagnosis': 'DBD_POSITIF', 'age': 37, 'gender': 'male', 'platelet': 147000, 'hematokrit': 48.92, 'wbc': 4700, 'hemoglobin': 14.07, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0059', 'diagnosis': 'DBD_POSITIF', 'age': 59, 'gender': 'male', 'platelet': 113000, 'hematokrit': 47.28, 'wbc': 4300, 'hemoglobin': 14.83, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0060', 'diagnosis': 'DBD_POSITIF', 'age': 24, 'gender': 'male', 'platelet': 109000, 'hematokrit': 46.11, 'wbc': 4400, 'hemoglobin': 13.79, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0061', 'diagnosis': 'DBD_POSITIF', 'age': 47, 'gender': 'female', 'platelet': 72000, 'hematokrit': 44.09, 'wbc': 4600, 'hemoglobin': 11.7, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0062', 'diagnosis': 'DBD_POSITIF', 'age': 29, 'gender': 'male', 'platelet': 84000, 'hematokrit': 46.33, 'wbc': 4300, 'hemoglobin': 14.67, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0063', 'diagnosis': 'DBD_POSITIF', 'age': 34, 'gender': 'male', 'platelet': 89000, 'hematokrit': 46.83, 'wbc': 4100, 'hemoglobin': 14.62, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0064', 'diagnosis': 'DBD_POSITIF', 'age': 15, 'gender': 'male', 'platelet': 117000, 'hematokrit': 44.99, 'wbc': 4700, 'hemoglobin': 15.14, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0065', 'diagnosis': 'DBD_POSITIF', 'age': 61, 'gender': 'male', 'platelet': 127000, 'hematokrit': 45.04, 'wbc': 4500, 'hemoglobin': 15.29, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0066', 'diagnosis': 'DBD_POSITIF', 'age': 28, 'gender': 'male', 'platelet': 131000, 'hematokrit': 46.48, 'wbc': 4400, 'hemoglobin': 14.73, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0067', 'diagnosis': 'BUKAN_DBD', 'age': 39, 'gender': 'male', 'platelet': 240000, 'hematokrit': 50.0, 'wbc': 7000, 'hemoglobin': 15.85, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0068', 'diagnosis': 'DBD_POSITIF', 'age': 37, 'gender': 'male', 'platelet': 79000, 'hematokrit': 41.02, 'wbc': 4000, 'hemoglobin': 13.91, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0069', 'diagnosis': 'BUKAN_DBD', 'age': 11, 'gender': 'male', 'platelet': 161000, 'hematokrit': 40.0, 'wbc': 13500, 'hemoglobin': 11.0, 'demam_tinggi': 0, 'sakit_kepala': 1, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0070', 'diagnosis': 'BUKAN_DBD', 'age': 44, 'gender': 'female', 'platelet': 230000, 'hematokrit': 49.05, 'wbc': 8000, 'hemoglobin': 15.5, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0071', 'diagnosis': 'DBD_POSITIF', 'age': 29, 'gender': 'female', 'platelet': 78000, 'hematokrit': 45.09, 'wbc': 4000, 'hemoglobin': 13.23, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0072', 'diagnosis': 'DBD_POSITIF', 'age': 53, 'gender': 'female', 'platelet': 85000, 'hematokrit': 47.91, 'wbc': 4200, 'hemoglobin': 11.78, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0073', 'diagnosis': 'DBD_POSITIF', 'age': 35, 'gender': 'female', 'platelet': 82000, 'hematokrit': 43.76, 'wbc': 4500, 'hemoglobin': 12.34, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0074', 'diagnosis': 'DBD_POSITIF', 'age': 38, 'gender': 'female', 'platelet': 90000, 'hematokrit': 46.66, 'wbc': 4300, 'hemoglobin': 13.19, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0075', 'diagnosis': 'DBD_POSITIF', 'age': 23, 'gender': 'female', 'platelet': 129000, 'hematokrit': 45.13, 'wbc': 4500, 'hemoglobin': 14.53, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0076', 'diagnosis': 'BUKAN_DBD', 'age': 45, 'gender': 'female', 'platelet': 194000, 'hematokrit': 49.93, 'wbc': 7500, 'hemoglobin': 15.9, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0077', 'diagnosis': 'DBD_POSITIF', 'age': 30, 'gender': 'female', 'platelet': 100500, 'hematokrit': 44.02, 'wbc': 4000, 'hemoglobin': 13.93, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0078', 'diagnosis': 'DBD_POSITIF', 'age': 18, 'gender': 'male', 'platelet': 136000, 'hematokrit': 48.09, 'wbc': 5000, 'hemoglobin': 15.99, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0079', 'diagnosis': 'DBD_POSITIF', 'age': 26, 'gender': 'female', 'platelet': 90000, 'hematokrit': 41.0, 'wbc': 4300, 'hemoglobin': 14.32, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0080', 'diagnosis': 'DBD_POSITIF', 'age': 44, 'gender': 'male', 'platelet': 95000, 'hematokrit': 46.94, 'wbc': 4500, 'hemoglobin': 14.58, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0081', 'diagnosis': 'DBD_POSITIF', 'age': 32, 'gender': 'male', 'platelet': 146000, 'hematokrit': 47.36, 'wbc': 4800, 'hemoglobin': 15.35, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0082', 'diagnosis': 'DBD_POSITIF', 'age': 56, 'gender': 'male', 'platelet': 107000, 'hematokrit': 49.84, 'wbc': 5000, 'hemoglobin': 16.64, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0083', 'diagnosis': 'DBD_POSITIF', 'age': 62, 'gender': 'male', 'platelet': 78000, 'hematokrit': 44.82, 'wbc': 4800, 'hemoglobin': 15.43, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0084', 'diagnosis': 'DBD_POSITIF', 'age': 28, 'gender': 'female', 'platelet': 110000, 'hematokrit': 45.46, 'wbc': 5500, 'hemoglobin': 14.78, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0085', 'diagnosis': 'DBD_POSITIF', 'age': 59, 'gender': 'male', 'platelet': 125000, 'hematokrit': 46.87, 'wbc': 6500, 'hemoglobin': 15.62, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0086', 'diagnosis': 'BUKAN_DBD', 'age': 16, 'gender': 'male', 'platelet': 250000, 'hematokrit': 50.0, 'wbc': 8000, 'hemoglobin': 16.85, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0087', 'diagnosis': 'DBD_POSITIF', 'age': 24, 'gender': 'female', 'platelet': 119000, 'hematokrit': 44.0, 'wbc': 4900, 'hemoglobin': 14.98, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0088', 'diagnosis': 'DBD_POSITIF', 'age': 28, 'gender': 'male', 'platelet': 126000, 'hematokrit': 46.93, 'wbc': 5600, 'hemoglobin': 15.73, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0089', 'diagnosis': 'DBD_POSITIF', 'age': 33, 'gender': 'male', 'platelet': 131000, 'hematokrit': 46.08, 'wbc': 4750, 'hemoglobin': 15.49, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0090', 'diagnosis': 'DBD_POSITIF', 'age': 56, 'gender': 'male', 'platelet': 147000, 'hematokrit': 47.09, 'wbc': 6500, 'hemoglobin': 16.83, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0091', 'diagnosis': 'DBD_POSITIF', 'age': 20, 'gender': 'female', 'platelet': 81500, 'hematokrit': 46.77, 'wbc': 4500, 'hemoglobin': 12.69, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0092', 'diagnosis': 'BUKAN_DBD', 'age': 59, 'gender': 'female', 'platelet': 186000, 'hematokrit': 47.84, 'wbc': 8500, 'hemoglobin': 14.93, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0093', 'diagnosis': 'BUKAN_DBD', 'age': 32, 'gender': 'male', 'platelet': 251000, 'hematokrit': 46.91, 'wbc': 9000, 'hemoglobin': 15.09, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0094', 'diagnosis': 'DBD_POSITIF', 'age': 35, 'gender': 'male', 'platelet': 139000, 'hematokrit': 44.983, 'wbc': 6000, 'hemoglobin': 15.61, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0095', 'diagnosis': 'DBD_POSITIF', 'age': 56, 'gender': 'male', 'platelet': 98000, 'hematokrit': 45.0, 'wbc': 4500, 'hemoglobin': 14.95, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0096', 'diagnosis': 'BUKAN_DBD', 'age': 34, 'gender': 'male', 'platelet': 194000, 'hematokrit': 49.33, 'wbc': 9000, 'hemoglobin': 15.95, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0097', 'diagnosis': 'BUKAN_DBD', 'age': 38, 'gender': 'male', 'platelet': 228000, 'hematokrit': 45.621, 'wbc': 10000, 'hemoglobin': 16.75, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0098', 'diagnosis': 'BUKAN_DBD', 'age': 34, 'gender': 'female', 'platelet': 221000, 'hematokrit': 46.742, 'wbc': 9500, 'hemoglobin': 16.089, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0099', 'diagnosis': 'BUKAN_DBD', 'age': 39, 'gender': 'female', 'platelet': 195500, 'hematokrit': 48.045, 'wbc': 8000, 'hemoglobin': 15.974, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0100', 'diagnosis': 'DBD_POSITIF', 'age': 46, 'gender': 'male', 'platelet': 118000, 'hematokrit': 48.07, 'wbc': 6500, 'hemoglobin': 11.202, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0101', 'diagnosis': 'DBD_POSITIF', 'age': 31, 'gender': 'male', 'platelet': 130500, 'hematokrit': 46.03, 'wbc': 4600, 'hemoglobin': 15.452, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0102', 'diagnosis': 'DBD_POSITIF', 'age': 16, 'gender': 'male', 'platelet': 112000, 'hematokrit': 45.0, 'wbc': 4300, 'hemoglobin': 14.52, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0103', 'diagnosis': 'DBD_POSITIF', 'age': 24, 'gender': 'male', 'platelet': 128000, 'hematokrit': 45.0923, 'wbc': 4900, 'hemoglobin': 14.8, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0104', 'diagnosis': 'DBD_POSITIF', 'age': 38, 'gender': 'male', 'platelet': 131000, 'hematokrit': 47.0, 'wbc': 4400, 'hemoglobin': 15.93, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0105', 'diagnosis': 'BUKAN_DBD', 'age': 32, 'gender': 'female', 'platelet': 245000, 'hematokrit': 48.0, 'wbc': 7000, 'hemoglobin': 16.0, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0106', 'diagnosis': 'BUKAN_DBD', 'age': 20, 'gender': 'female', 'platelet': 227000, 'hematokrit': 43.0341, 'wbc': 6500, 'hemoglobin': 15.09, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0107', 'diagnosis': 'BUKAN_DBD', 'age': 45, 'gender': 'male', 'platelet': 189000, 'hematokrit': 49.0, 'wbc': 8000, 'hemoglobin': 16.1024, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0108', 'diagnosis': 'BUKAN_DBD', 'age': 29, 'gender': 'female', 'platelet': 200000, 'hematokrit': 46.95, 'wbc': 7000, 'hemoglobin': 15.021, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0109', 'diagnosis': 'BUKAN_DBD', 'age': 30, 'gender': 'female', 'platelet': 192000, 'hematokrit': 48.0, 'wbc': 5000, 'hemoglobin': 14.53, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0110', 'diagnosis': 'DBD_POSITIF', 'age': 28, 'gender': 'male', 'platelet': 100000, 'hematokrit': 46.81, 'wbc': 5000, 'hemoglobin': 15.93, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0111', 'diagnosis': 'DBD_POSITIF', 'age': 49, 'gender': 'female', 'platelet': 107000, 'hematokrit': 47.02, 'wbc': 4700, 'hemoglobin': 14.0142, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0112', 'diagnosis': 'DBD_POSITIF', 'age': 24, 'gender': 'male', 'platelet': 79000, 'hematokrit': 43.201, 'wbc': 4400, 'hemoglobin': 14.03, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0113', 'diagnosis': 'DBD_POSITIF', 'age': 39, 'gender': 'male', 'platelet': 90000, 'hematokrit': 45.09, 'wbc': 4800, 'hemoglobin': 15.93, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0114', 'diagnosis': 'BUKAN_DBD', 'age': 25, 'gender': 'female', 'platelet': 188500, 'hematokrit': 46.83, 'wbc': 6000, 'hemoglobin': 15.432, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0115', 'diagnosis': 'BUKAN_DBD', 'age': 30, 'gender': 'male', 'platelet': 234000, 'hematokrit': 47.731, 'wbc': 9000, 'hemoglobin': 16.09, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0116', 'diagnosis': 'BUKAN_DBD', 'age': 41, 'gender': 'female', 'platelet': 190000, 'hematokrit': 48.09, 'wbc': 6000, 'hemoglobin': 11.092, 'demam_tinggi': 0, 'sakit_kepala': 1, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0117', 'diagnosis': 'DBD_POSITIF', 'age': 39, 'gender': 'female', 'platelet': 81000, 'hematokrit': 46.0, 'wbc': 4500, 'hemoglobin': 12.071, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0118', 'diagnosis': 'DBD_POSITIF', 'age': 23, 'gender': 'male', 'platelet': 95000, 'hematokrit': 44.093, 'wbc': 6000, 'hemoglobin': 13.369, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0119', 'diagnosis': 'DBD_POSITIF', 'age': 58, 'gender': 'female', 'platelet': 107000, 'hematokrit': 47.0, 'wbc': 5500, 'hemoglobin': 12.1, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0120', 'diagnosis': 'DBD_POSITIF', 'age': 32, 'gender': 'female', 'platelet': 98000, 'hematokrit': 44.21, 'wbc': 4800, 'hemoglobin': 14.803, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0121', 'diagnosis': 'DBD_POSITIF', 'age': 19, 'gender': 'male', 'platelet': 87000, 'hematokrit': 43.01, 'wbc': 5400, 'hemoglobin': 14.228, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0122', 'diagnosis': 'DBD_POSITIF', 'age': 33, 'gender': 'male', 'platelet': 138000, 'hematokrit': 47.84, 'wbc': 4300, 'hemoglobin': 13.701, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0123', 'diagnosis': 'DBD_POSITIF', 'age': 29, 'gender': 'male', 'platelet': 140000, 'hematokrit': 48.0731, 'wbc': 4800, 'hemoglobin': 14.09, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0124', 'diagnosis': 'DBD_POSITIF', 'age': 25, 'gender': 'female', 'platelet': 123000, 'hematokrit': 49.0, 'wbc': 7000, 'hemoglobin': 12.643, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0125', 'diagnosis': 'DBD_POSITIF', 'age': 18, 'gender': 'male', 'platelet': 88000, 'hematokrit': 41.0, 'wbc': 5000, 'hemoglobin': 14.028, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0126', 'diagnosis': 'BUKAN_DBD', 'age': 30, 'gender': 'female', 'platelet': 170000, 'hematokrit': 48.0, 'wbc': 8500, 'hemoglobin': 15.03, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0127', 'diagnosis': 'BUKAN_DBD', 'age': 47, 'gender': 'male', 'platelet': 223000, 'hematokrit': 47.306, 'wbc': 4300, 'hemoglobin': 16.042, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0128', 'diagnosis': 'BUKAN_DBD', 'age': 31, 'gender': 'female', 'platelet': 281000, 'hematokrit': 45.09, 'wbc': 5000, 'hemoglobin': 15.129, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0129', 'diagnosis': 'DBD_POSITIF', 'age': 26, 'gender': 'male', 'platelet': 74000, 'hematokrit': 46.01, 'wbc': 7000, 'hemoglobin': 14.9, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0130', 'diagnosis': 'BUKAN_DBD', 'age': 19, 'gender': 'female', 'platelet': 198000, 'hematokrit': 47.932, 'wbc': 4900, 'hemoglobin': 13.5, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0131', 'diagnosis': 'DBD_POSITIF', 'age': 21, 'gender': 'male', 'platelet': 78000, 'hematokrit': 48.0, 'wbc': 4500, 'hemoglobin': 14.236, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0132', 'diagnosis': 'DBD_POSITIF', 'age': 34, 'gender': 'male', 'platelet': 133000, 'hematokrit': 46.03, 'wbc': 7000, 'hemoglobin': 16.34, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0133', 'diagnosis': 'DBD_POSITIF', 'age': 49, 'gender': 'female', 'platelet': 93000, 'hematokrit': 47.13, 'wbc': 5000, 'hemoglobin': 14.428, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0134', 'diagnosis': 'DBD_POSITIF', 'age': 30, 'gender': 'female', 'platelet': 120000, 'hematokrit': 43.0, 'wbc': 4500, 'hemoglobin': 15.83, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0135', 'diagnosis': 'DBD_POSITIF', 'age': 42, 'gender': 'female', 'platelet': 134000, 'hematokrit': 45.14, 'wbc': 6000, 'hemoglobin': 14.09, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0136', 'diagnosis': 'BUKAN_DBD', 'age': 19, 'gender': 'male', 'platelet': 229000, 'hematokrit': 49.32, 'wbc': 8000, 'hemoglobin': 16.9, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0137', 'diagnosis': 'DBD_POSITIF', 'age': 27, 'gender': 'male', 'platelet': 141000, 'hematokrit': 42.764, 'wbc': 5000, 'hemoglobin': 15.611, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0138', 'diagnosis': 'DBD_POSITIF', 'age': 40, 'gender': 'male', 'platelet': 105000, 'hematokrit': 44.289, 'wbc': 5500, 'hemoglobin': 14.49, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0139', 'diagnosis': 'DBD_POSITIF', 'age': 28, 'gender': 'male', 'platelet': 127000, 'hematokrit': 47.324, 'wbc': 6000, 'hemoglobin': 15.378, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0140', 'diagnosis': 'DBD_POSITIF', 'age': 23, 'gender': 'male', 'platelet': 141000, 'hematokrit': 48.0, 'wbc': 4000, 'hemoglobin': 14.469, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0141', 'diagnosis': 'DBD_POSITIF', 'age': 48, 'gender': 'female', 'platelet': 131000, 'hematokrit': 48.231, 'wbc': 6000, 'hemoglobin': 11.204, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0142', 'diagnosis': 'DBD_POSITIF', 'age': 35, 'gender': 'male', 'platelet': 109000, 'hematokrit': 46.219, 'wbc': 5500, 'hemoglobin': 12.348, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0143', 'diagnosis': 'DBD_POSITIF', 'age': 42, 'gender': 'male', 'platelet': 111000, 'hematokrit': 48.0, 'wbc': 4500, 'hemoglobin': 15.4, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0144', 'diagnosis': 'DBD_POSITIF', 'age': 34, 'gender': 'male', 'platelet': 89000, 'hematokrit': 49.227, 'wbc': 5000, 'hemoglobin': 13.439, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0145', 'diagnosis': 'BUKAN_DBD', 'age': 43, 'gender': 'female', 'platelet': 199000, 'hematokrit': 48.0, 'wbc': 7500, 'hemoglobin': 16.0, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0146', 'diagnosis': 'DBD_POSITIF', 'age': 21, 'gender': 'female', 'platelet': 81500, 'hematokrit': 46.0, 'wbc': 4000, 'hemoglobin': 14.2, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0147', 'diagnosis': 'DBD_POSITIF', 'age': 38, 'gender': 'female', 'platelet': 117000, 'hematokrit': 46.512, 'wbc': 5400, 'hemoglobin': 15.0, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0148', 'diagnosis': 'DBD_POSITIF', 'age': 50, 'gender': 'female', 'platelet': 138000, 'hematokrit': 42.09, 'wbc': 4500, 'hemoglobin': 14.559, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0149', 'diagnosis': 'DBD_POSITIF', 'age': 36, 'gender': 'male', 'platelet': 124000, 'hematokrit': 47.83, 'wbc': 6550, 'hemoglobin': 15.249, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0150', 'diagnosis': 'DBD_POSITIF', 'age': 44, 'gender': 'female', 'platelet': 132000, 'hematokrit': 44.3891, 'wbc': 5000, 'hemoglobin': 13.231, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0151', 'diagnosis': 'DBD_POSITIF', 'age': 29, 'gender': 'male', 'platelet': 140000, 'hematokrit': 47.43, 'wbc': 4500, 'hemoglobin': 14.569, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0152', 'diagnosis': 'DBD_POSITIF', 'age': 27, 'gender': 'female', 'platelet': 115000, 'hematokrit': 48.231, 'wbc': 5000, 'hemoglobin': 12.892, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0153', 'diagnosis': 'DBD_POSITIF', 'age': 31, 'gender': 'female', 'platelet': 102000, 'hematokrit': 45.703, 'wbc': 5500, 'hemoglobin': 13.456, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0154', 'diagnosis': 'DBD_POSITIF', 'age': 29, 'gender': 'female', 'platelet': 114000, 'hematokrit': 46.0, 'wbc': 4500, 'hemoglobin': 14.229, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0155', 'diagnosis': 'DBD_POSITIF', 'age': 20, 'gender': 'female', 'platelet': 145000, 'hematokrit': 47.0, 'wbc': 6000, 'hemoglobin': 12.574, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0156', 'diagnosis': 'BUKAN_DBD', 'age': 34, 'gender': 'male', 'platelet': 131000, 'hematokrit': 48.342, 'wbc': 6000, 'hemoglobin': 16.782, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0157', 'diagnosis': 'DBD_POSITIF', 'age': 29, 'gender': 'male', 'platelet': 93000, 'hematokrit': 49.0, 'wbc': 4000, 'hemoglobin': 15.372, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0158', 'diagnosis': 'DBD_POSITIF', 'age': 30, 'gender': 'male', 'platelet': 97000, 'hematokrit': 43.2, 'wbc': 4500, 'hemoglobin': 16.264, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0159', 'diagnosis': 'DBD_POSITIF', 'age': 35, 'gender': 'male', 'platelet': 114000, 'hematokrit': 47.94, 'wbc': 5000, 'hemoglobin': 14.739, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0160', 'diagnosis': 'DBD_POSITIF', 'age': 48, 'gender': 'male', 'platelet': 123000, 'hematokrit': 48.0, 'wbc': 6000, 'hemoglobin': 15.43, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0161', 'diagnosis': 'DBD_POSITIF', 'age': 31, 'gender': 'male', 'platelet': 145000, 'hematokrit': 44.323, 'wbc': 6500, 'hemoglobin': 16.832, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0162', 'diagnosis': 'DBD_POSITIF', 'age': 24, 'gender': 'female', 'platelet': 134000, 'hematokrit': 45.26, 'wbc': 5500, 'hemoglobin': 13.303, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0163', 'diagnosis': 'DBD_POSITIF', 'age': 27, 'gender': 'female', 'platelet': 141000, 'hematokrit': 46.73, 'wbc': 5000, 'hemoglobin': 14.531, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0164', 'diagnosis': 'BUKAN_DBD', 'age': 16, 'gender': 'male', 'platelet': 228000, 'hematokrit': 48.0, 'wbc': 5500, 'hemoglobin': 15.73, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0165', 'diagnosis': 'DBD_POSITIF', 'age': 23, 'gender': 'female', 'platelet': 93000, 'hematokrit': 45.74, 'wbc': 5000, 'hemoglobin': 16.652, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0166', 'diagnosis': 'BUKAN_DBD', 'age': 27, 'gender': 'female', 'platelet': 155000, 'hematokrit': 49.31, 'wbc': 6500, 'hemoglobin': 15.43, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0167', 'diagnosis': 'DBD_POSITIF', 'age': 29, 'gender': 'male', 'platelet': 129000, 'hematokrit': 45.0, 'wbc': 7000, 'hemoglobin': 16.34, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0168', 'diagnosis': 'DBD_POSITIF', 'age': 47, 'gender': 'female', 'platelet': 145000, 'hematokrit': 46.78, 'wbc': 6000, 'hemoglobin': 15.621, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0169', 'diagnosis': 'DBD_POSITIF', 'age': 53, 'gender': 'female', 'platelet': 129000, 'hematokrit': 47.3, 'wbc': 5500, 'hemoglobin': 14.83, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0170', 'diagnosis': 'BUKAN_DBD', 'age': 28, 'gender': 'male', 'platelet': 200000, 'hematokrit': 46.4, 'wbc': 8000, 'hemoglobin': 15.631, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0171', 'diagnosis': 'DBD_POSITIF', 'age': 31, 'gender': 'female', 'platelet': 144000, 'hematokrit': 45.0, 'wbc': 6000, 'hemoglobin': 16.43, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0172', 'diagnosis': 'DBD_POSITIF', 'age': 29, 'gender': 'male', 'platelet': 138000, 'hematokrit': 46.73, 'wbc': 4500, 'hemoglobin': 16.9, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0173', 'diagnosis': 'DBD_POSITIF', 'age': 44, 'gender': 'male', 'platelet': 123000, 'hematokrit': 47.28, 'wbc': 6700, 'hemoglobin': 15.31, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0174', 'diagnosis': 'BUKAN_DBD', 'age': 37, 'gender': 'male', 'platelet': 228000, 'hematokrit': 46.0, 'wbc': 5550, 'hemoglobin': 16.775, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0175', 'diagnosis': 'BUKAN_DBD', 'age': 40, 'gender': 'male', 'platelet': 231000, 'hematokrit': 47.0, 'wbc': 4500, 'hemoglobin': 14.31, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0176', 'diagnosis': 'BUKAN_DBD', 'age': 29, 'gender': 'male', 'platelet': 236000, 'hematokrit': 45.112, 'wbc': 5000, 'hemoglobin': 15.56, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0177', 'diagnosis': 'BUKAN_DBD', 'age': 34, 'gender': 'male', 'platelet': 193000, 'hematokrit': 46.81, 'wbc': 6500, 'hemoglobin': 16.32, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0178', 'diagnosis': 'BUKAN_DBD', 'age': 24, 'gender': 'female', 'platelet': 179000, 'hematokrit': 43.0, 'wbc': 5000, 'hemoglobin': 15.891, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0179', 'diagnosis': 'DBD_POSITIF', 'age': 21, 'gender': 'male', 'platelet': 78000, 'hematokrit': 48.56, 'wbc': 6500, 'hemoglobin': 15.13, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0180', 'diagnosis': 'DBD_POSITIF', 'age': 33, 'gender': 'female', 'platelet': 99000, 'hematokrit': 45.31, 'wbc': 5500, 'hemoglobin': 14.283, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0181', 'diagnosis': 'DBD_POSITIF', 'age': 21, 'gender': 'male', 'platelet': 100000, 'hematokrit': 46.67, 'wbc': 4000, 'hemoglobin': 13.201, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0182', 'diagnosis': 'DBD_POSITIF', 'age': 26, 'gender': 'male', 'platelet': 108000, 'hematokrit': 47.321, 'wbc': 5100, 'hemoglobin': 14.71, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0183', 'diagnosis': 'DBD_POSITIF', 'age': 57, 'gender': 'male', 'platelet': 79000, 'hematokrit': 48.0, 'wbc': 4200, 'hemoglobin': 15.32, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0184', 'diagnosis': 'DBD_POSITIF', 'age': 58, 'gender': 'female', 'platelet': 91000, 'hematokrit': 45.36, 'wbc': 4700, 'hemoglobin': 13.267, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0185', 'diagnosis': 'BUKAN_DBD', 'age': 21, 'gender': 'male', 'platelet': 198000, 'hematokrit': 46.13, 'wbc': 4300, 'hemoglobin': 16.022, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0186', 'diagnosis': 'BUKAN_DBD', 'age': 52, 'gender': 'female', 'platelet': 164000, 'hematokrit': 45.672, 'wbc': 5000, 'hemoglobin': 14.32, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0187', 'diagnosis': 'BUKAN_DBD', 'age': 34, 'gender': 'female', 'platelet': 171000, 'hematokrit': 48.0, 'wbc': 6500, 'hemoglobin': 12.581, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0188', 'diagnosis': 'BUKAN_DBD', 'age': 26, 'gender': 'female', 'platelet': 201000, 'hematokrit': 46.41, 'wbc': 8000, 'hemoglobin': 15.1, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0189', 'diagnosis': 'BUKAN_DBD', 'age': 39, 'gender': 'female', 'platelet': 199000, 'hematokrit': 44.82, 'wbc': 5600, 'hemoglobin': 12.338, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0190', 'diagnosis': 'DBD_POSITIF', 'age': 42, 'gender': 'male', 'platelet': 87000, 'hematokrit': 47.61, 'wbc': 4500, 'hemoglobin': 15.451, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0191', 'diagnosis': 'DBD_POSITIF', 'age': 35, 'gender': 'female', 'platelet': 91000, 'hematokrit': 45.673, 'wbc': 6500, 'hemoglobin': 13.0, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0192', 'diagnosis': 'DBD_POSITIF', 'age': 46, 'gender': 'male', 'platelet': 97500, 'hematokrit': 46.81, 'wbc': 4300, 'hemoglobin': 14.32, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0193', 'diagnosis': 'DBD_POSITIF', 'age': 18, 'gender': 'male', 'platelet': 100700, 'hematokrit': 47.0, 'wbc': 4100, 'hemoglobin': 12.894, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0194', 'diagnosis': 'BUKAN_DBD', 'age': 23, 'gender': 'male', 'platelet': 261000, 'hematokrit': 43.28, 'wbc': 7600, 'hemoglobin': 13.47, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0195', 'diagnosis': 'DBD_POSITIF', 'age': 49, 'gender': 'male', 'platelet': 80000, 'hematokrit': 44.03, 'wbc': 5400, 'hemoglobin': 14.346, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0196', 'diagnosis': 'DBD_POSITIF', 'age': 19, 'gender': 'male', 'platelet': 93000, 'hematokrit': 42.0, 'wbc': 4300, 'hemoglobin': 15.43, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0197', 'diagnosis': 'DBD_POSITIF', 'age': 16, 'gender': 'female', 'platelet': 117000, 'hematokrit': 44.31, 'wbc': 5000, 'hemoglobin': 16.21, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0198', 'diagnosis': 'DBD_POSITIF', 'age': 23, 'gender': 'female', 'platelet': 138000, 'hematokrit': 46.31, 'wbc': 5100, 'hemoglobin': 14.32, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0199', 'diagnosis': 'DBD_POSITIF', 'age': 39, 'gender': 'male', 'platelet': 102100, 'hematokrit': 41.96, 'wbc': 4800, 'hemoglobin': 16.74, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0200', 'diagnosis': 'BUKAN_DBD', 'age': 17, 'gender': 'female', 'platelet': 278000, 'hematokrit': 45.72, 'wbc': 4200, 'hemoglobin': 12.217, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0201', 'diagnosis': 'BUKAN_DBD', 'age': 28, 'gender': 'male', 'platelet': 196000, 'hematokrit': 47.0, 'wbc': 5300, 'hemoglobin': 15.61, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0202', 'diagnosis': 'BUKAN_DBD', 'age': 18, 'gender': 'male', 'platelet': 220000, 'hematokrit': 45.88, 'wbc': 6800, 'hemoglobin': 13.1, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0203', 'diagnosis': 'DBD_POSITIF', 'age': 25, 'gender': 'female', 'platelet': 98000, 'hematokrit': 43.0, 'wbc': 4500, 'hemoglobin': 14.56, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0204', 'diagnosis': 'BUKAN_DBD', 'age': 34, 'gender': 'female', 'platelet': 190000, 'hematokrit': 47.09, 'wbc': 5000, 'hemoglobin': 16.0, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0205', 'diagnosis': 'BUKAN_DBD', 'age': 29, 'gender': 'male', 'platelet': 265000, 'hematokrit': 46.71, 'wbc': 5500, 'hemoglobin': 15.25, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0206', 'diagnosis': 'BUKAN_DBD', 'age': 47, 'gender': 'male', 'platelet': 177000, 'hematokrit': 45.63, 'wbc': 8000, 'hemoglobin': 14.67, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0207', 'diagnosis': 'DBD_POSITIF', 'age': 24, 'gender': 'male', 'platelet': 81000, 'hematokrit': 46.32, 'wbc': 6500, 'hemoglobin': 15.43, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0208', 'diagnosis': 'BUKAN_DBD', 'age': 30, 'gender': 'female', 'platelet': 157000, 'hematokrit': 44.13, 'wbc': 5000, 'hemoglobin': 12.1, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0209', 'diagnosis': 'BUKAN_DBD', 'age': 22, 'gender': 'male', 'platelet': 177500, 'hematokrit': 46.28, 'wbc': 4600, 'hemoglobin': 14.282, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0210', 'diagnosis': 'BUKAN_DBD', 'age': 51, 'gender': 'male', 'platelet': 161000, 'hematokrit': 43.63, 'wbc': 7000, 'hemoglobin': 15.43, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0211', 'diagnosis': 'BUKAN_DBD', 'age': 19, 'gender': 'female', 'platelet': 155000, 'hematokrit': 47.0, 'wbc': 5100, 'hemoglobin': 14.3, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0212', 'diagnosis': 'BUKAN_DBD', 'age': 36, 'gender': 'female', 'platelet': 178000, 'hematokrit': 46.49, 'wbc': 7510, 'hemoglobin': 15.121, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0213', 'diagnosis': 'BUKAN_DBD', 'age': 20, 'gender': 'male', 'platelet': 161000, 'hematokrit': 45.33, 'wbc': 6100, 'hemoglobin': 14.0, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0214', 'diagnosis': 'DBD_POSITIF', 'age': 32, 'gender': 'female', 'platelet': 99500, 'hematokrit': 42.18, 'wbc': 4000, 'hemoglobin': 16.321, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0215', 'diagnosis': 'BUKAN_DBD', 'age': 28, 'gender': 'female', 'platelet': 205000, 'hematokrit': 48.0, 'wbc': 5000, 'hemoglobin': 14.0, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0216', 'diagnosis': 'BUKAN_DBD', 'age': 22, 'gender': 'female', 'platelet': 197000, 'hematokrit': 45.0, 'wbc': 6500, 'hemoglobin': 12.3, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0217', 'diagnosis': 'BUKAN_DBD', 'age': 39, 'gender': 'female', 'platelet': 164000, 'hematokrit': 46.03, 'wbc': 5700, 'hemoglobin': 14.0, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0218', 'diagnosis': 'DBD_POSITIF', 'age': 21, 'gender': 'male', 'platelet': 80000, 'hematokrit': 47.03, 'wbc': 4400, 'hemoglobin': 13.44, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0219', 'diagnosis': 'BUKAN_DBD', 'age': 44, 'gender': 'male', 'platelet': 170000, 'hematokrit': 48.1, 'wbc': 5400, 'hemoglobin': 14.28, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0220', 'diagnosis': 'BUKAN_DBD', 'age': 21, 'gender': 'female', 'platelet': 163000, 'hematokrit': 43.0, 'wbc': 4500, 'hemoglobin': 12.3, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0221', 'diagnosis': 'BUKAN_DBD', 'age': 53, 'gender': 'male', 'platelet': 183000, 'hematokrit': 46.0, 'wbc': 4800, 'hemoglobin': 14.0, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0222', 'diagnosis': 'BUKAN_DBD', 'age': 30, 'gender': 'female', 'platelet': 160000, 'hematokrit': 44.24, 'wbc': 5000, 'hemoglobin': 15.22, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0223', 'diagnosis': 'BUKAN_DBD', 'age': 28, 'gender': 'female', 'platelet': 187000, 'hematokrit': 45.63, 'wbc': 6500, 'hemoglobin': 14.35, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0224', 'diagnosis': 'DBD_POSITIF', 'age': 20, 'gender': 'male', 'platelet': 100000, 'hematokrit': 42.26, 'wbc': 6500, 'hemoglobin': 13.0, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0225', 'diagnosis': 'BUKAN_DBD', 'age': 39, 'gender': 'female', 'platelet': 159000, 'hematokrit': 46.31, 'wbc': 5500, 'hemoglobin': 12.42, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0226', 'diagnosis': 'BUKAN_DBD', 'age': 36, 'gender': 'female', 'platelet': 161500, 'hematokrit': 45.22, 'wbc': 4000, 'hemoglobin': 13.3, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0227', 'diagnosis': 'BUKAN_DBD', 'age': 34, 'gender': 'female', 'platelet': 171000, 'hematokrit': 46.0, 'wbc': 5500, 'hemoglobin': 14.34, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0228', 'diagnosis': 'DBD_POSITIF', 'age': 25, 'gender': 'female', 'platelet': 162000, 'hematokrit': 44.36, 'wbc': 4500, 'hemoglobin': 15.0, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0229', 'diagnosis': 'DBD_POSITIF', 'age': 28, 'gender': 'male', 'platelet': 78000, 'hematokrit': 47.76, 'wbc': 4100, 'hemoglobin': 14.0, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0230', 'diagnosis': 'BUKAN_DBD', 'age': 30, 'gender': 'female', 'platelet': 153000, 'hematokrit': 45.03, 'wbc': 4900, 'hemoglobin': 13.69, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0231', 'diagnosis': 'BUKAN_DBD', 'age': 25, 'gender': 'male', 'platelet': 178000, 'hematokrit': 46.44, 'wbc': 4800, 'hemoglobin': 14.36, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0232', 'diagnosis': 'BUKAN_DBD', 'age': 32, 'gender': 'female', 'platelet': 276000, 'hematokrit': 44.23, 'wbc': 7000, 'hemoglobin': 13.38, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0233', 'diagnosis': 'DBD_POSITIF', 'age': 38, 'gender': 'male', 'platelet': 141000, 'hematokrit': 45.62, 'wbc': 5600, 'hemoglobin': 14.32, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0234', 'diagnosis': 'BUKAN_DBD', 'age': 22, 'gender': 'female', 'platelet': 195000, 'hematokrit': 46.32, 'wbc': 6600, 'hemoglobin': 15.381, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0235', 'diagnosis': 'BUKAN_DBD', 'age': 39, 'gender': 'male', 'platelet': 184000, 'hematokrit': 43.08, 'wbc': 6000, 'hemoglobin': 14.33, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0236', 'diagnosis': 'DBD_POSITIF', 'age': 47, 'gender': 'male', 'platelet': 87000, 'hematokrit': 44.01, 'wbc': 4500, 'hemoglobin': 15.0, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0237', 'diagnosis': 'BUKAN_DBD', 'age': 50, 'gender': 'female', 'platelet': 196000, 'hematokrit': 46.12, 'wbc': 5500, 'hemoglobin': 13.23, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0238', 'diagnosis': 'BUKAN_DBD', 'age': 34, 'gender': 'female', 'platelet': 154000, 'hematokrit': 45.771, 'wbc': 4800, 'hemoglobin': 14.42, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0239', 'diagnosis': 'DBD_POSITIF', 'age': 20, 'gender': 'male', 'platelet': 84000, 'hematokrit': 46.31, 'wbc': 5700, 'hemoglobin': 13.1, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0240', 'diagnosis': 'DBD_POSITIF', 'age': 32, 'gender': 'female', 'platelet': 105000, 'hematokrit': 47.0, 'wbc': 4600, 'hemoglobin': 14.2, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0241', 'diagnosis': 'BUKAN_DBD', 'age': 24, 'gender': 'male', 'platelet': 176000, 'hematokrit': 45.38, 'wbc': 5400, 'hemoglobin': 15.0, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0242', 'diagnosis': 'BUKAN_DBD', 'age': 48, 'gender': 'female', 'platelet': 167500, 'hematokrit': 44.32, 'wbc': 5100, 'hemoglobin': 14.0, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0243', 'diagnosis': 'BUKAN_DBD', 'age': 15, 'gender': 'female', 'platelet': 235000, 'hematokrit': 47.01, 'wbc': 4500, 'hemoglobin': 13.2, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0244', 'diagnosis': 'DBD_POSITIF', 'age': 32, 'gender': 'female', 'platelet': 95000, 'hematokrit': 44.0, 'wbc': 4800, 'hemoglobin': 15.74, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0245', 'diagnosis': 'BUKAN_DBD', 'age': 27, 'gender': 'female', 'platelet': 175500, 'hematokrit': 45.901, 'wbc': 5000, 'hemoglobin': 16.34, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0246', 'diagnosis': 'BUKAN_DBD', 'age': 35, 'gender': 'male', 'platelet': 200000, 'hematokrit': 46.0, 'wbc': 4500, 'hemoglobin': 14.71, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0247', 'diagnosis': 'BUKAN_DBD', 'age': 20, 'gender': 'female', 'platelet': 158000, 'hematokrit': 45.91, 'wbc': 5100, 'hemoglobin': 15.83, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0248', 'diagnosis': 'BUKAN_DBD', 'age': 24, 'gender': 'male', 'platelet': 150000, 'hematokrit': 46.7, 'wbc': 5400, 'hemoglobin': 16.72, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0249', 'diagnosis': 'DBD_POSITIF', 'age': 27, 'gender': 'female', 'platelet': 144000, 'hematokrit': 44.0, 'wbc': 6500, 'hemoglobin': 14.0, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0250', 'diagnosis': 'BUKAN_DBD', 'age': 35, 'gender': 'male', 'platelet': 241000, 'hematokrit': 47.81, 'wbc': 6000, 'hemoglobin': 15.63, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0251', 'diagnosis': 'DBD_POSITIF', 'age': 55, 'gender': 'female', 'platelet': 191000, 'hematokrit': 48.41, 'wbc': 6600, 'hemoglobin': 16.21, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0252', 'diagnosis': 'DBD_POSITIF', 'age': 53, 'gender': 'male', 'platelet': 79000, 'hematokrit': 43.44, 'wbc': 4500, 'hemoglobin': 14.48, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0253', 'diagnosis': 'BUKAN_DBD', 'age': 45, 'gender': 'male', 'platelet': 246000, 'hematokrit': 39.1, 'wbc': 6000, 'hemoglobin': 11.3, 'demam_tinggi': 0, 'sakit_kepala': 1, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0254', 'diagnosis': 'BUKAN_DBD', 'age': 5, 'gender': 'male', 'platelet': 184300, 'hematokrit': 36.3, 'wbc': 14900, 'hemoglobin': 10.4, 'demam_tinggi': 0, 'sakit_kepala': 1, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0255', 'diagnosis': 'BUKAN_DBD', 'age': 35, 'gender': 'male', 'platelet': 70000, 'hematokrit': 43.71, 'wbc': 4200, 'hemoglobin': 14.2, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0256', 'diagnosis': 'DBD_POSITIF', 'age': 29, 'gender': 'female', 'platelet': 84000, 'hematokrit': 45.42, 'wbc': 4500, 'hemoglobin': 12.31, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0257', 'diagnosis': 'DBD_POSITIF', 'age': 25, 'gender': 'male', 'platelet': 78000, 'hematokrit': 49.09, 'wbc': 6500, 'hemoglobin': 15.4, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0258', 'diagnosis': 'DBD_POSITIF', 'age': 41, 'gender': 'female', 'platelet': 81500, 'hematokrit': 45.93, 'wbc': 4400, 'hemoglobin': 11.4, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0259', 'diagnosis': 'BUKAN_DBD', 'age': 23, 'gender': 'male', 'platelet': 123000, 'hematokrit': 46.07, 'wbc': 4100, 'hemoglobin': 13.51, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0260', 'diagnosis': 'BUKAN_DBD', 'age': 44, 'gender': 'female', 'platelet': 147000, 'hematokrit': 48.92, 'wbc': 4700, 'hemoglobin': 14.07, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0261', 'diagnosis': 'DBD_POSITIF', 'age': 61, 'gender': 'male', 'platelet': 113000, 'hematokrit': 47.28, 'wbc': 4300, 'hemoglobin': 14.83, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0262', 'diagnosis': 'BUKAN_DBD', 'age': 34, 'gender': 'female', 'platelet': 109000, 'hematokrit': 46.11, 'wbc': 4400, 'hemoglobin': 13.79, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0263', 'diagnosis': 'DBD_POSITIF', 'age': 50, 'gender': 'female', 'platelet': 72000, 'hematokrit': 44.09, 'wbc': 4600, 'hemoglobin': 11.7, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0264', 'diagnosis': 'BUKAN_DBD', 'age': 34, 'gender': 'male', 'platelet': 84000, 'hematokrit': 46.33, 'wbc': 4300, 'hemoglobin': 14.67, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0265', 'diagnosis': 'DBD_POSITIF', 'age': 12, 'gender': 'female', 'platelet': 96000, 'hematokrit': 46.83, 'wbc': 5050, 'hemoglobin': 14.62, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0266', 'diagnosis': 'BUKAN_DBD', 'age': 31, 'gender': 'male', 'platelet': 117000, 'hematokrit': 44.99, 'wbc': 4700, 'hemoglobin': 15.14, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0267', 'diagnosis': 'BUKAN_DBD', 'age': 61, 'gender': 'female', 'platelet': 127000, 'hematokrit': 45.04, 'wbc': 4500, 'hemoglobin': 15.29, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0268', 'diagnosis': 'DBD_POSITIF', 'age': 32, 'gender': 'male', 'platelet': 131000, 'hematokrit': 46.48, 'wbc': 4400, 'hemoglobin': 14.73, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0269', 'diagnosis': 'BUKAN_DBD', 'age': 16, 'gender': 'male', 'platelet': 240000, 'hematokrit': 50.0, 'wbc': 7000, 'hemoglobin': 15.85, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0270', 'diagnosis': 'DBD_POSITIF', 'age': 37, 'gender': 'female', 'platelet': 79000, 'hematokrit': 41.02, 'wbc': 4000, 'hemoglobin': 13.91, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0271', 'diagnosis': 'BUKAN_DBD', 'age': 67, 'gender': 'male', 'platelet': 161000, 'hematokrit': 40.0, 'wbc': 13500, 'hemoglobin': 11.0, 'demam_tinggi': 0, 'sakit_kepala': 1, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0272', 'diagnosis': 'BUKAN_DBD', 'age': 38, 'gender': 'male', 'platelet': 230000, 'hematokrit': 49.05, 'wbc': 8000, 'hemoglobin': 15.5, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0273', 'diagnosis': 'BUKAN_DBD', 'age': 21, 'gender': 'female', 'platelet': 78000, 'hematokrit': 45.09, 'wbc': 5300, 'hemoglobin': 13.23, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0274', 'diagnosis': 'BUKAN_DBD', 'age': 56, 'gender': 'male', 'platelet': 85000, 'hematokrit': 47.91, 'wbc': 4200, 'hemoglobin': 11.78, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0275', 'diagnosis': 'DBD_POSITIF', 'age': 24, 'gender': 'female', 'platelet': 134000, 'hematokrit': 45.26, 'wbc': 5500, 'hemoglobin': 13.303, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0276', 'diagnosis': 'BUKAN_DBD', 'age': 40, 'gender': 'female', 'platelet': 141000, 'hematokrit': 46.73, 'wbc': 5000, 'hemoglobin': 14.531, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0277', 'diagnosis': 'BUKAN_DBD', 'age': 16, 'gender': 'female', 'platelet': 228000, 'hematokrit': 48.0, 'wbc': 5500, 'hemoglobin': 15.73, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0278', 'diagnosis': 'BUKAN_DBD', 'age': 23, 'gender': 'female', 'platelet': 93000, 'hematokrit': 45.74, 'wbc': 6000, 'hemoglobin': 16.652, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0279', 'diagnosis': 'BUKAN_DBD', 'age': 29, 'gender': 'male', 'platelet': 155000, 'hematokrit': 49.31, 'wbc': 6500, 'hemoglobin': 15.43, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0280', 'diagnosis': 'DBD_POSITIF', 'age': 29, 'gender': 'female', 'platelet': 129000, 'hematokrit': 45.0, 'wbc': 7000, 'hemoglobin': 16.34, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0281', 'diagnosis': 'DBD_POSITIF', 'age': 47, 'gender': 'male', 'platelet': 145000, 'hematokrit': 46.78, 'wbc': 6000, 'hemoglobin': 15.621, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0282', 'diagnosis': 'BUKAN_DBD', 'age': 53, 'gender': 'male', 'platelet': 129000, 'hematokrit': 47.3, 'wbc': 5500, 'hemoglobin': 14.83, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0283', 'diagnosis': 'BUKAN_DBD', 'age': 33, 'gender': 'female', 'platelet': 200000, 'hematokrit': 46.4, 'wbc': 8000, 'hemoglobin': 15.631, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0284', 'diagnosis': 'BUKAN_DBD', 'age': 41, 'gender': 'male', 'platelet': 144000, 'hematokrit': 45.0, 'wbc': 6000, 'hemoglobin': 16.43, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0285', 'diagnosis': 'BUKAN_DBD', 'age': 36, 'gender': 'female', 'platelet': 138000, 'hematokrit': 46.73, 'wbc': 4500, 'hemoglobin': 16.9, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0286', 'diagnosis': 'BUKAN_DBD', 'age': 44, 'gender': 'female', 'platelet': 123000, 'hematokrit': 47.28, 'wbc': 6700, 'hemoglobin': 15.31, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0287', 'diagnosis': 'DBD_POSITIF', 'age': 21, 'gender': 'female', 'platelet': 84000, 'hematokrit': 46.0, 'wbc': 5550, 'hemoglobin': 16.775, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0288', 'diagnosis': 'DBD_POSITIF', 'age': 17, 'gender': 'female', 'platelet': 78000, 'hematokrit': 47.0, 'wbc': 4500, 'hemoglobin': 14.31, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0289', 'diagnosis': 'DBD_POSITIF', 'age': 26, 'gender': 'female', 'platelet': 80500, 'hematokrit': 45.112, 'wbc': 5000, 'hemoglobin': 15.56, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0290', 'diagnosis': 'DBD_POSITIF', 'age': 55, 'gender': 'female', 'platelet': 94000, 'hematokrit': 46.81, 'wbc': 3500, 'hemoglobin': 16.32, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0291', 'diagnosis': 'DBD_POSITIF', 'age': 39, 'gender': 'male', 'platelet': 95500, 'hematokrit': 43.0, 'wbc': 4000, 'hemoglobin': 15.891, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0292', 'diagnosis': 'BUKAN_DBD', 'age': 21, 'gender': 'female', 'platelet': 200000, 'hematokrit': 48.56, 'wbc': 4300, 'hemoglobin': 15.13, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0293', 'diagnosis': 'BUKAN_DBD', 'age': 33, 'gender': 'female', 'platelet': 123500, 'hematokrit': 45.31, 'wbc': 5500, 'hemoglobin': 14.283, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0294', 'diagnosis': 'BUKAN_DBD', 'age': 50, 'gender': 'female', 'platelet': 100500, 'hematokrit': 46.67, 'wbc': 5030, 'hemoglobin': 13.201, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0295', 'diagnosis': 'BUKAN_DBD', 'age': 26, 'gender': 'male', 'platelet': 108000, 'hematokrit': 47.321, 'wbc': 5100, 'hemoglobin': 14.71, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0296', 'diagnosis': 'BUKAN_DBD', 'age': 57, 'gender': 'male', 'platelet': 145000, 'hematokrit': 48.0, 'wbc': 5000, 'hemoglobin': 15.32, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0297', 'diagnosis': 'BUKAN_DBD', 'age': 58, 'gender': 'male', 'platelet': 155000, 'hematokrit': 45.36, 'wbc': 6100, 'hemoglobin': 13.267, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0298', 'diagnosis': 'BUKAN_DBD', 'age': 14, 'gender': 'female', 'platelet': 198000, 'hematokrit': 46.13, 'wbc': 4300, 'hemoglobin': 16.022, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0299', 'diagnosis': 'DBD_POSITIF', 'age': 11, 'gender': 'male', 'platelet': 164000, 'hematokrit': 45.672, 'wbc': 5000, 'hemoglobin': 14.32, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0300', 'diagnosis': 'DBD_POSITIF', 'age': 29, 'gender': 'male', 'platelet': 56000, 'hematokrit': 48.0, 'wbc': 6500, 'hemoglobin': 12.581, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 1, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'SEDANG'},
-        {'case_id': 'CSV_0301', 'diagnosis': 'DBD_POSITIF', 'age': 19, 'gender': 'male', 'platelet': 75500, 'hematokrit': 46.41, 'wbc': 3600, 'hemoglobin': 15.1, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0302', 'diagnosis': 'DBD_POSITIF', 'age': 32, 'gender': 'male', 'platelet': 88000, 'hematokrit': 44.82, 'wbc': 4500, 'hemoglobin': 12.338, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0303', 'diagnosis': 'BUKAN_DBD', 'age': 42, 'gender': 'female', 'platelet': 98000, 'hematokrit': 47.61, 'wbc': 5000, 'hemoglobin': 15.451, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0304', 'diagnosis': 'DBD_POSITIF', 'age': 17, 'gender': 'female', 'platelet': 91000, 'hematokrit': 45.673, 'wbc': 6500, 'hemoglobin': 13.0, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0305', 'diagnosis': 'DBD_POSITIF', 'age': 46, 'gender': 'female', 'platelet': 97500, 'hematokrit': 46.81, 'wbc': 4300, 'hemoglobin': 14.32, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0306', 'diagnosis': 'BUKAN_DBD', 'age': 20, 'gender': 'female', 'platelet': 100700, 'hematokrit': 47.0, 'wbc': 4100, 'hemoglobin': 12.894, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0307', 'diagnosis': 'DBD_POSITIF', 'age': 45, 'gender': 'female', 'platelet': 261000, 'hematokrit': 43.28, 'wbc': 7600, 'hemoglobin': 13.47, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0308', 'diagnosis': 'BUKAN_DBD', 'age': 18, 'gender': 'female', 'platelet': 80000, 'hematokrit': 44.03, 'wbc': 5400, 'hemoglobin': 14.346, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0309', 'diagnosis': 'BUKAN_DBD', 'age': 52, 'gender': 'male', 'platelet': 106800, 'hematokrit': 42.09, 'wbc': 4500, 'hemoglobin': 14.559, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0310', 'diagnosis': 'DBD_POSITIF', 'age': 36, 'gender': 'female', 'platelet': 124000, 'hematokrit': 47.83, 'wbc': 6550, 'hemoglobin': 15.249, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0311', 'diagnosis': 'BUKAN_DBD', 'age': 44, 'gender': 'male', 'platelet': 132000, 'hematokrit': 44.3891, 'wbc': 5000, 'hemoglobin': 13.231, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0312', 'diagnosis': 'BUKAN_DBD', 'age': 45, 'gender': 'female', 'platelet': 140000, 'hematokrit': 47.43, 'wbc': 4500, 'hemoglobin': 14.569, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0313', 'diagnosis': 'BUKAN_DBD', 'age': 21, 'gender': 'male', 'platelet': 115000, 'hematokrit': 48.231, 'wbc': 5000, 'hemoglobin': 12.892, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0314', 'diagnosis': 'BUKAN_DBD', 'age': 31, 'gender': 'male', 'platelet': 102000, 'hematokrit': 45.703, 'wbc': 5500, 'hemoglobin': 13.456, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0315', 'diagnosis': 'BUKAN_DBD', 'age': 34, 'gender': 'male', 'platelet': 114000, 'hematokrit': 46.0, 'wbc': 6000, 'hemoglobin': 14.229, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0316', 'diagnosis': 'BUKAN_DBD', 'age': 34, 'gender': 'male', 'platelet': 145000, 'hematokrit': 47.0, 'wbc': 6000, 'hemoglobin': 12.574, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0317', 'diagnosis': 'DBD_POSITIF', 'age': 34, 'gender': 'female', 'platelet': 131000, 'hematokrit': 48.342, 'wbc': 6000, 'hemoglobin': 16.782, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0318', 'diagnosis': 'BUKAN_DBD', 'age': 12, 'gender': 'female', 'platelet': 93000, 'hematokrit': 49.0, 'wbc': 4000, 'hemoglobin': 15.372, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0319', 'diagnosis': 'BUKAN_DBD', 'age': 65, 'gender': 'female', 'platelet': 180000, 'hematokrit': 43.2, 'wbc': 4500, 'hemoglobin': 16.264, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0320', 'diagnosis': 'BUKAN_DBD', 'age': 26, 'gender': 'female', 'platelet': 114000, 'hematokrit': 47.94, 'wbc': 5000, 'hemoglobin': 14.739, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0321', 'diagnosis': 'BUKAN_DBD', 'age': 40, 'gender': 'female', 'platelet': 123000, 'hematokrit': 48.0, 'wbc': 6000, 'hemoglobin': 15.43, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0322', 'diagnosis': 'BUKAN_DBD', 'age': 28, 'gender': 'female', 'platelet': 145000, 'hematokrit': 44.323, 'wbc': 6400, 'hemoglobin': 16.832, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0323', 'diagnosis': 'BUKAN_DBD', 'age': 18, 'gender': 'male', 'platelet': 134000, 'hematokrit': 45.26, 'wbc': 5500, 'hemoglobin': 13.303, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0324', 'diagnosis': 'BUKAN_DBD', 'age': 43, 'gender': 'male', 'platelet': 141000, 'hematokrit': 46.73, 'wbc': 5000, 'hemoglobin': 14.531, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0325', 'diagnosis': 'DBD_POSITIF', 'age': 20, 'gender': 'female', 'platelet': 80000, 'hematokrit': 48.0, 'wbc': 5500, 'hemoglobin': 15.73, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0326', 'diagnosis': 'BUKAN_DBD', 'age': 29, 'gender': 'male', 'platelet': 93000, 'hematokrit': 45.74, 'wbc': 5000, 'hemoglobin': 16.652, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0327', 'diagnosis': 'DBD_POSITIF', 'age': 70, 'gender': 'male', 'platelet': 155000, 'hematokrit': 49.31, 'wbc': 6500, 'hemoglobin': 15.43, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0328', 'diagnosis': 'BUKAN_DBD', 'age': 40, 'gender': 'female', 'platelet': 129000, 'hematokrit': 45.0, 'wbc': 5500, 'hemoglobin': 16.34, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0329', 'diagnosis': 'BUKAN_DBD', 'age': 47, 'gender': 'male', 'platelet': 75000, 'hematokrit': 46.78, 'wbc': 6000, 'hemoglobin': 15.621, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0330', 'diagnosis': 'BUKAN_DBD', 'age': 40, 'gender': 'male', 'platelet': 129000, 'hematokrit': 47.3, 'wbc': 5500, 'hemoglobin': 14.83, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0331', 'diagnosis': 'BUKAN_DBD', 'age': 14, 'gender': 'female', 'platelet': 200000, 'hematokrit': 46.4, 'wbc': 8000, 'hemoglobin': 15.631, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0332', 'diagnosis': 'BUKAN_DBD', 'age': 31, 'gender': 'female', 'platelet': 144000, 'hematokrit': 45.0, 'wbc': 6000, 'hemoglobin': 16.43, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0333', 'diagnosis': 'BUKAN_DBD', 'age': 29, 'gender': 'female', 'platelet': 138000, 'hematokrit': 46.73, 'wbc': 4500, 'hemoglobin': 16.9, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0334', 'diagnosis': 'BUKAN_DBD', 'age': 34, 'gender': 'female', 'platelet': 123000, 'hematokrit': 47.28, 'wbc': 5200, 'hemoglobin': 15.31, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0335', 'diagnosis': 'BUKAN_DBD', 'age': 15, 'gender': 'female', 'platelet': 228000, 'hematokrit': 46.0, 'wbc': 5550, 'hemoglobin': 16.775, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0336', 'diagnosis': 'BUKAN_DBD', 'age': 40, 'gender': 'male', 'platelet': 231000, 'hematokrit': 47.0, 'wbc': 4500, 'hemoglobin': 14.31, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0337', 'diagnosis': 'BUKAN_DBD', 'age': 29, 'gender': 'male', 'platelet': 236000, 'hematokrit': 45.112, 'wbc': 5000, 'hemoglobin': 15.56, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0338', 'diagnosis': 'BUKAN_DBD', 'age': 34, 'gender': 'male', 'platelet': 193000, 'hematokrit': 46.81, 'wbc': 6500, 'hemoglobin': 16.32, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0339', 'diagnosis': 'BUKAN_DBD', 'age': 24, 'gender': 'female', 'platelet': 179000, 'hematokrit': 43.0, 'wbc': 5000, 'hemoglobin': 15.891, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0340', 'diagnosis': 'BUKAN_DBD', 'age': 12, 'gender': 'female', 'platelet': 97000, 'hematokrit': 48.56, 'wbc': 6500, 'hemoglobin': 15.13, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0341', 'diagnosis': 'DBD_POSITIF', 'age': 15, 'gender': 'female', 'platelet': 99000, 'hematokrit': 45.31, 'wbc': 5500, 'hemoglobin': 14.283, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0342', 'diagnosis': 'DBD_POSITIF', 'age': 21, 'gender': 'female', 'platelet': 100000, 'hematokrit': 46.67, 'wbc': 4000, 'hemoglobin': 13.201, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0343', 'diagnosis': 'DBD_POSITIF', 'age': 26, 'gender': 'female', 'platelet': 108000, 'hematokrit': 47.321, 'wbc': 5100, 'hemoglobin': 14.71, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0344', 'diagnosis': 'DBD_POSITIF', 'age': 57, 'gender': 'female', 'platelet': 79000, 'hematokrit': 48.0, 'wbc': 4200, 'hemoglobin': 15.32, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0345', 'diagnosis': 'DBD_POSITIF', 'age': 58, 'gender': 'female', 'platelet': 91000, 'hematokrit': 45.36, 'wbc': 4700, 'hemoglobin': 13.267, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0346', 'diagnosis': 'DBD_POSITIF', 'age': 21, 'gender': 'female', 'platelet': 198000, 'hematokrit': 46.13, 'wbc': 4300, 'hemoglobin': 16.022, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0347', 'diagnosis': 'BUKAN_DBD', 'age': 11, 'gender': 'female', 'platelet': 164000, 'hematokrit': 45.672, 'wbc': 5000, 'hemoglobin': 14.32, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0348', 'diagnosis': 'DBD_POSITIF', 'age': 23, 'gender': 'female', 'platelet': 171000, 'hematokrit': 48.0, 'wbc': 6500, 'hemoglobin': 12.581, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0349', 'diagnosis': 'BUKAN_DBD', 'age': 69, 'gender': 'female', 'platelet': 201000, 'hematokrit': 46.41, 'wbc': 8000, 'hemoglobin': 15.1, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0350', 'diagnosis': 'DBD_POSITIF', 'age': 75, 'gender': 'female', 'platelet': 199000, 'hematokrit': 44.82, 'wbc': 5600, 'hemoglobin': 12.338, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0351', 'diagnosis': 'BUKAN_DBD', 'age': 28, 'gender': 'male', 'platelet': 87000, 'hematokrit': 47.61, 'wbc': 4500, 'hemoglobin': 15.451, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0352', 'diagnosis': 'BUKAN_DBD', 'age': 18, 'gender': 'female', 'platelet': 91000, 'hematokrit': 45.673, 'wbc': 6500, 'hemoglobin': 13.0, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0353', 'diagnosis': 'DBD_POSITIF', 'age': 46, 'gender': 'female', 'platelet': 97500, 'hematokrit': 46.81, 'wbc': 4300, 'hemoglobin': 14.32, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0354', 'diagnosis': 'BUKAN_DBD', 'age': 18, 'gender': 'female', 'platelet': 100700, 'hematokrit': 47.0, 'wbc': 4100, 'hemoglobin': 12.894, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0355', 'diagnosis': 'DBD_POSITIF', 'age': 23, 'gender': 'female', 'platelet': 261000, 'hematokrit': 43.28, 'wbc': 7600, 'hemoglobin': 13.47, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0356', 'diagnosis': 'BUKAN_DBD', 'age': 21, 'gender': 'female', 'platelet': 80000, 'hematokrit': 44.03, 'wbc': 5400, 'hemoglobin': 14.346, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0357', 'diagnosis': 'BUKAN_DBD', 'age': 67, 'gender': 'male', 'platelet': 93000, 'hematokrit': 42.0, 'wbc': 4300, 'hemoglobin': 15.43, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0358', 'diagnosis': 'DBD_POSITIF', 'age': 16, 'gender': 'female', 'platelet': 117000, 'hematokrit': 44.31, 'wbc': 5000, 'hemoglobin': 16.21, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0359', 'diagnosis': 'BUKAN_DBD', 'age': 66, 'gender': 'male', 'platelet': 138000, 'hematokrit': 46.31, 'wbc': 5100, 'hemoglobin': 14.32, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0360', 'diagnosis': 'BUKAN_DBD', 'age': 39, 'gender': 'female', 'platelet': 102100, 'hematokrit': 41.96, 'wbc': 6000, 'hemoglobin': 16.74, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0361', 'diagnosis': 'DBD_POSITIF', 'age': 20, 'gender': 'male', 'platelet': 278000, 'hematokrit': 45.72, 'wbc': 4200, 'hemoglobin': 12.217, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0362', 'diagnosis': 'DBD_POSITIF', 'age': 30, 'gender': 'female', 'platelet': 196000, 'hematokrit': 47.0, 'wbc': 4000, 'hemoglobin': 15.61, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0363', 'diagnosis': 'BUKAN_DBD', 'age': 42, 'gender': 'female', 'platelet': 220000, 'hematokrit': 45.88, 'wbc': 5000, 'hemoglobin': 13.1, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0364', 'diagnosis': 'DBD_POSITIF', 'age': 27, 'gender': 'male', 'platelet': 98000, 'hematokrit': 43.0, 'wbc': 4500, 'hemoglobin': 14.56, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0365', 'diagnosis': 'BUKAN_DBD', 'age': 32, 'gender': 'male', 'platelet': 190000, 'hematokrit': 47.09, 'wbc': 5000, 'hemoglobin': 16.0, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0366', 'diagnosis': 'BUKAN_DBD', 'age': 20, 'gender': 'female', 'platelet': 265000, 'hematokrit': 46.71, 'wbc': 5500, 'hemoglobin': 15.25, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0367', 'diagnosis': 'DBD_POSITIF', 'age': 22, 'gender': 'female', 'platelet': 76000, 'hematokrit': 45.63, 'wbc': 8000, 'hemoglobin': 14.67, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0368', 'diagnosis': 'DBD_POSITIF', 'age': 34, 'gender': 'female', 'platelet': 81000, 'hematokrit': 46.32, 'wbc': 6500, 'hemoglobin': 15.43, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0369', 'diagnosis': 'DBD_POSITIF', 'age': 30, 'gender': 'male', 'platelet': 90000, 'hematokrit': 44.13, 'wbc': 5000, 'hemoglobin': 12.1, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0370', 'diagnosis': 'BUKAN_DBD', 'age': 22, 'gender': 'female', 'platelet': 177500, 'hematokrit': 46.28, 'wbc': 4600, 'hemoglobin': 14.282, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0371', 'diagnosis': 'DBD_POSITIF', 'age': 34, 'gender': 'female', 'platelet': 99000, 'hematokrit': 43.63, 'wbc': 5500, 'hemoglobin': 15.43, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0372', 'diagnosis': 'BUKAN_DBD', 'age': 33, 'gender': 'female', 'platelet': 155000, 'hematokrit': 47.0, 'wbc': 5100, 'hemoglobin': 14.3, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0373', 'diagnosis': 'BUKAN_DBD', 'age': 10, 'gender': 'female', 'platelet': 178000, 'hematokrit': 46.49, 'wbc': 7510, 'hemoglobin': 15.121, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0374', 'diagnosis': 'BUKAN_DBD', 'age': 20, 'gender': 'female', 'platelet': 161000, 'hematokrit': 45.33, 'wbc': 5500, 'hemoglobin': 14.0, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0375', 'diagnosis': 'BUKAN_DBD', 'age': 32, 'gender': 'male', 'platelet': 99500, 'hematokrit': 42.18, 'wbc': 4000, 'hemoglobin': 16.321, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0376', 'diagnosis': 'BUKAN_DBD', 'age': 28, 'gender': 'male', 'platelet': 205000, 'hematokrit': 48.0, 'wbc': 5000, 'hemoglobin': 14.0, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0377', 'diagnosis': 'BUKAN_DBD', 'age': 37, 'gender': 'female', 'platelet': 197000, 'hematokrit': 45.0, 'wbc': 6500, 'hemoglobin': 12.3, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0378', 'diagnosis': 'BUKAN_DBD', 'age': 36, 'gender': 'female', 'platelet': 164000, 'hematokrit': 46.03, 'wbc': 5700, 'hemoglobin': 14.0, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0379', 'diagnosis': 'DBD_POSITIF', 'age': 67, 'gender': 'female', 'platelet': 80000, 'hematokrit': 47.03, 'wbc': 4400, 'hemoglobin': 13.44, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0380', 'diagnosis': 'BUKAN_DBD', 'age': 33, 'gender': 'female', 'platelet': 170000, 'hematokrit': 48.1, 'wbc': 5400, 'hemoglobin': 14.28, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0381', 'diagnosis': 'BUKAN_DBD', 'age': 28, 'gender': 'male', 'platelet': 163000, 'hematokrit': 43.0, 'wbc': 5600, 'hemoglobin': 12.3, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0382', 'diagnosis': 'BUKAN_DBD', 'age': 40, 'gender': 'female', 'platelet': 183000, 'hematokrit': 46.0, 'wbc': 4800, 'hemoglobin': 14.0, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0383', 'diagnosis': 'DBD_POSITIF', 'age': 22, 'gender': 'male', 'platelet': 78000, 'hematokrit': 44.24, 'wbc': 5000, 'hemoglobin': 15.22, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0384', 'diagnosis': 'BUKAN_DBD', 'age': 39, 'gender': 'male', 'platelet': 89000, 'hematokrit': 45.63, 'wbc': 5000, 'hemoglobin': 14.35, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0385', 'diagnosis': 'DBD_POSITIF', 'age': 25, 'gender': 'female', 'platelet': 100000, 'hematokrit': 42.26, 'wbc': 6500, 'hemoglobin': 13.0, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0386', 'diagnosis': 'BUKAN_DBD', 'age': 16, 'gender': 'male', 'platelet': 159000, 'hematokrit': 46.31, 'wbc': 5500, 'hemoglobin': 12.42, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0387', 'diagnosis': 'BUKAN_DBD', 'age': 56, 'gender': 'male', 'platelet': 161500, 'hematokrit': 45.22, 'wbc': 4000, 'hemoglobin': 13.3, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0388', 'diagnosis': 'BUKAN_DBD', 'age': 23, 'gender': 'male', 'platelet': 171000, 'hematokrit': 46.0, 'wbc': 5500, 'hemoglobin': 14.34, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0389', 'diagnosis': 'DBD_POSITIF', 'age': 25, 'gender': 'female', 'platelet': 162000, 'hematokrit': 44.36, 'wbc': 4500, 'hemoglobin': 15.0, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0390', 'diagnosis': 'BUKAN_DBD', 'age': 26, 'gender': 'female', 'platelet': 78000, 'hematokrit': 47.76, 'wbc': 4100, 'hemoglobin': 14.0, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0391', 'diagnosis': 'BUKAN_DBD', 'age': 30, 'gender': 'female', 'platelet': 153000, 'hematokrit': 45.03, 'wbc': 4900, 'hemoglobin': 13.69, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0392', 'diagnosis': 'BUKAN_DBD', 'age': 25, 'gender': 'female', 'platelet': 178000, 'hematokrit': 46.44, 'wbc': 4800, 'hemoglobin': 14.36, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0393', 'diagnosis': 'BUKAN_DBD', 'age': 16, 'gender': 'female', 'platelet': 276000, 'hematokrit': 44.23, 'wbc': 7000, 'hemoglobin': 13.38, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0394', 'diagnosis': 'BUKAN_DBD', 'age': 26, 'gender': 'female', 'platelet': 141000, 'hematokrit': 45.62, 'wbc': 5600, 'hemoglobin': 14.32, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0395', 'diagnosis': 'BUKAN_DBD', 'age': 22, 'gender': 'female', 'platelet': 195000, 'hematokrit': 46.32, 'wbc': 6600, 'hemoglobin': 15.381, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0396', 'diagnosis': 'BUKAN_DBD', 'age': 17, 'gender': 'female', 'platelet': 184000, 'hematokrit': 43.08, 'wbc': 6000, 'hemoglobin': 14.33, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0397', 'diagnosis': 'DBD_POSITIF', 'age': 29, 'gender': 'female', 'platelet': 87000, 'hematokrit': 44.01, 'wbc': 4500, 'hemoglobin': 15.0, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0398', 'diagnosis': 'DBD_POSITIF', 'age': 47, 'gender': 'male', 'platelet': 79000, 'hematokrit': 46.12, 'wbc': 5500, 'hemoglobin': 13.23, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0399', 'diagnosis': 'DBD_POSITIF', 'age': 20, 'gender': 'male', 'platelet': 154000, 'hematokrit': 45.771, 'wbc': 4800, 'hemoglobin': 14.42, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0400', 'diagnosis': 'DBD_POSITIF', 'age': 20, 'gender': 'male', 'platelet': 84000, 'hematokrit': 46.31, 'wbc': 5700, 'hemoglobin': 13.1, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0401', 'diagnosis': 'BUKAN_DBD', 'age': 14, 'gender': 'female', 'platelet': 105000, 'hematokrit': 47.0, 'wbc': 4600, 'hemoglobin': 14.2, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0402', 'diagnosis': 'DBD_POSITIF', 'age': 45, 'gender': 'female', 'platelet': 176000, 'hematokrit': 45.38, 'wbc': 5400, 'hemoglobin': 15.0, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0403', 'diagnosis': 'DBD_POSITIF', 'age': 23, 'gender': 'female', 'platelet': 98000, 'hematokrit': 44.32, 'wbc': 4600, 'hemoglobin': 14.0, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0404', 'diagnosis': 'DBD_POSITIF', 'age': 56, 'gender': 'female', 'platelet': 235000, 'hematokrit': 47.01, 'wbc': 5400, 'hemoglobin': 13.2, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0405', 'diagnosis': 'BUKAN_DBD', 'age': 20, 'gender': 'male', 'platelet': 95000, 'hematokrit': 44.0, 'wbc': 4800, 'hemoglobin': 15.74, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0406', 'diagnosis': 'DBD_POSITIF', 'age': 44, 'gender': 'female', 'platelet': 89500, 'hematokrit': 45.901, 'wbc': 5050, 'hemoglobin': 16.34, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0407', 'diagnosis': 'BUKAN_DBD', 'age': 78, 'gender': 'female', 'platelet': 200000, 'hematokrit': 46.0, 'wbc': 4500, 'hemoglobin': 14.71, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0408', 'diagnosis': 'BUKAN_DBD', 'age': 19, 'gender': 'male', 'platelet': 158000, 'hematokrit': 45.91, 'wbc': 5100, 'hemoglobin': 15.83, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0409', 'diagnosis': 'DBD_POSITIF', 'age': 30, 'gender': 'female', 'platelet': 68000, 'hematokrit': 46.7, 'wbc': 5400, 'hemoglobin': 16.72, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 1, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'SEDANG'},
-        {'case_id': 'CSV_0410', 'diagnosis': 'DBD_POSITIF', 'age': 27, 'gender': 'male', 'platelet': 144000, 'hematokrit': 44.0, 'wbc': 5050, 'hemoglobin': 14.0, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0411', 'diagnosis': 'BUKAN_DBD', 'age': 29, 'gender': 'female', 'platelet': 241000, 'hematokrit': 47.81, 'wbc': 3500, 'hemoglobin': 15.63, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0412', 'diagnosis': 'DBD_POSITIF', 'age': 21, 'gender': 'male', 'platelet': 88050, 'hematokrit': 48.41, 'wbc': 6600, 'hemoglobin': 16.21, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0413', 'diagnosis': 'BUKAN_DBD', 'age': 53, 'gender': 'female', 'platelet': 100000, 'hematokrit': 43.44, 'wbc': 4500, 'hemoglobin': 14.48, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0414', 'diagnosis': 'BUKAN_DBD', 'age': 41, 'gender': 'female', 'platelet': 246000, 'hematokrit': 39.1, 'wbc': 6000, 'hemoglobin': 11.3, 'demam_tinggi': 0, 'sakit_kepala': 1, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0415', 'diagnosis': 'BUKAN_DBD', 'age': 8, 'gender': 'male', 'platelet': 184300, 'hematokrit': 36.3, 'wbc': 14900, 'hemoglobin': 10.4, 'demam_tinggi': 0, 'sakit_kepala': 1, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0416', 'diagnosis': 'DBD_POSITIF', 'age': 27, 'gender': 'female', 'platelet': 89000, 'hematokrit': 43.71, 'wbc': 5000, 'hemoglobin': 14.2, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0417', 'diagnosis': 'BUKAN_DBD', 'age': 16, 'gender': 'male', 'platelet': 84000, 'hematokrit': 45.42, 'wbc': 4500, 'hemoglobin': 12.31, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0418', 'diagnosis': 'BUKAN_DBD', 'age': 39, 'gender': 'female', 'platelet': 105000, 'hematokrit': 49.09, 'wbc': 5000, 'hemoglobin': 15.4, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0419', 'diagnosis': 'BUKAN_DBD', 'age': 21, 'gender': 'male', 'platelet': 99500, 'hematokrit': 45.93, 'wbc': 4400, 'hemoglobin': 11.4, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0420', 'diagnosis': 'BUKAN_DBD', 'age': 48, 'gender': 'female', 'platelet': 123000, 'hematokrit': 46.07, 'wbc': 5000, 'hemoglobin': 13.51, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0421', 'diagnosis': 'BUKAN_DBD', 'age': 24, 'gender': 'male', 'platelet': 147000, 'hematokrit': 48.92, 'wbc': 4700, 'hemoglobin': 14.07, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0422', 'diagnosis': 'BUKAN_DBD', 'age': 69, 'gender': 'female', 'platelet': 113000, 'hematokrit': 47.28, 'wbc': 5500, 'hemoglobin': 14.83, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0423', 'diagnosis': 'DBD_POSITIF', 'age': 28, 'gender': 'male', 'platelet': 109000, 'hematokrit': 46.11, 'wbc': 5050, 'hemoglobin': 13.79, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0424', 'diagnosis': 'DBD_POSITIF', 'age': 51, 'gender': 'male', 'platelet': 72000, 'hematokrit': 44.09, 'wbc': 4600, 'hemoglobin': 11.7, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0425', 'diagnosis': 'BUKAN_DBD', 'age': 22, 'gender': 'female', 'platelet': 84000, 'hematokrit': 46.33, 'wbc': 4300, 'hemoglobin': 14.67, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0426', 'diagnosis': 'BUKAN_DBD', 'age': 18, 'gender': 'male', 'platelet': 96000, 'hematokrit': 46.83, 'wbc': 5050, 'hemoglobin': 14.62, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0427', 'diagnosis': 'DBD_POSITIF', 'age': 76, 'gender': 'female', 'platelet': 117000, 'hematokrit': 44.99, 'wbc': 4700, 'hemoglobin': 15.14, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0428', 'diagnosis': 'DBD_POSITIF', 'age': 38, 'gender': 'male', 'platelet': 127000, 'hematokrit': 45.04, 'wbc': 5000, 'hemoglobin': 15.29, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0429', 'diagnosis': 'BUKAN_DBD', 'age': 32, 'gender': 'female', 'platelet': 131000, 'hematokrit': 46.48, 'wbc': 4400, 'hemoglobin': 14.73, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0430', 'diagnosis': 'BUKAN_DBD', 'age': 20, 'gender': 'female', 'platelet': 240000, 'hematokrit': 50.0, 'wbc': 7000, 'hemoglobin': 15.85, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0431', 'diagnosis': 'DBD_POSITIF', 'age': 30, 'gender': 'male', 'platelet': 80900, 'hematokrit': 41.02, 'wbc': 4000, 'hemoglobin': 13.91, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0432', 'diagnosis': 'BUKAN_DBD', 'age': 69, 'gender': 'female', 'platelet': 161000, 'hematokrit': 40.0, 'wbc': 13500, 'hemoglobin': 11.0, 'demam_tinggi': 0, 'sakit_kepala': 1, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0433', 'diagnosis': 'DBD_POSITIF', 'age': 38, 'gender': 'female', 'platelet': 230000, 'hematokrit': 49.05, 'wbc': 8000, 'hemoglobin': 15.5, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0434', 'diagnosis': 'BUKAN_DBD', 'age': 30, 'gender': 'male', 'platelet': 89000, 'hematokrit': 45.09, 'wbc': 5300, 'hemoglobin': 13.23, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0435', 'diagnosis': 'DBD_POSITIF', 'age': 56, 'gender': 'female', 'platelet': 85000, 'hematokrit': 47.91, 'wbc': 4200, 'hemoglobin': 11.78, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0436', 'diagnosis': 'DBD_POSITIF', 'age': 30, 'gender': 'male', 'platelet': 98300, 'hematokrit': 50.1, 'wbc': 3900, 'hemoglobin': 16.3, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0437', 'diagnosis': 'BUKAN_DBD', 'age': 45, 'gender': 'male', 'platelet': 167000, 'hematokrit': 48.09, 'wbc': 4000, 'hemoglobin': 12.3, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0438', 'diagnosis': 'DBD_POSITIF', 'age': 35, 'gender': 'female', 'platelet': 79005, 'hematokrit': 50.53, 'wbc': 5050, 'hemoglobin': 16.1, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0439', 'diagnosis': 'BUKAN_DBD', 'age': 60, 'gender': 'female', 'platelet': 90000, 'hematokrit': 47.0, 'wbc': 4600, 'hemoglobin': 13.5, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0440', 'diagnosis': 'DBD_POSITIF', 'age': 40, 'gender': 'male', 'platelet': 92000, 'hematokrit': 39.0, 'wbc': 4700, 'hemoglobin': 12.4, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0441', 'diagnosis': 'DBD_POSITIF', 'age': 21, 'gender': 'male', 'platelet': 90000, 'hematokrit': 40.2, 'wbc': 4200, 'hemoglobin': 13.4, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0442', 'diagnosis': 'BUKAN_DBD', 'age': 30, 'gender': 'male', 'platelet': 177000, 'hematokrit': 44.5, 'wbc': 5500, 'hemoglobin': 14.7, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0443', 'diagnosis': 'BUKAN_DBD', 'age': 44, 'gender': 'male', 'platelet': 97000, 'hematokrit': 45.0, 'wbc': 6000, 'hemoglobin': 14.1, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0444', 'diagnosis': 'BUKAN_DBD', 'age': 55, 'gender': 'male', 'platelet': 105000, 'hematokrit': 49.0, 'wbc': 5000, 'hemoglobin': 15.7, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0445', 'diagnosis': 'BUKAN_DBD', 'age': 12, 'gender': 'male', 'platelet': 220002, 'hematokrit': 38.64, 'wbc': 6000, 'hemoglobin': 11.9, 'demam_tinggi': 0, 'sakit_kepala': 1, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0446', 'diagnosis': 'BUKAN_DBD', 'age': 45, 'gender': 'male', 'platelet': 160000, 'hematokrit': 44.5, 'wbc': 5050, 'hemoglobin': 15.4, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0447', 'diagnosis': 'BUKAN_DBD', 'age': 30, 'gender': 'female', 'platelet': 159000, 'hematokrit': 41.06, 'wbc': 4800, 'hemoglobin': 14.5, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0448', 'diagnosis': 'BUKAN_DBD', 'age': 69, 'gender': 'female', 'platelet': 170000, 'hematokrit': 51.15, 'wbc': 5400, 'hemoglobin': 16.67, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0449', 'diagnosis': 'BUKAN_DBD', 'age': 76, 'gender': 'female', 'platelet': 160000, 'hematokrit': 49.5, 'wbc': 5700, 'hemoglobin': 15.9, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0450', 'diagnosis': 'DBD_POSITIF', 'age': 38, 'gender': 'female', 'platelet': 132000, 'hematokrit': 46.17, 'wbc': 4400, 'hemoglobin': 17.4, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0451', 'diagnosis': 'DBD_POSITIF', 'age': 44, 'gender': 'female', 'platelet': 100060, 'hematokrit': 45.55, 'wbc': 4500, 'hemoglobin': 16.3, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0452', 'diagnosis': 'BUKAN_DBD', 'age': 53, 'gender': 'female', 'platelet': 98000, 'hematokrit': 47.7, 'wbc': 6500, 'hemoglobin': 15.439, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0453', 'diagnosis': 'BUKAN_DBD', 'age': 29, 'gender': 'female', 'platelet': 187000, 'hematokrit': 49.62, 'wbc': 5000, 'hemoglobin': 15.7, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0454', 'diagnosis': 'BUKAN_DBD', 'age': 20, 'gender': 'female', 'platelet': 171000, 'hematokrit': 45.67, 'wbc': 7000, 'hemoglobin': 16.86, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0455', 'diagnosis': 'DBD_POSITIF', 'age': 36, 'gender': 'male', 'platelet': 132000, 'hematokrit': 40.12, 'wbc': 4400, 'hemoglobin': 12.35, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0456', 'diagnosis': 'DBD_POSITIF', 'age': 34, 'gender': 'female', 'platelet': 120000, 'hematokrit': 45.5, 'wbc': 4100, 'hemoglobin': 13.3, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0457', 'diagnosis': 'DBD_POSITIF', 'age': 22, 'gender': 'female', 'platelet': 142000, 'hematokrit': 44.4, 'wbc': 4600, 'hemoglobin': 14.6, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0458', 'diagnosis': 'BUKAN_DBD', 'age': 29, 'gender': 'female', 'platelet': 194000, 'hematokrit': 48.5, 'wbc': 5700, 'hemoglobin': 15.3, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0459', 'diagnosis': 'DBD_POSITIF', 'age': 30, 'gender': 'female', 'platelet': 83000, 'hematokrit': 44.6, 'wbc': 4300, 'hemoglobin': 14.3, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0460', 'diagnosis': 'DBD_POSITIF', 'age': 21, 'gender': 'female', 'platelet': 95000, 'hematokrit': 43.4, 'wbc': 4700, 'hemoglobin': 14.76, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0461', 'diagnosis': 'DBD_POSITIF', 'age': 34, 'gender': 'female', 'platelet': 91000, 'hematokrit': 44.5, 'wbc': 4200, 'hemoglobin': 14.32, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0462', 'diagnosis': 'BUKAN_DBD', 'age': 15, 'gender': 'male', 'platelet': 88000, 'hematokrit': 41.33, 'wbc': 4500, 'hemoglobin': 13.23, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0463', 'diagnosis': 'BUKAN_DBD', 'age': 23, 'gender': 'male', 'platelet': 111000, 'hematokrit': 43.56, 'wbc': 4700, 'hemoglobin': 14.13, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0464', 'diagnosis': 'BUKAN_DBD', 'age': 22, 'gender': 'female', 'platelet': 89900, 'hematokrit': 45.15, 'wbc': 4900, 'hemoglobin': 15.26, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0465', 'diagnosis': 'DBD_POSITIF', 'age': 54, 'gender': 'female', 'platelet': 100000, 'hematokrit': 50.38, 'wbc': 6000, 'hemoglobin': 16.44, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0466', 'diagnosis': 'DBD_POSITIF', 'age': 45, 'gender': 'male', 'platelet': 105000, 'hematokrit': 46.75, 'wbc': 4200, 'hemoglobin': 14.32, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0467', 'diagnosis': 'BUKAN_DBD', 'age': 19, 'gender': 'female', 'platelet': 160000, 'hematokrit': 48.95, 'wbc': 6500, 'hemoglobin': 16.24, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0468', 'diagnosis': 'DBD_POSITIF', 'age': 20, 'gender': 'female', 'platelet': 91000, 'hematokrit': 47.22, 'wbc': 5500, 'hemoglobin': 14.63, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0469', 'diagnosis': 'DBD_POSITIF', 'age': 20, 'gender': 'female', 'platelet': 141000, 'hematokrit': 49.15, 'wbc': 4700, 'hemoglobin': 14.28, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0470', 'diagnosis': 'DBD_POSITIF', 'age': 21, 'gender': 'female', 'platelet': 90000, 'hematokrit': 46.44, 'wbc': 4600, 'hemoglobin': 15.11, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0471', 'diagnosis': 'BUKAN_DBD', 'age': 28, 'gender': 'female', 'platelet': 182000, 'hematokrit': 48.63, 'wbc': 7500, 'hemoglobin': 15.41, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0472', 'diagnosis': 'DBD_POSITIF', 'age': 30, 'gender': 'female', 'platelet': 130000, 'hematokrit': 45.38, 'wbc': 4400, 'hemoglobin': 14.64, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0473', 'diagnosis': 'DBD_POSITIF', 'age': 70, 'gender': 'female', 'platelet': 144000, 'hematokrit': 46.36, 'wbc': 5000, 'hemoglobin': 14.82, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0474', 'diagnosis': 'DBD_POSITIF', 'age': 40, 'gender': 'male', 'platelet': 82000, 'hematokrit': 44.61, 'wbc': 5500, 'hemoglobin': 15.12, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0475', 'diagnosis': 'DBD_POSITIF', 'age': 35, 'gender': 'male', 'platelet': 99000, 'hematokrit': 46.28, 'wbc': 4900, 'hemoglobin': 14.77, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0476', 'diagnosis': 'BUKAN_DBD', 'age': 32, 'gender': 'female', 'platelet': 192000, 'hematokrit': 48.73, 'wbc': 6700, 'hemoglobin': 15.84, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0477', 'diagnosis': 'BUKAN_DBD', 'age': 34, 'gender': 'female', 'platelet': 186000, 'hematokrit': 49.93, 'wbc': 6300, 'hemoglobin': 15.26, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0478', 'diagnosis': 'BUKAN_DBD', 'age': 21, 'gender': 'female', 'platelet': 171000, 'hematokrit': 48.54, 'wbc': 7100, 'hemoglobin': 16.56, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0479', 'diagnosis': 'DBD_POSITIF', 'age': 18, 'gender': 'female', 'platelet': 72000, 'hematokrit': 43.67, 'wbc': 4000, 'hemoglobin': 14.86, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0480', 'diagnosis': 'BUKAN_DBD', 'age': 70, 'gender': 'female', 'platelet': 162000, 'hematokrit': 49.38, 'wbc': 6300, 'hemoglobin': 15.96, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0481', 'diagnosis': 'DBD_POSITIF', 'age': 29, 'gender': 'female', 'platelet': 88000, 'hematokrit': 45.62, 'wbc': 5000, 'hemoglobin': 14.471, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0482', 'diagnosis': 'BUKAN_DBD', 'age': 32, 'gender': 'male', 'platelet': 191000, 'hematokrit': 48.41, 'wbc': 6600, 'hemoglobin': 16.21, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0483', 'diagnosis': 'DBD_POSITIF', 'age': 60, 'gender': 'female', 'platelet': 81000, 'hematokrit': 43.44, 'wbc': 4500, 'hemoglobin': 14.48, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0484', 'diagnosis': 'BUKAN_DBD', 'age': 16, 'gender': 'male', 'platelet': 246000, 'hematokrit': 39.1, 'wbc': 6000, 'hemoglobin': 11.3, 'demam_tinggi': 0, 'sakit_kepala': 1, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0485', 'diagnosis': 'BUKAN_DBD', 'age': 67, 'gender': 'female', 'platelet': 170000, 'hematokrit': 36.3, 'wbc': 14900, 'hemoglobin': 10.4, 'demam_tinggi': 0, 'sakit_kepala': 1, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0486', 'diagnosis': 'DBD_POSITIF', 'age': 72, 'gender': 'female', 'platelet': 70000, 'hematokrit': 43.71, 'wbc': 4200, 'hemoglobin': 14.2, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0487', 'diagnosis': 'DBD_POSITIF', 'age': 20, 'gender': 'male', 'platelet': 84000, 'hematokrit': 45.42, 'wbc': 4500, 'hemoglobin': 12.31, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0488', 'diagnosis': 'BUKAN_DBD', 'age': 18, 'gender': 'male', 'platelet': 194000, 'hematokrit': 49.09, 'wbc': 6500, 'hemoglobin': 15.4, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0489', 'diagnosis': 'BUKAN_DBD', 'age': 39, 'gender': 'male', 'platelet': 81500, 'hematokrit': 45.93, 'wbc': 4400, 'hemoglobin': 11.4, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0490', 'diagnosis': 'BUKAN_DBD', 'age': 56, 'gender': 'female', 'platelet': 123000, 'hematokrit': 46.07, 'wbc': 4100, 'hemoglobin': 13.51, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0491', 'diagnosis': 'BUKAN_DBD', 'age': 31, 'gender': 'female', 'platelet': 147000, 'hematokrit': 48.92, 'wbc': 5050, 'hemoglobin': 14.07, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0492', 'diagnosis': 'DBD_POSITIF', 'age': 40, 'gender': 'female', 'platelet': 81000, 'hematokrit': 47.28, 'wbc': 4300, 'hemoglobin': 14.83, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0493', 'diagnosis': 'DBD_POSITIF', 'age': 24, 'gender': 'female', 'platelet': 109000, 'hematokrit': 46.11, 'wbc': 4400, 'hemoglobin': 13.79, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0494', 'diagnosis': 'DBD_POSITIF', 'age': 38, 'gender': 'male', 'platelet': 72000, 'hematokrit': 44.09, 'wbc': 4600, 'hemoglobin': 11.7, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0495', 'diagnosis': 'DBD_POSITIF', 'age': 30, 'gender': 'female', 'platelet': 84000, 'hematokrit': 46.33, 'wbc': 4300, 'hemoglobin': 14.67, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0496', 'diagnosis': 'DBD_POSITIF', 'age': 22, 'gender': 'female', 'platelet': 89000, 'hematokrit': 46.83, 'wbc': 4500, 'hemoglobin': 14.62, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0497', 'diagnosis': 'DBD_POSITIF', 'age': 16, 'gender': 'female', 'platelet': 117000, 'hematokrit': 44.99, 'wbc': 4700, 'hemoglobin': 15.14, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0498', 'diagnosis': 'DBD_POSITIF', 'age': 38, 'gender': 'female', 'platelet': 127000, 'hematokrit': 45.04, 'wbc': 4500, 'hemoglobin': 15.29, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0499', 'diagnosis': 'BUKAN_DBD', 'age': 28, 'gender': 'female', 'platelet': 131000, 'hematokrit': 46.48, 'wbc': 5050, 'hemoglobin': 14.73, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0500', 'diagnosis': 'DBD_POSITIF', 'age': 31, 'gender': 'female', 'platelet': 240000, 'hematokrit': 50.0, 'wbc': 7000, 'hemoglobin': 15.85, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0501', 'diagnosis': 'DBD_POSITIF', 'age': 13, 'gender': 'female', 'platelet': 79000, 'hematokrit': 41.02, 'wbc': 4000, 'hemoglobin': 13.91, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0502', 'diagnosis': 'BUKAN_DBD', 'age': 10, 'gender': 'female', 'platelet': 161000, 'hematokrit': 40.0, 'wbc': 13500, 'hemoglobin': 11.0, 'demam_tinggi': 0, 'sakit_kepala': 1, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0503', 'diagnosis': 'BUKAN_DBD', 'age': 22, 'gender': 'male', 'platelet': 140000, 'hematokrit': 49.05, 'wbc': 5050, 'hemoglobin': 15.5, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0504', 'diagnosis': 'BUKAN_DBD', 'age': 45, 'gender': 'male', 'platelet': 91500, 'hematokrit': 45.09, 'wbc': 5050, 'hemoglobin': 13.23, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0505', 'diagnosis': 'DBD_POSITIF', 'age': 29, 'gender': 'male', 'platelet': 103030, 'hematokrit': 47.91, 'wbc': 4200, 'hemoglobin': 11.78, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0506', 'diagnosis': 'DBD_POSITIF', 'age': 21, 'gender': 'male', 'platelet': 82000, 'hematokrit': 43.76, 'wbc': 4500, 'hemoglobin': 12.34, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0507', 'diagnosis': 'DBD_POSITIF', 'age': 11, 'gender': 'male', 'platelet': 90000, 'hematokrit': 46.66, 'wbc': 4300, 'hemoglobin': 13.19, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0508', 'diagnosis': 'DBD_POSITIF', 'age': 68, 'gender': 'male', 'platelet': 129000, 'hematokrit': 45.13, 'wbc': 4500, 'hemoglobin': 14.53, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0509', 'diagnosis': 'BUKAN_DBD', 'age': 38, 'gender': 'male', 'platelet': 194000, 'hematokrit': 49.93, 'wbc': 5000, 'hemoglobin': 15.9, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0510', 'diagnosis': 'BUKAN_DBD', 'age': 34, 'gender': 'male', 'platelet': 100500, 'hematokrit': 44.02, 'wbc': 4000, 'hemoglobin': 13.93, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0511', 'diagnosis': 'BUKAN_DBD', 'age': 20, 'gender': 'female', 'platelet': 136000, 'hematokrit': 48.09, 'wbc': 5000, 'hemoglobin': 15.99, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0512', 'diagnosis': 'BUKAN_DBD', 'age': 26, 'gender': 'male', 'platelet': 90000, 'hematokrit': 41.0, 'wbc': 4300, 'hemoglobin': 14.32, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0513', 'diagnosis': 'BUKAN_DBD', 'age': 44, 'gender': 'female', 'platelet': 95000, 'hematokrit': 46.94, 'wbc': 4500, 'hemoglobin': 14.58, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0514', 'diagnosis': 'DBD_POSITIF', 'age': 32, 'gender': 'female', 'platelet': 146000, 'hematokrit': 47.36, 'wbc': 4800, 'hemoglobin': 15.35, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0515', 'diagnosis': 'BUKAN_DBD', 'age': 43, 'gender': 'female', 'platelet': 107000, 'hematokrit': 49.84, 'wbc': 7000, 'hemoglobin': 16.64, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0516', 'diagnosis': 'DBD_POSITIF', 'age': 72, 'gender': 'female', 'platelet': 78000, 'hematokrit': 44.82, 'wbc': 4800, 'hemoglobin': 15.43, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0517', 'diagnosis': 'DBD_POSITIF', 'age': 31, 'gender': 'male', 'platelet': 110000, 'hematokrit': 45.46, 'wbc': 6500, 'hemoglobin': 14.78, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0518', 'diagnosis': 'DBD_POSITIF', 'age': 59, 'gender': 'female', 'platelet': 125000, 'hematokrit': 46.87, 'wbc': 6500, 'hemoglobin': 15.62, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0519', 'diagnosis': 'BUKAN_DBD', 'age': 16, 'gender': 'female', 'platelet': 250000, 'hematokrit': 50.0, 'wbc': 8000, 'hemoglobin': 16.85, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0520', 'diagnosis': 'DBD_POSITIF', 'age': 24, 'gender': 'male', 'platelet': 119000, 'hematokrit': 44.0, 'wbc': 4900, 'hemoglobin': 14.98, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0521', 'diagnosis': 'DBD_POSITIF', 'age': 28, 'gender': 'male', 'platelet': 126000, 'hematokrit': 46.93, 'wbc': 5600, 'hemoglobin': 15.73, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0522', 'diagnosis': 'DBD_POSITIF', 'age': 31, 'gender': 'female', 'platelet': 131000, 'hematokrit': 46.08, 'wbc': 4750, 'hemoglobin': 15.49, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0523', 'diagnosis': 'BUKAN_DBD', 'age': 67, 'gender': 'male', 'platelet': 147000, 'hematokrit': 47.09, 'wbc': 6500, 'hemoglobin': 16.83, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0524', 'diagnosis': 'DBD_POSITIF', 'age': 28, 'gender': 'female', 'platelet': 125111, 'hematokrit': 51.23, 'wbc': 5437, 'hemoglobin': 13.3, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0525', 'diagnosis': 'DBD_POSITIF', 'age': 29, 'gender': 'female', 'platelet': 286525, 'hematokrit': 41.96, 'wbc': 4370, 'hemoglobin': 16.1, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0526', 'diagnosis': 'DBD_POSITIF', 'age': 27, 'gender': 'female', 'platelet': 286753, 'hematokrit': 44.45, 'wbc': 4408, 'hemoglobin': 14.6, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0527', 'diagnosis': 'DBD_POSITIF', 'age': 25, 'gender': 'male', 'platelet': 119491, 'hematokrit': 47.4, 'wbc': 5406, 'hemoglobin': 13.6, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0528', 'diagnosis': 'DBD_POSITIF', 'age': 41, 'gender': 'female', 'platelet': 129336, 'hematokrit': 40.27, 'wbc': 5901, 'hemoglobin': 13.7, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0529', 'diagnosis': 'DBD_POSITIF', 'age': 45, 'gender': 'female', 'platelet': 96905, 'hematokrit': 44.81, 'wbc': 5470, 'hemoglobin': 11.5, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0530', 'diagnosis': 'DBD_POSITIF', 'age': 58, 'gender': 'female', 'platelet': 110273, 'hematokrit': 48.34, 'wbc': 4616, 'hemoglobin': 13.3, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0531', 'diagnosis': 'DBD_POSITIF', 'age': 53, 'gender': 'female', 'platelet': 205191, 'hematokrit': 50.14, 'wbc': 4070, 'hemoglobin': 15.4, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0532', 'diagnosis': 'DBD_POSITIF', 'age': 54, 'gender': 'female', 'platelet': 195936, 'hematokrit': 46.77, 'wbc': 4083, 'hemoglobin': 17.3, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0533', 'diagnosis': 'DBD_POSITIF', 'age': 38, 'gender': 'male', 'platelet': 237306, 'hematokrit': 47.37, 'wbc': 6256, 'hemoglobin': 16.6, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0534', 'diagnosis': 'DBD_POSITIF', 'age': 25, 'gender': 'male', 'platelet': 289957, 'hematokrit': 39.77, 'wbc': 4258, 'hemoglobin': 11.6, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0535', 'diagnosis': 'BUKAN_DBD', 'age': 26, 'gender': 'female', 'platelet': 146538, 'hematokrit': 51.24, 'wbc': 5325, 'hemoglobin': 16.9, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0536', 'diagnosis': 'DBD_POSITIF', 'age': 64, 'gender': 'female', 'platelet': 184570, 'hematokrit': 39.86, 'wbc': 4931, 'hemoglobin': 16.2, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0537', 'diagnosis': 'BUKAN_DBD', 'age': 32, 'gender': 'female', 'platelet': 243645, 'hematokrit': 48.85, 'wbc': 6329, 'hemoglobin': 16.2, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0538', 'diagnosis': 'DBD_POSITIF', 'age': 65, 'gender': 'male', 'platelet': 173339, 'hematokrit': 41.71, 'wbc': 4393, 'hemoglobin': 14.2, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0539', 'diagnosis': 'BUKAN_DBD', 'age': 63, 'gender': 'male', 'platelet': 201132, 'hematokrit': 51.07, 'wbc': 6465, 'hemoglobin': 13.9, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0540', 'diagnosis': 'DBD_POSITIF', 'age': 57, 'gender': 'female', 'platelet': 275392, 'hematokrit': 48.08, 'wbc': 5334, 'hemoglobin': 13.3, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0541', 'diagnosis': 'BUKAN_DBD', 'age': 35, 'gender': 'male', 'platelet': 208993, 'hematokrit': 48.55, 'wbc': 6906, 'hemoglobin': 11.9, 'demam_tinggi': 0, 'sakit_kepala': 1, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0542', 'diagnosis': 'DBD_POSITIF', 'age': 59, 'gender': 'male', 'platelet': 91330, 'hematokrit': 41.07, 'wbc': 5929, 'hemoglobin': 12.9, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0543', 'diagnosis': 'BUKAN_DBD', 'age': 37, 'gender': 'female', 'platelet': 291588, 'hematokrit': 44.2, 'wbc': 5720, 'hemoglobin': 13.0, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0544', 'diagnosis': 'DBD_POSITIF', 'age': 23, 'gender': 'male', 'platelet': 152553, 'hematokrit': 46.65, 'wbc': 4625, 'hemoglobin': 14.4, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0545', 'diagnosis': 'DBD_POSITIF', 'age': 29, 'gender': 'male', 'platelet': 252425, 'hematokrit': 48.78, 'wbc': 5892, 'hemoglobin': 16.0, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0546', 'diagnosis': 'DBD_POSITIF', 'age': 19, 'gender': 'female', 'platelet': 227083, 'hematokrit': 39.46, 'wbc': 5836, 'hemoglobin': 14.3, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0547', 'diagnosis': 'BUKAN_DBD', 'age': 24, 'gender': 'male', 'platelet': 163537, 'hematokrit': 51.47, 'wbc': 4561, 'hemoglobin': 11.8, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0548', 'diagnosis': 'DBD_POSITIF', 'age': 33, 'gender': 'male', 'platelet': 140985, 'hematokrit': 50.46, 'wbc': 6879, 'hemoglobin': 17.2, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0549', 'diagnosis': 'DBD_POSITIF', 'age': 20, 'gender': 'female', 'platelet': 97044, 'hematokrit': 41.78, 'wbc': 5793, 'hemoglobin': 17.2, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0550', 'diagnosis': 'DBD_POSITIF', 'age': 62, 'gender': 'male', 'platelet': 249364, 'hematokrit': 49.52, 'wbc': 4940, 'hemoglobin': 16.2, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0551', 'diagnosis': 'BUKAN_DBD', 'age': 20, 'gender': 'male', 'platelet': 202304, 'hematokrit': 45.26, 'wbc': 6109, 'hemoglobin': 17.4, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0552', 'diagnosis': 'BUKAN_DBD', 'age': 44, 'gender': 'female', 'platelet': 216322, 'hematokrit': 44.47, 'wbc': 5165, 'hemoglobin': 14.8, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0553', 'diagnosis': 'BUKAN_DBD', 'age': 67, 'gender': 'female', 'platelet': 103289, 'hematokrit': 42.4, 'wbc': 5865, 'hemoglobin': 17.3, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0554', 'diagnosis': 'DBD_POSITIF', 'age': 60, 'gender': 'female', 'platelet': 113087, 'hematokrit': 46.13, 'wbc': 6781, 'hemoglobin': 12.0, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0555', 'diagnosis': 'DBD_POSITIF', 'age': 57, 'gender': 'male', 'platelet': 155952, 'hematokrit': 48.22, 'wbc': 5891, 'hemoglobin': 13.7, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0556', 'diagnosis': 'DBD_POSITIF', 'age': 55, 'gender': 'female', 'platelet': 116368, 'hematokrit': 43.75, 'wbc': 5639, 'hemoglobin': 12.9, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0557', 'diagnosis': 'DBD_POSITIF', 'age': 50, 'gender': 'male', 'platelet': 200648, 'hematokrit': 46.81, 'wbc': 5550, 'hemoglobin': 12.7, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0558', 'diagnosis': 'BUKAN_DBD', 'age': 45, 'gender': 'female', 'platelet': 150815, 'hematokrit': 47.79, 'wbc': 4781, 'hemoglobin': 12.3, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0559', 'diagnosis': 'DBD_POSITIF', 'age': 18, 'gender': 'male', 'platelet': 170693, 'hematokrit': 47.96, 'wbc': 5694, 'hemoglobin': 15.2, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0560', 'diagnosis': 'BUKAN_DBD', 'age': 25, 'gender': 'female', 'platelet': 272112, 'hematokrit': 38.73, 'wbc': 6586, 'hemoglobin': 16.2, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0561', 'diagnosis': 'BUKAN_DBD', 'age': 54, 'gender': 'female', 'platelet': 138900, 'hematokrit': 50.04, 'wbc': 4596, 'hemoglobin': 15.0, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0562', 'diagnosis': 'DBD_POSITIF', 'age': 49, 'gender': 'female', 'platelet': 95494, 'hematokrit': 44.42, 'wbc': 6056, 'hemoglobin': 12.4, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0563', 'diagnosis': 'BUKAN_DBD', 'age': 65, 'gender': 'female', 'platelet': 196486, 'hematokrit': 41.67, 'wbc': 6323, 'hemoglobin': 16.4, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0564', 'diagnosis': 'DBD_POSITIF', 'age': 60, 'gender': 'male', 'platelet': 256238, 'hematokrit': 41.38, 'wbc': 6274, 'hemoglobin': 15.3, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0565', 'diagnosis': 'DBD_POSITIF', 'age': 54, 'gender': 'female', 'platelet': 236405, 'hematokrit': 44.76, 'wbc': 6233, 'hemoglobin': 13.8, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0566', 'diagnosis': 'BUKAN_DBD', 'age': 21, 'gender': 'female', 'platelet': 113050, 'hematokrit': 50.42, 'wbc': 6638, 'hemoglobin': 15.5, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0567', 'diagnosis': 'DBD_POSITIF', 'age': 47, 'gender': 'male', 'platelet': 177799, 'hematokrit': 43.3, 'wbc': 6480, 'hemoglobin': 13.1, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0568', 'diagnosis': 'DBD_POSITIF', 'age': 23, 'gender': 'female', 'platelet': 211016, 'hematokrit': 48.5, 'wbc': 6616, 'hemoglobin': 13.6, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0569', 'diagnosis': 'DBD_POSITIF', 'age': 63, 'gender': 'male', 'platelet': 290638, 'hematokrit': 39.36, 'wbc': 6703, 'hemoglobin': 17.0, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0570', 'diagnosis': 'BUKAN_DBD', 'age': 36, 'gender': 'female', 'platelet': 168257, 'hematokrit': 44.66, 'wbc': 4355, 'hemoglobin': 13.2, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0571', 'diagnosis': 'DBD_POSITIF', 'age': 49, 'gender': 'female', 'platelet': 128070, 'hematokrit': 51.88, 'wbc': 6890, 'hemoglobin': 14.3, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0572', 'diagnosis': 'BUKAN_DBD', 'age': 26, 'gender': 'female', 'platelet': 85166, 'hematokrit': 48.79, 'wbc': 6040, 'hemoglobin': 16.8, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0573', 'diagnosis': 'DBD_POSITIF', 'age': 29, 'gender': 'male', 'platelet': 218193, 'hematokrit': 40.95, 'wbc': 4391, 'hemoglobin': 15.7, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0574', 'diagnosis': 'DBD_POSITIF', 'age': 28, 'gender': 'female', 'platelet': 225749, 'hematokrit': 45.02, 'wbc': 4578, 'hemoglobin': 11.9, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0575', 'diagnosis': 'DBD_POSITIF', 'age': 63, 'gender': 'female', 'platelet': 267633, 'hematokrit': 41.27, 'wbc': 5640, 'hemoglobin': 12.4, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0576', 'diagnosis': 'DBD_POSITIF', 'age': 33, 'gender': 'female', 'platelet': 292981, 'hematokrit': 43.73, 'wbc': 6467, 'hemoglobin': 11.5, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0577', 'diagnosis': 'DBD_POSITIF', 'age': 18, 'gender': 'male', 'platelet': 167409, 'hematokrit': 48.92, 'wbc': 6008, 'hemoglobin': 15.3, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0578', 'diagnosis': 'BUKAN_DBD', 'age': 62, 'gender': 'male', 'platelet': 117664, 'hematokrit': 48.8, 'wbc': 5723, 'hemoglobin': 14.2, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0579', 'diagnosis': 'DBD_POSITIF', 'age': 38, 'gender': 'female', 'platelet': 209926, 'hematokrit': 41.19, 'wbc': 4163, 'hemoglobin': 12.3, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0580', 'diagnosis': 'DBD_POSITIF', 'age': 47, 'gender': 'male', 'platelet': 81293, 'hematokrit': 50.91, 'wbc': 6826, 'hemoglobin': 17.2, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0581', 'diagnosis': 'DBD_POSITIF', 'age': 30, 'gender': 'female', 'platelet': 233515, 'hematokrit': 46.3, 'wbc': 4637, 'hemoglobin': 14.7, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0582', 'diagnosis': 'DBD_POSITIF', 'age': 51, 'gender': 'female', 'platelet': 129212, 'hematokrit': 43.32, 'wbc': 6064, 'hemoglobin': 13.0, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0583', 'diagnosis': 'DBD_POSITIF', 'age': 21, 'gender': 'female', 'platelet': 295203, 'hematokrit': 45.03, 'wbc': 6493, 'hemoglobin': 14.5, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0584', 'diagnosis': 'BUKAN_DBD', 'age': 45, 'gender': 'female', 'platelet': 155276, 'hematokrit': 46.47, 'wbc': 4169, 'hemoglobin': 15.6, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0585', 'diagnosis': 'DBD_POSITIF', 'age': 55, 'gender': 'female', 'platelet': 92559, 'hematokrit': 45.84, 'wbc': 4339, 'hemoglobin': 12.0, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0586', 'diagnosis': 'DBD_POSITIF', 'age': 48, 'gender': 'female', 'platelet': 145231, 'hematokrit': 44.81, 'wbc': 4725, 'hemoglobin': 13.1, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0587', 'diagnosis': 'DBD_POSITIF', 'age': 44, 'gender': 'female', 'platelet': 188277, 'hematokrit': 45.07, 'wbc': 5933, 'hemoglobin': 16.3, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0588', 'diagnosis': 'DBD_POSITIF', 'age': 22, 'gender': 'male', 'platelet': 250116, 'hematokrit': 40.47, 'wbc': 5034, 'hemoglobin': 14.3, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0589', 'diagnosis': 'BUKAN_DBD', 'age': 42, 'gender': 'male', 'platelet': 101747, 'hematokrit': 49.38, 'wbc': 5645, 'hemoglobin': 14.8, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0590', 'diagnosis': 'DBD_POSITIF', 'age': 20, 'gender': 'male', 'platelet': 284581, 'hematokrit': 45.58, 'wbc': 4132, 'hemoglobin': 14.1, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0591', 'diagnosis': 'DBD_POSITIF', 'age': 50, 'gender': 'male', 'platelet': 291941, 'hematokrit': 39.84, 'wbc': 6948, 'hemoglobin': 11.8, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0592', 'diagnosis': 'DBD_POSITIF', 'age': 21, 'gender': 'male', 'platelet': 241201, 'hematokrit': 48.73, 'wbc': 6687, 'hemoglobin': 12.5, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0593', 'diagnosis': 'DBD_POSITIF', 'age': 42, 'gender': 'male', 'platelet': 80037, 'hematokrit': 51.05, 'wbc': 4822, 'hemoglobin': 14.2, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0594', 'diagnosis': 'DBD_POSITIF', 'age': 37, 'gender': 'male', 'platelet': 184294, 'hematokrit': 51.26, 'wbc': 4953, 'hemoglobin': 12.8, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0595', 'diagnosis': 'DBD_POSITIF', 'age': 51, 'gender': 'female', 'platelet': 177847, 'hematokrit': 43.17, 'wbc': 6126, 'hemoglobin': 11.8, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0596', 'diagnosis': 'BUKAN_DBD', 'age': 43, 'gender': 'female', 'platelet': 183742, 'hematokrit': 39.9, 'wbc': 4345, 'hemoglobin': 16.6, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0597', 'diagnosis': 'DBD_POSITIF', 'age': 22, 'gender': 'female', 'platelet': 128503, 'hematokrit': 45.26, 'wbc': 4608, 'hemoglobin': 17.4, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0598', 'diagnosis': 'DBD_POSITIF', 'age': 52, 'gender': 'female', 'platelet': 108207, 'hematokrit': 39.58, 'wbc': 4638, 'hemoglobin': 16.3, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0599', 'diagnosis': 'DBD_POSITIF', 'age': 45, 'gender': 'male', 'platelet': 113241, 'hematokrit': 51.08, 'wbc': 5047, 'hemoglobin': 16.6, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0600', 'diagnosis': 'BUKAN_DBD', 'age': 46, 'gender': 'male', 'platelet': 211130, 'hematokrit': 40.57, 'wbc': 5494, 'hemoglobin': 13.0, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0601', 'diagnosis': 'DBD_POSITIF', 'age': 26, 'gender': 'female', 'platelet': 279244, 'hematokrit': 41.54, 'wbc': 5224, 'hemoglobin': 17.3, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0602', 'diagnosis': 'DBD_POSITIF', 'age': 69, 'gender': 'female', 'platelet': 176171, 'hematokrit': 43.69, 'wbc': 6178, 'hemoglobin': 12.7, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0603', 'diagnosis': 'DBD_POSITIF', 'age': 55, 'gender': 'male', 'platelet': 225906, 'hematokrit': 43.36, 'wbc': 6403, 'hemoglobin': 17.2, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0604', 'diagnosis': 'DBD_POSITIF', 'age': 67, 'gender': 'female', 'platelet': 292185, 'hematokrit': 49.13, 'wbc': 6991, 'hemoglobin': 17.5, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0605', 'diagnosis': 'DBD_POSITIF', 'age': 23, 'gender': 'female', 'platelet': 197302, 'hematokrit': 44.39, 'wbc': 4149, 'hemoglobin': 15.8, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0606', 'diagnosis': 'DBD_POSITIF', 'age': 36, 'gender': 'female', 'platelet': 238262, 'hematokrit': 40.39, 'wbc': 5549, 'hemoglobin': 17.4, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0607', 'diagnosis': 'DBD_POSITIF', 'age': 61, 'gender': 'female', 'platelet': 152832, 'hematokrit': 41.74, 'wbc': 5327, 'hemoglobin': 14.9, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0608', 'diagnosis': 'DBD_POSITIF', 'age': 28, 'gender': 'male', 'platelet': 101383, 'hematokrit': 45.13, 'wbc': 5564, 'hemoglobin': 13.1, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0609', 'diagnosis': 'DBD_POSITIF', 'age': 19, 'gender': 'female', 'platelet': 204291, 'hematokrit': 40.06, 'wbc': 4049, 'hemoglobin': 14.1, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0610', 'diagnosis': 'DBD_POSITIF', 'age': 64, 'gender': 'female', 'platelet': 235732, 'hematokrit': 46.56, 'wbc': 6511, 'hemoglobin': 15.1, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0611', 'diagnosis': 'BUKAN_DBD', 'age': 61, 'gender': 'male', 'platelet': 82674, 'hematokrit': 45.92, 'wbc': 5505, 'hemoglobin': 11.9, 'demam_tinggi': 0, 'sakit_kepala': 1, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0612', 'diagnosis': 'DBD_POSITIF', 'age': 61, 'gender': 'male', 'platelet': 194100, 'hematokrit': 48.01, 'wbc': 6502, 'hemoglobin': 15.2, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0613', 'diagnosis': 'DBD_POSITIF', 'age': 26, 'gender': 'female', 'platelet': 189369, 'hematokrit': 51.13, 'wbc': 4334, 'hemoglobin': 17.4, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0614', 'diagnosis': 'BUKAN_DBD', 'age': 38, 'gender': 'male', 'platelet': 102820, 'hematokrit': 50.77, 'wbc': 5375, 'hemoglobin': 12.6, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0615', 'diagnosis': 'DBD_POSITIF', 'age': 41, 'gender': 'female', 'platelet': 296112, 'hematokrit': 51.25, 'wbc': 4667, 'hemoglobin': 16.3, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0616', 'diagnosis': 'BUKAN_DBD', 'age': 51, 'gender': 'female', 'platelet': 236738, 'hematokrit': 41.43, 'wbc': 5672, 'hemoglobin': 16.9, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0617', 'diagnosis': 'DBD_POSITIF', 'age': 39, 'gender': 'male', 'platelet': 123794, 'hematokrit': 39.84, 'wbc': 6374, 'hemoglobin': 17.2, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0618', 'diagnosis': 'DBD_POSITIF', 'age': 20, 'gender': 'female', 'platelet': 213148, 'hematokrit': 42.23, 'wbc': 5015, 'hemoglobin': 17.3, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0619', 'diagnosis': 'DBD_POSITIF', 'age': 29, 'gender': 'female', 'platelet': 275926, 'hematokrit': 50.53, 'wbc': 4335, 'hemoglobin': 14.6, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0620', 'diagnosis': 'DBD_POSITIF', 'age': 45, 'gender': 'female', 'platelet': 208544, 'hematokrit': 51.61, 'wbc': 4665, 'hemoglobin': 17.4, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0621', 'diagnosis': 'DBD_POSITIF', 'age': 47, 'gender': 'female', 'platelet': 263414, 'hematokrit': 50.03, 'wbc': 4080, 'hemoglobin': 16.0, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0622', 'diagnosis': 'DBD_POSITIF', 'age': 43, 'gender': 'male', 'platelet': 117555, 'hematokrit': 39.54, 'wbc': 6134, 'hemoglobin': 12.5, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0623', 'diagnosis': 'DBD_POSITIF', 'age': 65, 'gender': 'male', 'platelet': 266280, 'hematokrit': 51.26, 'wbc': 5799, 'hemoglobin': 14.4, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0624', 'diagnosis': 'DBD_POSITIF', 'age': 38, 'gender': 'female', 'platelet': 112406, 'hematokrit': 43.93, 'wbc': 4257, 'hemoglobin': 15.8, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0625', 'diagnosis': 'DBD_POSITIF', 'age': 45, 'gender': 'male', 'platelet': 272644, 'hematokrit': 38.13, 'wbc': 4990, 'hemoglobin': 13.0, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0626', 'diagnosis': 'DBD_POSITIF', 'age': 43, 'gender': 'female', 'platelet': 120262, 'hematokrit': 44.19, 'wbc': 4184, 'hemoglobin': 15.3, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0627', 'diagnosis': 'DBD_POSITIF', 'age': 50, 'gender': 'female', 'platelet': 171320, 'hematokrit': 38.64, 'wbc': 5715, 'hemoglobin': 15.5, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0628', 'diagnosis': 'BUKAN_DBD', 'age': 38, 'gender': 'female', 'platelet': 297733, 'hematokrit': 45.61, 'wbc': 6745, 'hemoglobin': 12.5, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0629', 'diagnosis': 'DBD_POSITIF', 'age': 52, 'gender': 'female', 'platelet': 234288, 'hematokrit': 42.74, 'wbc': 4122, 'hemoglobin': 14.9, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0630', 'diagnosis': 'DBD_POSITIF', 'age': 69, 'gender': 'female', 'platelet': 279189, 'hematokrit': 44.63, 'wbc': 4604, 'hemoglobin': 16.1, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0631', 'diagnosis': 'DBD_POSITIF', 'age': 51, 'gender': 'male', 'platelet': 292208, 'hematokrit': 46.58, 'wbc': 6562, 'hemoglobin': 14.5, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0632', 'diagnosis': 'BUKAN_DBD', 'age': 58, 'gender': 'female', 'platelet': 110284, 'hematokrit': 50.16, 'wbc': 4903, 'hemoglobin': 11.6, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0633', 'diagnosis': 'DBD_POSITIF', 'age': 68, 'gender': 'male', 'platelet': 231243, 'hematokrit': 47.27, 'wbc': 5537, 'hemoglobin': 11.6, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0634', 'diagnosis': 'DBD_POSITIF', 'age': 64, 'gender': 'male', 'platelet': 170627, 'hematokrit': 44.08, 'wbc': 5981, 'hemoglobin': 13.6, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0635', 'diagnosis': 'DBD_POSITIF', 'age': 35, 'gender': 'female', 'platelet': 225405, 'hematokrit': 49.47, 'wbc': 5394, 'hemoglobin': 17.1, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0636', 'diagnosis': 'DBD_POSITIF', 'age': 28, 'gender': 'female', 'platelet': 241607, 'hematokrit': 50.68, 'wbc': 6352, 'hemoglobin': 12.9, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0637', 'diagnosis': 'BUKAN_DBD', 'age': 40, 'gender': 'female', 'platelet': 169023, 'hematokrit': 39.68, 'wbc': 5308, 'hemoglobin': 15.3, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0638', 'diagnosis': 'BUKAN_DBD', 'age': 65, 'gender': 'female', 'platelet': 287012, 'hematokrit': 45.45, 'wbc': 6704, 'hemoglobin': 12.8, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0639', 'diagnosis': 'DBD_POSITIF', 'age': 39, 'gender': 'female', 'platelet': 244772, 'hematokrit': 41.98, 'wbc': 5865, 'hemoglobin': 13.4, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0640', 'diagnosis': 'BUKAN_DBD', 'age': 34, 'gender': 'male', 'platelet': 294655, 'hematokrit': 38.66, 'wbc': 5941, 'hemoglobin': 16.6, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0641', 'diagnosis': 'DBD_POSITIF', 'age': 22, 'gender': 'female', 'platelet': 121516, 'hematokrit': 47.36, 'wbc': 6309, 'hemoglobin': 15.9, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0642', 'diagnosis': 'BUKAN_DBD', 'age': 61, 'gender': 'female', 'platelet': 95577, 'hematokrit': 50.08, 'wbc': 5597, 'hemoglobin': 12.1, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0643', 'diagnosis': 'DBD_POSITIF', 'age': 28, 'gender': 'male', 'platelet': 95015, 'hematokrit': 40.28, 'wbc': 4490, 'hemoglobin': 14.1, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0644', 'diagnosis': 'DBD_POSITIF', 'age': 47, 'gender': 'male', 'platelet': 171104, 'hematokrit': 49.37, 'wbc': 6785, 'hemoglobin': 11.7, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0645', 'diagnosis': 'DBD_POSITIF', 'age': 32, 'gender': 'female', 'platelet': 194412, 'hematokrit': 49.95, 'wbc': 5054, 'hemoglobin': 14.4, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0646', 'diagnosis': 'DBD_POSITIF', 'age': 44, 'gender': 'male', 'platelet': 171740, 'hematokrit': 50.8, 'wbc': 4701, 'hemoglobin': 15.5, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0647', 'diagnosis': 'DBD_POSITIF', 'age': 52, 'gender': 'female', 'platelet': 232308, 'hematokrit': 41.71, 'wbc': 6934, 'hemoglobin': 12.2, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0648', 'diagnosis': 'DBD_POSITIF', 'age': 50, 'gender': 'male', 'platelet': 146640, 'hematokrit': 50.66, 'wbc': 5291, 'hemoglobin': 13.2, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0649', 'diagnosis': 'DBD_POSITIF', 'age': 37, 'gender': 'male', 'platelet': 163190, 'hematokrit': 42.49, 'wbc': 6059, 'hemoglobin': 13.9, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0650', 'diagnosis': 'DBD_POSITIF', 'age': 33, 'gender': 'female', 'platelet': 209516, 'hematokrit': 45.73, 'wbc': 5214, 'hemoglobin': 17.0, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0651', 'diagnosis': 'DBD_POSITIF', 'age': 51, 'gender': 'male', 'platelet': 256776, 'hematokrit': 38.71, 'wbc': 5423, 'hemoglobin': 17.5, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0652', 'diagnosis': 'DBD_POSITIF', 'age': 19, 'gender': 'male', 'platelet': 253441, 'hematokrit': 38.61, 'wbc': 5560, 'hemoglobin': 11.8, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0653', 'diagnosis': 'DBD_POSITIF', 'age': 52, 'gender': 'male', 'platelet': 214718, 'hematokrit': 48.09, 'wbc': 5941, 'hemoglobin': 16.1, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0654', 'diagnosis': 'DBD_POSITIF', 'age': 57, 'gender': 'male', 'platelet': 167007, 'hematokrit': 44.22, 'wbc': 6138, 'hemoglobin': 13.7, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0655', 'diagnosis': 'BUKAN_DBD', 'age': 45, 'gender': 'male', 'platelet': 236978, 'hematokrit': 41.59, 'wbc': 4599, 'hemoglobin': 13.9, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0656', 'diagnosis': 'DBD_POSITIF', 'age': 64, 'gender': 'male', 'platelet': 297715, 'hematokrit': 40.67, 'wbc': 5809, 'hemoglobin': 16.0, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0657', 'diagnosis': 'BUKAN_DBD', 'age': 56, 'gender': 'female', 'platelet': 127728, 'hematokrit': 47.38, 'wbc': 6348, 'hemoglobin': 17.0, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0658', 'diagnosis': 'DBD_POSITIF', 'age': 23, 'gender': 'female', 'platelet': 94878, 'hematokrit': 38.01, 'wbc': 5134, 'hemoglobin': 17.2, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0659', 'diagnosis': 'DBD_POSITIF', 'age': 26, 'gender': 'male', 'platelet': 208925, 'hematokrit': 49.28, 'wbc': 4079, 'hemoglobin': 15.0, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0660', 'diagnosis': 'DBD_POSITIF', 'age': 37, 'gender': 'female', 'platelet': 89145, 'hematokrit': 39.11, 'wbc': 4835, 'hemoglobin': 13.6, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0661', 'diagnosis': 'DBD_POSITIF', 'age': 18, 'gender': 'female', 'platelet': 168578, 'hematokrit': 40.68, 'wbc': 4651, 'hemoglobin': 16.2, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0662', 'diagnosis': 'DBD_POSITIF', 'age': 25, 'gender': 'female', 'platelet': 98226, 'hematokrit': 43.41, 'wbc': 6480, 'hemoglobin': 13.0, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0663', 'diagnosis': 'BUKAN_DBD', 'age': 40, 'gender': 'male', 'platelet': 82802, 'hematokrit': 44.79, 'wbc': 4416, 'hemoglobin': 14.9, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0664', 'diagnosis': 'DBD_POSITIF', 'age': 20, 'gender': 'female', 'platelet': 104119, 'hematokrit': 42.97, 'wbc': 5470, 'hemoglobin': 13.7, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0665', 'diagnosis': 'DBD_POSITIF', 'age': 21, 'gender': 'male', 'platelet': 143560, 'hematokrit': 42.49, 'wbc': 6065, 'hemoglobin': 15.4, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0666', 'diagnosis': 'DBD_POSITIF', 'age': 42, 'gender': 'female', 'platelet': 137353, 'hematokrit': 51.49, 'wbc': 5077, 'hemoglobin': 12.9, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0667', 'diagnosis': 'BUKAN_DBD', 'age': 64, 'gender': 'male', 'platelet': 203001, 'hematokrit': 46.98, 'wbc': 5903, 'hemoglobin': 12.6, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0668', 'diagnosis': 'DBD_POSITIF', 'age': 55, 'gender': 'male', 'platelet': 273198, 'hematokrit': 38.33, 'wbc': 4745, 'hemoglobin': 17.0, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0669', 'diagnosis': 'BUKAN_DBD', 'age': 32, 'gender': 'female', 'platelet': 151641, 'hematokrit': 44.02, 'wbc': 6002, 'hemoglobin': 12.1, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0670', 'diagnosis': 'BUKAN_DBD', 'age': 38, 'gender': 'female', 'platelet': 131712, 'hematokrit': 50.25, 'wbc': 4239, 'hemoglobin': 14.5, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0671', 'diagnosis': 'DBD_POSITIF', 'age': 52, 'gender': 'male', 'platelet': 263261, 'hematokrit': 42.22, 'wbc': 6893, 'hemoglobin': 12.8, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0672', 'diagnosis': 'BUKAN_DBD', 'age': 63, 'gender': 'female', 'platelet': 268856, 'hematokrit': 39.32, 'wbc': 5944, 'hemoglobin': 11.7, 'demam_tinggi': 0, 'sakit_kepala': 1, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0673', 'diagnosis': 'DBD_POSITIF', 'age': 69, 'gender': 'female', 'platelet': 210085, 'hematokrit': 48.62, 'wbc': 6465, 'hemoglobin': 11.7, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0674', 'diagnosis': 'DBD_POSITIF', 'age': 31, 'gender': 'female', 'platelet': 148285, 'hematokrit': 46.48, 'wbc': 4855, 'hemoglobin': 12.6, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0675', 'diagnosis': 'DBD_POSITIF', 'age': 53, 'gender': 'male', 'platelet': 195278, 'hematokrit': 45.98, 'wbc': 6646, 'hemoglobin': 16.7, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0676', 'diagnosis': 'BUKAN_DBD', 'age': 29, 'gender': 'male', 'platelet': 254021, 'hematokrit': 38.75, 'wbc': 5796, 'hemoglobin': 13.2, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0677', 'diagnosis': 'DBD_POSITIF', 'age': 34, 'gender': 'female', 'platelet': 245201, 'hematokrit': 39.97, 'wbc': 5771, 'hemoglobin': 17.2, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0678', 'diagnosis': 'DBD_POSITIF', 'age': 56, 'gender': 'female', 'platelet': 104512, 'hematokrit': 46.72, 'wbc': 4419, 'hemoglobin': 15.0, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0679', 'diagnosis': 'DBD_POSITIF', 'age': 26, 'gender': 'female', 'platelet': 182077, 'hematokrit': 40.91, 'wbc': 6263, 'hemoglobin': 14.1, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0680', 'diagnosis': 'DBD_POSITIF', 'age': 52, 'gender': 'male', 'platelet': 290103, 'hematokrit': 45.06, 'wbc': 4708, 'hemoglobin': 15.0, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0681', 'diagnosis': 'DBD_POSITIF', 'age': 30, 'gender': 'male', 'platelet': 274626, 'hematokrit': 45.63, 'wbc': 6598, 'hemoglobin': 14.6, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0682', 'diagnosis': 'BUKAN_DBD', 'age': 32, 'gender': 'female', 'platelet': 82064, 'hematokrit': 41.97, 'wbc': 5667, 'hemoglobin': 16.1, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0683', 'diagnosis': 'BUKAN_DBD', 'age': 35, 'gender': 'female', 'platelet': 175614, 'hematokrit': 51.28, 'wbc': 5353, 'hemoglobin': 13.2, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0684', 'diagnosis': 'DBD_POSITIF', 'age': 68, 'gender': 'female', 'platelet': 262639, 'hematokrit': 49.79, 'wbc': 6035, 'hemoglobin': 13.6, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0685', 'diagnosis': 'DBD_POSITIF', 'age': 50, 'gender': 'female', 'platelet': 197639, 'hematokrit': 48.11, 'wbc': 6880, 'hemoglobin': 16.9, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0686', 'diagnosis': 'DBD_POSITIF', 'age': 23, 'gender': 'female', 'platelet': 110011, 'hematokrit': 39.09, 'wbc': 4679, 'hemoglobin': 17.2, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0687', 'diagnosis': 'DBD_POSITIF', 'age': 44, 'gender': 'female', 'platelet': 151152, 'hematokrit': 39.49, 'wbc': 4486, 'hemoglobin': 16.9, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0688', 'diagnosis': 'DBD_POSITIF', 'age': 40, 'gender': 'male', 'platelet': 284583, 'hematokrit': 44.9, 'wbc': 4622, 'hemoglobin': 14.0, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0689', 'diagnosis': 'BUKAN_DBD', 'age': 44, 'gender': 'female', 'platelet': 90960, 'hematokrit': 40.25, 'wbc': 5438, 'hemoglobin': 16.2, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0690', 'diagnosis': 'BUKAN_DBD', 'age': 51, 'gender': 'male', 'platelet': 201789, 'hematokrit': 51.7, 'wbc': 4218, 'hemoglobin': 14.4, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0691', 'diagnosis': 'DBD_POSITIF', 'age': 63, 'gender': 'female', 'platelet': 138920, 'hematokrit': 40.22, 'wbc': 6768, 'hemoglobin': 14.5, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0692', 'diagnosis': 'DBD_POSITIF', 'age': 55, 'gender': 'female', 'platelet': 101387, 'hematokrit': 44.82, 'wbc': 6428, 'hemoglobin': 12.7, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0693', 'diagnosis': 'DBD_POSITIF', 'age': 31, 'gender': 'male', 'platelet': 226396, 'hematokrit': 43.1, 'wbc': 6134, 'hemoglobin': 15.0, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0694', 'diagnosis': 'DBD_POSITIF', 'age': 53, 'gender': 'male', 'platelet': 143960, 'hematokrit': 46.95, 'wbc': 5484, 'hemoglobin': 12.6, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0695', 'diagnosis': 'DBD_POSITIF', 'age': 25, 'gender': 'male', 'platelet': 202994, 'hematokrit': 39.81, 'wbc': 6862, 'hemoglobin': 13.5, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0696', 'diagnosis': 'BUKAN_DBD', 'age': 52, 'gender': 'male', 'platelet': 282851, 'hematokrit': 44.02, 'wbc': 6458, 'hemoglobin': 16.6, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0697', 'diagnosis': 'DBD_POSITIF', 'age': 36, 'gender': 'female', 'platelet': 112628, 'hematokrit': 41.85, 'wbc': 4690, 'hemoglobin': 12.7, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0698', 'diagnosis': 'BUKAN_DBD', 'age': 47, 'gender': 'male', 'platelet': 201269, 'hematokrit': 50.43, 'wbc': 6029, 'hemoglobin': 11.9, 'demam_tinggi': 0, 'sakit_kepala': 1, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0699', 'diagnosis': 'DBD_POSITIF', 'age': 31, 'gender': 'female', 'platelet': 286168, 'hematokrit': 38.57, 'wbc': 5012, 'hemoglobin': 11.9, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0700', 'diagnosis': 'DBD_POSITIF', 'age': 37, 'gender': 'male', 'platelet': 127452, 'hematokrit': 50.79, 'wbc': 6572, 'hemoglobin': 17.1, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0701', 'diagnosis': 'DBD_POSITIF', 'age': 66, 'gender': 'female', 'platelet': 121098, 'hematokrit': 49.66, 'wbc': 4446, 'hemoglobin': 14.5, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0702', 'diagnosis': 'BUKAN_DBD', 'age': 42, 'gender': 'female', 'platelet': 281531, 'hematokrit': 42.17, 'wbc': 6347, 'hemoglobin': 14.0, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0703', 'diagnosis': 'DBD_POSITIF', 'age': 57, 'gender': 'female', 'platelet': 250307, 'hematokrit': 49.05, 'wbc': 6455, 'hemoglobin': 16.4, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0704', 'diagnosis': 'DBD_POSITIF', 'age': 41, 'gender': 'female', 'platelet': 166861, 'hematokrit': 38.44, 'wbc': 4374, 'hemoglobin': 16.5, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0705', 'diagnosis': 'BUKAN_DBD', 'age': 31, 'gender': 'female', 'platelet': 107949, 'hematokrit': 51.54, 'wbc': 6280, 'hemoglobin': 13.5, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0706', 'diagnosis': 'DBD_POSITIF', 'age': 43, 'gender': 'female', 'platelet': 233893, 'hematokrit': 45.37, 'wbc': 5922, 'hemoglobin': 15.7, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0707', 'diagnosis': 'DBD_POSITIF', 'age': 55, 'gender': 'male', 'platelet': 282684, 'hematokrit': 42.25, 'wbc': 4637, 'hemoglobin': 16.1, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0708', 'diagnosis': 'DBD_POSITIF', 'age': 40, 'gender': 'female', 'platelet': 233104, 'hematokrit': 43.08, 'wbc': 5770, 'hemoglobin': 15.4, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0709', 'diagnosis': 'DBD_POSITIF', 'age': 39, 'gender': 'male', 'platelet': 153537, 'hematokrit': 38.93, 'wbc': 6697, 'hemoglobin': 12.4, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0710', 'diagnosis': 'DBD_POSITIF', 'age': 65, 'gender': 'male', 'platelet': 226375, 'hematokrit': 51.85, 'wbc': 6233, 'hemoglobin': 16.8, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0711', 'diagnosis': 'DBD_POSITIF', 'age': 36, 'gender': 'female', 'platelet': 196003, 'hematokrit': 38.55, 'wbc': 6125, 'hemoglobin': 14.7, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0712', 'diagnosis': 'BUKAN_DBD', 'age': 63, 'gender': 'male', 'platelet': 293065, 'hematokrit': 47.17, 'wbc': 5504, 'hemoglobin': 13.2, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0713', 'diagnosis': 'DBD_POSITIF', 'age': 68, 'gender': 'female', 'platelet': 223375, 'hematokrit': 44.2, 'wbc': 4193, 'hemoglobin': 14.1, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0714', 'diagnosis': 'DBD_POSITIF', 'age': 20, 'gender': 'male', 'platelet': 130701, 'hematokrit': 51.28, 'wbc': 5399, 'hemoglobin': 11.7, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0715', 'diagnosis': 'BUKAN_DBD', 'age': 59, 'gender': 'female', 'platelet': 130511, 'hematokrit': 41.44, 'wbc': 6334, 'hemoglobin': 12.3, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0716', 'diagnosis': 'DBD_POSITIF', 'age': 36, 'gender': 'male', 'platelet': 160664, 'hematokrit': 45.45, 'wbc': 5505, 'hemoglobin': 16.1, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0717', 'diagnosis': 'DBD_POSITIF', 'age': 26, 'gender': 'female', 'platelet': 229352, 'hematokrit': 44.75, 'wbc': 5746, 'hemoglobin': 11.5, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0718', 'diagnosis': 'DBD_POSITIF', 'age': 45, 'gender': 'female', 'platelet': 119427, 'hematokrit': 47.84, 'wbc': 4249, 'hemoglobin': 14.0, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0719', 'diagnosis': 'DBD_POSITIF', 'age': 37, 'gender': 'female', 'platelet': 177180, 'hematokrit': 38.95, 'wbc': 5224, 'hemoglobin': 14.6, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0720', 'diagnosis': 'BUKAN_DBD', 'age': 62, 'gender': 'female', 'platelet': 183550, 'hematokrit': 40.71, 'wbc': 4535, 'hemoglobin': 11.8, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0721', 'diagnosis': 'BUKAN_DBD', 'age': 24, 'gender': 'male', 'platelet': 218039, 'hematokrit': 41.0, 'wbc': 6347, 'hemoglobin': 17.3, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0722', 'diagnosis': 'DBD_POSITIF', 'age': 31, 'gender': 'female', 'platelet': 217733, 'hematokrit': 48.33, 'wbc': 5106, 'hemoglobin': 12.9, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0723', 'diagnosis': 'DBD_POSITIF', 'age': 26, 'gender': 'male', 'platelet': 157952, 'hematokrit': 40.65, 'wbc': 6856, 'hemoglobin': 13.3, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0724', 'diagnosis': 'BUKAN_DBD', 'age': 36, 'gender': 'male', 'platelet': 146046, 'hematokrit': 46.03, 'wbc': 4457, 'hemoglobin': 13.3, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0725', 'diagnosis': 'DBD_POSITIF', 'age': 64, 'gender': 'male', 'platelet': 186918, 'hematokrit': 41.01, 'wbc': 6738, 'hemoglobin': 12.9, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0726', 'diagnosis': 'DBD_POSITIF', 'age': 69, 'gender': 'female', 'platelet': 115200, 'hematokrit': 50.06, 'wbc': 5387, 'hemoglobin': 11.5, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0727', 'diagnosis': 'DBD_POSITIF', 'age': 31, 'gender': 'male', 'platelet': 147442, 'hematokrit': 51.19, 'wbc': 6765, 'hemoglobin': 15.9, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0728', 'diagnosis': 'BUKAN_DBD', 'age': 55, 'gender': 'male', 'platelet': 272743, 'hematokrit': 45.26, 'wbc': 4039, 'hemoglobin': 17.3, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0729', 'diagnosis': 'DBD_POSITIF', 'age': 53, 'gender': 'male', 'platelet': 171070, 'hematokrit': 42.93, 'wbc': 5539, 'hemoglobin': 12.8, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0730', 'diagnosis': 'DBD_POSITIF', 'age': 57, 'gender': 'female', 'platelet': 138168, 'hematokrit': 41.28, 'wbc': 6155, 'hemoglobin': 15.5, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0731', 'diagnosis': 'DBD_POSITIF', 'age': 34, 'gender': 'female', 'platelet': 128322, 'hematokrit': 38.7, 'wbc': 4260, 'hemoglobin': 16.0, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0732', 'diagnosis': 'DBD_POSITIF', 'age': 47, 'gender': 'male', 'platelet': 293056, 'hematokrit': 41.76, 'wbc': 5641, 'hemoglobin': 16.6, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0733', 'diagnosis': 'BUKAN_DBD', 'age': 26, 'gender': 'female', 'platelet': 248768, 'hematokrit': 47.16, 'wbc': 5247, 'hemoglobin': 14.0, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0734', 'diagnosis': 'DBD_POSITIF', 'age': 50, 'gender': 'female', 'platelet': 150246, 'hematokrit': 45.47, 'wbc': 6573, 'hemoglobin': 13.3, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0735', 'diagnosis': 'DBD_POSITIF', 'age': 69, 'gender': 'male', 'platelet': 249964, 'hematokrit': 51.22, 'wbc': 6757, 'hemoglobin': 13.5, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0736', 'diagnosis': 'DBD_POSITIF', 'age': 42, 'gender': 'male', 'platelet': 95583, 'hematokrit': 43.55, 'wbc': 4125, 'hemoglobin': 15.8, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0737', 'diagnosis': 'DBD_POSITIF', 'age': 31, 'gender': 'female', 'platelet': 162720, 'hematokrit': 47.71, 'wbc': 5229, 'hemoglobin': 16.4, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0738', 'diagnosis': 'DBD_POSITIF', 'age': 28, 'gender': 'male', 'platelet': 266287, 'hematokrit': 44.85, 'wbc': 5306, 'hemoglobin': 12.6, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0739', 'diagnosis': 'DBD_POSITIF', 'age': 52, 'gender': 'female', 'platelet': 235925, 'hematokrit': 45.18, 'wbc': 6101, 'hemoglobin': 13.7, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0740', 'diagnosis': 'BUKAN_DBD', 'age': 58, 'gender': 'female', 'platelet': 217181, 'hematokrit': 41.75, 'wbc': 6393, 'hemoglobin': 16.9, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0741', 'diagnosis': 'DBD_POSITIF', 'age': 31, 'gender': 'female', 'platelet': 139757, 'hematokrit': 44.37, 'wbc': 4135, 'hemoglobin': 16.3, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0742', 'diagnosis': 'DBD_POSITIF', 'age': 47, 'gender': 'female', 'platelet': 86659, 'hematokrit': 44.59, 'wbc': 6377, 'hemoglobin': 17.4, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0743', 'diagnosis': 'DBD_POSITIF', 'age': 58, 'gender': 'female', 'platelet': 81238, 'hematokrit': 47.89, 'wbc': 5459, 'hemoglobin': 16.0, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0744', 'diagnosis': 'DBD_POSITIF', 'age': 21, 'gender': 'female', 'platelet': 201270, 'hematokrit': 51.17, 'wbc': 4135, 'hemoglobin': 13.9, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0745', 'diagnosis': 'BUKAN_DBD', 'age': 21, 'gender': 'male', 'platelet': 199211, 'hematokrit': 42.61, 'wbc': 4812, 'hemoglobin': 15.0, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0746', 'diagnosis': 'DBD_POSITIF', 'age': 45, 'gender': 'male', 'platelet': 95064, 'hematokrit': 38.59, 'wbc': 4851, 'hemoglobin': 15.5, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0747', 'diagnosis': 'DBD_POSITIF', 'age': 25, 'gender': 'female', 'platelet': 242187, 'hematokrit': 44.95, 'wbc': 5744, 'hemoglobin': 12.0, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0748', 'diagnosis': 'DBD_POSITIF', 'age': 19, 'gender': 'female', 'platelet': 243024, 'hematokrit': 45.62, 'wbc': 5938, 'hemoglobin': 14.8, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0749', 'diagnosis': 'DBD_POSITIF', 'age': 58, 'gender': 'female', 'platelet': 216692, 'hematokrit': 40.36, 'wbc': 4870, 'hemoglobin': 15.8, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0750', 'diagnosis': 'DBD_POSITIF', 'age': 63, 'gender': 'male', 'platelet': 179790, 'hematokrit': 48.65, 'wbc': 6939, 'hemoglobin': 12.5, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0751', 'diagnosis': 'BUKAN_DBD', 'age': 39, 'gender': 'female', 'platelet': 182985, 'hematokrit': 51.79, 'wbc': 5472, 'hemoglobin': 16.2, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0752', 'diagnosis': 'BUKAN_DBD', 'age': 58, 'gender': 'male', 'platelet': 124258, 'hematokrit': 51.24, 'wbc': 4634, 'hemoglobin': 15.0, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0753', 'diagnosis': 'DBD_POSITIF', 'age': 33, 'gender': 'female', 'platelet': 215542, 'hematokrit': 40.76, 'wbc': 5651, 'hemoglobin': 17.2, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0754', 'diagnosis': 'BUKAN_DBD', 'age': 46, 'gender': 'female', 'platelet': 233075, 'hematokrit': 50.26, 'wbc': 4668, 'hemoglobin': 11.8, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0755', 'diagnosis': 'DBD_POSITIF', 'age': 66, 'gender': 'male', 'platelet': 238643, 'hematokrit': 47.86, 'wbc': 5293, 'hemoglobin': 13.1, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0756', 'diagnosis': 'DBD_POSITIF', 'age': 65, 'gender': 'male', 'platelet': 104668, 'hematokrit': 44.35, 'wbc': 4268, 'hemoglobin': 15.1, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0757', 'diagnosis': 'DBD_POSITIF', 'age': 47, 'gender': 'female', 'platelet': 157259, 'hematokrit': 45.57, 'wbc': 4860, 'hemoglobin': 13.3, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0758', 'diagnosis': 'BUKAN_DBD', 'age': 29, 'gender': 'female', 'platelet': 192192, 'hematokrit': 49.89, 'wbc': 4481, 'hemoglobin': 15.8, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0759', 'diagnosis': 'DBD_POSITIF', 'age': 52, 'gender': 'female', 'platelet': 176576, 'hematokrit': 44.72, 'wbc': 5261, 'hemoglobin': 16.1, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0760', 'diagnosis': 'DBD_POSITIF', 'age': 28, 'gender': 'male', 'platelet': 185481, 'hematokrit': 43.22, 'wbc': 6332, 'hemoglobin': 12.1, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0761', 'diagnosis': 'DBD_POSITIF', 'age': 63, 'gender': 'male', 'platelet': 191505, 'hematokrit': 44.91, 'wbc': 4102, 'hemoglobin': 14.6, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0762', 'diagnosis': 'DBD_POSITIF', 'age': 67, 'gender': 'male', 'platelet': 243118, 'hematokrit': 46.11, 'wbc': 5453, 'hemoglobin': 14.6, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0763', 'diagnosis': 'DBD_POSITIF', 'age': 38, 'gender': 'male', 'platelet': 282049, 'hematokrit': 40.65, 'wbc': 4791, 'hemoglobin': 13.7, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0764', 'diagnosis': 'DBD_POSITIF', 'age': 38, 'gender': 'male', 'platelet': 288327, 'hematokrit': 50.61, 'wbc': 5677, 'hemoglobin': 17.1, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0765', 'diagnosis': 'DBD_POSITIF', 'age': 22, 'gender': 'male', 'platelet': 85397, 'hematokrit': 47.44, 'wbc': 4238, 'hemoglobin': 16.5, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0766', 'diagnosis': 'DBD_POSITIF', 'age': 65, 'gender': 'female', 'platelet': 179925, 'hematokrit': 46.87, 'wbc': 6788, 'hemoglobin': 15.7, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0767', 'diagnosis': 'DBD_POSITIF', 'age': 37, 'gender': 'female', 'platelet': 163481, 'hematokrit': 39.39, 'wbc': 6692, 'hemoglobin': 15.8, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0768', 'diagnosis': 'BUKAN_DBD', 'age': 54, 'gender': 'male', 'platelet': 233305, 'hematokrit': 46.46, 'wbc': 5588, 'hemoglobin': 14.3, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0769', 'diagnosis': 'BUKAN_DBD', 'age': 20, 'gender': 'female', 'platelet': 294408, 'hematokrit': 39.69, 'wbc': 4881, 'hemoglobin': 17.0, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0770', 'diagnosis': 'DBD_POSITIF', 'age': 61, 'gender': 'female', 'platelet': 140308, 'hematokrit': 39.1, 'wbc': 6654, 'hemoglobin': 15.7, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0771', 'diagnosis': 'DBD_POSITIF', 'age': 50, 'gender': 'male', 'platelet': 280798, 'hematokrit': 45.38, 'wbc': 6235, 'hemoglobin': 15.9, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0772', 'diagnosis': 'BUKAN_DBD', 'age': 26, 'gender': 'female', 'platelet': 274291, 'hematokrit': 43.64, 'wbc': 4887, 'hemoglobin': 16.7, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0773', 'diagnosis': 'DBD_POSITIF', 'age': 26, 'gender': 'male', 'platelet': 81130, 'hematokrit': 46.24, 'wbc': 5279, 'hemoglobin': 13.1, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0774', 'diagnosis': 'DBD_POSITIF', 'age': 21, 'gender': 'male', 'platelet': 204293, 'hematokrit': 39.25, 'wbc': 4923, 'hemoglobin': 16.3, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0775', 'diagnosis': 'DBD_POSITIF', 'age': 52, 'gender': 'female', 'platelet': 94071, 'hematokrit': 44.03, 'wbc': 4793, 'hemoglobin': 12.7, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0776', 'diagnosis': 'BUKAN_DBD', 'age': 34, 'gender': 'male', 'platelet': 165517, 'hematokrit': 40.45, 'wbc': 6577, 'hemoglobin': 13.6, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0777', 'diagnosis': 'DBD_POSITIF', 'age': 51, 'gender': 'male', 'platelet': 190240, 'hematokrit': 51.82, 'wbc': 4675, 'hemoglobin': 13.5, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0778', 'diagnosis': 'DBD_POSITIF', 'age': 41, 'gender': 'male', 'platelet': 82118, 'hematokrit': 45.86, 'wbc': 6439, 'hemoglobin': 17.4, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0779', 'diagnosis': 'DBD_POSITIF', 'age': 49, 'gender': 'male', 'platelet': 211735, 'hematokrit': 47.62, 'wbc': 5681, 'hemoglobin': 16.6, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0780', 'diagnosis': 'BUKAN_DBD', 'age': 18, 'gender': 'male', 'platelet': 142408, 'hematokrit': 42.56, 'wbc': 5491, 'hemoglobin': 15.7, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0781', 'diagnosis': 'DBD_POSITIF', 'age': 25, 'gender': 'male', 'platelet': 131786, 'hematokrit': 39.33, 'wbc': 5849, 'hemoglobin': 15.9, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0782', 'diagnosis': 'DBD_POSITIF', 'age': 62, 'gender': 'male', 'platelet': 161271, 'hematokrit': 51.66, 'wbc': 5276, 'hemoglobin': 14.9, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0783', 'diagnosis': 'BUKAN_DBD', 'age': 40, 'gender': 'male', 'platelet': 99158, 'hematokrit': 42.01, 'wbc': 4671, 'hemoglobin': 17.2, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0784', 'diagnosis': 'DBD_POSITIF', 'age': 64, 'gender': 'female', 'platelet': 111087, 'hematokrit': 43.93, 'wbc': 6908, 'hemoglobin': 14.5, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0785', 'diagnosis': 'DBD_POSITIF', 'age': 57, 'gender': 'female', 'platelet': 168114, 'hematokrit': 47.1, 'wbc': 6513, 'hemoglobin': 13.8, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0786', 'diagnosis': 'DBD_POSITIF', 'age': 29, 'gender': 'female', 'platelet': 264193, 'hematokrit': 38.35, 'wbc': 4838, 'hemoglobin': 12.5, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0787', 'diagnosis': 'BUKAN_DBD', 'age': 29, 'gender': 'male', 'platelet': 99874, 'hematokrit': 49.34, 'wbc': 5312, 'hemoglobin': 16.2, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0788', 'diagnosis': 'BUKAN_DBD', 'age': 63, 'gender': 'male', 'platelet': 163443, 'hematokrit': 45.51, 'wbc': 5073, 'hemoglobin': 15.9, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0789', 'diagnosis': 'DBD_POSITIF', 'age': 64, 'gender': 'female', 'platelet': 120821, 'hematokrit': 41.9, 'wbc': 4003, 'hemoglobin': 13.8, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0790', 'diagnosis': 'BUKAN_DBD', 'age': 32, 'gender': 'female', 'platelet': 195675, 'hematokrit': 38.86, 'wbc': 5654, 'hemoglobin': 11.7, 'demam_tinggi': 0, 'sakit_kepala': 1, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0791', 'diagnosis': 'DBD_POSITIF', 'age': 58, 'gender': 'female', 'platelet': 140582, 'hematokrit': 40.27, 'wbc': 6899, 'hemoglobin': 16.5, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0792', 'diagnosis': 'BUKAN_DBD', 'age': 36, 'gender': 'male', 'platelet': 202603, 'hematokrit': 50.53, 'wbc': 5908, 'hemoglobin': 11.6, 'demam_tinggi': 0, 'sakit_kepala': 1, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0793', 'diagnosis': 'BUKAN_DBD', 'age': 43, 'gender': 'female', 'platelet': 233859, 'hematokrit': 47.6, 'wbc': 5893, 'hemoglobin': 15.7, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0794', 'diagnosis': 'DBD_POSITIF', 'age': 69, 'gender': 'female', 'platelet': 275775, 'hematokrit': 41.5, 'wbc': 5922, 'hemoglobin': 17.3, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0795', 'diagnosis': 'DBD_POSITIF', 'age': 46, 'gender': 'male', 'platelet': 232777, 'hematokrit': 38.92, 'wbc': 5285, 'hemoglobin': 14.1, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0796', 'diagnosis': 'DBD_POSITIF', 'age': 39, 'gender': 'female', 'platelet': 149381, 'hematokrit': 47.67, 'wbc': 4534, 'hemoglobin': 12.9, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0797', 'diagnosis': 'DBD_POSITIF', 'age': 57, 'gender': 'male', 'platelet': 191800, 'hematokrit': 46.01, 'wbc': 6950, 'hemoglobin': 15.7, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0798', 'diagnosis': 'DBD_POSITIF', 'age': 38, 'gender': 'male', 'platelet': 210805, 'hematokrit': 43.66, 'wbc': 5084, 'hemoglobin': 16.4, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0799', 'diagnosis': 'DBD_POSITIF', 'age': 68, 'gender': 'male', 'platelet': 255725, 'hematokrit': 43.09, 'wbc': 5379, 'hemoglobin': 14.8, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0800', 'diagnosis': 'BUKAN_DBD', 'age': 55, 'gender': 'female', 'platelet': 162018, 'hematokrit': 41.04, 'wbc': 4645, 'hemoglobin': 17.3, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0801', 'diagnosis': 'BUKAN_DBD', 'age': 37, 'gender': 'female', 'platelet': 180592, 'hematokrit': 47.37, 'wbc': 4023, 'hemoglobin': 11.8, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0802', 'diagnosis': 'DBD_POSITIF', 'age': 46, 'gender': 'male', 'platelet': 171626, 'hematokrit': 51.59, 'wbc': 5316, 'hemoglobin': 14.5, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0803', 'diagnosis': 'DBD_POSITIF', 'age': 68, 'gender': 'female', 'platelet': 166217, 'hematokrit': 40.46, 'wbc': 4556, 'hemoglobin': 15.8, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0804', 'diagnosis': 'DBD_POSITIF', 'age': 21, 'gender': 'female', 'platelet': 243324, 'hematokrit': 46.36, 'wbc': 6738, 'hemoglobin': 16.7, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0805', 'diagnosis': 'DBD_POSITIF', 'age': 24, 'gender': 'female', 'platelet': 284404, 'hematokrit': 43.94, 'wbc': 4355, 'hemoglobin': 12.6, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0806', 'diagnosis': 'DBD_POSITIF', 'age': 45, 'gender': 'female', 'platelet': 152799, 'hematokrit': 44.25, 'wbc': 6007, 'hemoglobin': 16.3, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0807', 'diagnosis': 'BUKAN_DBD', 'age': 45, 'gender': 'male', 'platelet': 142185, 'hematokrit': 41.56, 'wbc': 4869, 'hemoglobin': 14.8, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0808', 'diagnosis': 'BUKAN_DBD', 'age': 21, 'gender': 'female', 'platelet': 289385, 'hematokrit': 49.55, 'wbc': 6988, 'hemoglobin': 13.9, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0809', 'diagnosis': 'DBD_POSITIF', 'age': 39, 'gender': 'male', 'platelet': 121538, 'hematokrit': 44.79, 'wbc': 4574, 'hemoglobin': 12.3, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0810', 'diagnosis': 'DBD_POSITIF', 'age': 29, 'gender': 'male', 'platelet': 100343, 'hematokrit': 45.61, 'wbc': 4028, 'hemoglobin': 16.7, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0811', 'diagnosis': 'DBD_POSITIF', 'age': 62, 'gender': 'female', 'platelet': 291470, 'hematokrit': 42.27, 'wbc': 6404, 'hemoglobin': 12.4, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0812', 'diagnosis': 'DBD_POSITIF', 'age': 20, 'gender': 'male', 'platelet': 252304, 'hematokrit': 40.55, 'wbc': 4364, 'hemoglobin': 13.4, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0813', 'diagnosis': 'DBD_POSITIF', 'age': 39, 'gender': 'female', 'platelet': 200026, 'hematokrit': 39.2, 'wbc': 6655, 'hemoglobin': 13.2, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0814', 'diagnosis': 'DBD_POSITIF', 'age': 61, 'gender': 'female', 'platelet': 133106, 'hematokrit': 48.0, 'wbc': 4408, 'hemoglobin': 16.7, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0815', 'diagnosis': 'DBD_POSITIF', 'age': 19, 'gender': 'male', 'platelet': 194322, 'hematokrit': 40.75, 'wbc': 5314, 'hemoglobin': 15.5, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0816', 'diagnosis': 'DBD_POSITIF', 'age': 41, 'gender': 'male', 'platelet': 161227, 'hematokrit': 47.66, 'wbc': 6614, 'hemoglobin': 16.3, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0817', 'diagnosis': 'BUKAN_DBD', 'age': 51, 'gender': 'male', 'platelet': 264151, 'hematokrit': 43.47, 'wbc': 5176, 'hemoglobin': 13.0, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0818', 'diagnosis': 'DBD_POSITIF', 'age': 44, 'gender': 'male', 'platelet': 236100, 'hematokrit': 43.82, 'wbc': 4218, 'hemoglobin': 15.2, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0819', 'diagnosis': 'DBD_POSITIF', 'age': 58, 'gender': 'female', 'platelet': 122135, 'hematokrit': 44.57, 'wbc': 6220, 'hemoglobin': 14.9, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0820', 'diagnosis': 'DBD_POSITIF', 'age': 18, 'gender': 'female', 'platelet': 242138, 'hematokrit': 43.15, 'wbc': 4607, 'hemoglobin': 16.5, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0821', 'diagnosis': 'BUKAN_DBD', 'age': 25, 'gender': 'female', 'platelet': 199599, 'hematokrit': 39.41, 'wbc': 5035, 'hemoglobin': 16.9, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0822', 'diagnosis': 'BUKAN_DBD', 'age': 40, 'gender': 'male', 'platelet': 163470, 'hematokrit': 42.33, 'wbc': 5539, 'hemoglobin': 11.6, 'demam_tinggi': 0, 'sakit_kepala': 1, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0823', 'diagnosis': 'DBD_POSITIF', 'age': 55, 'gender': 'male', 'platelet': 100910, 'hematokrit': 47.29, 'wbc': 4857, 'hemoglobin': 15.5, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0824', 'diagnosis': 'BUKAN_DBD', 'age': 23, 'gender': 'male', 'platelet': 218213, 'hematokrit': 47.32, 'wbc': 5602, 'hemoglobin': 11.8, 'demam_tinggi': 0, 'sakit_kepala': 1, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0825', 'diagnosis': 'DBD_POSITIF', 'age': 39, 'gender': 'female', 'platelet': 125950, 'hematokrit': 42.01, 'wbc': 6704, 'hemoglobin': 14.8, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0826', 'diagnosis': 'DBD_POSITIF', 'age': 42, 'gender': 'male', 'platelet': 266795, 'hematokrit': 44.44, 'wbc': 4968, 'hemoglobin': 13.2, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0827', 'diagnosis': 'DBD_POSITIF', 'age': 35, 'gender': 'female', 'platelet': 96225, 'hematokrit': 40.71, 'wbc': 5500, 'hemoglobin': 13.3, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0828', 'diagnosis': 'DBD_POSITIF', 'age': 34, 'gender': 'male', 'platelet': 298195, 'hematokrit': 40.95, 'wbc': 5105, 'hemoglobin': 13.6, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0829', 'diagnosis': 'DBD_POSITIF', 'age': 29, 'gender': 'female', 'platelet': 112959, 'hematokrit': 38.32, 'wbc': 5640, 'hemoglobin': 15.2, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0830', 'diagnosis': 'DBD_POSITIF', 'age': 23, 'gender': 'female', 'platelet': 129192, 'hematokrit': 50.55, 'wbc': 5716, 'hemoglobin': 13.5, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0831', 'diagnosis': 'DBD_POSITIF', 'age': 43, 'gender': 'male', 'platelet': 159711, 'hematokrit': 40.95, 'wbc': 6488, 'hemoglobin': 15.9, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0832', 'diagnosis': 'BUKAN_DBD', 'age': 44, 'gender': 'male', 'platelet': 221123, 'hematokrit': 41.19, 'wbc': 4616, 'hemoglobin': 13.9, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0833', 'diagnosis': 'BUKAN_DBD', 'age': 25, 'gender': 'female', 'platelet': 282500, 'hematokrit': 41.91, 'wbc': 4225, 'hemoglobin': 11.9, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0834', 'diagnosis': 'DBD_POSITIF', 'age': 36, 'gender': 'female', 'platelet': 83449, 'hematokrit': 39.78, 'wbc': 6418, 'hemoglobin': 16.2, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0835', 'diagnosis': 'BUKAN_DBD', 'age': 59, 'gender': 'male', 'platelet': 252167, 'hematokrit': 46.95, 'wbc': 4027, 'hemoglobin': 13.2, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0836', 'diagnosis': 'DBD_POSITIF', 'age': 18, 'gender': 'male', 'platelet': 184213, 'hematokrit': 39.05, 'wbc': 4994, 'hemoglobin': 14.1, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0837', 'diagnosis': 'DBD_POSITIF', 'age': 46, 'gender': 'female', 'platelet': 289001, 'hematokrit': 39.88, 'wbc': 4015, 'hemoglobin': 15.6, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0838', 'diagnosis': 'BUKAN_DBD', 'age': 62, 'gender': 'male', 'platelet': 240262, 'hematokrit': 47.03, 'wbc': 4332, 'hemoglobin': 13.5, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0839', 'diagnosis': 'DBD_POSITIF', 'age': 66, 'gender': 'female', 'platelet': 180245, 'hematokrit': 42.76, 'wbc': 4482, 'hemoglobin': 11.8, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0840', 'diagnosis': 'DBD_POSITIF', 'age': 52, 'gender': 'female', 'platelet': 177069, 'hematokrit': 47.91, 'wbc': 4565, 'hemoglobin': 13.7, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0841', 'diagnosis': 'DBD_POSITIF', 'age': 57, 'gender': 'male', 'platelet': 237213, 'hematokrit': 45.8, 'wbc': 6161, 'hemoglobin': 17.2, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0842', 'diagnosis': 'DBD_POSITIF', 'age': 31, 'gender': 'male', 'platelet': 103908, 'hematokrit': 41.58, 'wbc': 6085, 'hemoglobin': 15.4, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0843', 'diagnosis': 'DBD_POSITIF', 'age': 52, 'gender': 'male', 'platelet': 184847, 'hematokrit': 47.11, 'wbc': 4453, 'hemoglobin': 15.5, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0844', 'diagnosis': 'DBD_POSITIF', 'age': 65, 'gender': 'male', 'platelet': 200910, 'hematokrit': 39.63, 'wbc': 6789, 'hemoglobin': 15.3, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0845', 'diagnosis': 'DBD_POSITIF', 'age': 62, 'gender': 'male', 'platelet': 243394, 'hematokrit': 45.51, 'wbc': 4165, 'hemoglobin': 12.7, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0846', 'diagnosis': 'DBD_POSITIF', 'age': 37, 'gender': 'female', 'platelet': 261782, 'hematokrit': 44.12, 'wbc': 6741, 'hemoglobin': 14.0, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0847', 'diagnosis': 'DBD_POSITIF', 'age': 66, 'gender': 'female', 'platelet': 94012, 'hematokrit': 41.75, 'wbc': 6252, 'hemoglobin': 16.0, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0848', 'diagnosis': 'DBD_POSITIF', 'age': 30, 'gender': 'male', 'platelet': 245961, 'hematokrit': 46.46, 'wbc': 4877, 'hemoglobin': 12.1, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0849', 'diagnosis': 'DBD_POSITIF', 'age': 55, 'gender': 'male', 'platelet': 97412, 'hematokrit': 50.2, 'wbc': 4244, 'hemoglobin': 13.2, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0850', 'diagnosis': 'DBD_POSITIF', 'age': 66, 'gender': 'male', 'platelet': 190030, 'hematokrit': 51.98, 'wbc': 5894, 'hemoglobin': 13.2, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0851', 'diagnosis': 'DBD_POSITIF', 'age': 63, 'gender': 'female', 'platelet': 104657, 'hematokrit': 46.51, 'wbc': 5356, 'hemoglobin': 14.1, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0852', 'diagnosis': 'BUKAN_DBD', 'age': 66, 'gender': 'male', 'platelet': 85656, 'hematokrit': 43.67, 'wbc': 4942, 'hemoglobin': 17.4, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0853', 'diagnosis': 'DBD_POSITIF', 'age': 25, 'gender': 'male', 'platelet': 220039, 'hematokrit': 41.15, 'wbc': 6868, 'hemoglobin': 11.9, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0854', 'diagnosis': 'DBD_POSITIF', 'age': 60, 'gender': 'female', 'platelet': 296030, 'hematokrit': 41.6, 'wbc': 6554, 'hemoglobin': 14.6, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0855', 'diagnosis': 'DBD_POSITIF', 'age': 37, 'gender': 'female', 'platelet': 226836, 'hematokrit': 44.71, 'wbc': 5952, 'hemoglobin': 12.6, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0856', 'diagnosis': 'BUKAN_DBD', 'age': 50, 'gender': 'male', 'platelet': 95873, 'hematokrit': 43.14, 'wbc': 6971, 'hemoglobin': 17.3, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0857', 'diagnosis': 'DBD_POSITIF', 'age': 43, 'gender': 'male', 'platelet': 174485, 'hematokrit': 50.79, 'wbc': 5282, 'hemoglobin': 12.2, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0858', 'diagnosis': 'DBD_POSITIF', 'age': 56, 'gender': 'male', 'platelet': 189383, 'hematokrit': 43.16, 'wbc': 5745, 'hemoglobin': 13.9, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0859', 'diagnosis': 'DBD_POSITIF', 'age': 38, 'gender': 'female', 'platelet': 262102, 'hematokrit': 43.23, 'wbc': 4409, 'hemoglobin': 15.9, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0860', 'diagnosis': 'DBD_POSITIF', 'age': 66, 'gender': 'male', 'platelet': 278879, 'hematokrit': 43.37, 'wbc': 6357, 'hemoglobin': 15.7, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0861', 'diagnosis': 'DBD_POSITIF', 'age': 59, 'gender': 'male', 'platelet': 81607, 'hematokrit': 49.71, 'wbc': 6115, 'hemoglobin': 14.0, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0862', 'diagnosis': 'DBD_POSITIF', 'age': 60, 'gender': 'male', 'platelet': 230595, 'hematokrit': 47.11, 'wbc': 6161, 'hemoglobin': 13.6, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0863', 'diagnosis': 'DBD_POSITIF', 'age': 58, 'gender': 'female', 'platelet': 128447, 'hematokrit': 46.6, 'wbc': 6267, 'hemoglobin': 13.9, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0864', 'diagnosis': 'BUKAN_DBD', 'age': 26, 'gender': 'female', 'platelet': 129757, 'hematokrit': 42.68, 'wbc': 6267, 'hemoglobin': 13.1, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0865', 'diagnosis': 'DBD_POSITIF', 'age': 41, 'gender': 'male', 'platelet': 149201, 'hematokrit': 49.45, 'wbc': 5496, 'hemoglobin': 12.7, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0866', 'diagnosis': 'BUKAN_DBD', 'age': 54, 'gender': 'male', 'platelet': 208765, 'hematokrit': 38.54, 'wbc': 6777, 'hemoglobin': 14.4, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0867', 'diagnosis': 'DBD_POSITIF', 'age': 66, 'gender': 'female', 'platelet': 292916, 'hematokrit': 50.19, 'wbc': 6796, 'hemoglobin': 13.1, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0868', 'diagnosis': 'DBD_POSITIF', 'age': 58, 'gender': 'female', 'platelet': 282460, 'hematokrit': 45.18, 'wbc': 6990, 'hemoglobin': 13.2, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0869', 'diagnosis': 'DBD_POSITIF', 'age': 34, 'gender': 'female', 'platelet': 85462, 'hematokrit': 43.58, 'wbc': 4385, 'hemoglobin': 15.4, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0870', 'diagnosis': 'DBD_POSITIF', 'age': 41, 'gender': 'female', 'platelet': 196832, 'hematokrit': 44.96, 'wbc': 4929, 'hemoglobin': 17.3, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0871', 'diagnosis': 'DBD_POSITIF', 'age': 38, 'gender': 'female', 'platelet': 242867, 'hematokrit': 47.34, 'wbc': 4404, 'hemoglobin': 15.1, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0872', 'diagnosis': 'DBD_POSITIF', 'age': 68, 'gender': 'female', 'platelet': 280878, 'hematokrit': 38.18, 'wbc': 4491, 'hemoglobin': 12.0, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0873', 'diagnosis': 'DBD_POSITIF', 'age': 56, 'gender': 'female', 'platelet': 128465, 'hematokrit': 50.2, 'wbc': 4356, 'hemoglobin': 12.0, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0874', 'diagnosis': 'DBD_POSITIF', 'age': 58, 'gender': 'female', 'platelet': 272181, 'hematokrit': 44.25, 'wbc': 4214, 'hemoglobin': 17.2, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0875', 'diagnosis': 'DBD_POSITIF', 'age': 56, 'gender': 'female', 'platelet': 170027, 'hematokrit': 42.8, 'wbc': 5403, 'hemoglobin': 13.3, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0876', 'diagnosis': 'BUKAN_DBD', 'age': 30, 'gender': 'male', 'platelet': 130528, 'hematokrit': 39.94, 'wbc': 4751, 'hemoglobin': 12.1, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0877', 'diagnosis': 'BUKAN_DBD', 'age': 28, 'gender': 'male', 'platelet': 116230, 'hematokrit': 44.15, 'wbc': 4826, 'hemoglobin': 15.1, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0878', 'diagnosis': 'BUKAN_DBD', 'age': 63, 'gender': 'male', 'platelet': 128242, 'hematokrit': 44.95, 'wbc': 5237, 'hemoglobin': 15.2, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0879', 'diagnosis': 'DBD_POSITIF', 'age': 36, 'gender': 'female', 'platelet': 276955, 'hematokrit': 43.65, 'wbc': 5121, 'hemoglobin': 15.4, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0880', 'diagnosis': 'DBD_POSITIF', 'age': 28, 'gender': 'male', 'platelet': 194688, 'hematokrit': 47.5, 'wbc': 6575, 'hemoglobin': 13.1, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0881', 'diagnosis': 'DBD_POSITIF', 'age': 30, 'gender': 'female', 'platelet': 81783, 'hematokrit': 43.89, 'wbc': 6963, 'hemoglobin': 11.6, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0882', 'diagnosis': 'DBD_POSITIF', 'age': 63, 'gender': 'female', 'platelet': 108390, 'hematokrit': 51.46, 'wbc': 4665, 'hemoglobin': 17.3, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0883', 'diagnosis': 'DBD_POSITIF', 'age': 62, 'gender': 'male', 'platelet': 219489, 'hematokrit': 46.39, 'wbc': 6757, 'hemoglobin': 13.0, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0884', 'diagnosis': 'DBD_POSITIF', 'age': 18, 'gender': 'female', 'platelet': 152102, 'hematokrit': 49.3, 'wbc': 6028, 'hemoglobin': 15.6, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0885', 'diagnosis': 'DBD_POSITIF', 'age': 57, 'gender': 'male', 'platelet': 97426, 'hematokrit': 39.53, 'wbc': 6582, 'hemoglobin': 15.7, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0886', 'diagnosis': 'BUKAN_DBD', 'age': 61, 'gender': 'male', 'platelet': 110750, 'hematokrit': 43.56, 'wbc': 4553, 'hemoglobin': 15.2, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0887', 'diagnosis': 'DBD_POSITIF', 'age': 36, 'gender': 'male', 'platelet': 138188, 'hematokrit': 42.72, 'wbc': 5572, 'hemoglobin': 13.4, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0888', 'diagnosis': 'DBD_POSITIF', 'age': 29, 'gender': 'female', 'platelet': 90872, 'hematokrit': 45.97, 'wbc': 4327, 'hemoglobin': 13.1, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0889', 'diagnosis': 'DBD_POSITIF', 'age': 25, 'gender': 'male', 'platelet': 174231, 'hematokrit': 50.06, 'wbc': 6949, 'hemoglobin': 15.1, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0890', 'diagnosis': 'DBD_POSITIF', 'age': 25, 'gender': 'female', 'platelet': 209860, 'hematokrit': 39.1, 'wbc': 5188, 'hemoglobin': 16.7, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0891', 'diagnosis': 'DBD_POSITIF', 'age': 62, 'gender': 'male', 'platelet': 259158, 'hematokrit': 39.02, 'wbc': 4149, 'hemoglobin': 17.2, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0892', 'diagnosis': 'DBD_POSITIF', 'age': 29, 'gender': 'male', 'platelet': 146770, 'hematokrit': 49.9, 'wbc': 5055, 'hemoglobin': 12.1, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0893', 'diagnosis': 'BUKAN_DBD', 'age': 65, 'gender': 'male', 'platelet': 204158, 'hematokrit': 40.98, 'wbc': 4656, 'hemoglobin': 12.4, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0894', 'diagnosis': 'DBD_POSITIF', 'age': 50, 'gender': 'female', 'platelet': 163514, 'hematokrit': 47.36, 'wbc': 6853, 'hemoglobin': 17.2, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0895', 'diagnosis': 'DBD_POSITIF', 'age': 62, 'gender': 'female', 'platelet': 299249, 'hematokrit': 45.6, 'wbc': 5936, 'hemoglobin': 15.9, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0896', 'diagnosis': 'BUKAN_DBD', 'age': 43, 'gender': 'female', 'platelet': 172663, 'hematokrit': 49.66, 'wbc': 4292, 'hemoglobin': 16.8, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0897', 'diagnosis': 'DBD_POSITIF', 'age': 56, 'gender': 'male', 'platelet': 245792, 'hematokrit': 39.75, 'wbc': 6966, 'hemoglobin': 12.7, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0898', 'diagnosis': 'DBD_POSITIF', 'age': 45, 'gender': 'male', 'platelet': 229151, 'hematokrit': 39.82, 'wbc': 6736, 'hemoglobin': 15.0, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0899', 'diagnosis': 'DBD_POSITIF', 'age': 22, 'gender': 'female', 'platelet': 228410, 'hematokrit': 45.8, 'wbc': 4956, 'hemoglobin': 15.7, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0900', 'diagnosis': 'DBD_POSITIF', 'age': 25, 'gender': 'female', 'platelet': 214363, 'hematokrit': 51.25, 'wbc': 5084, 'hemoglobin': 15.6, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0901', 'diagnosis': 'DBD_POSITIF', 'age': 42, 'gender': 'female', 'platelet': 285156, 'hematokrit': 43.81, 'wbc': 5612, 'hemoglobin': 13.9, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0902', 'diagnosis': 'DBD_POSITIF', 'age': 44, 'gender': 'female', 'platelet': 192808, 'hematokrit': 42.58, 'wbc': 4415, 'hemoglobin': 11.6, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0903', 'diagnosis': 'DBD_POSITIF', 'age': 63, 'gender': 'female', 'platelet': 190091, 'hematokrit': 46.49, 'wbc': 6645, 'hemoglobin': 15.0, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0904', 'diagnosis': 'DBD_POSITIF', 'age': 40, 'gender': 'female', 'platelet': 179272, 'hematokrit': 51.03, 'wbc': 6054, 'hemoglobin': 13.0, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0905', 'diagnosis': 'DBD_POSITIF', 'age': 47, 'gender': 'male', 'platelet': 129393, 'hematokrit': 49.72, 'wbc': 4917, 'hemoglobin': 14.2, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0906', 'diagnosis': 'BUKAN_DBD', 'age': 62, 'gender': 'female', 'platelet': 173558, 'hematokrit': 51.94, 'wbc': 4084, 'hemoglobin': 17.2, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0907', 'diagnosis': 'DBD_POSITIF', 'age': 64, 'gender': 'male', 'platelet': 149770, 'hematokrit': 38.32, 'wbc': 6821, 'hemoglobin': 13.9, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0908', 'diagnosis': 'DBD_POSITIF', 'age': 40, 'gender': 'male', 'platelet': 106720, 'hematokrit': 39.58, 'wbc': 4956, 'hemoglobin': 16.5, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0909', 'diagnosis': 'BUKAN_DBD', 'age': 66, 'gender': 'female', 'platelet': 93368, 'hematokrit': 46.53, 'wbc': 5421, 'hemoglobin': 12.6, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0910', 'diagnosis': 'DBD_POSITIF', 'age': 64, 'gender': 'female', 'platelet': 265385, 'hematokrit': 49.49, 'wbc': 5935, 'hemoglobin': 15.5, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0911', 'diagnosis': 'DBD_POSITIF', 'age': 37, 'gender': 'male', 'platelet': 127969, 'hematokrit': 41.99, 'wbc': 5794, 'hemoglobin': 17.4, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0912', 'diagnosis': 'DBD_POSITIF', 'age': 35, 'gender': 'female', 'platelet': 128838, 'hematokrit': 41.35, 'wbc': 5416, 'hemoglobin': 12.1, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0913', 'diagnosis': 'BUKAN_DBD', 'age': 35, 'gender': 'female', 'platelet': 88734, 'hematokrit': 49.02, 'wbc': 5070, 'hemoglobin': 11.5, 'demam_tinggi': 0, 'sakit_kepala': 1, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0914', 'diagnosis': 'DBD_POSITIF', 'age': 19, 'gender': 'male', 'platelet': 187187, 'hematokrit': 38.79, 'wbc': 5521, 'hemoglobin': 14.1, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0915', 'diagnosis': 'DBD_POSITIF', 'age': 21, 'gender': 'male', 'platelet': 179329, 'hematokrit': 43.17, 'wbc': 6653, 'hemoglobin': 12.1, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0916', 'diagnosis': 'DBD_POSITIF', 'age': 47, 'gender': 'male', 'platelet': 223269, 'hematokrit': 45.08, 'wbc': 5501, 'hemoglobin': 16.0, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0917', 'diagnosis': 'DBD_POSITIF', 'age': 50, 'gender': 'female', 'platelet': 148895, 'hematokrit': 45.84, 'wbc': 6473, 'hemoglobin': 17.0, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0918', 'diagnosis': 'DBD_POSITIF', 'age': 53, 'gender': 'male', 'platelet': 200424, 'hematokrit': 48.2, 'wbc': 6473, 'hemoglobin': 14.1, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0919', 'diagnosis': 'DBD_POSITIF', 'age': 35, 'gender': 'female', 'platelet': 267903, 'hematokrit': 42.97, 'wbc': 4735, 'hemoglobin': 13.1, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0920', 'diagnosis': 'DBD_POSITIF', 'age': 54, 'gender': 'male', 'platelet': 181255, 'hematokrit': 46.58, 'wbc': 6838, 'hemoglobin': 14.1, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0921', 'diagnosis': 'BUKAN_DBD', 'age': 36, 'gender': 'male', 'platelet': 138073, 'hematokrit': 46.2, 'wbc': 6562, 'hemoglobin': 15.8, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0922', 'diagnosis': 'DBD_POSITIF', 'age': 64, 'gender': 'male', 'platelet': 283997, 'hematokrit': 45.67, 'wbc': 5152, 'hemoglobin': 11.6, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0923', 'diagnosis': 'BUKAN_DBD', 'age': 45, 'gender': 'female', 'platelet': 291560, 'hematokrit': 46.97, 'wbc': 5272, 'hemoglobin': 15.0, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0924', 'diagnosis': 'BUKAN_DBD', 'age': 57, 'gender': 'female', 'platelet': 295547, 'hematokrit': 41.63, 'wbc': 4740, 'hemoglobin': 15.2, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0925', 'diagnosis': 'BUKAN_DBD', 'age': 37, 'gender': 'male', 'platelet': 261374, 'hematokrit': 39.19, 'wbc': 5862, 'hemoglobin': 15.3, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0926', 'diagnosis': 'DBD_POSITIF', 'age': 66, 'gender': 'male', 'platelet': 95624, 'hematokrit': 39.67, 'wbc': 4130, 'hemoglobin': 13.0, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0927', 'diagnosis': 'DBD_POSITIF', 'age': 50, 'gender': 'male', 'platelet': 278343, 'hematokrit': 41.14, 'wbc': 5763, 'hemoglobin': 15.8, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0928', 'diagnosis': 'DBD_POSITIF', 'age': 29, 'gender': 'female', 'platelet': 104315, 'hematokrit': 45.0, 'wbc': 5712, 'hemoglobin': 12.0, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0929', 'diagnosis': 'DBD_POSITIF', 'age': 68, 'gender': 'male', 'platelet': 97422, 'hematokrit': 49.77, 'wbc': 4322, 'hemoglobin': 12.7, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0930', 'diagnosis': 'DBD_POSITIF', 'age': 32, 'gender': 'female', 'platelet': 250209, 'hematokrit': 47.82, 'wbc': 4822, 'hemoglobin': 16.8, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0931', 'diagnosis': 'DBD_POSITIF', 'age': 58, 'gender': 'male', 'platelet': 152663, 'hematokrit': 49.05, 'wbc': 4542, 'hemoglobin': 15.9, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0932', 'diagnosis': 'BUKAN_DBD', 'age': 56, 'gender': 'male', 'platelet': 181216, 'hematokrit': 42.91, 'wbc': 6113, 'hemoglobin': 11.6, 'demam_tinggi': 0, 'sakit_kepala': 1, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0933', 'diagnosis': 'DBD_POSITIF', 'age': 19, 'gender': 'male', 'platelet': 259304, 'hematokrit': 43.67, 'wbc': 6765, 'hemoglobin': 13.0, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0934', 'diagnosis': 'DBD_POSITIF', 'age': 46, 'gender': 'male', 'platelet': 289214, 'hematokrit': 43.51, 'wbc': 5855, 'hemoglobin': 12.8, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0935', 'diagnosis': 'DBD_POSITIF', 'age': 58, 'gender': 'male', 'platelet': 112743, 'hematokrit': 40.69, 'wbc': 6078, 'hemoglobin': 13.1, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0936', 'diagnosis': 'BUKAN_DBD', 'age': 27, 'gender': 'male', 'platelet': 226708, 'hematokrit': 38.86, 'wbc': 4884, 'hemoglobin': 13.0, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0937', 'diagnosis': 'DBD_POSITIF', 'age': 19, 'gender': 'female', 'platelet': 90108, 'hematokrit': 46.27, 'wbc': 4190, 'hemoglobin': 11.9, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0938', 'diagnosis': 'DBD_POSITIF', 'age': 68, 'gender': 'male', 'platelet': 284706, 'hematokrit': 51.85, 'wbc': 4414, 'hemoglobin': 14.3, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0939', 'diagnosis': 'DBD_POSITIF', 'age': 28, 'gender': 'female', 'platelet': 116180, 'hematokrit': 40.34, 'wbc': 5838, 'hemoglobin': 15.9, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0940', 'diagnosis': 'DBD_POSITIF', 'age': 30, 'gender': 'male', 'platelet': 98883, 'hematokrit': 38.65, 'wbc': 6794, 'hemoglobin': 15.1, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0941', 'diagnosis': 'DBD_POSITIF', 'age': 27, 'gender': 'male', 'platelet': 124400, 'hematokrit': 48.91, 'wbc': 5813, 'hemoglobin': 15.5, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0942', 'diagnosis': 'DBD_POSITIF', 'age': 31, 'gender': 'female', 'platelet': 257071, 'hematokrit': 41.54, 'wbc': 5760, 'hemoglobin': 12.0, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0943', 'diagnosis': 'DBD_POSITIF', 'age': 35, 'gender': 'male', 'platelet': 127951, 'hematokrit': 49.62, 'wbc': 5069, 'hemoglobin': 17.2, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0944', 'diagnosis': 'DBD_POSITIF', 'age': 68, 'gender': 'female', 'platelet': 218232, 'hematokrit': 47.86, 'wbc': 5721, 'hemoglobin': 16.5, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0945', 'diagnosis': 'DBD_POSITIF', 'age': 26, 'gender': 'female', 'platelet': 135262, 'hematokrit': 51.24, 'wbc': 4374, 'hemoglobin': 16.3, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0946', 'diagnosis': 'DBD_POSITIF', 'age': 56, 'gender': 'male', 'platelet': 231001, 'hematokrit': 43.72, 'wbc': 4557, 'hemoglobin': 16.4, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0947', 'diagnosis': 'DBD_POSITIF', 'age': 45, 'gender': 'female', 'platelet': 163133, 'hematokrit': 47.27, 'wbc': 5280, 'hemoglobin': 17.1, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0948', 'diagnosis': 'DBD_POSITIF', 'age': 20, 'gender': 'female', 'platelet': 222195, 'hematokrit': 44.51, 'wbc': 5944, 'hemoglobin': 14.8, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0949', 'diagnosis': 'DBD_POSITIF', 'age': 37, 'gender': 'male', 'platelet': 195106, 'hematokrit': 46.83, 'wbc': 5596, 'hemoglobin': 12.7, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0950', 'diagnosis': 'BUKAN_DBD', 'age': 23, 'gender': 'female', 'platelet': 239429, 'hematokrit': 44.29, 'wbc': 5128, 'hemoglobin': 15.2, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0951', 'diagnosis': 'DBD_POSITIF', 'age': 44, 'gender': 'male', 'platelet': 150496, 'hematokrit': 40.64, 'wbc': 5360, 'hemoglobin': 16.0, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0952', 'diagnosis': 'DBD_POSITIF', 'age': 19, 'gender': 'male', 'platelet': 244628, 'hematokrit': 45.11, 'wbc': 5324, 'hemoglobin': 15.9, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0953', 'diagnosis': 'DBD_POSITIF', 'age': 46, 'gender': 'male', 'platelet': 294863, 'hematokrit': 45.4, 'wbc': 5100, 'hemoglobin': 14.6, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0954', 'diagnosis': 'DBD_POSITIF', 'age': 55, 'gender': 'male', 'platelet': 141934, 'hematokrit': 49.35, 'wbc': 5534, 'hemoglobin': 11.9, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0955', 'diagnosis': 'BUKAN_DBD', 'age': 20, 'gender': 'female', 'platelet': 158886, 'hematokrit': 48.3, 'wbc': 5253, 'hemoglobin': 13.7, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0956', 'diagnosis': 'DBD_POSITIF', 'age': 33, 'gender': 'male', 'platelet': 110881, 'hematokrit': 47.29, 'wbc': 5702, 'hemoglobin': 17.0, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0957', 'diagnosis': 'DBD_POSITIF', 'age': 47, 'gender': 'male', 'platelet': 98409, 'hematokrit': 39.59, 'wbc': 6625, 'hemoglobin': 15.0, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0958', 'diagnosis': 'DBD_POSITIF', 'age': 57, 'gender': 'female', 'platelet': 266488, 'hematokrit': 48.09, 'wbc': 4031, 'hemoglobin': 14.7, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0959', 'diagnosis': 'DBD_POSITIF', 'age': 19, 'gender': 'male', 'platelet': 178171, 'hematokrit': 45.0, 'wbc': 5631, 'hemoglobin': 13.1, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0960', 'diagnosis': 'DBD_POSITIF', 'age': 34, 'gender': 'male', 'platelet': 279054, 'hematokrit': 50.52, 'wbc': 4057, 'hemoglobin': 13.7, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0961', 'diagnosis': 'BUKAN_DBD', 'age': 58, 'gender': 'female', 'platelet': 241729, 'hematokrit': 50.88, 'wbc': 5127, 'hemoglobin': 16.9, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0962', 'diagnosis': 'DBD_POSITIF', 'age': 29, 'gender': 'female', 'platelet': 297815, 'hematokrit': 38.77, 'wbc': 4311, 'hemoglobin': 15.5, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0963', 'diagnosis': 'DBD_POSITIF', 'age': 52, 'gender': 'female', 'platelet': 128951, 'hematokrit': 49.49, 'wbc': 5752, 'hemoglobin': 16.2, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0964', 'diagnosis': 'DBD_POSITIF', 'age': 60, 'gender': 'female', 'platelet': 88752, 'hematokrit': 38.53, 'wbc': 6001, 'hemoglobin': 14.2, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0965', 'diagnosis': 'DBD_POSITIF', 'age': 18, 'gender': 'female', 'platelet': 197339, 'hematokrit': 43.14, 'wbc': 6737, 'hemoglobin': 15.3, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0966', 'diagnosis': 'BUKAN_DBD', 'age': 62, 'gender': 'female', 'platelet': 224512, 'hematokrit': 45.59, 'wbc': 5397, 'hemoglobin': 13.0, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0967', 'diagnosis': 'BUKAN_DBD', 'age': 32, 'gender': 'female', 'platelet': 124864, 'hematokrit': 40.07, 'wbc': 5782, 'hemoglobin': 15.7, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0968', 'diagnosis': 'BUKAN_DBD', 'age': 43, 'gender': 'male', 'platelet': 260763, 'hematokrit': 48.45, 'wbc': 6282, 'hemoglobin': 14.1, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0969', 'diagnosis': 'DBD_POSITIF', 'age': 54, 'gender': 'female', 'platelet': 152035, 'hematokrit': 38.12, 'wbc': 6690, 'hemoglobin': 14.2, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0970', 'diagnosis': 'DBD_POSITIF', 'age': 38, 'gender': 'female', 'platelet': 166675, 'hematokrit': 40.36, 'wbc': 5412, 'hemoglobin': 15.4, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0971', 'diagnosis': 'BUKAN_DBD', 'age': 66, 'gender': 'female', 'platelet': 291375, 'hematokrit': 46.13, 'wbc': 5431, 'hemoglobin': 17.1, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0972', 'diagnosis': 'BUKAN_DBD', 'age': 48, 'gender': 'male', 'platelet': 102343, 'hematokrit': 48.0, 'wbc': 4801, 'hemoglobin': 11.9, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0973', 'diagnosis': 'DBD_POSITIF', 'age': 42, 'gender': 'male', 'platelet': 99673, 'hematokrit': 50.83, 'wbc': 4238, 'hemoglobin': 16.4, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0974', 'diagnosis': 'DBD_POSITIF', 'age': 40, 'gender': 'female', 'platelet': 271026, 'hematokrit': 47.88, 'wbc': 5775, 'hemoglobin': 13.3, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0975', 'diagnosis': 'DBD_POSITIF', 'age': 41, 'gender': 'female', 'platelet': 265770, 'hematokrit': 47.4, 'wbc': 5318, 'hemoglobin': 14.2, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0976', 'diagnosis': 'BUKAN_DBD', 'age': 55, 'gender': 'female', 'platelet': 175024, 'hematokrit': 43.52, 'wbc': 4111, 'hemoglobin': 11.6, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0977', 'diagnosis': 'DBD_POSITIF', 'age': 45, 'gender': 'male', 'platelet': 106520, 'hematokrit': 38.02, 'wbc': 6523, 'hemoglobin': 13.3, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0978', 'diagnosis': 'DBD_POSITIF', 'age': 38, 'gender': 'male', 'platelet': 95784, 'hematokrit': 39.68, 'wbc': 6351, 'hemoglobin': 14.5, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0979', 'diagnosis': 'DBD_POSITIF', 'age': 60, 'gender': 'female', 'platelet': 197446, 'hematokrit': 45.48, 'wbc': 5328, 'hemoglobin': 11.8, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0980', 'diagnosis': 'DBD_POSITIF', 'age': 35, 'gender': 'male', 'platelet': 118079, 'hematokrit': 47.45, 'wbc': 4289, 'hemoglobin': 14.4, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0981', 'diagnosis': 'DBD_POSITIF', 'age': 53, 'gender': 'female', 'platelet': 124220, 'hematokrit': 43.84, 'wbc': 6255, 'hemoglobin': 17.1, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0982', 'diagnosis': 'DBD_POSITIF', 'age': 52, 'gender': 'male', 'platelet': 231563, 'hematokrit': 48.23, 'wbc': 6915, 'hemoglobin': 12.1, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0983', 'diagnosis': 'DBD_POSITIF', 'age': 62, 'gender': 'male', 'platelet': 192878, 'hematokrit': 45.31, 'wbc': 5809, 'hemoglobin': 16.1, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0984', 'diagnosis': 'DBD_POSITIF', 'age': 26, 'gender': 'female', 'platelet': 196583, 'hematokrit': 39.04, 'wbc': 4581, 'hemoglobin': 14.0, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0985', 'diagnosis': 'BUKAN_DBD', 'age': 55, 'gender': 'female', 'platelet': 128720, 'hematokrit': 40.69, 'wbc': 4369, 'hemoglobin': 15.4, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0986', 'diagnosis': 'DBD_POSITIF', 'age': 47, 'gender': 'female', 'platelet': 94718, 'hematokrit': 49.76, 'wbc': 4219, 'hemoglobin': 13.1, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0987', 'diagnosis': 'DBD_POSITIF', 'age': 61, 'gender': 'female', 'platelet': 246669, 'hematokrit': 48.15, 'wbc': 6849, 'hemoglobin': 12.5, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0988', 'diagnosis': 'DBD_POSITIF', 'age': 51, 'gender': 'male', 'platelet': 141217, 'hematokrit': 50.53, 'wbc': 6866, 'hemoglobin': 12.5, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0989', 'diagnosis': 'DBD_POSITIF', 'age': 49, 'gender': 'male', 'platelet': 180668, 'hematokrit': 39.65, 'wbc': 5896, 'hemoglobin': 11.9, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0990', 'diagnosis': 'DBD_POSITIF', 'age': 20, 'gender': 'male', 'platelet': 237904, 'hematokrit': 51.86, 'wbc': 4348, 'hemoglobin': 12.6, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0991', 'diagnosis': 'DBD_POSITIF', 'age': 20, 'gender': 'female', 'platelet': 265890, 'hematokrit': 40.93, 'wbc': 6302, 'hemoglobin': 15.5, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0992', 'diagnosis': 'DBD_POSITIF', 'age': 45, 'gender': 'male', 'platelet': 223936, 'hematokrit': 38.16, 'wbc': 4451, 'hemoglobin': 16.8, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0993', 'diagnosis': 'DBD_POSITIF', 'age': 61, 'gender': 'female', 'platelet': 168378, 'hematokrit': 51.96, 'wbc': 6189, 'hemoglobin': 16.4, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0994', 'diagnosis': 'DBD_POSITIF', 'age': 32, 'gender': 'male', 'platelet': 88177, 'hematokrit': 41.94, 'wbc': 4088, 'hemoglobin': 15.6, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0995', 'diagnosis': 'BUKAN_DBD', 'age': 58, 'gender': 'female', 'platelet': 257187, 'hematokrit': 47.35, 'wbc': 4870, 'hemoglobin': 12.2, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0996', 'diagnosis': 'DBD_POSITIF', 'age': 40, 'gender': 'female', 'platelet': 202318, 'hematokrit': 40.47, 'wbc': 5159, 'hemoglobin': 13.2, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0997', 'diagnosis': 'BUKAN_DBD', 'age': 57, 'gender': 'male', 'platelet': 267282, 'hematokrit': 46.12, 'wbc': 6042, 'hemoglobin': 13.4, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_0998', 'diagnosis': 'DBD_POSITIF', 'age': 28, 'gender': 'female', 'platelet': 263026, 'hematokrit': 50.66, 'wbc': 5874, 'hemoglobin': 13.0, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_0999', 'diagnosis': 'DBD_POSITIF', 'age': 65, 'gender': 'female', 'platelet': 191145, 'hematokrit': 42.48, 'wbc': 4522, 'hemoglobin': 14.6, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1000', 'diagnosis': 'BUKAN_DBD', 'age': 49, 'gender': 'male', 'platelet': 222916, 'hematokrit': 47.38, 'wbc': 6707, 'hemoglobin': 14.7, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_1001', 'diagnosis': 'BUKAN_DBD', 'age': 53, 'gender': 'female', 'platelet': 285202, 'hematokrit': 40.63, 'wbc': 6998, 'hemoglobin': 13.6, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_1002', 'diagnosis': 'DBD_POSITIF', 'age': 50, 'gender': 'female', 'platelet': 93418, 'hematokrit': 46.75, 'wbc': 4909, 'hemoglobin': 13.6, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1003', 'diagnosis': 'DBD_POSITIF', 'age': 41, 'gender': 'female', 'platelet': 245926, 'hematokrit': 42.71, 'wbc': 4441, 'hemoglobin': 16.5, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1004', 'diagnosis': 'DBD_POSITIF', 'age': 56, 'gender': 'male', 'platelet': 299716, 'hematokrit': 40.96, 'wbc': 4037, 'hemoglobin': 16.2, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1005', 'diagnosis': 'DBD_POSITIF', 'age': 51, 'gender': 'male', 'platelet': 287027, 'hematokrit': 42.38, 'wbc': 5880, 'hemoglobin': 13.3, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1006', 'diagnosis': 'DBD_POSITIF', 'age': 45, 'gender': 'female', 'platelet': 168075, 'hematokrit': 40.5, 'wbc': 4209, 'hemoglobin': 17.0, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1007', 'diagnosis': 'DBD_POSITIF', 'age': 54, 'gender': 'male', 'platelet': 255022, 'hematokrit': 50.63, 'wbc': 6560, 'hemoglobin': 17.2, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1008', 'diagnosis': 'DBD_POSITIF', 'age': 24, 'gender': 'female', 'platelet': 145227, 'hematokrit': 43.56, 'wbc': 5600, 'hemoglobin': 13.5, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1009', 'diagnosis': 'DBD_POSITIF', 'age': 21, 'gender': 'female', 'platelet': 223907, 'hematokrit': 41.43, 'wbc': 4980, 'hemoglobin': 13.6, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1010', 'diagnosis': 'DBD_POSITIF', 'age': 54, 'gender': 'female', 'platelet': 97533, 'hematokrit': 44.28, 'wbc': 4380, 'hemoglobin': 14.5, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1011', 'diagnosis': 'BUKAN_DBD', 'age': 18, 'gender': 'female', 'platelet': 181457, 'hematokrit': 42.49, 'wbc': 6875, 'hemoglobin': 17.1, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_1012', 'diagnosis': 'BUKAN_DBD', 'age': 18, 'gender': 'female', 'platelet': 187504, 'hematokrit': 48.42, 'wbc': 5560, 'hemoglobin': 16.8, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_1013', 'diagnosis': 'DBD_POSITIF', 'age': 64, 'gender': 'male', 'platelet': 298930, 'hematokrit': 51.6, 'wbc': 6906, 'hemoglobin': 12.1, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1014', 'diagnosis': 'DBD_POSITIF', 'age': 37, 'gender': 'female', 'platelet': 221295, 'hematokrit': 44.13, 'wbc': 4393, 'hemoglobin': 13.9, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1015', 'diagnosis': 'DBD_POSITIF', 'age': 36, 'gender': 'male', 'platelet': 204202, 'hematokrit': 50.05, 'wbc': 5073, 'hemoglobin': 14.8, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1016', 'diagnosis': 'DBD_POSITIF', 'age': 46, 'gender': 'male', 'platelet': 90273, 'hematokrit': 45.92, 'wbc': 4395, 'hemoglobin': 14.5, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1017', 'diagnosis': 'DBD_POSITIF', 'age': 27, 'gender': 'female', 'platelet': 113519, 'hematokrit': 40.2, 'wbc': 5776, 'hemoglobin': 12.7, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1018', 'diagnosis': 'DBD_POSITIF', 'age': 35, 'gender': 'female', 'platelet': 235232, 'hematokrit': 47.67, 'wbc': 6079, 'hemoglobin': 16.7, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1019', 'diagnosis': 'BUKAN_DBD', 'age': 45, 'gender': 'male', 'platelet': 207024, 'hematokrit': 45.19, 'wbc': 4544, 'hemoglobin': 15.6, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_1020', 'diagnosis': 'BUKAN_DBD', 'age': 52, 'gender': 'male', 'platelet': 285457, 'hematokrit': 47.11, 'wbc': 6759, 'hemoglobin': 16.5, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_1021', 'diagnosis': 'BUKAN_DBD', 'age': 60, 'gender': 'male', 'platelet': 204540, 'hematokrit': 50.46, 'wbc': 5084, 'hemoglobin': 16.7, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_1022', 'diagnosis': 'BUKAN_DBD', 'age': 64, 'gender': 'female', 'platelet': 260060, 'hematokrit': 44.17, 'wbc': 4552, 'hemoglobin': 16.0, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_1023', 'diagnosis': 'DBD_POSITIF', 'age': 48, 'gender': 'male', 'platelet': 221420, 'hematokrit': 50.62, 'wbc': 5464, 'hemoglobin': 14.1, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1024', 'diagnosis': 'DBD_POSITIF', 'age': 44, 'gender': 'female', 'platelet': 163460, 'hematokrit': 48.51, 'wbc': 5153, 'hemoglobin': 15.2, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1025', 'diagnosis': 'DBD_POSITIF', 'age': 28, 'gender': 'female', 'platelet': 184471, 'hematokrit': 44.84, 'wbc': 5377, 'hemoglobin': 12.5, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1026', 'diagnosis': 'DBD_POSITIF', 'age': 66, 'gender': 'female', 'platelet': 184668, 'hematokrit': 46.45, 'wbc': 6245, 'hemoglobin': 15.5, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1027', 'diagnosis': 'BUKAN_DBD', 'age': 66, 'gender': 'male', 'platelet': 147519, 'hematokrit': 42.56, 'wbc': 6846, 'hemoglobin': 12.6, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_1028', 'diagnosis': 'BUKAN_DBD', 'age': 55, 'gender': 'female', 'platelet': 170426, 'hematokrit': 51.77, 'wbc': 5686, 'hemoglobin': 15.7, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_1029', 'diagnosis': 'DBD_POSITIF', 'age': 22, 'gender': 'female', 'platelet': 94629, 'hematokrit': 47.34, 'wbc': 5739, 'hemoglobin': 12.9, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1030', 'diagnosis': 'BUKAN_DBD', 'age': 25, 'gender': 'female', 'platelet': 129056, 'hematokrit': 38.61, 'wbc': 4693, 'hemoglobin': 12.2, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_1031', 'diagnosis': 'DBD_POSITIF', 'age': 51, 'gender': 'female', 'platelet': 91273, 'hematokrit': 42.57, 'wbc': 6194, 'hemoglobin': 12.5, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1032', 'diagnosis': 'DBD_POSITIF', 'age': 65, 'gender': 'female', 'platelet': 200484, 'hematokrit': 46.73, 'wbc': 5739, 'hemoglobin': 11.5, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1033', 'diagnosis': 'DBD_POSITIF', 'age': 69, 'gender': 'male', 'platelet': 177275, 'hematokrit': 38.79, 'wbc': 4497, 'hemoglobin': 15.8, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1034', 'diagnosis': 'DBD_POSITIF', 'age': 29, 'gender': 'female', 'platelet': 251488, 'hematokrit': 38.33, 'wbc': 6095, 'hemoglobin': 15.9, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1035', 'diagnosis': 'DBD_POSITIF', 'age': 55, 'gender': 'female', 'platelet': 218966, 'hematokrit': 44.3, 'wbc': 6817, 'hemoglobin': 14.6, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1036', 'diagnosis': 'DBD_POSITIF', 'age': 18, 'gender': 'male', 'platelet': 126073, 'hematokrit': 42.66, 'wbc': 6698, 'hemoglobin': 12.5, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1037', 'diagnosis': 'DBD_POSITIF', 'age': 48, 'gender': 'female', 'platelet': 125693, 'hematokrit': 44.14, 'wbc': 5195, 'hemoglobin': 12.0, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1038', 'diagnosis': 'DBD_POSITIF', 'age': 21, 'gender': 'male', 'platelet': 262538, 'hematokrit': 41.68, 'wbc': 4612, 'hemoglobin': 11.6, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1039', 'diagnosis': 'DBD_POSITIF', 'age': 66, 'gender': 'female', 'platelet': 104343, 'hematokrit': 40.31, 'wbc': 6746, 'hemoglobin': 12.5, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1040', 'diagnosis': 'DBD_POSITIF', 'age': 62, 'gender': 'male', 'platelet': 123095, 'hematokrit': 47.65, 'wbc': 5338, 'hemoglobin': 16.8, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1041', 'diagnosis': 'DBD_POSITIF', 'age': 67, 'gender': 'male', 'platelet': 242246, 'hematokrit': 45.2, 'wbc': 4375, 'hemoglobin': 12.9, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1042', 'diagnosis': 'DBD_POSITIF', 'age': 22, 'gender': 'female', 'platelet': 261873, 'hematokrit': 40.8, 'wbc': 4805, 'hemoglobin': 13.6, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1043', 'diagnosis': 'DBD_POSITIF', 'age': 47, 'gender': 'female', 'platelet': 202388, 'hematokrit': 42.47, 'wbc': 4920, 'hemoglobin': 12.1, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1044', 'diagnosis': 'DBD_POSITIF', 'age': 41, 'gender': 'female', 'platelet': 283508, 'hematokrit': 46.29, 'wbc': 4874, 'hemoglobin': 12.8, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1045', 'diagnosis': 'DBD_POSITIF', 'age': 20, 'gender': 'male', 'platelet': 194441, 'hematokrit': 39.01, 'wbc': 6857, 'hemoglobin': 14.6, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1046', 'diagnosis': 'DBD_POSITIF', 'age': 28, 'gender': 'male', 'platelet': 280408, 'hematokrit': 40.06, 'wbc': 5443, 'hemoglobin': 15.1, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1047', 'diagnosis': 'BUKAN_DBD', 'age': 62, 'gender': 'male', 'platelet': 180782, 'hematokrit': 39.03, 'wbc': 6952, 'hemoglobin': 13.0, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_1048', 'diagnosis': 'DBD_POSITIF', 'age': 21, 'gender': 'female', 'platelet': 253998, 'hematokrit': 49.37, 'wbc': 5419, 'hemoglobin': 11.8, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1049', 'diagnosis': 'DBD_POSITIF', 'age': 43, 'gender': 'male', 'platelet': 152590, 'hematokrit': 48.53, 'wbc': 5545, 'hemoglobin': 13.8, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1050', 'diagnosis': 'DBD_POSITIF', 'age': 44, 'gender': 'male', 'platelet': 249899, 'hematokrit': 48.55, 'wbc': 5210, 'hemoglobin': 12.9, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1051', 'diagnosis': 'DBD_POSITIF', 'age': 63, 'gender': 'female', 'platelet': 188263, 'hematokrit': 48.03, 'wbc': 5005, 'hemoglobin': 12.8, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1052', 'diagnosis': 'DBD_POSITIF', 'age': 60, 'gender': 'male', 'platelet': 255847, 'hematokrit': 47.37, 'wbc': 6080, 'hemoglobin': 17.3, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1053', 'diagnosis': 'DBD_POSITIF', 'age': 44, 'gender': 'male', 'platelet': 252273, 'hematokrit': 44.68, 'wbc': 6116, 'hemoglobin': 15.2, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1054', 'diagnosis': 'BUKAN_DBD', 'age': 59, 'gender': 'female', 'platelet': 109373, 'hematokrit': 46.99, 'wbc': 4591, 'hemoglobin': 14.8, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_1055', 'diagnosis': 'DBD_POSITIF', 'age': 68, 'gender': 'male', 'platelet': 107525, 'hematokrit': 38.54, 'wbc': 5214, 'hemoglobin': 14.0, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1056', 'diagnosis': 'DBD_POSITIF', 'age': 67, 'gender': 'female', 'platelet': 207716, 'hematokrit': 46.7, 'wbc': 6148, 'hemoglobin': 14.1, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1057', 'diagnosis': 'DBD_POSITIF', 'age': 23, 'gender': 'female', 'platelet': 184513, 'hematokrit': 48.89, 'wbc': 5508, 'hemoglobin': 14.7, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1058', 'diagnosis': 'DBD_POSITIF', 'age': 32, 'gender': 'female', 'platelet': 283723, 'hematokrit': 45.01, 'wbc': 5308, 'hemoglobin': 15.7, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1059', 'diagnosis': 'DBD_POSITIF', 'age': 47, 'gender': 'female', 'platelet': 209401, 'hematokrit': 43.01, 'wbc': 4913, 'hemoglobin': 15.7, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1060', 'diagnosis': 'DBD_POSITIF', 'age': 59, 'gender': 'female', 'platelet': 176643, 'hematokrit': 41.88, 'wbc': 6780, 'hemoglobin': 12.5, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1061', 'diagnosis': 'DBD_POSITIF', 'age': 54, 'gender': 'male', 'platelet': 241558, 'hematokrit': 47.0, 'wbc': 4389, 'hemoglobin': 14.5, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1062', 'diagnosis': 'BUKAN_DBD', 'age': 54, 'gender': 'male', 'platelet': 289676, 'hematokrit': 47.7, 'wbc': 4159, 'hemoglobin': 14.0, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_1063', 'diagnosis': 'DBD_POSITIF', 'age': 59, 'gender': 'female', 'platelet': 229712, 'hematokrit': 50.19, 'wbc': 4891, 'hemoglobin': 16.7, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1064', 'diagnosis': 'DBD_POSITIF', 'age': 54, 'gender': 'female', 'platelet': 177694, 'hematokrit': 42.79, 'wbc': 5070, 'hemoglobin': 15.3, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1065', 'diagnosis': 'DBD_POSITIF', 'age': 52, 'gender': 'male', 'platelet': 272527, 'hematokrit': 48.78, 'wbc': 5469, 'hemoglobin': 14.7, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1066', 'diagnosis': 'BUKAN_DBD', 'age': 40, 'gender': 'female', 'platelet': 116136, 'hematokrit': 45.86, 'wbc': 4695, 'hemoglobin': 12.2, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_1067', 'diagnosis': 'DBD_POSITIF', 'age': 23, 'gender': 'female', 'platelet': 273497, 'hematokrit': 50.36, 'wbc': 4757, 'hemoglobin': 15.1, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1068', 'diagnosis': 'DBD_POSITIF', 'age': 21, 'gender': 'female', 'platelet': 136539, 'hematokrit': 45.39, 'wbc': 6570, 'hemoglobin': 12.2, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1069', 'diagnosis': 'DBD_POSITIF', 'age': 35, 'gender': 'male', 'platelet': 292736, 'hematokrit': 45.25, 'wbc': 6779, 'hemoglobin': 13.5, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1070', 'diagnosis': 'BUKAN_DBD', 'age': 26, 'gender': 'male', 'platelet': 236014, 'hematokrit': 46.09, 'wbc': 6202, 'hemoglobin': 12.4, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_1071', 'diagnosis': 'DBD_POSITIF', 'age': 66, 'gender': 'female', 'platelet': 148363, 'hematokrit': 48.49, 'wbc': 4338, 'hemoglobin': 15.7, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1072', 'diagnosis': 'DBD_POSITIF', 'age': 46, 'gender': 'female', 'platelet': 269668, 'hematokrit': 51.51, 'wbc': 5976, 'hemoglobin': 12.7, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1073', 'diagnosis': 'BUKAN_DBD', 'age': 30, 'gender': 'male', 'platelet': 161526, 'hematokrit': 39.03, 'wbc': 4794, 'hemoglobin': 13.9, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_1074', 'diagnosis': 'DBD_POSITIF', 'age': 64, 'gender': 'male', 'platelet': 115255, 'hematokrit': 38.75, 'wbc': 5722, 'hemoglobin': 16.9, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1075', 'diagnosis': 'DBD_POSITIF', 'age': 69, 'gender': 'female', 'platelet': 273201, 'hematokrit': 51.13, 'wbc': 5597, 'hemoglobin': 12.7, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1076', 'diagnosis': 'DBD_POSITIF', 'age': 34, 'gender': 'female', 'platelet': 296595, 'hematokrit': 45.42, 'wbc': 4898, 'hemoglobin': 14.5, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1077', 'diagnosis': 'DBD_POSITIF', 'age': 62, 'gender': 'male', 'platelet': 198209, 'hematokrit': 46.61, 'wbc': 5167, 'hemoglobin': 14.0, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1078', 'diagnosis': 'DBD_POSITIF', 'age': 49, 'gender': 'male', 'platelet': 273358, 'hematokrit': 44.75, 'wbc': 4102, 'hemoglobin': 11.6, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1079', 'diagnosis': 'BUKAN_DBD', 'age': 65, 'gender': 'male', 'platelet': 166437, 'hematokrit': 39.31, 'wbc': 6859, 'hemoglobin': 16.3, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_1080', 'diagnosis': 'DBD_POSITIF', 'age': 39, 'gender': 'female', 'platelet': 227349, 'hematokrit': 48.75, 'wbc': 4092, 'hemoglobin': 11.9, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1081', 'diagnosis': 'BUKAN_DBD', 'age': 21, 'gender': 'male', 'platelet': 212715, 'hematokrit': 48.46, 'wbc': 4974, 'hemoglobin': 14.3, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_1082', 'diagnosis': 'DBD_POSITIF', 'age': 22, 'gender': 'female', 'platelet': 195900, 'hematokrit': 42.36, 'wbc': 5447, 'hemoglobin': 14.9, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1083', 'diagnosis': 'BUKAN_DBD', 'age': 54, 'gender': 'male', 'platelet': 103729, 'hematokrit': 42.29, 'wbc': 4118, 'hemoglobin': 15.3, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_1084', 'diagnosis': 'DBD_POSITIF', 'age': 58, 'gender': 'male', 'platelet': 297695, 'hematokrit': 49.73, 'wbc': 6032, 'hemoglobin': 15.6, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1085', 'diagnosis': 'DBD_POSITIF', 'age': 66, 'gender': 'male', 'platelet': 101818, 'hematokrit': 39.01, 'wbc': 6076, 'hemoglobin': 13.0, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1086', 'diagnosis': 'DBD_POSITIF', 'age': 30, 'gender': 'male', 'platelet': 145555, 'hematokrit': 50.34, 'wbc': 5534, 'hemoglobin': 11.6, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1087', 'diagnosis': 'BUKAN_DBD', 'age': 51, 'gender': 'female', 'platelet': 178979, 'hematokrit': 41.59, 'wbc': 6919, 'hemoglobin': 15.8, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_1088', 'diagnosis': 'DBD_POSITIF', 'age': 62, 'gender': 'female', 'platelet': 133629, 'hematokrit': 46.3, 'wbc': 5389, 'hemoglobin': 14.7, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1089', 'diagnosis': 'DBD_POSITIF', 'age': 39, 'gender': 'male', 'platelet': 195296, 'hematokrit': 51.1, 'wbc': 6847, 'hemoglobin': 16.5, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1090', 'diagnosis': 'DBD_POSITIF', 'age': 40, 'gender': 'female', 'platelet': 135438, 'hematokrit': 47.49, 'wbc': 4474, 'hemoglobin': 16.4, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1091', 'diagnosis': 'DBD_POSITIF', 'age': 68, 'gender': 'male', 'platelet': 89457, 'hematokrit': 43.8, 'wbc': 6610, 'hemoglobin': 16.6, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1092', 'diagnosis': 'DBD_POSITIF', 'age': 20, 'gender': 'male', 'platelet': 270701, 'hematokrit': 47.65, 'wbc': 4434, 'hemoglobin': 14.4, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1093', 'diagnosis': 'DBD_POSITIF', 'age': 59, 'gender': 'male', 'platelet': 113922, 'hematokrit': 42.82, 'wbc': 6851, 'hemoglobin': 13.5, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1094', 'diagnosis': 'DBD_POSITIF', 'age': 51, 'gender': 'male', 'platelet': 220892, 'hematokrit': 41.88, 'wbc': 5257, 'hemoglobin': 16.2, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1095', 'diagnosis': 'DBD_POSITIF', 'age': 49, 'gender': 'female', 'platelet': 243822, 'hematokrit': 51.95, 'wbc': 4054, 'hemoglobin': 14.2, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1096', 'diagnosis': 'BUKAN_DBD', 'age': 62, 'gender': 'male', 'platelet': 188122, 'hematokrit': 48.51, 'wbc': 4930, 'hemoglobin': 12.6, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_1097', 'diagnosis': 'DBD_POSITIF', 'age': 68, 'gender': 'male', 'platelet': 182020, 'hematokrit': 47.03, 'wbc': 5315, 'hemoglobin': 16.6, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1098', 'diagnosis': 'DBD_POSITIF', 'age': 66, 'gender': 'female', 'platelet': 248862, 'hematokrit': 42.97, 'wbc': 6799, 'hemoglobin': 16.8, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1099', 'diagnosis': 'BUKAN_DBD', 'age': 38, 'gender': 'male', 'platelet': 168405, 'hematokrit': 38.69, 'wbc': 4311, 'hemoglobin': 14.3, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_1100', 'diagnosis': 'DBD_POSITIF', 'age': 63, 'gender': 'male', 'platelet': 196130, 'hematokrit': 38.43, 'wbc': 5571, 'hemoglobin': 12.0, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1101', 'diagnosis': 'DBD_POSITIF', 'age': 61, 'gender': 'male', 'platelet': 245493, 'hematokrit': 45.76, 'wbc': 4956, 'hemoglobin': 13.8, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1102', 'diagnosis': 'DBD_POSITIF', 'age': 38, 'gender': 'female', 'platelet': 148038, 'hematokrit': 48.67, 'wbc': 6365, 'hemoglobin': 16.3, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1103', 'diagnosis': 'DBD_POSITIF', 'age': 61, 'gender': 'male', 'platelet': 293273, 'hematokrit': 45.52, 'wbc': 5900, 'hemoglobin': 16.9, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1104', 'diagnosis': 'DBD_POSITIF', 'age': 28, 'gender': 'female', 'platelet': 142325, 'hematokrit': 49.77, 'wbc': 4756, 'hemoglobin': 12.7, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1105', 'diagnosis': 'DBD_POSITIF', 'age': 56, 'gender': 'male', 'platelet': 105600, 'hematokrit': 38.47, 'wbc': 6512, 'hemoglobin': 11.9, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1106', 'diagnosis': 'DBD_POSITIF', 'age': 21, 'gender': 'male', 'platelet': 240466, 'hematokrit': 43.13, 'wbc': 5432, 'hemoglobin': 16.8, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1107', 'diagnosis': 'DBD_POSITIF', 'age': 68, 'gender': 'female', 'platelet': 290694, 'hematokrit': 41.32, 'wbc': 5263, 'hemoglobin': 13.8, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1108', 'diagnosis': 'DBD_POSITIF', 'age': 18, 'gender': 'male', 'platelet': 247243, 'hematokrit': 44.26, 'wbc': 5855, 'hemoglobin': 14.8, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1109', 'diagnosis': 'DBD_POSITIF', 'age': 45, 'gender': 'male', 'platelet': 141526, 'hematokrit': 39.01, 'wbc': 6747, 'hemoglobin': 17.3, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1110', 'diagnosis': 'BUKAN_DBD', 'age': 41, 'gender': 'female', 'platelet': 93149, 'hematokrit': 51.36, 'wbc': 6782, 'hemoglobin': 11.9, 'demam_tinggi': 0, 'sakit_kepala': 1, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_1111', 'diagnosis': 'DBD_POSITIF', 'age': 52, 'gender': 'female', 'platelet': 241466, 'hematokrit': 41.13, 'wbc': 5093, 'hemoglobin': 15.4, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1112', 'diagnosis': 'DBD_POSITIF', 'age': 30, 'gender': 'female', 'platelet': 225468, 'hematokrit': 50.91, 'wbc': 6786, 'hemoglobin': 11.9, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1113', 'diagnosis': 'DBD_POSITIF', 'age': 64, 'gender': 'female', 'platelet': 234396, 'hematokrit': 43.96, 'wbc': 6815, 'hemoglobin': 13.8, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1114', 'diagnosis': 'BUKAN_DBD', 'age': 51, 'gender': 'female', 'platelet': 258270, 'hematokrit': 51.8, 'wbc': 4743, 'hemoglobin': 16.3, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_1115', 'diagnosis': 'DBD_POSITIF', 'age': 28, 'gender': 'male', 'platelet': 293777, 'hematokrit': 45.76, 'wbc': 6323, 'hemoglobin': 14.1, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1116', 'diagnosis': 'DBD_POSITIF', 'age': 53, 'gender': 'female', 'platelet': 192168, 'hematokrit': 51.03, 'wbc': 4232, 'hemoglobin': 17.5, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1117', 'diagnosis': 'BUKAN_DBD', 'age': 68, 'gender': 'male', 'platelet': 189813, 'hematokrit': 38.07, 'wbc': 6101, 'hemoglobin': 14.9, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_1118', 'diagnosis': 'DBD_POSITIF', 'age': 34, 'gender': 'male', 'platelet': 171779, 'hematokrit': 48.48, 'wbc': 4256, 'hemoglobin': 13.4, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1119', 'diagnosis': 'DBD_POSITIF', 'age': 52, 'gender': 'male', 'platelet': 242088, 'hematokrit': 50.64, 'wbc': 6028, 'hemoglobin': 12.8, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1120', 'diagnosis': 'DBD_POSITIF', 'age': 35, 'gender': 'female', 'platelet': 214266, 'hematokrit': 39.96, 'wbc': 6137, 'hemoglobin': 13.6, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1121', 'diagnosis': 'DBD_POSITIF', 'age': 57, 'gender': 'female', 'platelet': 112398, 'hematokrit': 39.35, 'wbc': 5761, 'hemoglobin': 13.7, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1122', 'diagnosis': 'BUKAN_DBD', 'age': 39, 'gender': 'male', 'platelet': 84789, 'hematokrit': 43.94, 'wbc': 5929, 'hemoglobin': 11.9, 'demam_tinggi': 0, 'sakit_kepala': 1, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_1123', 'diagnosis': 'DBD_POSITIF', 'age': 41, 'gender': 'female', 'platelet': 296767, 'hematokrit': 51.07, 'wbc': 5458, 'hemoglobin': 13.7, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1124', 'diagnosis': 'DBD_POSITIF', 'age': 36, 'gender': 'female', 'platelet': 144967, 'hematokrit': 45.59, 'wbc': 5648, 'hemoglobin': 14.3, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1125', 'diagnosis': 'DBD_POSITIF', 'age': 54, 'gender': 'female', 'platelet': 272206, 'hematokrit': 45.38, 'wbc': 4407, 'hemoglobin': 15.8, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1126', 'diagnosis': 'DBD_POSITIF', 'age': 56, 'gender': 'female', 'platelet': 281958, 'hematokrit': 39.98, 'wbc': 5692, 'hemoglobin': 15.4, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1127', 'diagnosis': 'DBD_POSITIF', 'age': 38, 'gender': 'male', 'platelet': 178837, 'hematokrit': 38.01, 'wbc': 5977, 'hemoglobin': 15.8, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1128', 'diagnosis': 'BUKAN_DBD', 'age': 25, 'gender': 'male', 'platelet': 236049, 'hematokrit': 49.34, 'wbc': 6413, 'hemoglobin': 11.6, 'demam_tinggi': 0, 'sakit_kepala': 1, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_1129', 'diagnosis': 'DBD_POSITIF', 'age': 45, 'gender': 'female', 'platelet': 181967, 'hematokrit': 39.23, 'wbc': 6398, 'hemoglobin': 12.8, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1130', 'diagnosis': 'BUKAN_DBD', 'age': 22, 'gender': 'male', 'platelet': 211201, 'hematokrit': 46.87, 'wbc': 5322, 'hemoglobin': 15.5, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_1131', 'diagnosis': 'DBD_POSITIF', 'age': 34, 'gender': 'female', 'platelet': 139683, 'hematokrit': 50.8, 'wbc': 5929, 'hemoglobin': 14.4, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1132', 'diagnosis': 'DBD_POSITIF', 'age': 54, 'gender': 'female', 'platelet': 125331, 'hematokrit': 40.92, 'wbc': 5182, 'hemoglobin': 11.5, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1133', 'diagnosis': 'DBD_POSITIF', 'age': 53, 'gender': 'male', 'platelet': 114626, 'hematokrit': 47.31, 'wbc': 6534, 'hemoglobin': 16.3, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1134', 'diagnosis': 'BUKAN_DBD', 'age': 36, 'gender': 'male', 'platelet': 259575, 'hematokrit': 39.1, 'wbc': 4841, 'hemoglobin': 16.1, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_1135', 'diagnosis': 'DBD_POSITIF', 'age': 44, 'gender': 'male', 'platelet': 238621, 'hematokrit': 46.45, 'wbc': 4983, 'hemoglobin': 14.8, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1136', 'diagnosis': 'DBD_POSITIF', 'age': 51, 'gender': 'female', 'platelet': 92342, 'hematokrit': 40.3, 'wbc': 5760, 'hemoglobin': 11.9, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1137', 'diagnosis': 'DBD_POSITIF', 'age': 28, 'gender': 'male', 'platelet': 116417, 'hematokrit': 48.3, 'wbc': 5378, 'hemoglobin': 16.1, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1138', 'diagnosis': 'DBD_POSITIF', 'age': 62, 'gender': 'female', 'platelet': 287586, 'hematokrit': 42.22, 'wbc': 4620, 'hemoglobin': 15.0, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1139', 'diagnosis': 'DBD_POSITIF', 'age': 64, 'gender': 'male', 'platelet': 263321, 'hematokrit': 44.49, 'wbc': 4929, 'hemoglobin': 16.2, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1140', 'diagnosis': 'DBD_POSITIF', 'age': 29, 'gender': 'male', 'platelet': 132664, 'hematokrit': 46.39, 'wbc': 6448, 'hemoglobin': 16.0, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1141', 'diagnosis': 'DBD_POSITIF', 'age': 38, 'gender': 'female', 'platelet': 88833, 'hematokrit': 40.4, 'wbc': 5730, 'hemoglobin': 16.3, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1142', 'diagnosis': 'DBD_POSITIF', 'age': 28, 'gender': 'female', 'platelet': 140658, 'hematokrit': 48.38, 'wbc': 6617, 'hemoglobin': 14.6, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1143', 'diagnosis': 'DBD_POSITIF', 'age': 56, 'gender': 'female', 'platelet': 240545, 'hematokrit': 42.24, 'wbc': 4974, 'hemoglobin': 12.3, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1144', 'diagnosis': 'DBD_POSITIF', 'age': 45, 'gender': 'female', 'platelet': 211809, 'hematokrit': 47.27, 'wbc': 4391, 'hemoglobin': 15.5, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1145', 'diagnosis': 'DBD_POSITIF', 'age': 22, 'gender': 'female', 'platelet': 174965, 'hematokrit': 40.22, 'wbc': 4351, 'hemoglobin': 15.2, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1146', 'diagnosis': 'DBD_POSITIF', 'age': 34, 'gender': 'female', 'platelet': 257719, 'hematokrit': 47.63, 'wbc': 6853, 'hemoglobin': 16.0, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1147', 'diagnosis': 'DBD_POSITIF', 'age': 37, 'gender': 'female', 'platelet': 144054, 'hematokrit': 39.79, 'wbc': 5689, 'hemoglobin': 12.5, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1148', 'diagnosis': 'DBD_POSITIF', 'age': 58, 'gender': 'female', 'platelet': 81299, 'hematokrit': 43.95, 'wbc': 4575, 'hemoglobin': 12.7, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1149', 'diagnosis': 'DBD_POSITIF', 'age': 63, 'gender': 'male', 'platelet': 274353, 'hematokrit': 41.46, 'wbc': 5693, 'hemoglobin': 16.8, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1150', 'diagnosis': 'DBD_POSITIF', 'age': 29, 'gender': 'female', 'platelet': 145875, 'hematokrit': 48.48, 'wbc': 6824, 'hemoglobin': 16.0, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1151', 'diagnosis': 'DBD_POSITIF', 'age': 23, 'gender': 'female', 'platelet': 243992, 'hematokrit': 41.67, 'wbc': 6680, 'hemoglobin': 16.9, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1152', 'diagnosis': 'DBD_POSITIF', 'age': 34, 'gender': 'male', 'platelet': 265908, 'hematokrit': 50.34, 'wbc': 5311, 'hemoglobin': 16.1, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1153', 'diagnosis': 'DBD_POSITIF', 'age': 68, 'gender': 'female', 'platelet': 253453, 'hematokrit': 50.49, 'wbc': 4522, 'hemoglobin': 15.1, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1154', 'diagnosis': 'DBD_POSITIF', 'age': 36, 'gender': 'male', 'platelet': 194286, 'hematokrit': 40.75, 'wbc': 4725, 'hemoglobin': 15.4, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1155', 'diagnosis': 'DBD_POSITIF', 'age': 43, 'gender': 'male', 'platelet': 296043, 'hematokrit': 46.59, 'wbc': 4161, 'hemoglobin': 16.8, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1156', 'diagnosis': 'BUKAN_DBD', 'age': 65, 'gender': 'female', 'platelet': 178730, 'hematokrit': 39.23, 'wbc': 5937, 'hemoglobin': 15.0, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_1157', 'diagnosis': 'DBD_POSITIF', 'age': 61, 'gender': 'male', 'platelet': 136298, 'hematokrit': 43.48, 'wbc': 4658, 'hemoglobin': 15.3, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1158', 'diagnosis': 'DBD_POSITIF', 'age': 61, 'gender': 'female', 'platelet': 235581, 'hematokrit': 47.99, 'wbc': 6897, 'hemoglobin': 12.4, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1159', 'diagnosis': 'DBD_POSITIF', 'age': 69, 'gender': 'male', 'platelet': 201035, 'hematokrit': 47.23, 'wbc': 5572, 'hemoglobin': 14.3, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1160', 'diagnosis': 'DBD_POSITIF', 'age': 49, 'gender': 'male', 'platelet': 253167, 'hematokrit': 46.75, 'wbc': 6129, 'hemoglobin': 15.8, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1161', 'diagnosis': 'DBD_POSITIF', 'age': 23, 'gender': 'male', 'platelet': 262596, 'hematokrit': 41.96, 'wbc': 4523, 'hemoglobin': 13.1, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1162', 'diagnosis': 'DBD_POSITIF', 'age': 53, 'gender': 'female', 'platelet': 189825, 'hematokrit': 43.29, 'wbc': 4003, 'hemoglobin': 12.7, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1163', 'diagnosis': 'BUKAN_DBD', 'age': 55, 'gender': 'female', 'platelet': 195637, 'hematokrit': 39.44, 'wbc': 6542, 'hemoglobin': 13.4, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_1164', 'diagnosis': 'DBD_POSITIF', 'age': 28, 'gender': 'male', 'platelet': 277981, 'hematokrit': 48.07, 'wbc': 5578, 'hemoglobin': 12.9, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1165', 'diagnosis': 'BUKAN_DBD', 'age': 50, 'gender': 'male', 'platelet': 152618, 'hematokrit': 45.05, 'wbc': 5074, 'hemoglobin': 12.8, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_1166', 'diagnosis': 'DBD_POSITIF', 'age': 41, 'gender': 'female', 'platelet': 105532, 'hematokrit': 47.92, 'wbc': 5284, 'hemoglobin': 14.0, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1167', 'diagnosis': 'DBD_POSITIF', 'age': 40, 'gender': 'female', 'platelet': 188197, 'hematokrit': 41.49, 'wbc': 5622, 'hemoglobin': 16.9, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1168', 'diagnosis': 'DBD_POSITIF', 'age': 32, 'gender': 'male', 'platelet': 210860, 'hematokrit': 42.54, 'wbc': 6615, 'hemoglobin': 14.5, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1169', 'diagnosis': 'BUKAN_DBD', 'age': 44, 'gender': 'male', 'platelet': 140285, 'hematokrit': 42.68, 'wbc': 4877, 'hemoglobin': 12.6, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_1170', 'diagnosis': 'BUKAN_DBD', 'age': 28, 'gender': 'female', 'platelet': 98866, 'hematokrit': 38.36, 'wbc': 5091, 'hemoglobin': 12.0, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_1171', 'diagnosis': 'DBD_POSITIF', 'age': 68, 'gender': 'female', 'platelet': 218665, 'hematokrit': 42.77, 'wbc': 6911, 'hemoglobin': 15.7, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1172', 'diagnosis': 'DBD_POSITIF', 'age': 67, 'gender': 'female', 'platelet': 89495, 'hematokrit': 49.25, 'wbc': 5166, 'hemoglobin': 13.8, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1173', 'diagnosis': 'DBD_POSITIF', 'age': 34, 'gender': 'female', 'platelet': 87837, 'hematokrit': 50.56, 'wbc': 5577, 'hemoglobin': 16.4, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1174', 'diagnosis': 'DBD_POSITIF', 'age': 68, 'gender': 'female', 'platelet': 287780, 'hematokrit': 45.26, 'wbc': 5674, 'hemoglobin': 15.5, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1175', 'diagnosis': 'BUKAN_DBD', 'age': 31, 'gender': 'male', 'platelet': 229752, 'hematokrit': 44.38, 'wbc': 5608, 'hemoglobin': 16.3, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_1176', 'diagnosis': 'BUKAN_DBD', 'age': 44, 'gender': 'female', 'platelet': 266548, 'hematokrit': 38.43, 'wbc': 6826, 'hemoglobin': 13.1, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_1177', 'diagnosis': 'BUKAN_DBD', 'age': 35, 'gender': 'male', 'platelet': 110346, 'hematokrit': 50.31, 'wbc': 5217, 'hemoglobin': 15.7, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_1178', 'diagnosis': 'DBD_POSITIF', 'age': 45, 'gender': 'female', 'platelet': 188621, 'hematokrit': 38.18, 'wbc': 5690, 'hemoglobin': 13.1, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1179', 'diagnosis': 'BUKAN_DBD', 'age': 68, 'gender': 'male', 'platelet': 103412, 'hematokrit': 51.23, 'wbc': 4313, 'hemoglobin': 17.1, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_1180', 'diagnosis': 'BUKAN_DBD', 'age': 64, 'gender': 'female', 'platelet': 299471, 'hematokrit': 44.85, 'wbc': 4729, 'hemoglobin': 15.3, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_1181', 'diagnosis': 'DBD_POSITIF', 'age': 64, 'gender': 'female', 'platelet': 198833, 'hematokrit': 42.79, 'wbc': 4383, 'hemoglobin': 13.4, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1182', 'diagnosis': 'DBD_POSITIF', 'age': 21, 'gender': 'male', 'platelet': 241876, 'hematokrit': 50.94, 'wbc': 5788, 'hemoglobin': 13.1, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1183', 'diagnosis': 'DBD_POSITIF', 'age': 24, 'gender': 'male', 'platelet': 145206, 'hematokrit': 38.34, 'wbc': 5812, 'hemoglobin': 12.6, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1184', 'diagnosis': 'DBD_POSITIF', 'age': 62, 'gender': 'female', 'platelet': 90934, 'hematokrit': 46.14, 'wbc': 6324, 'hemoglobin': 15.7, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1185', 'diagnosis': 'DBD_POSITIF', 'age': 52, 'gender': 'female', 'platelet': 110723, 'hematokrit': 45.69, 'wbc': 5095, 'hemoglobin': 12.8, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1186', 'diagnosis': 'BUKAN_DBD', 'age': 65, 'gender': 'female', 'platelet': 207968, 'hematokrit': 41.07, 'wbc': 5152, 'hemoglobin': 15.1, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_1187', 'diagnosis': 'DBD_POSITIF', 'age': 26, 'gender': 'female', 'platelet': 231477, 'hematokrit': 44.0, 'wbc': 6745, 'hemoglobin': 13.1, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1188', 'diagnosis': 'DBD_POSITIF', 'age': 25, 'gender': 'female', 'platelet': 229820, 'hematokrit': 47.13, 'wbc': 5548, 'hemoglobin': 15.5, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1189', 'diagnosis': 'BUKAN_DBD', 'age': 69, 'gender': 'male', 'platelet': 281838, 'hematokrit': 48.18, 'wbc': 5864, 'hemoglobin': 16.4, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_1190', 'diagnosis': 'DBD_POSITIF', 'age': 62, 'gender': 'male', 'platelet': 257485, 'hematokrit': 38.01, 'wbc': 4750, 'hemoglobin': 16.2, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1191', 'diagnosis': 'DBD_POSITIF', 'age': 34, 'gender': 'female', 'platelet': 233426, 'hematokrit': 51.12, 'wbc': 4982, 'hemoglobin': 16.1, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1192', 'diagnosis': 'DBD_POSITIF', 'age': 34, 'gender': 'male', 'platelet': 285562, 'hematokrit': 40.3, 'wbc': 6671, 'hemoglobin': 12.6, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1193', 'diagnosis': 'DBD_POSITIF', 'age': 66, 'gender': 'male', 'platelet': 201988, 'hematokrit': 41.27, 'wbc': 4227, 'hemoglobin': 12.0, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1194', 'diagnosis': 'DBD_POSITIF', 'age': 50, 'gender': 'male', 'platelet': 299747, 'hematokrit': 41.69, 'wbc': 6043, 'hemoglobin': 15.7, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1195', 'diagnosis': 'DBD_POSITIF', 'age': 49, 'gender': 'female', 'platelet': 228460, 'hematokrit': 38.53, 'wbc': 5977, 'hemoglobin': 13.7, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1196', 'diagnosis': 'DBD_POSITIF', 'age': 25, 'gender': 'male', 'platelet': 116523, 'hematokrit': 39.72, 'wbc': 6064, 'hemoglobin': 14.1, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1197', 'diagnosis': 'DBD_POSITIF', 'age': 36, 'gender': 'female', 'platelet': 181150, 'hematokrit': 51.81, 'wbc': 5608, 'hemoglobin': 11.7, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1198', 'diagnosis': 'DBD_POSITIF', 'age': 55, 'gender': 'male', 'platelet': 200950, 'hematokrit': 42.41, 'wbc': 4011, 'hemoglobin': 13.1, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1199', 'diagnosis': 'DBD_POSITIF', 'age': 20, 'gender': 'female', 'platelet': 268765, 'hematokrit': 39.61, 'wbc': 5522, 'hemoglobin': 11.7, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1200', 'diagnosis': 'BUKAN_DBD', 'age': 22, 'gender': 'male', 'platelet': 246804, 'hematokrit': 39.5, 'wbc': 4691, 'hemoglobin': 16.8, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_1201', 'diagnosis': 'DBD_POSITIF', 'age': 30, 'gender': 'female', 'platelet': 121646, 'hematokrit': 48.07, 'wbc': 5739, 'hemoglobin': 13.0, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1202', 'diagnosis': 'DBD_POSITIF', 'age': 64, 'gender': 'female', 'platelet': 232093, 'hematokrit': 49.96, 'wbc': 5525, 'hemoglobin': 14.8, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1203', 'diagnosis': 'BUKAN_DBD', 'age': 63, 'gender': 'male', 'platelet': 132776, 'hematokrit': 41.6, 'wbc': 4069, 'hemoglobin': 11.7, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_1204', 'diagnosis': 'DBD_POSITIF', 'age': 48, 'gender': 'female', 'platelet': 99116, 'hematokrit': 38.29, 'wbc': 6155, 'hemoglobin': 15.5, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1205', 'diagnosis': 'DBD_POSITIF', 'age': 33, 'gender': 'female', 'platelet': 283081, 'hematokrit': 41.12, 'wbc': 6248, 'hemoglobin': 13.4, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1206', 'diagnosis': 'DBD_POSITIF', 'age': 67, 'gender': 'female', 'platelet': 192858, 'hematokrit': 38.79, 'wbc': 5572, 'hemoglobin': 16.9, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1207', 'diagnosis': 'DBD_POSITIF', 'age': 49, 'gender': 'female', 'platelet': 299343, 'hematokrit': 39.45, 'wbc': 4628, 'hemoglobin': 16.8, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1208', 'diagnosis': 'BUKAN_DBD', 'age': 39, 'gender': 'female', 'platelet': 156620, 'hematokrit': 44.04, 'wbc': 5287, 'hemoglobin': 13.5, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_1209', 'diagnosis': 'DBD_POSITIF', 'age': 46, 'gender': 'female', 'platelet': 255843, 'hematokrit': 41.22, 'wbc': 4905, 'hemoglobin': 16.9, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1210', 'diagnosis': 'DBD_POSITIF', 'age': 39, 'gender': 'female', 'platelet': 239828, 'hematokrit': 45.22, 'wbc': 6350, 'hemoglobin': 17.5, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1211', 'diagnosis': 'DBD_POSITIF', 'age': 60, 'gender': 'female', 'platelet': 162604, 'hematokrit': 41.55, 'wbc': 6984, 'hemoglobin': 16.5, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1212', 'diagnosis': 'DBD_POSITIF', 'age': 20, 'gender': 'male', 'platelet': 174452, 'hematokrit': 51.17, 'wbc': 4575, 'hemoglobin': 16.6, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1213', 'diagnosis': 'BUKAN_DBD', 'age': 27, 'gender': 'male', 'platelet': 213991, 'hematokrit': 50.68, 'wbc': 6602, 'hemoglobin': 13.0, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_1214', 'diagnosis': 'BUKAN_DBD', 'age': 59, 'gender': 'female', 'platelet': 103550, 'hematokrit': 45.94, 'wbc': 6172, 'hemoglobin': 15.0, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_1215', 'diagnosis': 'DBD_POSITIF', 'age': 38, 'gender': 'female', 'platelet': 247596, 'hematokrit': 42.96, 'wbc': 6020, 'hemoglobin': 11.9, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1216', 'diagnosis': 'BUKAN_DBD', 'age': 33, 'gender': 'male', 'platelet': 265678, 'hematokrit': 43.34, 'wbc': 4858, 'hemoglobin': 12.1, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_1217', 'diagnosis': 'DBD_POSITIF', 'age': 29, 'gender': 'male', 'platelet': 279891, 'hematokrit': 43.77, 'wbc': 4744, 'hemoglobin': 17.5, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1218', 'diagnosis': 'DBD_POSITIF', 'age': 19, 'gender': 'male', 'platelet': 150227, 'hematokrit': 48.19, 'wbc': 6527, 'hemoglobin': 13.5, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1219', 'diagnosis': 'DBD_POSITIF', 'age': 58, 'gender': 'female', 'platelet': 103212, 'hematokrit': 44.32, 'wbc': 6179, 'hemoglobin': 16.0, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1220', 'diagnosis': 'DBD_POSITIF', 'age': 41, 'gender': 'male', 'platelet': 120118, 'hematokrit': 49.99, 'wbc': 4114, 'hemoglobin': 16.3, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1221', 'diagnosis': 'BUKAN_DBD', 'age': 52, 'gender': 'female', 'platelet': 108602, 'hematokrit': 51.22, 'wbc': 4480, 'hemoglobin': 16.6, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_1222', 'diagnosis': 'DBD_POSITIF', 'age': 47, 'gender': 'female', 'platelet': 97540, 'hematokrit': 42.7, 'wbc': 4980, 'hemoglobin': 17.5, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1223', 'diagnosis': 'DBD_POSITIF', 'age': 47, 'gender': 'male', 'platelet': 246901, 'hematokrit': 45.85, 'wbc': 5024, 'hemoglobin': 12.9, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1224', 'diagnosis': 'DBD_POSITIF', 'age': 64, 'gender': 'female', 'platelet': 267381, 'hematokrit': 39.33, 'wbc': 6378, 'hemoglobin': 11.7, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1225', 'diagnosis': 'BUKAN_DBD', 'age': 52, 'gender': 'female', 'platelet': 276475, 'hematokrit': 40.81, 'wbc': 5600, 'hemoglobin': 14.0, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_1226', 'diagnosis': 'DBD_POSITIF', 'age': 36, 'gender': 'female', 'platelet': 151455, 'hematokrit': 43.79, 'wbc': 4941, 'hemoglobin': 12.3, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1227', 'diagnosis': 'DBD_POSITIF', 'age': 67, 'gender': 'female', 'platelet': 102277, 'hematokrit': 40.89, 'wbc': 4954, 'hemoglobin': 11.6, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1228', 'diagnosis': 'DBD_POSITIF', 'age': 25, 'gender': 'male', 'platelet': 199133, 'hematokrit': 50.27, 'wbc': 5660, 'hemoglobin': 13.7, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1229', 'diagnosis': 'BUKAN_DBD', 'age': 43, 'gender': 'male', 'platelet': 270745, 'hematokrit': 40.22, 'wbc': 4767, 'hemoglobin': 16.2, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_1230', 'diagnosis': 'DBD_POSITIF', 'age': 66, 'gender': 'female', 'platelet': 228748, 'hematokrit': 44.38, 'wbc': 6438, 'hemoglobin': 14.9, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1231', 'diagnosis': 'DBD_POSITIF', 'age': 57, 'gender': 'female', 'platelet': 253916, 'hematokrit': 46.48, 'wbc': 4833, 'hemoglobin': 13.4, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1232', 'diagnosis': 'DBD_POSITIF', 'age': 24, 'gender': 'male', 'platelet': 275780, 'hematokrit': 47.69, 'wbc': 6190, 'hemoglobin': 15.4, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1233', 'diagnosis': 'BUKAN_DBD', 'age': 47, 'gender': 'female', 'platelet': 89752, 'hematokrit': 43.36, 'wbc': 6375, 'hemoglobin': 12.9, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_1234', 'diagnosis': 'DBD_POSITIF', 'age': 24, 'gender': 'male', 'platelet': 292620, 'hematokrit': 50.17, 'wbc': 5781, 'hemoglobin': 11.6, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1235', 'diagnosis': 'DBD_POSITIF', 'age': 20, 'gender': 'female', 'platelet': 285783, 'hematokrit': 45.96, 'wbc': 4627, 'hemoglobin': 16.1, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1236', 'diagnosis': 'DBD_POSITIF', 'age': 18, 'gender': 'female', 'platelet': 251742, 'hematokrit': 44.15, 'wbc': 4376, 'hemoglobin': 15.2, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1237', 'diagnosis': 'DBD_POSITIF', 'age': 53, 'gender': 'male', 'platelet': 278675, 'hematokrit': 38.94, 'wbc': 4089, 'hemoglobin': 16.1, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1238', 'diagnosis': 'DBD_POSITIF', 'age': 42, 'gender': 'male', 'platelet': 242550, 'hematokrit': 44.51, 'wbc': 6855, 'hemoglobin': 11.7, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1239', 'diagnosis': 'DBD_POSITIF', 'age': 54, 'gender': 'male', 'platelet': 237511, 'hematokrit': 49.49, 'wbc': 5020, 'hemoglobin': 16.5, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1240', 'diagnosis': 'DBD_POSITIF', 'age': 18, 'gender': 'male', 'platelet': 245819, 'hematokrit': 46.6, 'wbc': 5065, 'hemoglobin': 15.2, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1241', 'diagnosis': 'DBD_POSITIF', 'age': 32, 'gender': 'female', 'platelet': 205332, 'hematokrit': 49.65, 'wbc': 5970, 'hemoglobin': 14.9, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1242', 'diagnosis': 'DBD_POSITIF', 'age': 54, 'gender': 'male', 'platelet': 240882, 'hematokrit': 44.92, 'wbc': 5058, 'hemoglobin': 15.2, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1243', 'diagnosis': 'DBD_POSITIF', 'age': 30, 'gender': 'female', 'platelet': 98302, 'hematokrit': 39.66, 'wbc': 5517, 'hemoglobin': 16.7, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1244', 'diagnosis': 'DBD_POSITIF', 'age': 57, 'gender': 'male', 'platelet': 146236, 'hematokrit': 38.19, 'wbc': 6600, 'hemoglobin': 15.0, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1245', 'diagnosis': 'DBD_POSITIF', 'age': 25, 'gender': 'male', 'platelet': 144467, 'hematokrit': 42.25, 'wbc': 4123, 'hemoglobin': 15.0, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1246', 'diagnosis': 'DBD_POSITIF', 'age': 22, 'gender': 'female', 'platelet': 182350, 'hematokrit': 47.77, 'wbc': 6104, 'hemoglobin': 17.4, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1247', 'diagnosis': 'DBD_POSITIF', 'age': 26, 'gender': 'male', 'platelet': 245913, 'hematokrit': 49.06, 'wbc': 6853, 'hemoglobin': 16.0, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1248', 'diagnosis': 'DBD_POSITIF', 'age': 18, 'gender': 'male', 'platelet': 255785, 'hematokrit': 42.14, 'wbc': 5479, 'hemoglobin': 14.2, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1249', 'diagnosis': 'DBD_POSITIF', 'age': 53, 'gender': 'male', 'platelet': 260618, 'hematokrit': 44.94, 'wbc': 6282, 'hemoglobin': 15.7, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1250', 'diagnosis': 'DBD_POSITIF', 'age': 52, 'gender': 'male', 'platelet': 83048, 'hematokrit': 43.9, 'wbc': 6655, 'hemoglobin': 13.8, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1251', 'diagnosis': 'DBD_POSITIF', 'age': 19, 'gender': 'female', 'platelet': 244362, 'hematokrit': 43.75, 'wbc': 6439, 'hemoglobin': 12.9, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1252', 'diagnosis': 'DBD_POSITIF', 'age': 57, 'gender': 'female', 'platelet': 138906, 'hematokrit': 41.24, 'wbc': 5515, 'hemoglobin': 15.1, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1253', 'diagnosis': 'DBD_POSITIF', 'age': 40, 'gender': 'male', 'platelet': 156637, 'hematokrit': 39.91, 'wbc': 5854, 'hemoglobin': 17.1, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1254', 'diagnosis': 'DBD_POSITIF', 'age': 26, 'gender': 'male', 'platelet': 109778, 'hematokrit': 40.75, 'wbc': 5366, 'hemoglobin': 17.1, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1255', 'diagnosis': 'DBD_POSITIF', 'age': 51, 'gender': 'male', 'platelet': 238497, 'hematokrit': 38.77, 'wbc': 4051, 'hemoglobin': 13.6, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1256', 'diagnosis': 'DBD_POSITIF', 'age': 63, 'gender': 'female', 'platelet': 294460, 'hematokrit': 40.77, 'wbc': 5573, 'hemoglobin': 14.7, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1257', 'diagnosis': 'DBD_POSITIF', 'age': 31, 'gender': 'female', 'platelet': 200918, 'hematokrit': 38.13, 'wbc': 5501, 'hemoglobin': 12.8, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1258', 'diagnosis': 'DBD_POSITIF', 'age': 21, 'gender': 'female', 'platelet': 170036, 'hematokrit': 46.78, 'wbc': 6536, 'hemoglobin': 17.5, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1259', 'diagnosis': 'DBD_POSITIF', 'age': 47, 'gender': 'female', 'platelet': 269248, 'hematokrit': 42.43, 'wbc': 6052, 'hemoglobin': 17.4, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1260', 'diagnosis': 'DBD_POSITIF', 'age': 48, 'gender': 'male', 'platelet': 223746, 'hematokrit': 51.62, 'wbc': 4631, 'hemoglobin': 15.4, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1261', 'diagnosis': 'DBD_POSITIF', 'age': 55, 'gender': 'male', 'platelet': 273474, 'hematokrit': 40.71, 'wbc': 5861, 'hemoglobin': 16.3, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1262', 'diagnosis': 'DBD_POSITIF', 'age': 28, 'gender': 'male', 'platelet': 299803, 'hematokrit': 42.84, 'wbc': 5232, 'hemoglobin': 15.8, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1263', 'diagnosis': 'DBD_POSITIF', 'age': 52, 'gender': 'female', 'platelet': 244125, 'hematokrit': 43.01, 'wbc': 6264, 'hemoglobin': 15.1, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1264', 'diagnosis': 'DBD_POSITIF', 'age': 25, 'gender': 'male', 'platelet': 91957, 'hematokrit': 38.12, 'wbc': 6047, 'hemoglobin': 11.8, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1265', 'diagnosis': 'DBD_POSITIF', 'age': 20, 'gender': 'female', 'platelet': 152644, 'hematokrit': 49.75, 'wbc': 4535, 'hemoglobin': 14.2, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1266', 'diagnosis': 'BUKAN_DBD', 'age': 31, 'gender': 'female', 'platelet': 264688, 'hematokrit': 38.45, 'wbc': 6785, 'hemoglobin': 15.5, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_1267', 'diagnosis': 'DBD_POSITIF', 'age': 30, 'gender': 'male', 'platelet': 193294, 'hematokrit': 51.16, 'wbc': 4729, 'hemoglobin': 15.6, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1268', 'diagnosis': 'DBD_POSITIF', 'age': 62, 'gender': 'male', 'platelet': 97829, 'hematokrit': 50.49, 'wbc': 5275, 'hemoglobin': 13.7, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1269', 'diagnosis': 'BUKAN_DBD', 'age': 49, 'gender': 'male', 'platelet': 85837, 'hematokrit': 45.5, 'wbc': 6050, 'hemoglobin': 17.2, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_1270', 'diagnosis': 'DBD_POSITIF', 'age': 51, 'gender': 'female', 'platelet': 275213, 'hematokrit': 45.61, 'wbc': 5025, 'hemoglobin': 12.5, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1271', 'diagnosis': 'DBD_POSITIF', 'age': 62, 'gender': 'female', 'platelet': 226104, 'hematokrit': 47.15, 'wbc': 6197, 'hemoglobin': 14.5, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1272', 'diagnosis': 'DBD_POSITIF', 'age': 36, 'gender': 'male', 'platelet': 179770, 'hematokrit': 43.42, 'wbc': 6051, 'hemoglobin': 15.6, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1273', 'diagnosis': 'DBD_POSITIF', 'age': 55, 'gender': 'male', 'platelet': 106352, 'hematokrit': 47.06, 'wbc': 5520, 'hemoglobin': 15.7, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1274', 'diagnosis': 'DBD_POSITIF', 'age': 33, 'gender': 'female', 'platelet': 110215, 'hematokrit': 38.63, 'wbc': 5894, 'hemoglobin': 15.4, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1275', 'diagnosis': 'DBD_POSITIF', 'age': 19, 'gender': 'male', 'platelet': 267391, 'hematokrit': 38.76, 'wbc': 4467, 'hemoglobin': 13.2, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1276', 'diagnosis': 'BUKAN_DBD', 'age': 57, 'gender': 'female', 'platelet': 285714, 'hematokrit': 44.4, 'wbc': 6117, 'hemoglobin': 12.4, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_1277', 'diagnosis': 'DBD_POSITIF', 'age': 34, 'gender': 'female', 'platelet': 121247, 'hematokrit': 45.69, 'wbc': 4200, 'hemoglobin': 15.3, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1278', 'diagnosis': 'BUKAN_DBD', 'age': 51, 'gender': 'male', 'platelet': 209692, 'hematokrit': 50.43, 'wbc': 4307, 'hemoglobin': 15.1, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_1279', 'diagnosis': 'DBD_POSITIF', 'age': 59, 'gender': 'male', 'platelet': 254120, 'hematokrit': 39.47, 'wbc': 6045, 'hemoglobin': 12.6, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1280', 'diagnosis': 'DBD_POSITIF', 'age': 33, 'gender': 'male', 'platelet': 286604, 'hematokrit': 49.52, 'wbc': 4921, 'hemoglobin': 15.7, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1281', 'diagnosis': 'DBD_POSITIF', 'age': 55, 'gender': 'male', 'platelet': 146714, 'hematokrit': 40.94, 'wbc': 6339, 'hemoglobin': 14.2, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1282', 'diagnosis': 'DBD_POSITIF', 'age': 19, 'gender': 'female', 'platelet': 115319, 'hematokrit': 43.52, 'wbc': 6971, 'hemoglobin': 15.5, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1283', 'diagnosis': 'DBD_POSITIF', 'age': 19, 'gender': 'female', 'platelet': 199058, 'hematokrit': 42.43, 'wbc': 4882, 'hemoglobin': 16.5, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1284', 'diagnosis': 'DBD_POSITIF', 'age': 43, 'gender': 'female', 'platelet': 96025, 'hematokrit': 43.6, 'wbc': 4585, 'hemoglobin': 12.5, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1285', 'diagnosis': 'DBD_POSITIF', 'age': 30, 'gender': 'male', 'platelet': 89780, 'hematokrit': 40.11, 'wbc': 5720, 'hemoglobin': 11.6, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1286', 'diagnosis': 'DBD_POSITIF', 'age': 64, 'gender': 'female', 'platelet': 102706, 'hematokrit': 45.05, 'wbc': 4508, 'hemoglobin': 16.2, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1287', 'diagnosis': 'DBD_POSITIF', 'age': 48, 'gender': 'male', 'platelet': 253988, 'hematokrit': 49.22, 'wbc': 4004, 'hemoglobin': 15.2, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1288', 'diagnosis': 'BUKAN_DBD', 'age': 51, 'gender': 'male', 'platelet': 155503, 'hematokrit': 44.18, 'wbc': 6340, 'hemoglobin': 15.7, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_1289', 'diagnosis': 'BUKAN_DBD', 'age': 56, 'gender': 'male', 'platelet': 241928, 'hematokrit': 44.87, 'wbc': 4359, 'hemoglobin': 16.5, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_1290', 'diagnosis': 'DBD_POSITIF', 'age': 20, 'gender': 'male', 'platelet': 183166, 'hematokrit': 49.88, 'wbc': 4213, 'hemoglobin': 16.3, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1291', 'diagnosis': 'DBD_POSITIF', 'age': 25, 'gender': 'male', 'platelet': 89179, 'hematokrit': 47.88, 'wbc': 5459, 'hemoglobin': 17.3, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1292', 'diagnosis': 'DBD_POSITIF', 'age': 40, 'gender': 'male', 'platelet': 249695, 'hematokrit': 44.87, 'wbc': 4562, 'hemoglobin': 14.7, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1293', 'diagnosis': 'DBD_POSITIF', 'age': 31, 'gender': 'female', 'platelet': 228659, 'hematokrit': 41.61, 'wbc': 6812, 'hemoglobin': 14.4, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1294', 'diagnosis': 'DBD_POSITIF', 'age': 44, 'gender': 'male', 'platelet': 234805, 'hematokrit': 50.39, 'wbc': 4044, 'hemoglobin': 13.9, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1295', 'diagnosis': 'BUKAN_DBD', 'age': 46, 'gender': 'female', 'platelet': 299378, 'hematokrit': 46.08, 'wbc': 6750, 'hemoglobin': 12.4, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_1296', 'diagnosis': 'BUKAN_DBD', 'age': 56, 'gender': 'female', 'platelet': 179423, 'hematokrit': 41.1, 'wbc': 4633, 'hemoglobin': 14.9, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_1297', 'diagnosis': 'DBD_POSITIF', 'age': 56, 'gender': 'male', 'platelet': 203076, 'hematokrit': 41.77, 'wbc': 5435, 'hemoglobin': 13.2, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1298', 'diagnosis': 'DBD_POSITIF', 'age': 18, 'gender': 'male', 'platelet': 215047, 'hematokrit': 49.24, 'wbc': 5210, 'hemoglobin': 17.0, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1299', 'diagnosis': 'DBD_POSITIF', 'age': 34, 'gender': 'male', 'platelet': 289527, 'hematokrit': 38.62, 'wbc': 5749, 'hemoglobin': 15.0, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1300', 'diagnosis': 'DBD_POSITIF', 'age': 58, 'gender': 'female', 'platelet': 155138, 'hematokrit': 51.89, 'wbc': 6708, 'hemoglobin': 15.1, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1301', 'diagnosis': 'BUKAN_DBD', 'age': 47, 'gender': 'male', 'platelet': 256535, 'hematokrit': 39.82, 'wbc': 6768, 'hemoglobin': 13.6, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_1302', 'diagnosis': 'DBD_POSITIF', 'age': 30, 'gender': 'female', 'platelet': 253226, 'hematokrit': 49.14, 'wbc': 4593, 'hemoglobin': 11.8, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1303', 'diagnosis': 'DBD_POSITIF', 'age': 38, 'gender': 'male', 'platelet': 286748, 'hematokrit': 43.53, 'wbc': 5424, 'hemoglobin': 11.7, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1304', 'diagnosis': 'BUKAN_DBD', 'age': 36, 'gender': 'male', 'platelet': 166706, 'hematokrit': 44.89, 'wbc': 6293, 'hemoglobin': 14.0, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_1305', 'diagnosis': 'BUKAN_DBD', 'age': 36, 'gender': 'female', 'platelet': 196905, 'hematokrit': 50.33, 'wbc': 5926, 'hemoglobin': 12.0, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_1306', 'diagnosis': 'DBD_POSITIF', 'age': 42, 'gender': 'female', 'platelet': 108830, 'hematokrit': 43.78, 'wbc': 4856, 'hemoglobin': 15.1, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1307', 'diagnosis': 'BUKAN_DBD', 'age': 39, 'gender': 'male', 'platelet': 190076, 'hematokrit': 45.52, 'wbc': 5892, 'hemoglobin': 16.8, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_1308', 'diagnosis': 'DBD_POSITIF', 'age': 48, 'gender': 'female', 'platelet': 283198, 'hematokrit': 38.69, 'wbc': 4551, 'hemoglobin': 16.8, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1309', 'diagnosis': 'BUKAN_DBD', 'age': 34, 'gender': 'female', 'platelet': 257817, 'hematokrit': 38.03, 'wbc': 4042, 'hemoglobin': 15.5, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_1310', 'diagnosis': 'DBD_POSITIF', 'age': 40, 'gender': 'female', 'platelet': 110609, 'hematokrit': 41.43, 'wbc': 6888, 'hemoglobin': 12.8, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1311', 'diagnosis': 'DBD_POSITIF', 'age': 49, 'gender': 'female', 'platelet': 97401, 'hematokrit': 47.53, 'wbc': 4178, 'hemoglobin': 16.7, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1312', 'diagnosis': 'DBD_POSITIF', 'age': 27, 'gender': 'female', 'platelet': 238801, 'hematokrit': 39.7, 'wbc': 5480, 'hemoglobin': 16.8, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1313', 'diagnosis': 'DBD_POSITIF', 'age': 27, 'gender': 'male', 'platelet': 183480, 'hematokrit': 39.59, 'wbc': 6582, 'hemoglobin': 12.7, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1314', 'diagnosis': 'DBD_POSITIF', 'age': 53, 'gender': 'male', 'platelet': 198278, 'hematokrit': 43.75, 'wbc': 4606, 'hemoglobin': 15.9, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1315', 'diagnosis': 'DBD_POSITIF', 'age': 25, 'gender': 'female', 'platelet': 256239, 'hematokrit': 47.07, 'wbc': 4671, 'hemoglobin': 13.2, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1316', 'diagnosis': 'DBD_POSITIF', 'age': 69, 'gender': 'male', 'platelet': 137391, 'hematokrit': 47.97, 'wbc': 4926, 'hemoglobin': 16.3, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1317', 'diagnosis': 'DBD_POSITIF', 'age': 37, 'gender': 'male', 'platelet': 206543, 'hematokrit': 40.5, 'wbc': 4016, 'hemoglobin': 17.5, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1318', 'diagnosis': 'BUKAN_DBD', 'age': 49, 'gender': 'female', 'platelet': 208886, 'hematokrit': 39.11, 'wbc': 5135, 'hemoglobin': 11.7, 'demam_tinggi': 0, 'sakit_kepala': 1, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_1319', 'diagnosis': 'DBD_POSITIF', 'age': 67, 'gender': 'male', 'platelet': 174583, 'hematokrit': 51.17, 'wbc': 5638, 'hemoglobin': 16.9, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1320', 'diagnosis': 'DBD_POSITIF', 'age': 31, 'gender': 'female', 'platelet': 269243, 'hematokrit': 41.65, 'wbc': 6873, 'hemoglobin': 15.2, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1321', 'diagnosis': 'DBD_POSITIF', 'age': 67, 'gender': 'female', 'platelet': 299168, 'hematokrit': 49.95, 'wbc': 6594, 'hemoglobin': 17.3, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1322', 'diagnosis': 'DBD_POSITIF', 'age': 45, 'gender': 'male', 'platelet': 217719, 'hematokrit': 50.09, 'wbc': 5053, 'hemoglobin': 14.3, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1323', 'diagnosis': 'DBD_POSITIF', 'age': 63, 'gender': 'female', 'platelet': 232178, 'hematokrit': 48.82, 'wbc': 5215, 'hemoglobin': 16.6, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1324', 'diagnosis': 'DBD_POSITIF', 'age': 69, 'gender': 'female', 'platelet': 86015, 'hematokrit': 40.36, 'wbc': 6484, 'hemoglobin': 11.9, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1325', 'diagnosis': 'DBD_POSITIF', 'age': 41, 'gender': 'female', 'platelet': 101506, 'hematokrit': 49.51, 'wbc': 6226, 'hemoglobin': 13.5, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1326', 'diagnosis': 'DBD_POSITIF', 'age': 32, 'gender': 'female', 'platelet': 104067, 'hematokrit': 48.77, 'wbc': 4615, 'hemoglobin': 11.9, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1327', 'diagnosis': 'BUKAN_DBD', 'age': 39, 'gender': 'female', 'platelet': 210819, 'hematokrit': 46.35, 'wbc': 6724, 'hemoglobin': 17.4, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_1328', 'diagnosis': 'DBD_POSITIF', 'age': 47, 'gender': 'male', 'platelet': 82056, 'hematokrit': 42.72, 'wbc': 6681, 'hemoglobin': 16.4, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1329', 'diagnosis': 'BUKAN_DBD', 'age': 21, 'gender': 'male', 'platelet': 109328, 'hematokrit': 41.68, 'wbc': 6849, 'hemoglobin': 16.6, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_1330', 'diagnosis': 'DBD_POSITIF', 'age': 30, 'gender': 'female', 'platelet': 157712, 'hematokrit': 39.71, 'wbc': 4311, 'hemoglobin': 17.1, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1331', 'diagnosis': 'DBD_POSITIF', 'age': 40, 'gender': 'female', 'platelet': 132832, 'hematokrit': 45.14, 'wbc': 6072, 'hemoglobin': 12.0, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1332', 'diagnosis': 'DBD_POSITIF', 'age': 25, 'gender': 'male', 'platelet': 122771, 'hematokrit': 46.19, 'wbc': 6418, 'hemoglobin': 13.8, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1333', 'diagnosis': 'DBD_POSITIF', 'age': 35, 'gender': 'female', 'platelet': 177421, 'hematokrit': 43.03, 'wbc': 4524, 'hemoglobin': 11.9, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1334', 'diagnosis': 'DBD_POSITIF', 'age': 29, 'gender': 'male', 'platelet': 297877, 'hematokrit': 44.66, 'wbc': 6277, 'hemoglobin': 12.8, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1335', 'diagnosis': 'DBD_POSITIF', 'age': 48, 'gender': 'female', 'platelet': 257587, 'hematokrit': 43.09, 'wbc': 5473, 'hemoglobin': 12.9, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1336', 'diagnosis': 'DBD_POSITIF', 'age': 31, 'gender': 'female', 'platelet': 144538, 'hematokrit': 46.97, 'wbc': 6425, 'hemoglobin': 14.3, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1337', 'diagnosis': 'DBD_POSITIF', 'age': 51, 'gender': 'female', 'platelet': 279722, 'hematokrit': 50.62, 'wbc': 4887, 'hemoglobin': 13.1, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1338', 'diagnosis': 'DBD_POSITIF', 'age': 35, 'gender': 'female', 'platelet': 290050, 'hematokrit': 40.29, 'wbc': 5924, 'hemoglobin': 12.1, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1339', 'diagnosis': 'BUKAN_DBD', 'age': 51, 'gender': 'female', 'platelet': 120151, 'hematokrit': 43.34, 'wbc': 6007, 'hemoglobin': 12.5, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_1340', 'diagnosis': 'DBD_POSITIF', 'age': 28, 'gender': 'female', 'platelet': 212701, 'hematokrit': 39.97, 'wbc': 4461, 'hemoglobin': 12.4, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1341', 'diagnosis': 'DBD_POSITIF', 'age': 58, 'gender': 'female', 'platelet': 163463, 'hematokrit': 46.75, 'wbc': 6412, 'hemoglobin': 17.3, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1342', 'diagnosis': 'BUKAN_DBD', 'age': 29, 'gender': 'male', 'platelet': 176853, 'hematokrit': 48.2, 'wbc': 6151, 'hemoglobin': 16.1, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_1343', 'diagnosis': 'DBD_POSITIF', 'age': 66, 'gender': 'male', 'platelet': 169432, 'hematokrit': 51.05, 'wbc': 4427, 'hemoglobin': 17.3, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1344', 'diagnosis': 'BUKAN_DBD', 'age': 32, 'gender': 'male', 'platelet': 108155, 'hematokrit': 41.9, 'wbc': 4468, 'hemoglobin': 14.1, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_1345', 'diagnosis': 'DBD_POSITIF', 'age': 48, 'gender': 'female', 'platelet': 229360, 'hematokrit': 51.3, 'wbc': 5014, 'hemoglobin': 13.2, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1346', 'diagnosis': 'DBD_POSITIF', 'age': 66, 'gender': 'female', 'platelet': 130588, 'hematokrit': 38.89, 'wbc': 5604, 'hemoglobin': 16.3, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1347', 'diagnosis': 'DBD_POSITIF', 'age': 46, 'gender': 'female', 'platelet': 298023, 'hematokrit': 46.44, 'wbc': 4869, 'hemoglobin': 13.5, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1348', 'diagnosis': 'DBD_POSITIF', 'age': 43, 'gender': 'female', 'platelet': 247157, 'hematokrit': 38.8, 'wbc': 6817, 'hemoglobin': 13.3, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1349', 'diagnosis': 'BUKAN_DBD', 'age': 35, 'gender': 'female', 'platelet': 91251, 'hematokrit': 50.51, 'wbc': 6727, 'hemoglobin': 12.9, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_1350', 'diagnosis': 'DBD_POSITIF', 'age': 49, 'gender': 'female', 'platelet': 182420, 'hematokrit': 45.42, 'wbc': 6852, 'hemoglobin': 12.3, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1351', 'diagnosis': 'DBD_POSITIF', 'age': 39, 'gender': 'female', 'platelet': 236646, 'hematokrit': 47.37, 'wbc': 4885, 'hemoglobin': 13.0, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1352', 'diagnosis': 'BUKAN_DBD', 'age': 55, 'gender': 'male', 'platelet': 89623, 'hematokrit': 49.64, 'wbc': 6608, 'hemoglobin': 13.6, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_1353', 'diagnosis': 'BUKAN_DBD', 'age': 34, 'gender': 'female', 'platelet': 297544, 'hematokrit': 40.1, 'wbc': 5273, 'hemoglobin': 15.5, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_1354', 'diagnosis': 'DBD_POSITIF', 'age': 40, 'gender': 'male', 'platelet': 134715, 'hematokrit': 38.54, 'wbc': 4330, 'hemoglobin': 11.9, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1355', 'diagnosis': 'BUKAN_DBD', 'age': 41, 'gender': 'male', 'platelet': 86123, 'hematokrit': 50.3, 'wbc': 5955, 'hemoglobin': 12.8, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_1356', 'diagnosis': 'DBD_POSITIF', 'age': 67, 'gender': 'female', 'platelet': 83061, 'hematokrit': 42.41, 'wbc': 4586, 'hemoglobin': 16.4, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1357', 'diagnosis': 'BUKAN_DBD', 'age': 25, 'gender': 'female', 'platelet': 186393, 'hematokrit': 39.81, 'wbc': 4200, 'hemoglobin': 12.4, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_1358', 'diagnosis': 'DBD_POSITIF', 'age': 58, 'gender': 'male', 'platelet': 182035, 'hematokrit': 44.56, 'wbc': 4453, 'hemoglobin': 13.6, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1359', 'diagnosis': 'DBD_POSITIF', 'age': 23, 'gender': 'male', 'platelet': 119095, 'hematokrit': 46.38, 'wbc': 4825, 'hemoglobin': 16.7, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1360', 'diagnosis': 'DBD_POSITIF', 'age': 22, 'gender': 'female', 'platelet': 270690, 'hematokrit': 38.43, 'wbc': 4110, 'hemoglobin': 12.4, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1361', 'diagnosis': 'DBD_POSITIF', 'age': 61, 'gender': 'female', 'platelet': 239523, 'hematokrit': 41.85, 'wbc': 6911, 'hemoglobin': 12.0, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1362', 'diagnosis': 'BUKAN_DBD', 'age': 46, 'gender': 'male', 'platelet': 161897, 'hematokrit': 38.46, 'wbc': 4907, 'hemoglobin': 14.4, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_1363', 'diagnosis': 'DBD_POSITIF', 'age': 45, 'gender': 'female', 'platelet': 161443, 'hematokrit': 43.88, 'wbc': 5772, 'hemoglobin': 13.3, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1364', 'diagnosis': 'DBD_POSITIF', 'age': 28, 'gender': 'female', 'platelet': 198005, 'hematokrit': 50.53, 'wbc': 5567, 'hemoglobin': 14.9, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1365', 'diagnosis': 'DBD_POSITIF', 'age': 18, 'gender': 'female', 'platelet': 114814, 'hematokrit': 51.76, 'wbc': 5232, 'hemoglobin': 16.3, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1366', 'diagnosis': 'DBD_POSITIF', 'age': 60, 'gender': 'male', 'platelet': 165141, 'hematokrit': 46.92, 'wbc': 6080, 'hemoglobin': 12.3, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1367', 'diagnosis': 'DBD_POSITIF', 'age': 36, 'gender': 'male', 'platelet': 287940, 'hematokrit': 40.26, 'wbc': 4554, 'hemoglobin': 15.0, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1368', 'diagnosis': 'DBD_POSITIF', 'age': 26, 'gender': 'male', 'platelet': 248904, 'hematokrit': 50.68, 'wbc': 5903, 'hemoglobin': 14.5, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1369', 'diagnosis': 'DBD_POSITIF', 'age': 44, 'gender': 'female', 'platelet': 220517, 'hematokrit': 45.23, 'wbc': 4106, 'hemoglobin': 12.4, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1370', 'diagnosis': 'DBD_POSITIF', 'age': 51, 'gender': 'female', 'platelet': 244562, 'hematokrit': 40.15, 'wbc': 6273, 'hemoglobin': 15.2, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1371', 'diagnosis': 'DBD_POSITIF', 'age': 61, 'gender': 'male', 'platelet': 109767, 'hematokrit': 50.9, 'wbc': 6534, 'hemoglobin': 13.1, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1372', 'diagnosis': 'DBD_POSITIF', 'age': 21, 'gender': 'male', 'platelet': 126057, 'hematokrit': 48.6, 'wbc': 6226, 'hemoglobin': 14.4, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1373', 'diagnosis': 'DBD_POSITIF', 'age': 53, 'gender': 'male', 'platelet': 291818, 'hematokrit': 48.24, 'wbc': 5393, 'hemoglobin': 12.0, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1374', 'diagnosis': 'DBD_POSITIF', 'age': 35, 'gender': 'female', 'platelet': 284172, 'hematokrit': 47.93, 'wbc': 6684, 'hemoglobin': 14.3, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1375', 'diagnosis': 'DBD_POSITIF', 'age': 32, 'gender': 'male', 'platelet': 252115, 'hematokrit': 40.8, 'wbc': 6835, 'hemoglobin': 13.3, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1376', 'diagnosis': 'DBD_POSITIF', 'age': 68, 'gender': 'male', 'platelet': 166755, 'hematokrit': 40.95, 'wbc': 4166, 'hemoglobin': 16.4, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1377', 'diagnosis': 'DBD_POSITIF', 'age': 30, 'gender': 'female', 'platelet': 107946, 'hematokrit': 47.64, 'wbc': 6710, 'hemoglobin': 11.8, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1378', 'diagnosis': 'BUKAN_DBD', 'age': 36, 'gender': 'female', 'platelet': 247659, 'hematokrit': 41.08, 'wbc': 6347, 'hemoglobin': 14.0, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_1379', 'diagnosis': 'BUKAN_DBD', 'age': 66, 'gender': 'female', 'platelet': 83364, 'hematokrit': 44.14, 'wbc': 5404, 'hemoglobin': 14.3, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_1380', 'diagnosis': 'DBD_POSITIF', 'age': 23, 'gender': 'male', 'platelet': 280926, 'hematokrit': 48.95, 'wbc': 6082, 'hemoglobin': 15.9, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1381', 'diagnosis': 'BUKAN_DBD', 'age': 65, 'gender': 'female', 'platelet': 267160, 'hematokrit': 48.98, 'wbc': 6454, 'hemoglobin': 14.9, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_1382', 'diagnosis': 'BUKAN_DBD', 'age': 29, 'gender': 'female', 'platelet': 157015, 'hematokrit': 44.35, 'wbc': 5525, 'hemoglobin': 15.5, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_1383', 'diagnosis': 'DBD_POSITIF', 'age': 68, 'gender': 'male', 'platelet': 218470, 'hematokrit': 49.09, 'wbc': 4313, 'hemoglobin': 16.2, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1384', 'diagnosis': 'DBD_POSITIF', 'age': 54, 'gender': 'female', 'platelet': 213524, 'hematokrit': 49.74, 'wbc': 4815, 'hemoglobin': 16.7, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1385', 'diagnosis': 'DBD_POSITIF', 'age': 34, 'gender': 'male', 'platelet': 167208, 'hematokrit': 47.17, 'wbc': 4742, 'hemoglobin': 13.4, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1386', 'diagnosis': 'DBD_POSITIF', 'age': 40, 'gender': 'male', 'platelet': 203208, 'hematokrit': 41.2, 'wbc': 6774, 'hemoglobin': 14.7, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1387', 'diagnosis': 'DBD_POSITIF', 'age': 43, 'gender': 'female', 'platelet': 244265, 'hematokrit': 41.84, 'wbc': 4825, 'hemoglobin': 16.5, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1388', 'diagnosis': 'DBD_POSITIF', 'age': 46, 'gender': 'female', 'platelet': 290473, 'hematokrit': 42.41, 'wbc': 5124, 'hemoglobin': 17.4, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1389', 'diagnosis': 'BUKAN_DBD', 'age': 50, 'gender': 'female', 'platelet': 105345, 'hematokrit': 39.64, 'wbc': 4568, 'hemoglobin': 16.8, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_1390', 'diagnosis': 'DBD_POSITIF', 'age': 44, 'gender': 'female', 'platelet': 165895, 'hematokrit': 41.82, 'wbc': 5238, 'hemoglobin': 13.7, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1391', 'diagnosis': 'DBD_POSITIF', 'age': 42, 'gender': 'female', 'platelet': 285407, 'hematokrit': 40.93, 'wbc': 5958, 'hemoglobin': 12.7, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1392', 'diagnosis': 'BUKAN_DBD', 'age': 27, 'gender': 'female', 'platelet': 270268, 'hematokrit': 44.37, 'wbc': 6623, 'hemoglobin': 14.4, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_1393', 'diagnosis': 'BUKAN_DBD', 'age': 64, 'gender': 'male', 'platelet': 234125, 'hematokrit': 50.72, 'wbc': 6109, 'hemoglobin': 15.9, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_1394', 'diagnosis': 'DBD_POSITIF', 'age': 40, 'gender': 'male', 'platelet': 209022, 'hematokrit': 39.46, 'wbc': 4368, 'hemoglobin': 14.5, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1395', 'diagnosis': 'DBD_POSITIF', 'age': 38, 'gender': 'female', 'platelet': 294292, 'hematokrit': 48.08, 'wbc': 5391, 'hemoglobin': 14.4, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1396', 'diagnosis': 'DBD_POSITIF', 'age': 38, 'gender': 'male', 'platelet': 216087, 'hematokrit': 47.62, 'wbc': 4093, 'hemoglobin': 16.5, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1397', 'diagnosis': 'DBD_POSITIF', 'age': 60, 'gender': 'female', 'platelet': 219729, 'hematokrit': 39.34, 'wbc': 5458, 'hemoglobin': 13.7, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1398', 'diagnosis': 'DBD_POSITIF', 'age': 30, 'gender': 'male', 'platelet': 131116, 'hematokrit': 50.92, 'wbc': 6097, 'hemoglobin': 16.7, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1399', 'diagnosis': 'DBD_POSITIF', 'age': 54, 'gender': 'male', 'platelet': 233023, 'hematokrit': 45.96, 'wbc': 6930, 'hemoglobin': 13.9, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1400', 'diagnosis': 'DBD_POSITIF', 'age': 50, 'gender': 'male', 'platelet': 177599, 'hematokrit': 43.09, 'wbc': 4763, 'hemoglobin': 13.5, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1401', 'diagnosis': 'DBD_POSITIF', 'age': 41, 'gender': 'female', 'platelet': 106521, 'hematokrit': 48.59, 'wbc': 6083, 'hemoglobin': 14.2, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1402', 'diagnosis': 'BUKAN_DBD', 'age': 61, 'gender': 'male', 'platelet': 134431, 'hematokrit': 41.6, 'wbc': 5433, 'hemoglobin': 16.1, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_1403', 'diagnosis': 'DBD_POSITIF', 'age': 28, 'gender': 'female', 'platelet': 90731, 'hematokrit': 47.71, 'wbc': 6147, 'hemoglobin': 12.3, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1404', 'diagnosis': 'BUKAN_DBD', 'age': 34, 'gender': 'male', 'platelet': 229816, 'hematokrit': 38.56, 'wbc': 4328, 'hemoglobin': 12.7, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_1405', 'diagnosis': 'DBD_POSITIF', 'age': 21, 'gender': 'male', 'platelet': 143094, 'hematokrit': 49.75, 'wbc': 4705, 'hemoglobin': 17.2, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1406', 'diagnosis': 'DBD_POSITIF', 'age': 64, 'gender': 'male', 'platelet': 98423, 'hematokrit': 44.27, 'wbc': 4220, 'hemoglobin': 12.6, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1407', 'diagnosis': 'BUKAN_DBD', 'age': 42, 'gender': 'male', 'platelet': 194612, 'hematokrit': 46.91, 'wbc': 5814, 'hemoglobin': 14.9, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_1408', 'diagnosis': 'DBD_POSITIF', 'age': 47, 'gender': 'male', 'platelet': 228640, 'hematokrit': 41.1, 'wbc': 5861, 'hemoglobin': 15.0, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1409', 'diagnosis': 'DBD_POSITIF', 'age': 26, 'gender': 'female', 'platelet': 258483, 'hematokrit': 47.48, 'wbc': 6614, 'hemoglobin': 14.4, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1410', 'diagnosis': 'DBD_POSITIF', 'age': 38, 'gender': 'female', 'platelet': 83934, 'hematokrit': 48.81, 'wbc': 4995, 'hemoglobin': 15.4, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1411', 'diagnosis': 'BUKAN_DBD', 'age': 37, 'gender': 'male', 'platelet': 156945, 'hematokrit': 44.62, 'wbc': 5021, 'hemoglobin': 12.9, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_1412', 'diagnosis': 'DBD_POSITIF', 'age': 36, 'gender': 'male', 'platelet': 210443, 'hematokrit': 46.65, 'wbc': 4109, 'hemoglobin': 14.8, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1413', 'diagnosis': 'DBD_POSITIF', 'age': 36, 'gender': 'male', 'platelet': 176946, 'hematokrit': 44.39, 'wbc': 4148, 'hemoglobin': 13.7, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1414', 'diagnosis': 'DBD_POSITIF', 'age': 29, 'gender': 'male', 'platelet': 176344, 'hematokrit': 50.52, 'wbc': 6453, 'hemoglobin': 15.5, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1415', 'diagnosis': 'DBD_POSITIF', 'age': 54, 'gender': 'female', 'platelet': 219244, 'hematokrit': 44.97, 'wbc': 4698, 'hemoglobin': 12.3, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1416', 'diagnosis': 'DBD_POSITIF', 'age': 59, 'gender': 'male', 'platelet': 107358, 'hematokrit': 49.79, 'wbc': 5433, 'hemoglobin': 14.9, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1417', 'diagnosis': 'BUKAN_DBD', 'age': 34, 'gender': 'female', 'platelet': 277385, 'hematokrit': 49.22, 'wbc': 4107, 'hemoglobin': 12.6, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_1418', 'diagnosis': 'DBD_POSITIF', 'age': 54, 'gender': 'male', 'platelet': 209774, 'hematokrit': 43.75, 'wbc': 4388, 'hemoglobin': 13.2, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1419', 'diagnosis': 'DBD_POSITIF', 'age': 65, 'gender': 'female', 'platelet': 99763, 'hematokrit': 41.22, 'wbc': 4424, 'hemoglobin': 12.8, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1420', 'diagnosis': 'DBD_POSITIF', 'age': 56, 'gender': 'male', 'platelet': 259745, 'hematokrit': 43.69, 'wbc': 6494, 'hemoglobin': 12.6, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1421', 'diagnosis': 'DBD_POSITIF', 'age': 45, 'gender': 'male', 'platelet': 165997, 'hematokrit': 49.57, 'wbc': 6965, 'hemoglobin': 16.5, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1422', 'diagnosis': 'DBD_POSITIF', 'age': 58, 'gender': 'female', 'platelet': 147975, 'hematokrit': 41.19, 'wbc': 5091, 'hemoglobin': 13.2, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1423', 'diagnosis': 'DBD_POSITIF', 'age': 52, 'gender': 'male', 'platelet': 218876, 'hematokrit': 45.34, 'wbc': 6703, 'hemoglobin': 17.1, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1424', 'diagnosis': 'DBD_POSITIF', 'age': 64, 'gender': 'male', 'platelet': 258666, 'hematokrit': 49.29, 'wbc': 5999, 'hemoglobin': 17.3, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1425', 'diagnosis': 'BUKAN_DBD', 'age': 65, 'gender': 'male', 'platelet': 289820, 'hematokrit': 42.95, 'wbc': 5663, 'hemoglobin': 14.9, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_1426', 'diagnosis': 'DBD_POSITIF', 'age': 35, 'gender': 'female', 'platelet': 167189, 'hematokrit': 46.99, 'wbc': 5527, 'hemoglobin': 12.4, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1427', 'diagnosis': 'DBD_POSITIF', 'age': 31, 'gender': 'male', 'platelet': 167507, 'hematokrit': 41.44, 'wbc': 6026, 'hemoglobin': 13.7, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1428', 'diagnosis': 'DBD_POSITIF', 'age': 52, 'gender': 'male', 'platelet': 147525, 'hematokrit': 39.53, 'wbc': 6368, 'hemoglobin': 16.3, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1429', 'diagnosis': 'DBD_POSITIF', 'age': 61, 'gender': 'female', 'platelet': 284476, 'hematokrit': 49.12, 'wbc': 6766, 'hemoglobin': 13.7, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1430', 'diagnosis': 'DBD_POSITIF', 'age': 58, 'gender': 'female', 'platelet': 179248, 'hematokrit': 39.39, 'wbc': 5855, 'hemoglobin': 12.0, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1431', 'diagnosis': 'DBD_POSITIF', 'age': 24, 'gender': 'female', 'platelet': 104604, 'hematokrit': 41.8, 'wbc': 6775, 'hemoglobin': 14.8, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1432', 'diagnosis': 'DBD_POSITIF', 'age': 58, 'gender': 'male', 'platelet': 196585, 'hematokrit': 49.97, 'wbc': 6627, 'hemoglobin': 16.6, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1433', 'diagnosis': 'DBD_POSITIF', 'age': 30, 'gender': 'male', 'platelet': 233207, 'hematokrit': 42.85, 'wbc': 4446, 'hemoglobin': 16.3, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1434', 'diagnosis': 'BUKAN_DBD', 'age': 35, 'gender': 'male', 'platelet': 248990, 'hematokrit': 51.62, 'wbc': 5597, 'hemoglobin': 12.6, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_1435', 'diagnosis': 'DBD_POSITIF', 'age': 54, 'gender': 'female', 'platelet': 209716, 'hematokrit': 51.72, 'wbc': 4209, 'hemoglobin': 15.5, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1436', 'diagnosis': 'DBD_POSITIF', 'age': 30, 'gender': 'male', 'platelet': 261921, 'hematokrit': 41.76, 'wbc': 4848, 'hemoglobin': 12.8, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1437', 'diagnosis': 'BUKAN_DBD', 'age': 53, 'gender': 'male', 'platelet': 241919, 'hematokrit': 38.57, 'wbc': 5862, 'hemoglobin': 12.8, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_1438', 'diagnosis': 'BUKAN_DBD', 'age': 48, 'gender': 'female', 'platelet': 254846, 'hematokrit': 47.87, 'wbc': 6417, 'hemoglobin': 16.7, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_1439', 'diagnosis': 'BUKAN_DBD', 'age': 19, 'gender': 'female', 'platelet': 271781, 'hematokrit': 44.31, 'wbc': 5964, 'hemoglobin': 13.0, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_1440', 'diagnosis': 'DBD_POSITIF', 'age': 33, 'gender': 'female', 'platelet': 90680, 'hematokrit': 39.41, 'wbc': 5587, 'hemoglobin': 13.1, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1441', 'diagnosis': 'DBD_POSITIF', 'age': 26, 'gender': 'female', 'platelet': 193508, 'hematokrit': 47.91, 'wbc': 5651, 'hemoglobin': 11.5, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1442', 'diagnosis': 'DBD_POSITIF', 'age': 26, 'gender': 'female', 'platelet': 175619, 'hematokrit': 38.44, 'wbc': 5916, 'hemoglobin': 16.7, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1443', 'diagnosis': 'DBD_POSITIF', 'age': 55, 'gender': 'male', 'platelet': 135037, 'hematokrit': 50.18, 'wbc': 5918, 'hemoglobin': 16.3, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1444', 'diagnosis': 'DBD_POSITIF', 'age': 28, 'gender': 'female', 'platelet': 179969, 'hematokrit': 39.94, 'wbc': 4576, 'hemoglobin': 15.3, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1445', 'diagnosis': 'DBD_POSITIF', 'age': 39, 'gender': 'male', 'platelet': 191115, 'hematokrit': 39.78, 'wbc': 5665, 'hemoglobin': 16.0, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1446', 'diagnosis': 'DBD_POSITIF', 'age': 50, 'gender': 'male', 'platelet': 138914, 'hematokrit': 40.46, 'wbc': 4688, 'hemoglobin': 12.4, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1447', 'diagnosis': 'DBD_POSITIF', 'age': 53, 'gender': 'female', 'platelet': 237381, 'hematokrit': 51.44, 'wbc': 4789, 'hemoglobin': 14.2, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1448', 'diagnosis': 'DBD_POSITIF', 'age': 62, 'gender': 'female', 'platelet': 187255, 'hematokrit': 47.7, 'wbc': 4991, 'hemoglobin': 13.6, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1449', 'diagnosis': 'DBD_POSITIF', 'age': 40, 'gender': 'female', 'platelet': 90349, 'hematokrit': 49.22, 'wbc': 6210, 'hemoglobin': 12.1, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1450', 'diagnosis': 'DBD_POSITIF', 'age': 62, 'gender': 'male', 'platelet': 286151, 'hematokrit': 43.57, 'wbc': 4976, 'hemoglobin': 14.4, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1451', 'diagnosis': 'BUKAN_DBD', 'age': 62, 'gender': 'female', 'platelet': 271892, 'hematokrit': 42.71, 'wbc': 5355, 'hemoglobin': 17.0, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_1452', 'diagnosis': 'DBD_POSITIF', 'age': 51, 'gender': 'female', 'platelet': 286068, 'hematokrit': 41.28, 'wbc': 5687, 'hemoglobin': 11.7, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1453', 'diagnosis': 'BUKAN_DBD', 'age': 26, 'gender': 'female', 'platelet': 245625, 'hematokrit': 44.73, 'wbc': 4349, 'hemoglobin': 13.2, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_1454', 'diagnosis': 'DBD_POSITIF', 'age': 41, 'gender': 'female', 'platelet': 108525, 'hematokrit': 45.73, 'wbc': 5771, 'hemoglobin': 12.7, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1455', 'diagnosis': 'DBD_POSITIF', 'age': 25, 'gender': 'female', 'platelet': 85948, 'hematokrit': 46.84, 'wbc': 6717, 'hemoglobin': 12.9, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1456', 'diagnosis': 'BUKAN_DBD', 'age': 24, 'gender': 'male', 'platelet': 94498, 'hematokrit': 41.6, 'wbc': 4425, 'hemoglobin': 17.0, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_1457', 'diagnosis': 'DBD_POSITIF', 'age': 53, 'gender': 'male', 'platelet': 230063, 'hematokrit': 51.28, 'wbc': 4326, 'hemoglobin': 14.3, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1458', 'diagnosis': 'DBD_POSITIF', 'age': 35, 'gender': 'male', 'platelet': 139790, 'hematokrit': 40.38, 'wbc': 5129, 'hemoglobin': 14.3, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1459', 'diagnosis': 'DBD_POSITIF', 'age': 20, 'gender': 'female', 'platelet': 218732, 'hematokrit': 51.52, 'wbc': 4254, 'hemoglobin': 16.1, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1460', 'diagnosis': 'DBD_POSITIF', 'age': 45, 'gender': 'female', 'platelet': 106245, 'hematokrit': 38.21, 'wbc': 6037, 'hemoglobin': 12.4, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1461', 'diagnosis': 'DBD_POSITIF', 'age': 23, 'gender': 'female', 'platelet': 211310, 'hematokrit': 44.74, 'wbc': 6405, 'hemoglobin': 14.4, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1462', 'diagnosis': 'BUKAN_DBD', 'age': 61, 'gender': 'male', 'platelet': 230992, 'hematokrit': 42.67, 'wbc': 5990, 'hemoglobin': 14.1, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_1463', 'diagnosis': 'DBD_POSITIF', 'age': 61, 'gender': 'female', 'platelet': 126659, 'hematokrit': 44.29, 'wbc': 4443, 'hemoglobin': 15.1, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1464', 'diagnosis': 'DBD_POSITIF', 'age': 38, 'gender': 'female', 'platelet': 205983, 'hematokrit': 45.99, 'wbc': 4112, 'hemoglobin': 17.5, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1465', 'diagnosis': 'BUKAN_DBD', 'age': 45, 'gender': 'female', 'platelet': 154874, 'hematokrit': 44.1, 'wbc': 5053, 'hemoglobin': 16.1, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_1466', 'diagnosis': 'BUKAN_DBD', 'age': 57, 'gender': 'male', 'platelet': 122517, 'hematokrit': 43.81, 'wbc': 6571, 'hemoglobin': 13.9, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_1467', 'diagnosis': 'DBD_POSITIF', 'age': 18, 'gender': 'female', 'platelet': 206618, 'hematokrit': 48.26, 'wbc': 4688, 'hemoglobin': 16.5, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1468', 'diagnosis': 'DBD_POSITIF', 'age': 53, 'gender': 'male', 'platelet': 155885, 'hematokrit': 47.6, 'wbc': 4990, 'hemoglobin': 12.5, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1469', 'diagnosis': 'DBD_POSITIF', 'age': 38, 'gender': 'female', 'platelet': 126350, 'hematokrit': 49.67, 'wbc': 5873, 'hemoglobin': 11.7, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1470', 'diagnosis': 'DBD_POSITIF', 'age': 60, 'gender': 'male', 'platelet': 157179, 'hematokrit': 41.5, 'wbc': 4045, 'hemoglobin': 12.7, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1471', 'diagnosis': 'DBD_POSITIF', 'age': 52, 'gender': 'male', 'platelet': 239346, 'hematokrit': 46.53, 'wbc': 5194, 'hemoglobin': 13.5, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1472', 'diagnosis': 'BUKAN_DBD', 'age': 30, 'gender': 'male', 'platelet': 125013, 'hematokrit': 46.19, 'wbc': 4756, 'hemoglobin': 14.6, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_1473', 'diagnosis': 'DBD_POSITIF', 'age': 66, 'gender': 'female', 'platelet': 119913, 'hematokrit': 43.18, 'wbc': 5376, 'hemoglobin': 15.2, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1474', 'diagnosis': 'DBD_POSITIF', 'age': 27, 'gender': 'female', 'platelet': 125819, 'hematokrit': 44.8, 'wbc': 5226, 'hemoglobin': 17.0, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1475', 'diagnosis': 'DBD_POSITIF', 'age': 61, 'gender': 'male', 'platelet': 162168, 'hematokrit': 42.39, 'wbc': 5249, 'hemoglobin': 14.6, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1476', 'diagnosis': 'DBD_POSITIF', 'age': 64, 'gender': 'male', 'platelet': 172680, 'hematokrit': 39.99, 'wbc': 4563, 'hemoglobin': 14.5, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1477', 'diagnosis': 'DBD_POSITIF', 'age': 27, 'gender': 'female', 'platelet': 288929, 'hematokrit': 40.99, 'wbc': 6208, 'hemoglobin': 11.8, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1478', 'diagnosis': 'DBD_POSITIF', 'age': 63, 'gender': 'female', 'platelet': 174792, 'hematokrit': 39.48, 'wbc': 6887, 'hemoglobin': 11.7, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1479', 'diagnosis': 'DBD_POSITIF', 'age': 30, 'gender': 'male', 'platelet': 275982, 'hematokrit': 47.56, 'wbc': 6585, 'hemoglobin': 14.8, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1480', 'diagnosis': 'DBD_POSITIF', 'age': 54, 'gender': 'female', 'platelet': 234557, 'hematokrit': 47.25, 'wbc': 6272, 'hemoglobin': 14.1, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1481', 'diagnosis': 'DBD_POSITIF', 'age': 55, 'gender': 'female', 'platelet': 213932, 'hematokrit': 51.31, 'wbc': 5340, 'hemoglobin': 16.5, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1482', 'diagnosis': 'DBD_POSITIF', 'age': 41, 'gender': 'female', 'platelet': 129875, 'hematokrit': 48.22, 'wbc': 5437, 'hemoglobin': 12.5, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1483', 'diagnosis': 'DBD_POSITIF', 'age': 19, 'gender': 'female', 'platelet': 225991, 'hematokrit': 38.73, 'wbc': 4094, 'hemoglobin': 11.6, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1484', 'diagnosis': 'DBD_POSITIF', 'age': 39, 'gender': 'male', 'platelet': 153947, 'hematokrit': 50.38, 'wbc': 5802, 'hemoglobin': 14.2, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1485', 'diagnosis': 'DBD_POSITIF', 'age': 34, 'gender': 'female', 'platelet': 89586, 'hematokrit': 50.08, 'wbc': 4948, 'hemoglobin': 12.9, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1486', 'diagnosis': 'DBD_POSITIF', 'age': 53, 'gender': 'female', 'platelet': 131986, 'hematokrit': 44.21, 'wbc': 4552, 'hemoglobin': 11.8, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1487', 'diagnosis': 'BUKAN_DBD', 'age': 31, 'gender': 'male', 'platelet': 169848, 'hematokrit': 46.2, 'wbc': 6692, 'hemoglobin': 15.8, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_1488', 'diagnosis': 'DBD_POSITIF', 'age': 27, 'gender': 'male', 'platelet': 103055, 'hematokrit': 51.67, 'wbc': 4065, 'hemoglobin': 12.2, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1489', 'diagnosis': 'DBD_POSITIF', 'age': 52, 'gender': 'female', 'platelet': 245962, 'hematokrit': 45.45, 'wbc': 5497, 'hemoglobin': 15.1, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1490', 'diagnosis': 'DBD_POSITIF', 'age': 42, 'gender': 'female', 'platelet': 274153, 'hematokrit': 50.67, 'wbc': 4664, 'hemoglobin': 13.2, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1491', 'diagnosis': 'DBD_POSITIF', 'age': 20, 'gender': 'female', 'platelet': 108807, 'hematokrit': 39.16, 'wbc': 6731, 'hemoglobin': 12.5, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1492', 'diagnosis': 'DBD_POSITIF', 'age': 64, 'gender': 'female', 'platelet': 296992, 'hematokrit': 40.67, 'wbc': 6957, 'hemoglobin': 13.8, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1493', 'diagnosis': 'BUKAN_DBD', 'age': 55, 'gender': 'male', 'platelet': 127177, 'hematokrit': 44.17, 'wbc': 6884, 'hemoglobin': 16.3, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_1494', 'diagnosis': 'DBD_POSITIF', 'age': 34, 'gender': 'male', 'platelet': 148625, 'hematokrit': 46.19, 'wbc': 6618, 'hemoglobin': 13.9, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1495', 'diagnosis': 'BUKAN_DBD', 'age': 29, 'gender': 'male', 'platelet': 225314, 'hematokrit': 49.43, 'wbc': 6743, 'hemoglobin': 16.0, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_1496', 'diagnosis': 'DBD_POSITIF', 'age': 69, 'gender': 'female', 'platelet': 136317, 'hematokrit': 51.84, 'wbc': 4179, 'hemoglobin': 12.3, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1497', 'diagnosis': 'DBD_POSITIF', 'age': 41, 'gender': 'female', 'platelet': 251050, 'hematokrit': 43.44, 'wbc': 6881, 'hemoglobin': 16.1, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1498', 'diagnosis': 'DBD_POSITIF', 'age': 46, 'gender': 'female', 'platelet': 96433, 'hematokrit': 38.66, 'wbc': 5482, 'hemoglobin': 12.9, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1499', 'diagnosis': 'DBD_POSITIF', 'age': 60, 'gender': 'female', 'platelet': 113282, 'hematokrit': 49.22, 'wbc': 4201, 'hemoglobin': 15.6, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1500', 'diagnosis': 'DBD_POSITIF', 'age': 42, 'gender': 'male', 'platelet': 156519, 'hematokrit': 46.46, 'wbc': 5498, 'hemoglobin': 14.9, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1501', 'diagnosis': 'DBD_POSITIF', 'age': 53, 'gender': 'male', 'platelet': 123578, 'hematokrit': 40.78, 'wbc': 5541, 'hemoglobin': 17.1, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1502', 'diagnosis': 'DBD_POSITIF', 'age': 43, 'gender': 'female', 'platelet': 210843, 'hematokrit': 44.93, 'wbc': 6590, 'hemoglobin': 13.8, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1503', 'diagnosis': 'DBD_POSITIF', 'age': 55, 'gender': 'male', 'platelet': 188333, 'hematokrit': 48.39, 'wbc': 6821, 'hemoglobin': 11.9, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1504', 'diagnosis': 'DBD_POSITIF', 'age': 18, 'gender': 'female', 'platelet': 281279, 'hematokrit': 48.79, 'wbc': 5312, 'hemoglobin': 11.6, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1505', 'diagnosis': 'DBD_POSITIF', 'age': 37, 'gender': 'female', 'platelet': 235205, 'hematokrit': 44.99, 'wbc': 5948, 'hemoglobin': 16.5, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1506', 'diagnosis': 'BUKAN_DBD', 'age': 45, 'gender': 'male', 'platelet': 130317, 'hematokrit': 42.27, 'wbc': 4693, 'hemoglobin': 14.6, 'demam_tinggi': 1, 'sakit_kepala': 0, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_1507', 'diagnosis': 'DBD_POSITIF', 'age': 33, 'gender': 'female', 'platelet': 207878, 'hematokrit': 51.63, 'wbc': 5719, 'hemoglobin': 16.2, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1508', 'diagnosis': 'DBD_POSITIF', 'age': 64, 'gender': 'female', 'platelet': 188745, 'hematokrit': 47.29, 'wbc': 5267, 'hemoglobin': 12.9, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1509', 'diagnosis': 'DBD_POSITIF', 'age': 34, 'gender': 'male', 'platelet': 209230, 'hematokrit': 43.72, 'wbc': 5791, 'hemoglobin': 13.6, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1510', 'diagnosis': 'BUKAN_DBD', 'age': 57, 'gender': 'female', 'platelet': 145950, 'hematokrit': 41.93, 'wbc': 6659, 'hemoglobin': 11.7, 'demam_tinggi': 0, 'sakit_kepala': 1, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_1511', 'diagnosis': 'DBD_POSITIF', 'age': 45, 'gender': 'female', 'platelet': 139612, 'hematokrit': 48.24, 'wbc': 5721, 'hemoglobin': 17.3, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1512', 'diagnosis': 'DBD_POSITIF', 'age': 29, 'gender': 'male', 'platelet': 144873, 'hematokrit': 41.39, 'wbc': 5621, 'hemoglobin': 15.5, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1513', 'diagnosis': 'DBD_POSITIF', 'age': 44, 'gender': 'female', 'platelet': 195792, 'hematokrit': 40.4, 'wbc': 5197, 'hemoglobin': 17.1, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1514', 'diagnosis': 'DBD_POSITIF', 'age': 59, 'gender': 'male', 'platelet': 297850, 'hematokrit': 45.42, 'wbc': 5557, 'hemoglobin': 13.1, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1515', 'diagnosis': 'BUKAN_DBD', 'age': 64, 'gender': 'female', 'platelet': 273074, 'hematokrit': 42.06, 'wbc': 5532, 'hemoglobin': 15.2, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_1516', 'diagnosis': 'DBD_POSITIF', 'age': 47, 'gender': 'male', 'platelet': 263580, 'hematokrit': 46.8, 'wbc': 6291, 'hemoglobin': 15.6, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1517', 'diagnosis': 'BUKAN_DBD', 'age': 58, 'gender': 'male', 'platelet': 249451, 'hematokrit': 39.65, 'wbc': 6107, 'hemoglobin': 13.4, 'demam_tinggi': 0, 'sakit_kepala': 0, 'nyeri_sendi': 0, 'nyeri_otot': 0, 'lemah_lesu': 0, 'kehilangan_nafsu_makan': 0, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 0, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'NON_DBD'},
-        {'case_id': 'CSV_1518', 'diagnosis': 'DBD_POSITIF', 'age': 51, 'gender': 'male', 'platelet': 204814, 'hematokrit': 47.17, 'wbc': 4103, 'hemoglobin': 16.6, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1519', 'diagnosis': 'DBD_POSITIF', 'age': 54, 'gender': 'female', 'platelet': 95231, 'hematokrit': 41.97, 'wbc': 6698, 'hemoglobin': 17.2, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 1, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 1, 'trombosit_rendah': 1, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1520', 'diagnosis': 'DBD_POSITIF', 'age': 23, 'gender': 'male', 'platelet': 167385, 'hematokrit': 38.0, 'wbc': 5694, 'hemoglobin': 16.8, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1521', 'diagnosis': 'DBD_POSITIF', 'age': 24, 'gender': 'male', 'platelet': 121163, 'hematokrit': 39.78, 'wbc': 5010, 'hemoglobin': 15.9, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1522', 'diagnosis': 'DBD_POSITIF', 'age': 49, 'gender': 'male', 'platelet': 201880, 'hematokrit': 51.07, 'wbc': 5767, 'hemoglobin': 13.2, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-        {'case_id': 'CSV_1523', 'diagnosis': 'DBD_POSITIF', 'age': 49, 'gender': 'male', 'platelet': 242748, 'hematokrit': 50.14, 'wbc': 6124, 'hemoglobin': 13.2, 'demam_tinggi': 1, 'sakit_kepala': 1, 'nyeri_sendi': 1, 'nyeri_otot': 1, 'lemah_lesu': 1, 'kehilangan_nafsu_makan': 1, 'bintik_merah': 0, 'mimisan': 0, 'gusi_berdarah': 0, 'nyeri_belakang_mata': 1, 'pembesaran_hati': 0, 'mual_muntah': 0, 'nyeri_perut': 0, 'ruam_kulit': 0, 'trombosit_rendah': 0, 'severity': 'RINGAN'},
-    ]
-    return cases
+    columns = get_case_columns()
+    names = columns.pop('symptom_names').tolist()
+    columns.update(zip(names, columns.pop('symptoms').T))
+    values = [columns[key].tolist() for key in _KEYS]
+    return [dict(zip(_KEYS, row)) for row in zip(*values)]
@@ -0,0 +1,581 @@
+"""
+CASE BASE STORE
+Format penyimpanan case base: JSON (interchange) dan columnar .npz
+(kolom bertipe, dimuat langsung ke array tanpa objek per baris).
+"""
+
+import gzip
+import hashlib
+import io
+import json
+import lzma
+import os
+
+import numpy as np
+import pandas as pd
+
+from cbr_engine import SYMPTOMS, file_checksum
+
+CASE_BASE_JSON = 'case_base.json'
+CASE_BASE_NPZ = 'case_base.npz'
+SHARED_DIR = '.cache'
+
+# Naikkan jika aturan generate gejala berubah, supaya file shared lama tidak dipakai
+GENERATOR_VERSION = 3
+# Seed default generate gejala: semua replica menghasilkan case base yang sama
+GENERATION_SEED = 2024
+
+# Kolom lab dan tipe penyimpanannya
+LAB_COLUMNS = {
+    'age': np.int32,
+    'platelet': np.int32,
+    'hematokrit': np.float64,
+    'wbc': np.int32,
+    'hemoglobin': np.float64,
+}
+LABEL_COLUMNS = ['diagnosis', 'severity', 'gender']
+
+# Kolom non-gejala DataFrame, urutan sama dengan key di case_base.json
+FRAME_COLUMNS = ['case_id', 'diagnosis', 'age', 'gender', 'platelet', 'hematokrit', 'wbc', 'hemoglobin']
+
+# Skema compact DataFrame case base di memori
+COMPACT_DTYPES = {
+    'diagnosis': 'category',
+    'severity': 'category',
+    'gender': 'category',
+    'age': np.uint8,
+    'platelet': np.uint32,
+    'wbc': np.uint32,
+    'hematokrit': np.float32,
+    'hemoglobin': np.float32,
+    **{sym: np.int8 for sym in SYMPTOMS},
+}
+
+# ============================================================================
+# KONVERSI
+# ============================================================================
+def cases_to_columns(cases):
+    """Ubah list of dict (format case_base.json) menjadi dict kolom bertipe"""
+    columns = {'case_id': np.array([c['case_id'] for c in cases], dtype=str)}
+    for col in LABEL_COLUMNS:
+        columns[col] = np.array([c[col] for c in cases], dtype=str)
+    for col, dtype in LAB_COLUMNS.items():
+        columns[col] = np.array([c[col] for c in cases], dtype=dtype)
+    columns['symptoms'] = np.array(
+        [[c[sym] for sym in SYMPTOMS] for c in cases], dtype=np.int8
+    ).reshape(len(cases), len(SYMPTOMS))
+    return columns
+
+def columns_to_frame(columns):
+    """DataFrame case base (skema compact) dari dict kolom, tanpa objek per baris"""
+    data = {col: columns[col] for col in FRAME_COLUMNS}
+    for j, sym in enumerate(SYMPTOMS):
+        data[sym] = columns['symptoms'][:, j]
+    data['severity'] = columns['severity']
+    return compact_case_base(pd.DataFrame(data))
+
+def compact_case_base(frame):
+    """
+    Terapkan COMPACT_DTYPES: gejala int8, label categorical, nilai lab
+    uint32/float32, index integer posisi kasus (RangeIndex).
+    """
+    dtypes = {col: dtype for col, dtype in COMPACT_DTYPES.items() if col in frame}
+    return frame.astype(dtypes).reset_index(drop=True)
+
+def memory_report(frame):
+    """Memori (deep, byte) per kolom: skema lama (int64/float64/object) vs skema compact"""
+    loose = frame.astype({
+        col: object if dtype == 'category' else (np.float64 if np.dtype(dtype).kind == 'f' else np.int64)
+        for col, dtype in COMPACT_DTYPES.items() if col in frame
+    })
+    report = pd.DataFrame({
+        'lama': loose.memory_usage(deep=True),
+        'compact': compact_case_base(frame).memory_usage(deep=True),
+    })
+    report.loc['TOTAL'] = report.sum()
+    return report
+
+# ============================================================================
+# STREAMING JSON
+# ============================================================================
+STREAM_CHUNK_SIZE = 10000
+_READ_SIZE = 1 << 16
+# Batas ukuran satu record; record belum lengkap sepanjang ini dianggap JSON rusak
+MAX_RECORD_SIZE = 1 << 20
+
+def open_case_file(path, mode='rb'):
+    """open() biner untuk file case base; .gz / .xz otomatis di-(de)kompres"""
+    if path.endswith('.gz'):
+        # mtime=0: isi .gz sama untuk data yang sama (checksum cache tetap stabil)
+        return gzip.GzipFile(path, mode, mtime=0)
+    if path.endswith('.xz'):
+        return lzma.open(path, mode)
+    return open(path, mode)
+
+def iter_json_records(path, max_record_size=MAX_RECORD_SIZE):
+    """
+    Yield record satu per satu dari JSON array atau JSON Lines tanpa memuat
+    seluruh file; yang ditahan hanya buffer baca dan record yang sedang di-parse
+    (maks. max_record_size karakter, lebih dari itu JSONDecodeError).
+    JSON array dicek seketat json.load: tepat satu ',' antar record, file
+    harus berakhir dengan ']' dan setelahnya hanya spasi; jadi file yang
+    terpotong (mis. append terputus) gagal, bukan terbaca sebagian.
+    File .gz / .xz dibaca langsung (lihat open_case_file).
+    """
+    decoder = json.JSONDecoder()
+    with io.TextIOWrapper(open_case_file(path), encoding='utf-8') as f:
+        buffer, pos = '', 0
+
+        def next_char():
+            """Karakter non-spasi berikutnya (buffer[pos]), None di akhir file"""
+            nonlocal buffer, pos
+            while True:
+                while pos < len(buffer) and buffer[pos] in ' \t\r\n':
+                    pos += 1
+                if pos < len(buffer):
+                    return buffer[pos]
+                buffer, pos = f.read(_READ_SIZE), 0
+                if not buffer:
+                    return None
+
+        # Karakter pertama menentukan format: '[' = JSON array, selain itu JSON Lines
+        char = next_char()
+        if char is None:
+            return
+        in_array = char == '['
+        if in_array:
+            pos += 1
+            char = next_char()
+            if char == ']':
+                pos += 1
+                if next_char() is not None:
+                    raise json.JSONDecodeError("Extra data", buffer, pos)
+                return
+
+        while char is not None:
+            if in_array and char in ',]':
+                raise json.JSONDecodeError("Expecting value", buffer, pos)
+
+            # Record terpotong di akhir buffer: sambung dengan blok berikutnya.
+            # Blok dibaca minimal sepanjang sisa buffer (copy total tetap linear)
+            # dan berhenti di max_record_size, jadi JSON rusak tidak memuat sisa file.
+            while True:
+                try:
+                    record, pos = decoder.raw_decode(buffer, pos)
+                    break
+                except json.JSONDecodeError:
+                    pending = len(buffer) - pos
+                    if pending >= max_record_size:
+                        raise
+                    block = f.read(min(max(_READ_SIZE, pending), max_record_size - pending))
+                    if not block:
+                        raise
+                    buffer, pos = buffer[pos:] + block, 0
+            yield record
+
+            char = next_char()
+            if not in_array:
+                continue
+            if char == ',':
+                pos += 1
+                char = next_char()
+                if char is None:
+                    raise json.JSONDecodeError("Expecting value", buffer, pos)
+            elif char == ']':
+                pos += 1
+                char = next_char()
+                if char is not None:
+                    raise json.JSONDecodeError("Extra data", buffer, pos)
+                return
+            elif char is None:
+                raise json.JSONDecodeError("Unterminated array (file berakhir sebelum ']')", buffer, pos)
+            else:
+                raise json.JSONDecodeError("Expecting ',' delimiter", buffer, pos)
+
+        if in_array:
+            raise json.JSONDecodeError("Unterminated array (file berakhir sebelum ']')", buffer, pos)
+
+def _append_rows(buffer, rows, values):
+    """
+    Tulis values ke buffer[rows:]. Buffer penuh diperbesar 2x di tempat
+    (ndarray.resize / realloc, tanpa array kedua); dtype string dilebarkan
+    jika values lebih panjang.
+    """
+    dtype = np.promote_types(buffer.dtype, values.dtype)
+    if dtype != buffer.dtype:
+        buffer = buffer.astype(dtype)
+    if rows + len(values) > len(buffer):
+        buffer.resize((max(2 * len(buffer), rows + len(values)),) + buffer.shape[1:], refcheck=False)
+    buffer[rows:rows + len(values)] = values
+    return buffer
+
+def stream_case_columns(path, chunk_size=STREAM_CHUNK_SIZE):
+    """
+    Muat case base JSON/JSON Lines per chunk: tiap chunk_size record langsung
+    diubah ke kolom bertipe lalu ditulis ke satu buffer per kolom (lihat
+    _append_rows), jadi peak memori = kolom hasil + satu chunk, bukan ukuran
+    file dan tanpa concatenate di akhir.
+    """
+    columns, rows, records = None, 0, []
+
+    def flush():
+        nonlocal columns, rows
+        chunk = cases_to_columns(records)
+        if columns is None:
+            columns = {col: np.empty((chunk_size,) + arr.shape[1:], dtype=arr.dtype) for col, arr in chunk.items()}
+        for col, arr in chunk.items():
+            columns[col] = _append_rows(columns[col], rows, arr)
+        rows += len(records)
+        records.clear()
+
+    for record in iter_json_records(path):
+        records.append(record)
+        if len(records) == chunk_size:
+            flush()
+    if records or columns is None:
+        flush()
+
+    for arr in columns.values():
+        arr.resize((rows,) + arr.shape[1:], refcheck=False)
+    return columns
+
+# ============================================================================
+# COLUMNAR .NPZ
+# ============================================================================
+def columnar_arrays(columns):
+    """Array yang disimpan di .npz; kolom label menjadi kode int8 + daftar label"""
+    arrays = {
+        'case_id': columns['case_id'],
+        'symptoms': columns['symptoms'],
+        'symptom_names': np.array(SYMPTOMS),
+    }
+    for col in LABEL_COLUMNS:
+        labels, codes = np.unique(columns[col], return_inverse=True)
+        arrays[f'{col}_labels'] = labels
+        arrays[f'{col}_codes'] = codes.astype(np.int8)
+    for col, dtype in LAB_COLUMNS.items():
+        arrays[col] = np.asarray(columns[col], dtype=dtype)
+    return arrays
+
+def save_columnar(columns, output_file=CASE_BASE_NPZ, json_file=None):
+    """
+    Simpan case base sebagai .npz (lihat columnar_arrays). json_file: JSON
+    yang ditulis dari kolom yang sama (boleh .gz / .xz); path relatif
+    terhadap .npz dan sha256-nya ikut disimpan supaya case_source_file bisa
+    menemukan JSON itu dan mengecek .npz masih sesuai dengannya.
+    """
+    arrays = columnar_arrays(columns)
+    if json_file is not None:
+        json_rel = os.path.relpath(os.path.abspath(json_file), os.path.dirname(os.path.abspath(output_file)))
+        arrays['json_file'] = np.array(json_rel.replace(os.sep, '/'))
+        arrays['json_sha256'] = np.array(file_checksum(json_file))
+    np.savez_compressed(output_file, **arrays)
+    print(f"\n🗜️ Columnar case base saved to: {output_file}")
+    print(f"📦 File size: {os.path.getsize(output_file) / 1024:.2f} KB")
+
+def load_columnar(path=CASE_BASE_NPZ):
+    """Muat case base .npz menjadi dict kolom"""
+    with np.load(path, allow_pickle=False) as data:
+        if list(data['symptom_names']) != SYMPTOMS:
+            raise ValueError(f"Urutan gejala di {path} tidak sesuai SYMPTOMS")
+
+        columns = {'case_id': data['case_id'], 'symptoms': data['symptoms']}
+        for col in LABEL_COLUMNS:
+            columns[col] = data[f'{col}_labels'][data[f'{col}_codes']]
+        for col in LAB_COLUMNS:
+            columns[col] = data[col]
+    return columns
+
+def columnar_json_source(path=CASE_BASE_NPZ):
+    """
+    (path JSON, sha256) asal .npz yang tersimpan di dalamnya; path None untuk
+    .npz lama tanpa nama file, (None, None) jika tidak ada / tidak terbaca.
+    """
+    try:
+        with np.load(path, allow_pickle=False) as data:
+            if 'json_sha256' not in data.files:
+                return None, None
+            json_file = None
+            if 'json_file' in data.files:
+                json_file = os.path.join(os.path.dirname(path), *str(data['json_file']).split('/'))
+            return json_file, str(data['json_sha256'])
+    except (OSError, ValueError):
+        return None, None
+
+def case_json_file(json_path=CASE_BASE_JSON, npz_path=CASE_BASE_NPZ):
+    """JSON case base: file yang tercatat di .npz (mis. case_base.json.gz), selain itu json_path"""
+    json_file, _ = columnar_json_source(npz_path)
+    return json_file or json_path
+
+def _case_source(json_path, npz_path):
+    """(file sumber, sha256 atau None): sha256 ikut jika sumbernya JSON yang sudah di-hash"""
+    if not os.path.exists(npz_path):
+        return json_path, None
+    json_file, json_sha256 = columnar_json_source(npz_path)
+    json_file = json_file or json_path
+    if not os.path.exists(json_file):
+        return npz_path, None
+    checksum = file_checksum(json_file)
+    return (npz_path, None) if checksum == json_sha256 else (json_file, checksum)
+
+def case_source_file(json_path=CASE_BASE_JSON, npz_path=CASE_BASE_NPZ):
+    """
+    File sumber case base: .npz jika dibuat dari isi JSON-nya yang sekarang
+    (sha256 sama, JSON dari case_json_file), selain itu JSON tersebut
+    (.gz / .xz terbaca langsung). JSON yang diedit/diganti di luar converter
+    tetap terbaca, begitu juga key cache shared dan answer table.
+    """
+    return _case_source(json_path, npz_path)[0]
+
+def case_source(json_path=CASE_BASE_JSON, npz_path=CASE_BASE_NPZ):
+    """
+    (file sumber, sha256-nya): case_source_file beserta checksum, tiap file
+    di-hash paling banyak sekali. Diteruskan ke load_shared_case_base dan
+    open_answer_table supaya cold start tidak membaca ulang file sumber.
+    """
+    source_file, checksum = _case_source(json_path, npz_path)
+    return source_file, checksum or file_checksum(source_file)
+
+def file_stamp(paths):
+    """(path, mtime_ns, ukuran) per file, None jika tidak ada: cek perubahan file tanpa hash"""
+    stamp = []
+    for path in paths:
+        try:
+            info = os.stat(path)
+            stamp.append((path, info.st_mtime_ns, info.st_size))
+        except OSError:
+            stamp.append((path, None, None))
+    return tuple(stamp)
+
+def case_base_stamp(json_path=CASE_BASE_JSON, npz_path=CASE_BASE_NPZ):
+    """file_stamp .npz dan JSON-nya (case_json_file); berubah setiap case base ditulis ulang"""
+    return file_stamp([npz_path, case_json_file(json_path, npz_path)])
+
+def load_case_columns(json_path=CASE_BASE_JSON, npz_path=CASE_BASE_NPZ, source_file=None):
+    """Muat case base sebagai dict kolom dari source_file (default: case_source_file)"""
+    if source_file is None:
+        source_file = case_source_file(json_path, npz_path)
+    if source_file == npz_path:
+        return load_columnar(npz_path)
+
+    return stream_case_columns(source_file)
+
+def load_case_base(json_path=CASE_BASE_JSON, npz_path=CASE_BASE_NPZ):
+    """Muat case base (gejala tersimpan, tanpa generate ulang) sebagai DataFrame"""
+    return columns_to_frame(load_case_columns(json_path, npz_path))
+
+# ============================================================================
+# GENERATE GEJALA PROBABILISTIK
+# ============================================================================
+# Probabilitas gejala = 1 (mis. 0.95 = 95% pasien DBD punya demam)
+_DBD_UMUM = {
+    # GEJALA UMUM DBD (hampir selalu ada)
+    'demam_tinggi': 0.95, 'lemah_lesu': 0.90, 'kehilangan_nafsu_makan': 0.85,
+    # GEJALA KARAKTERISTIK DBD (sering ada)
+    'sakit_kepala': 0.80, 'nyeri_sendi': 0.75, 'nyeri_otot': 0.75, 'nyeri_belakang_mata': 0.70,
+    # GEJALA GI & KULIT (variabel)
+    'mual_muntah': 0.60, 'nyeri_perut': 0.50, 'ruam_kulit': 0.50,
+}
+
+# Satu baris per kelompok pasien; GEJALA PERDARAHAN tergantung platelet
+SYMPTOM_BANDS = [
+    # SEVERE (platelet < 20.000)
+    dict(_DBD_UMUM, bintik_merah=0.90, mimisan=0.70, gusi_berdarah=0.65, trombosit_rendah=1.0, pembesaran_hati=0.80),
+    # MODERATE-SEVERE (platelet < 50.000), hematokrit > 45
+    dict(_DBD_UMUM, bintik_merah=0.80, mimisan=0.50, gusi_berdarah=0.45, trombosit_rendah=1.0, pembesaran_hati=0.60),
+    # MODERATE-SEVERE (platelet < 50.000), hematokrit <= 45
+    dict(_DBD_UMUM, bintik_merah=0.80, mimisan=0.50, gusi_berdarah=0.45, trombosit_rendah=1.0, pembesaran_hati=0.30),
+    # MILD-MODERATE (platelet < 100.000)
+    dict(_DBD_UMUM, bintik_merah=0.60, mimisan=0.30, gusi_berdarah=0.25, trombosit_rendah=1.0, pembesaran_hati=0.30),
+    # VERY MILD (platelet normal tapi DBD)
+    dict(_DBD_UMUM, bintik_merah=0.30, mimisan=0.15, gusi_berdarah=0.10, trombosit_rendah=0.0, pembesaran_hati=0.15),
+    # BUKAN DBD: gejala DBD-spesifik hampir TIDAK ADA
+    {
+        'demam_tinggi': 0.60, 'sakit_kepala': 0.50, 'lemah_lesu': 0.60, 'mual_muntah': 0.40,
+        'nyeri_perut': 0.35, 'kehilangan_nafsu_makan': 0.45, 'nyeri_sendi': 0.30, 'nyeri_otot': 0.30,
+        'nyeri_belakang_mata': 0.15, 'ruam_kulit': 0.20, 'bintik_merah': 0.05, 'mimisan': 0.05,
+        'gusi_berdarah': 0.03, 'pembesaran_hati': 0.0, 'trombosit_rendah': 0.0,
+    },
+]
+_BAND_PROBABILITIES = np.array([[band[sym] for sym in SYMPTOMS] for band in SYMPTOM_BANDS])
+
+def generate_case_columns(lab, seed=GENERATION_SEED):
+    """
+    Generate gejala berdasarkan PROBABILITAS medis dari kolom data lab.
+    Diagnosis diambil dari data lab, severity dari platelet/hematokrit.
+
+    Semua gejala diambil sekaligus: satu matriks uniform (n x 15) dari
+    numpy.random.Generator ber-seed, dibandingkan dengan matriks
+    probabilitas sesuai kelompok tiap pasien. Seed sama = hasil sama.
+    """
+    platelet = np.asarray(lab['platelet'])
+    hct = np.asarray(lab['hematokrit'])
+    is_dbd = np.asarray(lab['diagnosis']) == 'DBD_POSITIF'
+
+    band = np.select(
+        [~is_dbd, platelet < 20000, (platelet < 50000) & (hct > 45), platelet < 50000, platelet < 100000],
+        [5, 0, 1, 2, 3],
+        default=4
+    )
+    severity = np.select(
+        [~is_dbd, platelet < 20000, platelet < 50000, (platelet < 100000) & (platelet <= 70000)],
+        ['NON_DBD', 'BERAT', 'SEDANG', 'SEDANG'],
+        default='RINGAN'
+    )
+
+    rng = np.random.default_rng(seed)
+    uniform = rng.random((len(band), len(SYMPTOMS)))
+    symptoms = (uniform < _BAND_PROBABILITIES[band]).astype(np.int8)
+
+    columns = {col: lab[col] for col in ['case_id', 'diagnosis', 'gender', *LAB_COLUMNS]}
+    columns['symptoms'] = symptoms
+    columns['severity'] = severity
+    return columns
+
+# ============================================================================
+# SHARED CASE BASE (MEMORY-MAPPED)
+# ============================================================================
+# Layout file: magic (8 byte) | panjang header (uint64 LE) | header JSON |
+# blok kolom, masing-masing mulai di offset kelipatan 64 byte
+SHARED_MAGIC = b'DBDCASE1'
+_ALIGN = 64
+
+def _aligned(offset):
+    return -(-offset // _ALIGN) * _ALIGN
+
+def shared_case_base_key(source_file, seed=GENERATION_SEED, checksum=None):
+    """
+    Key case base hasil generate: checksum file sumber, seed, dan versi
+    generator. checksum: file_checksum(source_file) yang sudah dihitung (opsional).
+    """
+    if checksum is None:
+        checksum = file_checksum(source_file)
+    return f'{checksum}:{seed}:{GENERATOR_VERSION}'
+
+def shared_case_base_path(key):
+    """Path file shared untuk key tertentu; key beda = file beda"""
+    return os.path.join(SHARED_DIR, f"case_base_{hashlib.sha256(key.encode()).hexdigest()[:16]}.bin")
+
+def write_shared_case_base(columns, path, key):
+    """
+    Tulis case base ke file fixed-layout. File ditulis ke tmp lalu di-link
+    ke path; jika proses lain sudah lebih dulu, file miliknya yang dipakai
+    (isinya sama karena key menentukan sumber, seed, dan versi generator),
+    kecuali file itu rusak.
+    """
+    arrays = {'case_id': columns['case_id'], 'symptoms': columns['symptoms']}
+    labels = {}
+    for col in LABEL_COLUMNS:
+        labels[col], codes = np.unique(columns[col], return_inverse=True)
+        arrays[f'{col}_codes'] = codes.astype(np.int8)
+    for col, dtype in LAB_COLUMNS.items():
+        arrays[col] = np.ascontiguousarray(columns[col], dtype=dtype)
+
+    layout, offset = {}, 0
+    for name, arr in arrays.items():
+        layout[name] = {'dtype': arr.dtype.str, 'shape': list(arr.shape), 'offset': offset}
+        offset = _aligned(offset + arr.nbytes)
+    header = json.dumps({
+        'key': key,
+        'symptoms': SYMPTOMS,
+        'labels': {col: values.tolist() for col, values in labels.items()},
+        'columns': layout,
+    }).encode('utf-8')
+    data_start = _aligned(16 + len(header))
+
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(SHARED_MAGIC + len(header).to_bytes(8, 'little') + header)
+        for name, arr in arrays.items():
+            f.seek(data_start + layout[name]['offset'])
+            f.write(np.ascontiguousarray(arr).tobytes())
+        f.truncate(data_start + offset)
+
+    try:
+        os.link(tmp_path, path)
+    except FileExistsError:
+        # File lama rusak/terpotong: ganti (proses yang sudah memetakannya tetap aman)
+        if open_shared_case_base(path, key) is None:
+            os.replace(tmp_path, path)
+    except OSError:
+        # Filesystem tanpa hard link
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+def open_shared_case_base(path, key, decode_labels=True):
+    """
+    Buka file shared sebagai dict kolom. Kolom gejala dan lab adalah view
+    read-only ke satu np.memmap, jadi semua proses berbagi page cache yang sama.
+    decode_labels=False: kolom label tetap sebagai '<kolom>_codes' (view memmap)
+    + '<kolom>_labels', tanpa array string per baris.
+    Return None jika file tidak ada, key-nya berbeda, atau rusak/terpotong
+    (file lalu ditulis ulang oleh load_shared_case_base).
+    """
+    try:
+        with open(path, 'rb') as f:
+            magic = f.read(8)
+            header_len = int.from_bytes(f.read(8), 'little')
+            header = json.loads(f.read(header_len))
+        if magic != SHARED_MAGIC or header['key'] != key or header['symptoms'] != SYMPTOMS:
+            return None
+
+        data_start = _aligned(16 + header_len)
+        buffer = np.memmap(path, dtype=np.uint8, mode='r')
+        arrays = {}
+        for name, spec in header['columns'].items():
+            dtype, shape = np.dtype(spec['dtype']), tuple(spec['shape'])
+            offset = data_start + spec['offset']
+            # File terpotong: kolom melewati akhir file
+            if offset + int(np.prod(shape)) * dtype.itemsize > buffer.size:
+                return None
+            arrays[name] = np.ndarray(shape, dtype=dtype, buffer=buffer, offset=offset)
+    except (OSError, ValueError, TypeError, KeyError):
+        return None
+
+    columns = {'case_id': arrays['case_id'], 'symptoms': arrays['symptoms']}
+    for col in LABEL_COLUMNS:
+        labels = np.array(header['labels'][col], dtype=str)
+        if decode_labels:
+            columns[col] = labels[arrays[f'{col}_codes']]
+        else:
+            columns[f'{col}_codes'] = arrays[f'{col}_codes']
+            columns[f'{col}_labels'] = labels
+    for col in LAB_COLUMNS:
+        columns[col] = arrays[col]
+    return columns
+
+def load_shared_case_base(json_path=CASE_BASE_JSON, npz_path=CASE_BASE_NPZ, seed=GENERATION_SEED,
+                          decode_labels=True, source=None):
+    """
+    Case base hasil generate yang sama untuk semua proses dan restart:
+    buka file cache jika sudah ada, jika belum generate lalu tulis.
+    decode_labels: lihat open_shared_case_base.
+    source: (file sumber, sha256) dari case_source, dihitung jika None.
+    """
+    source_file, checksum = source or case_source(json_path, npz_path)
+    key = shared_case_base_key(source_file, seed, checksum)
+    path = shared_case_base_path(key)
+
+    columns = open_shared_case_base(path, key, decode_labels)
+    if columns is None:
+        generated = generate_case_columns(load_case_columns(json_path, npz_path, source_file), seed)
+        try:
+            write_shared_case_base(generated, path, key)
+        except OSError:
+            # Direktori tidak bisa ditulis: pakai hasil generate tanpa berbagi
+            return generated
+        columns = open_shared_case_base(path, key, decode_labels)
+    return columns
+
+# ============================================================================
+# MAIN EXECUTION
+# ============================================================================
+if __name__ == "__main__":
+    report = memory_report(columns_to_frame(load_shared_case_base()))
+    print(report.to_string())
+    total = report.loc['TOTAL']
+    print(f"\n📦 {total['lama'] / 1024:.1f} KB -> {total['compact'] / 1024:.1f} KB "
+          f"({total['compact'] / total['lama'] * 100:.0f}%)")
@@ -0,0 +1,936 @@
+"""
+CBR ENGINE
+Perhitungan similarity berbasis array NumPy untuk sistem screening DBD.
+Dipakai oleh app.py, tapi tidak bergantung pada Streamlit.
+"""
+
+import functools
+import hashlib
+import json
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+# ============================================================================
+# GEJALA & BOBOT
+# ============================================================================
+SYMPTOMS = [
+    'demam_tinggi', 'sakit_kepala', 'nyeri_sendi', 'nyeri_otot',
+    'mual_muntah', 'ruam_kulit', 'nyeri_perut', 'mimisan',
+    'gusi_berdarah', 'bintik_merah', 'lemah_lesu', 'kehilangan_nafsu_makan',
+    'nyeri_belakang_mata', 'pembesaran_hati', 'trombosit_rendah'
+]
+
+# Bobot berdasarkan spesifisitas DBD
+WEIGHTS = {
+    'trombosit_rendah': 0.15,      # Paling spesifik (tapi jarang user tahu)
+    'bintik_merah': 0.13,           # Sangat spesifik DBD
+    'mimisan': 0.11,                # Tanda perdarahan
+    'gusi_berdarah': 0.11,          # Tanda perdarahan
+    'demam_tinggi': 0.10,           # Umum tapi penting
+    'nyeri_sendi': 0.08,            # Break-bone fever
+    'nyeri_otot': 0.07,             # Myalgia
+    'nyeri_belakang_mata': 0.07,    # Khas DBD
+    'pembesaran_hati': 0.06,        # Warning sign
+    'sakit_kepala': 0.04,           # Umum
+    'nyeri_perut': 0.03,            # Warning sign
+    'ruam_kulit': 0.02,             # Bisa ada
+    'mual_muntah': 0.02,            # Umum
+    'lemah_lesu': 0.01,             # Sangat umum
+    'kehilangan_nafsu_makan': 0.01  # Sangat umum
+}
+
+# Label hasil diagnosa & severity; posisi di list = kode integer
+DIAGNOSIS_LABELS = ['DBD_POSITIF', 'SUSPEK_DBD', 'BUKAN_DBD', 'DATA_INSUFFICIENT']
+SEVERITY_LABELS = ['BERAT', 'SEDANG', 'RINGAN', 'NON_DBD', 'OBSERVASI', 'INSUFFICIENT', 'UNKNOWN']
+
+TOP_K = 10
+
+# ============================================================================
+# REPRESENTASI ARRAY
+# ============================================================================
+def symptom_matrix(case_base):
+    """Matriks gejala int8 (n x 15) yang kontigu, kolom sesuai urutan SYMPTOMS"""
+    if isinstance(case_base, dict):
+        # Dict kolom: matriks 'symptoms' dipakai langsung (view memmap tidak di-copy)
+        return np.ascontiguousarray(case_base['symptoms'], dtype=np.int8)
+    return np.ascontiguousarray(case_base[SYMPTOMS].to_numpy(dtype=np.int8))
+
+def case_columns(case_base):
+    """
+    Case base sebagai dict kolom (format case_base_store): 'symptoms' (n x 15)
+    plus satu array per kolom; kolom label boleh disimpan sebagai
+    '<kolom>_codes' + '<kolom>_labels'. Dict dikembalikan apa adanya,
+    DataFrame diubah sekali (kolom categorical menjadi codes + labels).
+    """
+    if isinstance(case_base, dict):
+        return case_base
+    
+    columns = {'symptoms': symptom_matrix(case_base)}
+    for col in case_base.columns:
+        if col in SYMPTOMS:
+            continue
+        values = case_base[col]
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            columns[f'{col}_codes'] = values.cat.codes.to_numpy()
+            columns[f'{col}_labels'] = np.asarray(values.cat.categories)
+        else:
+            columns[col] = values.to_numpy()
+    return columns
+
+def case_values(case_base, col, rows=None):
+    """Nilai satu kolom (semua baris atau baris tertentu); label di-decode hanya untuk rows"""
+    if not isinstance(case_base, dict):
+        values = case_base[col].to_numpy()
+        return values if rows is None else values[rows]
+    
+    if f'{col}_codes' in case_base:
+        codes = case_base[f'{col}_codes']
+        return np.asarray(case_base[f'{col}_labels'])[codes if rows is None else codes[rows]]
+    values = case_base[col]
+    return values if rows is None else values[rows]
+
+def weight_vector(weights=WEIGHTS):
+    """Bobot gejala sebagai vektor float64, urutan sesuai SYMPTOMS"""
+    return np.array([weights[sym] for sym in SYMPTOMS], dtype=np.float64)
+
+def symptom_vector(new_case):
+    """Ubah dict gejala pasien menjadi vektor int8"""
+    return np.array([new_case.get(sym, 0) for sym in SYMPTOMS], dtype=np.int8)
+
+# ============================================================================
+# SIMILARITY
+# ============================================================================
+def similarity_scores(query, matrix, weights):
+    """
+    Hitung similarity dan jumlah gejala cocok untuk seluruh case base sekaligus.
+
+    Jarak dijumlahkan dengan cumsum per baris supaya urutan penjumlahan
+    floating point sama persis dengan loop per gejala yang lama.
+    """
+    diff = np.abs(matrix.astype(np.int16) - query)
+    distance = np.cumsum(diff * weights, axis=1)[:, -1]
+    matched = ((matrix == query) & (query == 1)).sum(axis=1, dtype=np.int64)
+
+    similarity = (1 - distance) * 100
+    return similarity, matched
+
+# ============================================================================
+# REPRESENTASI BIT-PACKED
+# ============================================================================
+# Bit ke-j = SYMPTOMS[j]; byte rendah = gejala 0-7, byte tinggi = gejala 8-14
+_BIT_SHIFTS = np.arange(len(SYMPTOMS), dtype=np.uint16)
+_POPCOUNT = np.array([bin(b).count('1') for b in range(256)], dtype=np.int64)
+
+def pack_symptoms(matrix):
+    """Pack matriks gejala biner (n x 15) menjadi satu uint16 per kasus"""
+    return (matrix.astype(np.uint16) << _BIT_SHIFTS).sum(axis=1, dtype=np.uint16)
+
+def symptom_mask(new_case):
+    """Ubah dict gejala pasien menjadi bitmask 15-bit"""
+    mask = 0
+    for bit, sym in enumerate(SYMPTOMS):
+        if new_case.get(sym, 0):
+            mask |= 1 << bit
+    return mask
+
+def similarity_table(weights=WEIGHTS):
+    """
+    Similarity untuk setiap hasil XOR 15-bit (2^15 entri, 256 KB).
+
+    Dihitung dengan similarity_scores terhadap query kosong, jadi urutan
+    penjumlahan bobot sama persis dengan loop per gejala yang lama;
+    table[mask ^ packed] identik dengan similarity_scores (gejala biner).
+    """
+    masks = np.arange(1 << len(SYMPTOMS), dtype=np.uint16)
+    bits = ((masks[:, None] >> _BIT_SHIFTS) & 1).astype(np.int8)
+    similarity, _ = similarity_scores(np.zeros(len(SYMPTOMS), dtype=np.int8), bits, weight_vector(weights))
+    return similarity
+
+@functools.lru_cache(maxsize=1)
+def default_similarity_table():
+    """similarity_table(WEIGHTS), dibuat sekali per proses dan read-only"""
+    table = similarity_table()
+    table.flags.writeable = False
+    return table
+
+def packed_similarity_scores(mask, packed, table):
+    """
+    Similarity via XOR bitmask pasien terhadap case base yang sudah di-pack:
+    similarity = table[xor] (lihat similarity_table), gejala cocok = popcount AND.
+    """
+    similarity = table[packed ^ np.uint16(mask)]
+
+    both = packed & np.uint16(mask)
+    matched = _POPCOUNT[both & 0xFF] + _POPCOUNT[both >> 8]
+    return similarity, matched
+
+# ============================================================================
+# POLA GEJALA UNIK
+# ============================================================================
+def group_patterns(matrix):
+    """
+    Kelompokkan kasus dengan vektor gejala identik.
+
+    members berisi posisi kasus yang diurutkan per pola (dalam satu pola
+    tetap urut posisi); anggota pola p ada di members[offsets[p]:offsets[p + 1]].
+    """
+    packed = pack_symptoms(matrix)
+    uniques, inverse, counts = np.unique(packed, return_inverse=True, return_counts=True)
+    
+    return {
+        'packed': uniques,
+        'patterns': ((uniques[:, None] >> _BIT_SHIFTS) & 1).astype(np.int8),
+        'counts': counts,
+        'inverse': inverse,
+        'members': np.argsort(inverse, kind='stable'),
+        'offsets': np.concatenate([[0], np.cumsum(counts)]),
+    }
+
+def top_k_grouped(pattern_similarity, groups, k=TOP_K):
+    """
+    Top-k kasus dari similarity per pola; urutan sama dengan stable sort
+    menurun similarity per kasus (similarity sama diurutkan per posisi).
+    Return posisi kasus dan pola masing-masing.
+    """
+    k = min(k, len(groups['inverse']))
+    if k <= 0:
+        return np.empty(0, dtype=np.intp), np.empty(0, dtype=np.intp)
+    
+    # Similarity terendah yang masih masuk top-k
+    by_similarity = np.argsort(-pattern_similarity, kind='stable')
+    covered = np.cumsum(groups['counts'][by_similarity])
+    cutoff = pattern_similarity[by_similarity[np.searchsorted(covered, k)]]
+    
+    # Ekspansi hanya pola dengan similarity >= cutoff
+    candidates = np.flatnonzero(pattern_similarity >= cutoff)
+    members, offsets = groups['members'], groups['offsets']
+    rows = np.concatenate([members[offsets[p]:offsets[p + 1]] for p in candidates])
+    patterns = np.repeat(candidates, groups['counts'][candidates])
+    
+    order = np.lexsort((rows, -pattern_similarity[patterns]))[:k]
+    return rows[order], patterns[order]
+
+# ============================================================================
+# VOTING (WEIGHTED BINCOUNT)
+# ============================================================================
+def label_codes(values, labels):
+    """Ubah array label string menjadi kode integer sesuai posisi di labels"""
+    if isinstance(getattr(values, 'dtype', None), pd.CategoricalDtype):
+        # Kolom categorical: cukup petakan kategorinya
+        lookup = np.array([labels.index(c) for c in values.cat.categories], dtype=np.int8)
+        return lookup[values.cat.codes.to_numpy()]
+    
+    uniques, inverse = np.unique(np.asarray(values, dtype=object).astype(str), return_inverse=True)
+    lookup = np.array([labels.index(u) for u in uniques], dtype=np.int8)
+    return lookup[inverse]
+
+def case_label_codes(case_base, col, labels):
+    """label_codes untuk kolom case base; kolom '<kolom>_codes' cukup dipetakan per label"""
+    if isinstance(case_base, dict) and f'{col}_codes' in case_base:
+        lookup = np.array([labels.index(str(l)) for l in case_base[f'{col}_labels']], dtype=np.int8)
+        return lookup[case_base[f'{col}_codes']]
+    return label_codes(case_base[col], labels)
+
+def vote(top_sims, diag_codes, sev_codes, total_symptoms):
+    """
+    Voting diagnose() berbasis array untuk satu pasien (array k) atau banyak
+    pasien (m x k). Bobot = similarity / total similarity top-k; vote per
+    label dijumlah dengan np.bincount dalam urutan top-k, jadi hasilnya
+    identik dengan loop diagnose() lama. Return kode
+    (diagnosis, confidence, votes [.., 3], severity).
+    """
+    top_sims = np.asarray(top_sims, dtype=np.float64)
+    single = top_sims.ndim == 1
+    top_sims = np.atleast_2d(top_sims)
+    m, k = top_sims.shape
+    diag_codes = np.asarray(diag_codes, dtype=np.intp).reshape(m, k)
+    sev_codes = np.asarray(sev_codes, dtype=np.intp).reshape(m, k)
+    total_symptoms = np.broadcast_to(total_symptoms, (m,))
+    n_sev = len(SEVERITY_LABELS)
+    patients = np.arange(m)
+    
+    weight = top_sims / top_sims.sum(axis=1, keepdims=True)
+    votes = np.bincount((patients[:, None] * 3 + diag_codes).ravel(),
+                        weights=(weight * 100).ravel(), minlength=m * 3).reshape(m, 3)
+    sev_bins = (patients[:, None] * n_sev + sev_codes).ravel()
+    severity_votes = np.bincount(sev_bins, weights=weight.ravel(), minlength=m * n_sev).reshape(m, n_sev)
+    
+    # Severity terbanyak; jika seri, yang pertama muncul di top-k (seperti max() pada dict)
+    first_seen = np.full(m * n_sev, k)
+    np.minimum.at(first_seen, sev_bins, np.tile(np.arange(k), m))
+    first_seen = first_seen.reshape(m, n_sev)
+    seen = first_seen < k
+    best = np.where(seen, severity_votes, -np.inf).max(axis=1)
+    tied = seen & (severity_votes == best[:, None])
+    severity = np.argmin(np.where(tied, first_seen, k + 1), axis=1)
+    severity = np.where(seen.any(axis=1), severity, SEVERITY_LABELS.index('UNKNOWN'))
+    
+    diagnosis = np.argmax(votes, axis=1)
+    
+    # RULE SCREENING: Gejala sedikit = tidak bisa DBD POSITIF
+    few = total_symptoms <= 4
+    votes[few, 0] = 0
+    suspect = votes[:, 1] > votes[:, 2]
+    diagnosis = np.where(few, np.where(suspect, 1, 2), diagnosis)
+    severity = np.where(few, np.where(suspect, SEVERITY_LABELS.index('OBSERVASI'), SEVERITY_LABELS.index('NON_DBD')), severity)
+    confidence = votes[patients, diagnosis]
+    
+    # Validasi: minimal 3 gejala
+    insufficient = total_symptoms < 3
+    votes[insufficient] = 0
+    confidence[insufficient] = 0
+    diagnosis[insufficient] = DIAGNOSIS_LABELS.index('DATA_INSUFFICIENT')
+    severity[insufficient] = SEVERITY_LABELS.index('INSUFFICIENT')
+    
+    if single:
+        return diagnosis[0], confidence[0], votes[0], severity[0]
+    return diagnosis, confidence, votes, severity
+
+# ============================================================================
+# FUNGSI CBR
+# ============================================================================
+def _similarity_frame(case_base, rows, similarity, matched):
+    """DataFrame hasil similarity untuk baris-baris case base tertentu"""
+    return pd.DataFrame({
+        'case_id': case_values(case_base, 'case_id', rows),
+        'similarity': similarity,
+        'matched_symptoms': matched,
+        'diagnosis': case_values(case_base, 'diagnosis', rows),
+        'severity': case_values(case_base, 'severity', rows)
+    }, index=rows)
+
+def calculate_similarity(new_case, case_base):
+    """Hitung similarity HANYA berdasarkan gejala klinis"""
+    
+    similarity, matched = similarity_scores(
+        symptom_vector(new_case), symptom_matrix(case_base), weight_vector()
+    )
+    
+    similarities = _similarity_frame(case_base, np.arange(len(case_base)), similarity, matched)
+    
+    # Stable sort: kasus dengan similarity sama tetap urut sesuai posisi di case base
+    return similarities.sort_values('similarity', ascending=False, kind='stable')
+
+def top_k_similar(new_case, case_base, k=TOP_K, groups=None):
+    """
+    Ambil k kasus paling mirip tanpa sort seluruh case base.
+    Similarity dihitung sekali per pola gejala unik (lihat group_patterns).
+    """
+    if groups is None:
+        groups = group_patterns(symptom_matrix(case_base))
+    
+    similarity, matched = packed_similarity_scores(
+        symptom_mask(new_case), groups['packed'], default_similarity_table()
+    )
+    
+    rows, patterns = top_k_grouped(similarity, groups, k)
+    return _similarity_frame(case_base, rows, similarity[patterns], matched[patterns])
+
+def diagnose(similar_cases, total_symptoms):
+    """Diagnosa dengan validasi minimum gejala"""
+    
+    # Validasi: minimal 3 gejala
+    if total_symptoms < 3:
+        return 'DATA_INSUFFICIENT', 0, {
+            'DBD_POSITIF': 0, 'SUSPEK_DBD': 0, 'BUKAN_DBD': 0
+        }, 'INSUFFICIENT'
+    
+    diagnosis, confidence, votes, severity = vote(
+        similar_cases['similarity'].to_numpy(dtype=np.float64),
+        label_codes(similar_cases['diagnosis'], DIAGNOSIS_LABELS),
+        label_codes(similar_cases['severity'], SEVERITY_LABELS),
+        total_symptoms,
+    )
+    votes = dict(zip(DIAGNOSIS_LABELS[:3], votes.tolist()))
+    return DIAGNOSIS_LABELS[diagnosis], float(confidence), votes, SEVERITY_LABELS[severity]
+
+# ============================================================================
+# SCREENING SATU PASIEN (RETRIEVE + VOTE)
+# ============================================================================
+def prepare_case_base(case_base, version=None):
+    """
+    Array yang dipakai ulang setiap screening; dihitung sekali per case base.
+    case_base: DataFrame atau dict kolom (lihat case_columns).
+    version: identitas isi case base (default case_base_fingerprint).
+    """
+    case_ids = case_values(case_base, 'case_id')
+    return {
+        'version': case_base_fingerprint(case_base) if version is None else version,
+        'groups': group_patterns(symptom_matrix(case_base)),
+        'similarity_table': default_similarity_table(),
+        'diag_codes': case_label_codes(case_base, 'diagnosis', DIAGNOSIS_LABELS),
+        'sev_codes': case_label_codes(case_base, 'severity', SEVERITY_LABELS),
+        'case_ids': case_ids,
+        # Index case_id -> baris: urutan case_id terurut (8 byte per kasus,
+        # tanpa hash table objek string), dicari dengan binary search
+        'case_order': np.argsort(case_ids, kind='stable'),
+    }
+
+def case_rows(prepared, case_ids):
+    """Posisi baris case base untuk daftar case_id, O(k log n) lewat case_order"""
+    ids, order = prepared['case_ids'], prepared['case_order']
+    case_ids = np.asarray(case_ids)
+    rows = np.full(len(case_ids), -1, dtype=np.intp)
+    if len(ids):
+        pos = np.searchsorted(ids, case_ids, sorter=order)
+        rows = order[np.minimum(pos, len(ids) - 1)]
+        rows[ids[rows] != case_ids] = -1
+    if (rows < 0).any():
+        missing = case_ids[rows < 0]
+        raise KeyError(f"case_id tidak ada di case base: {', '.join(map(str, missing))}")
+    return rows
+
+def screen(new_case, prepared, k=TOP_K):
+    """
+    Screening satu pasien dalam satu panggilan tanpa DataFrame perantara:
+    similarity per pola unik -> top-k -> vote(). Hasil identik dengan
+    top_k_similar + diagnose; rows = posisi kasus di case base (untuk iloc).
+    """
+    groups = prepared['groups']
+    similarity, matched = packed_similarity_scores(
+        symptom_mask(new_case), groups['packed'], prepared['similarity_table']
+    )
+    rows, patterns = top_k_grouped(similarity, groups, k)
+    
+    diagnosis, confidence, votes, severity = vote(
+        similarity[patterns], prepared['diag_codes'][rows], prepared['sev_codes'][rows],
+        int(symptom_vector(new_case).sum())
+    )
+    return {
+        'rows': rows,
+        'similarity': similarity[patterns],
+        'matched': matched[patterns],
+        'diagnosis': DIAGNOSIS_LABELS[diagnosis],
+        'confidence': float(confidence),
+        'votes': dict(zip(DIAGNOSIS_LABELS[:3], votes.tolist())),
+        'severity': SEVERITY_LABELS[severity],
+    }
+
+def screen_frame(case_base, result):
+    """DataFrame top-k (format top_k_similar) dari hasil screen(), untuk tampilan"""
+    return _similarity_frame(case_base, result['rows'], result['similarity'], result['matched'])
+
+# ============================================================================
+# CACHE HASIL SCREENING (LRU)
+# ============================================================================
+RESULT_CACHE_SIZE = 4096
+
+def make_result_cache(maxsize=RESULT_CACHE_SIZE):
+    """Cache LRU hasil screen(), aman dipakai bersama oleh banyak thread/sesi"""
+    return {
+        'entries': OrderedDict(),
+        'maxsize': maxsize,
+        'version': None,
+        'hits': 0,
+        'misses': 0,
+        'lock': threading.Lock(),
+    }
+
+def cached_screen(new_case, prepared, cache, k=TOP_K):
+    """
+    screen() lewat cache LRU dengan key (versi case base, bitmask gejala, k).
+    Versi case base baru mengosongkan cache, jadi hasil lama tidak terpakai.
+    """
+    key = (prepared['version'], symptom_mask(new_case), k)
+    with cache['lock']:
+        result = cache['entries'].get(key)
+        if result is not None:
+            cache['entries'].move_to_end(key)
+            cache['hits'] += 1
+    
+    if result is None:
+        result = screen(new_case, prepared, k)
+        for name in ('rows', 'similarity', 'matched'):
+            result[name].flags.writeable = False
+        with cache['lock']:
+            if cache['version'] != prepared['version']:
+                cache['entries'].clear()
+                cache['version'] = prepared['version']
+            cache['misses'] += 1
+            cache['entries'][key] = result
+            while len(cache['entries']) > cache['maxsize']:
+                cache['entries'].popitem(last=False)
+    
+    # Array hasil read-only; dict votes disalin supaya entri cache tidak berubah
+    return dict(result, votes=dict(result['votes']))
+
+def cache_stats(cache):
+    """Counter cache: hit, miss, jumlah entri, hit rate (%)"""
+    with cache['lock']:
+        hits, misses, size = cache['hits'], cache['misses'], len(cache['entries'])
+    total = hits + misses
+    return {
+        'hits': hits,
+        'misses': misses,
+        'size': size,
+        'maxsize': cache['maxsize'],
+        'hit_rate': hits / total * 100 if total else 0.0,
+    }
+
+def benchmark_screening(case_base, patients=200, k=TOP_K, seed=0):
+    """
+    Latensi rata-rata per pasien (ms) untuk alur lama vs screen(), termasuk
+    ambil baris kasus untuk Tab 2. Return dict nama alur -> ms.
+    """
+    rng = np.random.default_rng(seed)
+    cases = [dict(zip(SYMPTOMS, row)) for row in rng.integers(0, 2, (patients, len(SYMPTOMS))).tolist()]
+    prepared = prepare_case_base(case_base)
+    
+    def legacy(case):
+        top = calculate_similarity(case, case_base).head(k)
+        diagnose(top, sum(case.values()))
+        for case_id in top['case_id']:
+            case_base[case_base['case_id'] == case_id].iloc[0]
+    
+    def current(case):
+        top = top_k_similar(case, case_base, k, groups=prepared['groups'])
+        diagnose(top, sum(case.values()))
+        for case_id in top['case_id']:
+            case_base[case_base['case_id'] == case_id].iloc[0]
+    
+    def fused(case):
+        case_base.iloc[screen(case, prepared, k)['rows']]
+    
+    cache = make_result_cache()
+    for case in cases:
+        cached_screen(case, prepared, cache, k)
+    
+    def cache_hit(case):
+        cached_screen(case, prepared, cache, k)
+    
+    timings = {}
+    for name, run in [('calculate_similarity + diagnose', legacy),
+                      ('top_k_similar + diagnose', current),
+                      ('screen', fused),
+                      ('cached_screen (hit)', cache_hit)]:
+        start = time.perf_counter()
+        for case in cases:
+            run(case)
+        timings[name] = (time.perf_counter() - start) / patients * 1000
+    return timings
+
+# ============================================================================
+# CEK KESETARAAN DENGAN ALUR LAMA (REFERENSI)
+# ============================================================================
+def reference_similarity(new_case, case_base, weights=WEIGHTS):
+    """Loop iterrows calculate_similarity versi awal (referensi, lambat)"""
+    similarities = []
+
+    for idx, case in case_base.iterrows():
+        distance = 0
+        matched = 0
+
+        for sym in SYMPTOMS:
+            new_val = new_case.get(sym, 0)
+            case_val = case[sym]
+            distance += abs(new_val - case_val) * weights[sym]
+
+            if new_val == case_val and new_val == 1:
+                matched += 1
+
+        similarity = (1 - distance) * 100
+
+        similarities.append({
+            'case_id': case['case_id'],
+            'similarity': similarity,
+            'matched_symptoms': matched,
+            'diagnosis': case['diagnosis'],
+            'severity': case['severity']
+        })
+
+    # Urutan kasus dengan similarity sama: posisi di case base (stable sort)
+    return pd.DataFrame(similarities).sort_values('similarity', ascending=False, kind='stable')
+
+def reference_diagnose(similar_cases, total_symptoms):
+    """Loop iterrows diagnose versi awal (referensi, lambat)"""
+    if total_symptoms < 3:
+        return 'DATA_INSUFFICIENT', 0, {
+            'DBD_POSITIF': 0, 'SUSPEK_DBD': 0, 'BUKAN_DBD': 0
+        }, 'INSUFFICIENT'
+
+    total_sim = similar_cases['similarity'].sum()
+    votes = {'DBD_POSITIF': 0, 'SUSPEK_DBD': 0, 'BUKAN_DBD': 0}
+    severity_votes = {}
+
+    for _, case in similar_cases.iterrows():
+        weight = case['similarity'] / total_sim
+        votes[case['diagnosis']] += weight * 100
+
+        if case['severity'] not in severity_votes:
+            severity_votes[case['severity']] = 0
+        severity_votes[case['severity']] += weight
+
+    if total_symptoms <= 4:
+        votes['DBD_POSITIF'] = 0
+        final_diag = 'SUSPEK_DBD' if votes['SUSPEK_DBD'] > votes['BUKAN_DBD'] else 'BUKAN_DBD'
+        conf = max(votes['SUSPEK_DBD'], votes['BUKAN_DBD'])
+        sev = 'OBSERVASI' if final_diag == 'SUSPEK_DBD' else 'NON_DBD'
+    else:
+        final_diag = max(votes, key=votes.get)
+        conf = votes[final_diag]
+        sev = max(severity_votes, key=severity_votes.get) if severity_votes else 'UNKNOWN'
+
+    return final_diag, conf, votes, sev
+
+def check_equivalence(case_base, patients=50, ks=(1, 3, TOP_K, 25), seed=0):
+    """
+    Bandingkan alur array dengan referensi loop lama pada bitmask gejala acak
+    dan beberapa k: similarity/matched/urutan (calculate_similarity,
+    top_k_similar, screen, screen_batch) dan hasil voting (diagnose, vote)
+    harus identik persis. Return dict nama alur -> daftar (mask, k) yang beda.
+    """
+    rng = np.random.default_rng(seed)
+    masks = rng.choice(1 << len(SYMPTOMS), size=patients, replace=False)
+    queries = (masks[:, None] >> np.arange(len(SYMPTOMS))) & 1
+    prepared = prepare_case_base(case_base)
+    case_ids = case_base['case_id'].to_numpy()
+    mismatches = {name: [] for name in ['calculate_similarity', 'top_k_similar + diagnose',
+                                        'screen', 'screen_batch']}
+
+    def same_top(frame, ref):
+        return (np.array_equal(frame['case_id'].to_numpy(), ref['case_id'].to_numpy())
+                and np.array_equal(frame['similarity'].to_numpy(), ref['similarity'].to_numpy())
+                and np.array_equal(frame['matched_symptoms'].to_numpy(), ref['matched_symptoms'].to_numpy()))
+
+    batches = {k: screen_batch(queries, case_base, k, groups=prepared['groups']) for k in ks}
+    for i, (mask, query) in enumerate(zip(masks.tolist(), queries)):
+        new_case = dict(zip(SYMPTOMS, query.tolist()))
+        total = int(query.sum())
+        ranked = reference_similarity(new_case, case_base)
+        if not same_top(calculate_similarity(new_case, case_base), ranked):
+            mismatches['calculate_similarity'].append((mask, None))
+
+        for k in ks:
+            ref = ranked.head(k)
+            expected = reference_diagnose(ref, total)
+
+            top = top_k_similar(new_case, case_base, k, groups=prepared['groups'])
+            if not same_top(top, ref) or diagnose(top, total) != expected:
+                mismatches['top_k_similar + diagnose'].append((mask, k))
+
+            result = screen(new_case, prepared, k)
+            got = (result['diagnosis'], result['confidence'], result['votes'], result['severity'])
+            if (got != expected or not np.array_equal(case_ids[result['rows']], ref['case_id'].to_numpy())
+                    or not np.array_equal(result['similarity'], ref['similarity'].to_numpy())
+                    or not np.array_equal(result['matched'], ref['matched_symptoms'].to_numpy())):
+                mismatches['screen'].append((mask, k))
+
+            batch = batches[k]
+            got = (batch['diagnosis'][i], batch['confidence'][i],
+                   dict(zip(DIAGNOSIS_LABELS[:3], batch['votes'][i].tolist())), batch['severity'][i])
+            if (got != expected or not np.array_equal(case_ids[batch['top_rows'][i]], ref['case_id'].to_numpy())
+                    or not np.array_equal(batch['similarity'][i], ref['similarity'].to_numpy())):
+                mismatches['screen_batch'].append((mask, k))
+    return mismatches
+
+# ============================================================================
+# BATCH SCREENING
+# ============================================================================
+# Batas elemen matriks jarak (pasien x kasus) per blok, ~32 MB float64
+BLOCK_ELEMENTS = 1 << 22
+
+def _block_similarity(masks, packed, table):
+    """Similarity (b x n) satu blok pasien lewat XOR + similarity_table"""
+    return table[masks[:, None] ^ packed[None, :]]
+
+def _block_top_k(similarity, k):
+    """
+    Top-k per baris matriks similarity (b x n) dengan partial selection;
+    urutan sama dengan stable sort menurun (similarity sama diurutkan per posisi).
+    """
+    b, n = similarity.shape
+    if k >= n:
+        return np.argsort(-similarity, axis=1, kind='stable')
+    if k <= 0:
+        return np.empty((b, 0), dtype=np.intp)
+    
+    kth = np.partition(similarity, n - k, axis=1)[:, n - k]
+    rows, cols = np.nonzero(similarity >= kth[:, None])
+    order = np.lexsort((cols, -similarity[rows, cols], rows))
+    rows, cols = rows[order], cols[order]
+    
+    # Ambil k kandidat pertama per baris (kelebihan hanya dari similarity == kth)
+    rank = np.arange(len(rows)) - np.searchsorted(rows, np.arange(b))[rows]
+    return cols[rank < k].reshape(b, k)
+
+def screen_batch(symptoms, case_base, k=TOP_K, block_elements=BLOCK_ELEMENTS, groups=None):
+    """
+    Screening banyak pasien sekaligus dari matriks gejala biner (m x 15, urutan SYMPTOMS).
+
+    Similarity dihitung per pola gejala unik (XOR bitmask + similarity_table)
+    lalu disebar ke kasus, per blok pasien
+    supaya memori tetap terbatas. Hasil per pasien identik dengan
+    top_k_similar + diagnose.
+    """
+    queries = np.asarray(symptoms, dtype=np.int16).reshape(-1, len(SYMPTOMS))
+    if groups is None:
+        groups = group_patterns(symptom_matrix(case_base))
+    masks = pack_symptoms(queries != 0)
+    table = default_similarity_table()
+    diag_codes = case_label_codes(case_base, 'diagnosis', DIAGNOSIS_LABELS)
+    sev_codes = case_label_codes(case_base, 'severity', SEVERITY_LABELS)
+    
+    m, n = len(queries), len(groups['inverse'])
+    k = min(k, n)
+    top_rows = np.zeros((m, max(k, 0)), dtype=np.intp)
+    top_sims = np.zeros((m, max(k, 0)))
+    block = max(1, block_elements // max(n, 1))
+    
+    for start in range(0, m, block):
+        similarity = _block_similarity(masks[start:start + block], groups['packed'], table)
+        similarity = similarity[:, groups['inverse']]
+        rows = _block_top_k(similarity, k)
+        top_rows[start:start + block] = rows
+        top_sims[start:start + block] = np.take_along_axis(similarity, rows, axis=1)
+    
+    diagnosis, confidence, votes, severity = vote(
+        top_sims, diag_codes[top_rows], sev_codes[top_rows], queries.sum(axis=1)
+    )
+    
+    return {
+        'diagnosis': np.array(DIAGNOSIS_LABELS, dtype=object)[diagnosis],
+        'confidence': confidence,
+        'votes': votes,
+        'severity': np.array(SEVERITY_LABELS, dtype=object)[severity],
+        'top_rows': top_rows,
+        'similarity': top_sims,
+    }
+
+# ============================================================================
+# ANSWER TABLE (PRECOMPUTED UNTUK SEMUA 2^15 KOMBINASI GEJALA)
+# ============================================================================
+ANSWER_TABLE_FILE = 'answer_table.npy'
+ANSWER_TABLE_VERSION = 2
+
+ANSWER_DTYPE = np.dtype([
+    ('diagnosis', 'u1'),
+    ('severity', 'u1'),
+    ('confidence', '<f8'),
+    ('votes', '<f8', (3,)),
+    ('top_rows', '<i4', (TOP_K,)),
+])
+
+def file_checksum(path):
+    """SHA-256 isi file"""
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            h.update(block)
+    return h.hexdigest()
+
+def case_base_fingerprint(case_base):
+    """SHA-256 dari gejala, label, dan case_id; berubah jika isi case base berubah"""
+    h = hashlib.sha256()
+    h.update(symptom_matrix(case_base).tobytes())
+    for col in ['case_id', 'diagnosis', 'severity']:
+        h.update('\0'.join(map(str, case_values(case_base, col))).encode('utf-8'))
+    return h.hexdigest()
+
+def _meta_path(path):
+    return os.path.splitext(path)[0] + '.json'
+
+def answer_table_files(path=ANSWER_TABLE_FILE):
+    """File answer table: tabel .npy dan metadata .json-nya"""
+    return [path, _meta_path(path)]
+
+def compile_answer_table(case_base, path=ANSWER_TABLE_FILE, source_file='case_base.json'):
+    """
+    Screening setiap bitmask gejala (via screen_batch, identik dengan
+    top_k_similar + diagnose) dan simpan hasilnya sebagai tabel .npy
+    yang bisa di-memory-map.
+    """
+    masks = np.arange(1 << len(SYMPTOMS))
+    result = screen_batch((masks[:, None] >> np.arange(len(SYMPTOMS))) & 1, case_base, TOP_K)
+    
+    table = np.zeros(len(masks), dtype=ANSWER_DTYPE)
+    table['diagnosis'] = label_codes(result['diagnosis'], DIAGNOSIS_LABELS)
+    table['severity'] = label_codes(result['severity'], SEVERITY_LABELS)
+    table['confidence'] = result['confidence']
+    table['votes'] = result['votes']
+    table['top_rows'] = result['top_rows']
+    
+    # Tulis ke file sementara lalu rename, supaya worker lain tidak membaca file setengah jadi
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        np.save(f, table)
+    meta = {
+        'version': ANSWER_TABLE_VERSION,
+        'source_checksum': file_checksum(source_file),
+        'case_base_fingerprint': case_base_fingerprint(case_base),
+        'table_checksum': file_checksum(tmp_path),
+        'diagnosis_labels': DIAGNOSIS_LABELS,
+        'severity_labels': SEVERITY_LABELS,
+    }
+    with open(_meta_path(tmp_path), 'w') as f:
+        json.dump(meta, f, indent=2)
+    os.replace(tmp_path, path)
+    os.replace(_meta_path(tmp_path), _meta_path(path))
+    
+    return table
+
+def open_answer_table(case_base, path=ANSWER_TABLE_FILE, source_file='case_base.json', fingerprint=None,
+                      source_checksum=None):
+    """
+    Buka answer table secara read-only (memory-mapped).
+    Return None jika tabel tidak ada atau sudah tidak cocok dengan case base.
+    fingerprint / source_checksum: case_base_fingerprint dan file_checksum(source_file)
+    yang sudah dihitung (opsional).
+    """
+    if fingerprint is None:
+        fingerprint = case_base_fingerprint(case_base)
+    try:
+        with open(_meta_path(path)) as f:
+            meta = json.load(f)
+        if source_checksum is None:
+            source_checksum = file_checksum(source_file)
+        if (meta.get('version') != ANSWER_TABLE_VERSION
+                or meta['source_checksum'] != source_checksum
+                or meta['table_checksum'] != file_checksum(path)
+                or meta['case_base_fingerprint'] != fingerprint):
+            return None
+        return np.load(path, mmap_mode='r')
+    except (OSError, ValueError, KeyError):
+        return None
+
+# ============================================================================
+# SCREENING ENGINE (DIPAKAI BERSAMA SEMUA SESI)
+# ============================================================================
+class ScreeningEngine:
+    """
+    Kolom case base beserta array siap pakai (pola unik, tabel similarity,
+    kode label), cache LRU, dan answer table opsional dalam satu objek.
+
+    case_base sebaiknya dict kolom dari load_shared_case_base(decode_labels=False):
+    kolom tetap berupa view read-only ke file memory-mapped, jadi yang
+    dialokasikan per proses hanya array hasil prepare_case_base; detail
+    kasus diambil per baris saat dibutuhkan (case_detail). DataFrame juga
+    diterima (diubah sekali lewat case_columns).
+
+    Dibuat sekali per proses dan tidak diubah setelahnya: semua array
+    (termasuk index case_id) dibuat read-only di __init__, yang berubah
+    hanya cache dan counter lookup answer table (keduanya ber-lock).
+    Jadi satu instance aman dipakai bersama oleh semua sesi/thread tanpa copy.
+    """
+
+    def __init__(self, case_base, version=None, answer_table=None, cache_size=RESULT_CACHE_SIZE):
+        self.columns = case_columns(case_base)
+        self.prepared = prepare_case_base(self.columns, version)
+        self.version = self.prepared['version']
+        self.answer_table = answer_table
+        self.cache = make_result_cache(cache_size)
+        self._table_lookups = 0
+        self._table_lock = threading.Lock()
+
+        # Jumlah kasus per diagnosis, dihitung sekali (tanpa filter case base per rerun)
+        counts = np.bincount(self.prepared['diag_codes'], minlength=len(DIAGNOSIS_LABELS))
+        self.diagnosis_counts = dict(zip(DIAGNOSIS_LABELS, counts.tolist()))
+
+        groups = self.prepared['groups']
+        for arr in (*self.columns.values(), *groups.values(), self.prepared['similarity_table'],
+                    self.prepared['diag_codes'], self.prepared['sev_codes'],
+                    self.prepared['case_ids'], self.prepared['case_order']):
+            if isinstance(arr, np.ndarray):
+                arr.flags.writeable = False
+
+    def __len__(self):
+        return len(self.columns['symptoms'])
+
+    def _answer(self, new_case):
+        """Hasil screen() dari answer table (O(1)); similarity dihitung ulang untuk top-k saja"""
+        row = self.answer_table[symptom_mask(new_case)]
+        rows = np.asarray(row['top_rows'], dtype=np.intp)
+        groups = self.prepared['groups']
+        similarity, matched = packed_similarity_scores(
+            symptom_mask(new_case), groups['packed'][groups['inverse'][rows]], self.prepared['similarity_table']
+        )
+        return {
+            'rows': rows,
+            'similarity': similarity,
+            'matched': matched,
+            'diagnosis': DIAGNOSIS_LABELS[row['diagnosis']],
+            'confidence': float(row['confidence']),
+            'votes': dict(zip(DIAGNOSIS_LABELS[:3], row['votes'].tolist())),
+            'severity': SEVERITY_LABELS[row['severity']],
+        }
+
+    def screen(self, new_case, k=TOP_K):
+        """Screening satu pasien (format screen()): answer table jika ada, selain itu cached_screen"""
+        if self.answer_table is not None and k == TOP_K:
+            with self._table_lock:
+                self._table_lookups += 1
+            return self._answer(new_case)
+        return cached_screen(new_case, self.prepared, self.cache, k)
+
+    def frame(self, result):
+        """DataFrame top-k untuk tampilan (screen_frame)"""
+        return screen_frame(self.columns, result)
+
+    def case_detail(self, row):
+        """Satu kasus (nama kolom -> nilai) pada posisi row, diambil dari kolom saat dibutuhkan"""
+        detail = dict(zip(SYMPTOMS, self.columns['symptoms'][row].tolist()))
+        for name in self.columns:
+            if name == 'symptoms' or name.endswith('_labels'):
+                continue
+            col = name[:-len('_codes')] if name.endswith('_codes') else name
+            value = case_values(self.columns, col, row)
+            detail[col] = value.item() if isinstance(value, np.generic) else value
+        return detail
+
+    def rows(self, case_ids):
+        """Posisi baris untuk daftar case_id (case_rows)"""
+        return case_rows(self.prepared, case_ids)
+
+    def cache_stats(self):
+        """cache_stats + table_lookups (jumlah hasil yang dilayani answer table)"""
+        with self._table_lock:
+            table_lookups = self._table_lookups
+        return dict(cache_stats(self.cache), table_lookups=table_lookups)
+
+# ============================================================================
+# MAIN EXECUTION
+# ============================================================================
+if __name__ == "__main__":
+    from case_base_store import case_source, columns_to_frame, load_case_base, load_shared_case_base
+    
+    # python cbr_engine.py bench -> benchmark latensi screening
+    # python cbr_engine.py check -> cek hasil identik dengan loop lama
+    mode = sys.argv[1] if sys.argv[1:] in (['bench'], ['check']) else 'compile'
+    
+    print("="*70)
+    print({
+        'bench': "BENCHMARK SCREENING",
+        'check': "CEK KESETARAAN DENGAN ALUR LAMA",
+        'compile': "COMPILE ANSWER TABLE - SEMUA KOMBINASI GEJALA",
+    }[mode])
+    print("="*70)
+    
+    # Case base yang sama dengan yang dipakai app (file shared hasil generate)
+    source_file, source_checksum = case_source()
+    case_base = columns_to_frame(load_shared_case_base(source=(source_file, source_checksum)))
+    
+    if mode == 'bench':
+        print(f"\n⏱️ Latensi screening per pasien ({len(case_base)} kasus):")
+        for name, ms in benchmark_screening(case_base).items():
+            print(f"   - {name:<32} {ms:8.3f} ms")
+    elif mode == 'check':
+        failed = False
+        for label, frame in [('generate', case_base), (source_file, load_case_base())]:
+            print(f"\n🔍 Case base {label} ({len(frame)} kasus):")
+            for name, diffs in check_equivalence(frame).items():
+                failed |= bool(diffs)
+                status = '✅ identik' if not diffs else f'❌ {len(diffs)} beda, mis. (mask, k) = {diffs[0]}'
+                print(f"   - {name:<28} {status}")
+        sys.exit(1 if failed else 0)
+    elif open_answer_table(case_base, source_file=source_file, source_checksum=source_checksum) is not None:
+        print(f"\n✅ {ANSWER_TABLE_FILE} masih sesuai dengan case base, tidak perlu rebuild")
+    else:
+        print(f"\n🔄 Compiling {1 << len(SYMPTOMS)} kombinasi gejala...")
+        compile_answer_table(case_base, source_file=source_file)
+        print(f"\n💾 Saved to: {ANSWER_TABLE_FILE}")
+        print(f"📦 File size: {os.path.getsize(ANSWER_TABLE_FILE) / 1024:.2f} KB")
@@ -7,145 +7,480 @@ Copy hasil JSON ke sistem pakar utama.
 import pandas as pd
 import json
 import numpy as np
+import argparse
+import base64
+import glob
+import hashlib
+import io
+import itertools
+import os
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
 
-def convert_csv_to_embedded_json(csv_path):
-    """Convert CSV dataset ke format JSON yang bisa di-embed"""
+from case_base_store import (
+    LAB_COLUMNS, LABEL_COLUMNS, cases_to_columns, columnar_arrays, load_columnar,
+    open_case_file, save_columnar
+)
+from cbr_engine import SYMPTOMS, file_checksum
+
+# Urutan key per kasus di case_base.json (format lama, dipertahankan)
+CASE_KEYS = [
+    'case_id', 'diagnosis', 'age', 'gender', 'platelet', 'hematokrit', 'wbc', 'hemoglobin',
+    'demam_tinggi', 'sakit_kepala', 'nyeri_sendi', 'nyeri_otot', 'lemah_lesu',
+    'kehilangan_nafsu_makan', 'bintik_merah', 'mimisan', 'gusi_berdarah',
+    'nyeri_belakang_mata', 'pembesaran_hati', 'mual_muntah', 'nyeri_perut',
+    'ruam_kulit', 'trombosit_rendah', 'severity'
+]
+
+def normalize_labels(series):
+    """strip().lower() per nilai unik saja (kolom label hanya punya sedikit nilai)"""
+    codes, uniques = pd.factorize(series, use_na_sentinel=False)
+    return uniques.str.strip().str.lower().to_numpy(dtype=str)[codes]
+
+def make_case_ids(start_id, n, prefix='CSV', width=4):
+    """case_id berurutan: CSV_0001, CSV_0002, ... (prefix per file untuk banyak CSV)"""
+    return np.array([f'{prefix}_{i:0{width}d}' for i in range(start_id, start_id + n)], dtype=str)
+
+def case_id_prefix(csv_path, root='.'):
+    """
+    Prefix case_id untuk satu file pada konversi banyak CSV: path relatif
+    terhadap input root tanpa ekstensi, separator jadi '/' (mis.
+    'jkt/rs1/data'). Hanya bergantung pada path file itu sendiri, jadi
+    tidak berubah saat file lain ditambah/dihapus dan selalu unik.
+    """
+    rel = os.path.relpath(os.path.abspath(csv_path), os.path.abspath(root))
+    return os.path.splitext(rel)[0].replace(os.sep, '/')
+
+def file_case_ids(csv_paths, index, start_id, n, root='.'):
+    """
+    case_id untuk n baris file ke-index. Satu file: namespace lama CSV_0001, ...
+    (sama dengan case_base.json dan mode --incremental). Banyak file:
+    case_id_prefix + nomor baris, mis. 'jkt/rs1/data_00001'. Kedua namespace
+    terpisah: file yang dikonversi sendiri lalu digabung dengan file lain
+    mendapat case_id baru.
+    """
+    if len(csv_paths) == 1:
+        return make_case_ids(start_id, n)
+    return make_case_ids(start_id, n, prefix=case_id_prefix(csv_paths[index], root), width=5)
+
+def convert_frame_to_columns(df, start_id=1):
+    """
+    Konversi DataFrame CSV ke dict kolom bertipe (format cases_to_columns)
+    secara vektor: gejala & severity dari mask boolean / np.select.
+    start_id=None: tanpa kolom case_id (diberikan saat merge).
+    """
+    platelet = df['Total Platelet Count(/cumm)'].to_numpy()
+    hct = df['HCT(%)'].to_numpy()
+    wbc = df['Total WBC count(/cumm)'].to_numpy()
+    hb = df['Hemoglobin(g/dl)'].to_numpy()
+    is_dbd = normalize_labels(df['Result']) == 'positive'
+    
+    # Band platelet pasien DBD: <50rb (berat/sedang), <100rb (sedang/ringan), sisanya
+    low = is_dbd & (platelet < 50000)
+    mid = is_dbd & ~low & (platelet < 100000)
+    bleeding = low | mid
+    
+    # Gejala berdasarkan data lab (DETERMINISTIK)
+    symptom = {
+        'demam_tinggi': is_dbd | (wbc < 5000),
+        'sakit_kepala': is_dbd | (hb < 12),
+        'nyeri_sendi': is_dbd | (wbc < 5000),
+        'nyeri_otot': is_dbd | (wbc < 5000),
+        'lemah_lesu': is_dbd | (hb < 11),
+        'kehilangan_nafsu_makan': is_dbd | (hb < 10),
+        'bintik_merah': bleeding,
+        'mimisan': low & (platelet < 30000),
+        'gusi_berdarah': low & (platelet < 30000),
+        'nyeri_belakang_mata': is_dbd,
+        'pembesaran_hati': low & (hct > 45),
+        'mual_muntah': bleeding & (platelet < 70000),
+        'nyeri_perut': low,
+        'ruam_kulit': bleeding,
+        'trombosit_rendah': bleeding,
+    }
+    severity = np.select(
+        [~is_dbd, low & (platelet < 20000), low, mid & (platelet < 70000)],
+        ['NON_DBD', 'BERAT', 'SEDANG', 'SEDANG'],
+        'RINGAN'
+    )
+    
+    columns = {
+        'diagnosis': np.where(is_dbd, 'DBD_POSITIF', 'BUKAN_DBD'),
+        'severity': severity,
+        'gender': normalize_labels(df['Gender']),
+        'age': df['Age'].to_numpy().astype(LAB_COLUMNS['age']),
+        'platelet': platelet.astype(LAB_COLUMNS['platelet']),
+        'hematokrit': hct.astype(LAB_COLUMNS['hematokrit']),
+        'wbc': wbc.astype(LAB_COLUMNS['wbc']),
+        'hemoglobin': hb.astype(LAB_COLUMNS['hemoglobin']),
+        'symptoms': np.column_stack([symptom[sym] for sym in SYMPTOMS]).astype(np.int8),
+    }
+    if start_id is not None:
+        columns = {'case_id': make_case_ids(start_id, len(df)), **columns}
+    return columns
+
+def columns_to_cases(columns):
+    """Dict kolom -> list of dict dengan urutan key CASE_KEYS (tipe Python)"""
+    values = dict(columns)
+    values.update(zip(SYMPTOMS, values.pop('symptoms').T))
+    lists = [values[key].tolist() for key in CASE_KEYS]
+    return [dict(zip(CASE_KEYS, row)) for row in zip(*lists)]
+
+def convert_csv_to_columns(csv_path):
+    """Load CSV dan konversi ke dict kolom bertipe"""
     
     print("🔄 Loading CSV dataset...")
     df = pd.read_csv(csv_path)
     
+    result = normalize_labels(df['Result'])
     print(f"📊 Total data: {len(df)} kasus")
-    print(f"   - DBD Positif: {len(df[df['Result'].str.lower().str.strip() == 'positive'])}")
-    print(f"   - Bukan DBD: {len(df[df['Result'].str.lower().str.strip() == 'negative'])}")
-    
-    cases = []
-    
-    for idx, row in df.iterrows():
-        # Data lab
-        platelet = row['Total Platelet Count(/cumm)']
-        hct = row['HCT(%)']
-        gender = row['Gender'].strip().lower()
-        wbc = row['Total WBC count(/cumm)']
-        hb = row['Hemoglobin(g/dl)']
-        age = row['Age']
-        
-        result = row['Result'].strip().lower()
-        is_dbd = (result == 'positive')
-        
-        case = {
-            'case_id': f'CSV_{idx+1:04d}',
-            'diagnosis': 'DBD_POSITIF' if is_dbd else 'BUKAN_DBD',
-            'age': int(age),
-            'gender': gender,
-            'platelet': int(platelet),
-            'hematokrit': float(hct),
-            'wbc': int(wbc),
-            'hemoglobin': float(hb)
-        }
-        
-        # Generate gejala berdasarkan data lab (DETERMINISTIK)
-        if is_dbd:
-            case['demam_tinggi'] = 1
-            case['sakit_kepala'] = 1
-            case['nyeri_sendi'] = 1
-            case['nyeri_otot'] = 1
-            case['lemah_lesu'] = 1
-            case['kehilangan_nafsu_makan'] = 1
-            
-            # Gejala berdasarkan severity
-            if platelet < 50000:
-                case['bintik_merah'] = 1
-                case['mimisan'] = 1 if platelet < 30000 else 0
-                case['gusi_berdarah'] = 1 if platelet < 30000 else 0
-                case['nyeri_belakang_mata'] = 1
-                case['pembesaran_hati'] = 1 if hct > 45 else 0
-                case['mual_muntah'] = 1
-                case['nyeri_perut'] = 1
-                case['ruam_kulit'] = 1
-                case['trombosit_rendah'] = 1
-                case['severity'] = 'BERAT' if platelet < 20000 else 'SEDANG'
-            elif platelet < 100000:
-                case['bintik_merah'] = 1
-                case['mimisan'] = 0
-                case['gusi_berdarah'] = 0
-                case['nyeri_belakang_mata'] = 1
-                case['pembesaran_hati'] = 0
-                case['mual_muntah'] = 1 if platelet < 70000 else 0
-                case['nyeri_perut'] = 0
-                case['ruam_kulit'] = 1
-                case['trombosit_rendah'] = 1
-                case['severity'] = 'SEDANG' if platelet < 70000 else 'RINGAN'
-            else:
-                case['bintik_merah'] = 0
-                case['mimisan'] = 0
-                case['gusi_berdarah'] = 0
-                case['nyeri_belakang_mata'] = 1
-                case['pembesaran_hati'] = 0
-                case['mual_muntah'] = 0
-                case['nyeri_perut'] = 0
-                case['ruam_kulit'] = 0
-                case['trombosit_rendah'] = 0
-                case['severity'] = 'RINGAN'
-                
-        else:  # BUKAN DBD
-            case['demam_tinggi'] = 1 if wbc < 5000 else 0
-            case['sakit_kepala'] = 1 if hb < 12 else 0
-            case['nyeri_sendi'] = 1 if wbc < 5000 else 0
-            case['nyeri_otot'] = 1 if wbc < 5000 else 0
-            case['lemah_lesu'] = 1 if hb < 11 else 0
-            case['kehilangan_nafsu_makan'] = 1 if hb < 10 else 0
-            case['bintik_merah'] = 0
-            case['mimisan'] = 0
-            case['gusi_berdarah'] = 0
-            case['nyeri_belakang_mata'] = 0
-            case['pembesaran_hati'] = 0
-            case['mual_muntah'] = 0
-            case['nyeri_perut'] = 0
-            case['ruam_kulit'] = 0
-            case['trombosit_rendah'] = 0
-            case['severity'] = 'NON_DBD'
-        
-        cases.append(case)
-        
-        if (idx + 1) % 100 == 0:
-            print(f"   Processed: {idx + 1}/{len(df)} kasus...")
+    print(f"   - DBD Positif: {(result == 'positive').sum()}")
+    print(f"   - Bukan DBD: {(result == 'negative').sum()}")
+    
+    columns = convert_frame_to_columns(df)
+    
+    print(f"\n✅ Conversion completed!")
+    print(f"📝 Total cases converted: {len(df)}")
+    
+    return columns
+
+def convert_csv_to_embedded_json(csv_path):
+    """Convert CSV dataset ke format JSON yang bisa di-embed"""
+    return columns_to_cases(convert_csv_to_columns(csv_path))
+
+# ============================================================================
+# STREAMING (CSV BESAR)
+# ============================================================================
+STREAM_CHUNK_ROWS = 20000
+
+def stream_csv_to_jsonl(csv_paths, output_file='case_base.jsonl', chunk_size=STREAM_CHUNK_ROWS, root='.'):
+    """
+    Mode streaming: baca CSV per chunk, konversi, lalu append ke JSON Lines.
+    Memori tetap sebesar satu chunk berapa pun ukuran CSV. Beberapa file
+    diproses berurutan dengan case_id per file (lihat file_case_ids).
+    """
+    if isinstance(csv_paths, str):
+        csv_paths = [csv_paths]
+    
+    rows = 0
+    start = time.perf_counter()
+    with open_case_file(output_file, 'wb') as f:
+        for index, csv_path in enumerate(csv_paths):
+            print(f"🔄 Streaming CSV dataset: {csv_path}")
+            file_rows = 0
+            for chunk in pd.read_csv(csv_path, chunksize=chunk_size):
+                columns = convert_frame_to_columns(chunk, start_id=None)
+                columns = {'case_id': file_case_ids(csv_paths, index, file_rows + 1, len(chunk), root), **columns}
+                cases = columns_to_cases(columns)
+                f.write(''.join(json.dumps(case) + '\n' for case in cases).encode('utf-8'))
+                file_rows += len(chunk)
+                rows += len(chunk)
+                rate = rows / max(time.perf_counter() - start, 1e-9)
+                print(f"   Processed: {rows:,} kasus ({rate:,.0f} rows/s)")
+        size = f.tell()
     
     print(f"\n✅ Conversion completed!")
-    print(f"📝 Total cases converted: {len(cases)}")
+    print(f"📝 Total cases converted: {rows}")
+    print(f"💾 Saved to: {output_file}")
+    print_file_size(output_file, size)
+    
+    return rows
+
+# ============================================================================
+# MULTI FILE (PARALEL)
+# ============================================================================
+def resolve_csv_paths(inputs):
+    """File, direktori (semua *.csv) atau glob -> daftar path CSV unik & terurut"""
+    paths = set()
+    for item in inputs:
+        if os.path.isdir(item):
+            paths.update(glob.glob(os.path.join(item, '*.csv')))
+        elif any(ch in item for ch in '*?['):
+            paths.update(glob.glob(item))
+        else:
+            paths.add(item)
+    # 'a.csv' dan './a.csv' adalah file yang sama
+    return sorted({os.path.normpath(path) for path in paths})
+
+def _convert_csv_file(csv_path):
+    """Worker process pool: konversi satu CSV tanpa case_id"""
+    return convert_frame_to_columns(pd.read_csv(csv_path), start_id=None)
+
+def convert_csv_files(csv_paths, workers=None, root='.'):
+    """
+    Konversi banyak CSV secara paralel lalu gabungkan jadi satu dict kolom.
+    Urutan hasil = urutan csv_paths (executor.map), bukan urutan worker
+    selesai. case_id: CSV_0001, ... untuk satu file; untuk banyak file
+    path relatif terhadap root + nomor baris (lihat file_case_ids).
+    """
+    print(f"🔄 Converting {len(csv_paths)} file CSV...")
+    
+    if len(csv_paths) == 1:
+        parts = [_convert_csv_file(csv_paths[0])]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            parts = list(executor.map(_convert_csv_file, csv_paths))
+    
+    for csv_path, part in zip(csv_paths, parts):
+        print(f"   - {csv_path}: {len(part['diagnosis'])} kasus")
+    
+    case_ids = [file_case_ids(csv_paths, i, 1, len(part['diagnosis']), root) for i, part in enumerate(parts)]
+    columns = {key: np.concatenate([part[key] for part in parts]) for key in parts[0]}
+    total = len(columns['diagnosis'])
+    columns = {'case_id': np.concatenate(case_ids), **columns}
+    
+    dbd_count = int((columns['diagnosis'] == 'DBD_POSITIF').sum())
+    print(f"📊 Total data: {total} kasus")
+    print(f"   - DBD Positif: {dbd_count}")
+    print(f"   - Bukan DBD: {total - dbd_count}")
     
-    return cases
+    return columns
 
-def save_to_json(cases, output_file='case_base.json'):
-    """Save cases to JSON file"""
-    with open(output_file, 'w') as f:
-        json.dump(cases, f, indent=2)
+JSON_WRITE_BATCH = 1000
+
+def print_file_size(output_file, size):
+    """Ukuran output dari f.tell() (byte sebelum kompresi untuk .gz / .xz)"""
+    if output_file.endswith(('.gz', '.xz')):
+        print(f"📦 File size: {os.path.getsize(output_file) / 1024:.2f} KB "
+              f"({size / 1024:.2f} KB sebelum kompresi)")
+    else:
+        print(f"📦 File size: {size / 1024:.2f} KB")
+
+def json_record(case, compact=False):
+    """Teks satu record di dalam JSON array: format json.dump(indent=2) atau compact"""
+    if compact:
+        return json.dumps(case, separators=(',', ':'))
+    return '  ' + json.dumps(case, indent=2).replace('\n', '\n  ')
+
+def save_to_json(cases, output_file='case_base.json', compact=False):
+    """
+    Save cases to JSON file secara streaming (per batch record, tanpa
+    membangun seluruh string). Default byte-identik dengan json.dump(indent=2);
+    compact=True tanpa indent/spasi. Output .gz / .xz langsung dikompres.
+    """
+    lead, sep = ('', ',') if compact else ('\n', ',\n')
+    records = iter(cases)
+    first = True
+    
+    with open_case_file(output_file, 'wb') as f:
+        f.write(b'[')
+        while True:
+            batch = [json_record(case, compact) for case in itertools.islice(records, JSON_WRITE_BATCH)]
+            if not batch:
+                break
+            f.write(((lead if first else sep) + sep.join(batch)).encode('utf-8'))
+            first = False
+        f.write(b']' if compact or first else b'\n]')
+        size = f.tell()
+    
     print(f"\n💾 Saved to: {output_file}")
-    print(f"📦 File size: {len(json.dumps(cases)) / 1024:.2f} KB")
+    print_file_size(output_file, size)
+
+EMBEDDED_LINE_WIDTH = 76
+EMBEDDED_LINE_BYTES = EMBEDDED_LINE_WIDTH // 4 * 3  # 57 byte -> 76 karakter base64
+EMBEDDED_WRITE_LINES = 1024
+
+# Decoder ikut ditulis ke modul hasil supaya tetap mandiri (tanpa file eksternal)
+EMBEDDED_DECODER = '''
+def get_case_columns():
+    """Return embedded case base sebagai dict kolom (array bertipe)"""
+    with np.load(io.BytesIO(base64.b64decode(_DATA))) as data:
+        columns = {name: data[name] for name in data.files}
+    columns.pop('json_file', None)
+    columns.pop('json_sha256', None)
+    for col in _LABEL_COLUMNS:
+        codes = columns.pop(f'{col}_codes')
+        columns[col] = columns.pop(f'{col}_labels')[codes]
+    return columns
+
+def get_case_base():
+    """Return embedded case base"""
+    columns = get_case_columns()
+    names = columns.pop('symptom_names').tolist()
+    columns.update(zip(names, columns.pop('symptoms').T))
+    values = [columns[key].tolist() for key in _KEYS]
+    return [dict(zip(_KEYS, row)) for row in zip(*values)]
+'''
 
 def generate_python_code(cases, output_file='case_base_embedded.py'):
-    """Generate Python code with embedded data"""
+    """Generate Python code with embedded data (.npz kolom bertipe, base64)"""
+    write_embedded_module(cases_to_columns(cases), output_file,
+                          keys=list(cases[0].keys()) if cases else [])
+
+def write_embedded_module(columns, output_file='case_base_embedded.py', keys=CASE_KEYS, npz_file=None):
+    """
+    Tulis modul embedded langsung dari dict kolom. npz_file: hasil
+    save_columnar dari kolom yang sama, isinya dipakai ulang tanpa kompres ulang.
+    Kode ditulis bertahap ke file (per blok baris base64), tidak dirangkai di memori.
+    """
     
-    # Split into chunks untuk readability
-    chunk_size = 100
-    chunks = [cases[i:i + chunk_size] for i in range(0, len(cases), chunk_size)]
+    if npz_file is None:
+        # .npz sementara di disk, bukan di memori
+        source = tempfile.TemporaryFile()
+        np.savez_compressed(source, **columnar_arrays(columns))
+        source.seek(0)
+    else:
+        source = open(npz_file, 'rb')
+    
+    header = [
+        "# Auto-generated case base",
+        "# Total cases: {}".format(len(columns['case_id'])),
+        "",
+        "import base64",
+        "import io",
+        "",
+        "import numpy as np",
+        "",
+        "_KEYS = {!r}".format(list(keys)),
+        "_LABEL_COLUMNS = {!r}".format(LABEL_COLUMNS),
+        "",
+        "_DATA = (",
+        "",
+    ]
+    
+    with source, open(output_file, 'wb') as f:
+        f.write("\n".join(header).encode('ascii'))
+        while True:
+            block = source.read(EMBEDDED_LINE_BYTES * EMBEDDED_WRITE_LINES)
+            if not block:
+                break
+            f.write(b''.join(
+                b'    "' + base64.b64encode(block[i:i + EMBEDDED_LINE_BYTES]) + b'"\n'
+                for i in range(0, len(block), EMBEDDED_LINE_BYTES)
+            ))
+        f.write((")\n" + EMBEDDED_DECODER).encode('ascii'))
+        size = f.tell()
+    
+    print(f"\n🐍 Python code saved to: {output_file}")
+    print(f"📦 Code size: {size / 1024:.2f} KB")
+
+# ============================================================================
+# INCREMENTAL (HANYA BARIS BARU)
+# ============================================================================
+WATERMARK_FILE = 'case_base.watermark.json'
+CONVERTER_VERSION = 2
+
+def read_watermark(path=WATERMARK_FILE):
+    """Watermark konversi terakhir, None jika belum ada/rusak"""
+    try:
+        with open(path, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def write_watermark(csv_path, rows, size, sha256, json_file='case_base.json', compact=False,
+                    path=WATERMARK_FILE):
+    """
+    Simpan watermark: jumlah baris + ukuran & hash prefix CSV yang sudah
+    dikonversi, serta path dan format (compact) JSON output-nya.
+    """
+    mark = {
+        'version': CONVERTER_VERSION,
+        'source': os.path.abspath(csv_path),
+        'rows': int(rows),
+        'bytes': int(size),
+        'sha256': sha256,
+        'json_file': os.path.abspath(json_file),
+        'compact': bool(compact),
+        'json_bytes': os.path.getsize(json_file),
+    }
+    with open(path, 'w') as f:
+        json.dump(mark, f, indent=2)
+
+def _read_new_tail(csv_path, mark, size, json_file, compact=False):
+    """
+    (tail, sha256 seluruh file) jika prefix CSV sama dengan watermark,
+    (None, None) jika harus rebuild penuh. Rebuild juga jika JSON output
+    atau formatnya beda dari run terakhir, atau terkompresi (tidak bisa di-append).
+    """
+    if (mark is None or mark.get('version') != CONVERTER_VERSION
+            or mark.get('source') != os.path.abspath(csv_path)
+            or not 0 < mark['bytes'] <= size
+            or mark['json_file'] != os.path.abspath(json_file)
+            or mark['compact'] != bool(compact)
+            or json_file.endswith(('.gz', '.xz'))
+            or not os.path.exists(json_file)
+            or os.path.getsize(json_file) != mark['json_bytes']):
+        return None, None
     
-    code = "# Auto-generated case base\n"
-    code += "# Total cases: {}\n\n".format(len(cases))
-    code += "def get_case_base():\n"
-    code += "    \"\"\"Return embedded case base\"\"\"\n"
-    code += "    cases = [\n"
+    hasher = hashlib.sha256()
+    with open(csv_path, 'rb') as f:
+        remaining = mark['bytes']
+        while remaining > 0:
+            block = f.read(min(1 << 20, remaining))
+            hasher.update(block)
+            remaining -= len(block)
+        if hasher.hexdigest() != mark['sha256']:
+            return None, None
+        f.seek(mark['bytes'] - 1)
+        last = f.read(1)
+        tail = f.read(size - mark['bytes'])
     
-    for case in cases:
-        code += "        " + str(case) + ",\n"
+    # Baris baru harus dimulai di baris baru (bukan sambungan baris terakhir)
+    if last != b'\n' and tail.strip() and tail[:1] not in (b'\n', b'\r'):
+        return None, None
+    hasher.update(tail)
+    return tail, hasher.hexdigest()
+
+def append_to_json(cases, output_file='case_base.json', compact=False):
+    """Tambahkan record ke JSON array (tidak kosong) hasil save_to_json, format sama (indent=2 / compact)"""
+    end, sep = (']', ',') if compact else ('\n]', ',\n')
+    with open(output_file, 'r+b') as f:
+        f.seek(-len(end), os.SEEK_END)
+        if f.read(len(end)) != end.encode('utf-8'):
+            raise ValueError(f"{output_file} bukan JSON array hasil converter")
+        f.seek(-len(end), os.SEEK_END)
+        body = sep.join(json_record(case, compact) for case in cases)
+        f.write((sep + body + end).encode('utf-8'))
+
+def convert_incremental(csv_path, json_file='case_base.json', npz_file='case_base.npz',
+                        py_file='case_base_embedded.py', watermark_file=WATERMARK_FILE, compact=False):
+    """
+    Konversi hanya baris yang baru di-append ke CSV lalu tambahkan ke case
+    base yang ada. Rebuild penuh jika belum ada watermark, prefix CSV
+    berubah (hash beda) atau output tidak cocok dengan watermark.
+    """
+    start = time.perf_counter()
+    size = os.path.getsize(csv_path)
+    mark = read_watermark(watermark_file)
+    tail, sha256 = _read_new_tail(csv_path, mark, size, json_file, compact)
     
-    code += "    ]\n"
-    code += "    return cases\n"
+    old = None
+    if tail is not None and tail.strip():
+        old = load_columnar(npz_file) if os.path.exists(npz_file) else None
+        # JSON array kosong ("[]") tidak bisa di-append dengan format yang sama
+        if old is None or len(old['case_id']) != mark['rows'] or mark['rows'] == 0:
+            tail = None
     
-    with open(output_file, 'w') as f:
-        f.write(code)
+    if tail is None:
+        print("🔁 Full rebuild (watermark tidak ada / prefix CSV atau format output berubah)")
+        sha256 = file_checksum(csv_path)
+        columns = convert_csv_to_columns(csv_path)
+        cases = columns_to_cases(columns)
+        save_to_json(cases, json_file, compact=compact)
+        save_columnar(columns, npz_file, json_file)
+        write_embedded_module(columns, py_file, npz_file=npz_file)
+        rows, new_rows = len(cases), len(cases)
+    elif old is None:
+        print("✅ Tidak ada baris baru, case base sudah up to date")
+        rows, new_rows = mark['rows'], 0
+    else:
+        header = pd.read_csv(csv_path, nrows=0).columns
+        df = pd.read_csv(io.BytesIO(tail), header=None, names=header)
+        new_columns = convert_frame_to_columns(df, start_id=mark['rows'] + 1)
+        print(f"➕ {len(df)} baris baru (setelah baris {mark['rows']})")
+        
+        append_to_json(columns_to_cases(new_columns), json_file, compact=compact)
+        columns = {key: np.concatenate([old[key], new_columns[key]]) for key in old}
+        save_columnar(columns, npz_file, json_file)
+        write_embedded_module(columns, py_file, npz_file=npz_file)
+        rows, new_rows = len(columns['case_id']), len(df)
     
-    print(f"\n🐍 Python code saved to: {output_file}")
-    print(f"📦 Code size: {len(code) / 1024:.2f} KB")
+    write_watermark(csv_path, rows, size, sha256, json_file, compact, watermark_file)
+    print(f"\n⏱️ {new_rows} kasus dikonversi dalam {time.perf_counter() - start:.3f} s "
+          f"(total {rows} kasus)")
+    return new_rows
 
 # ============================================================================
 # MAIN EXECUTION
@@ -155,27 +490,67 @@ if __name__ == "__main__":
     print("DENGUE DATASET CONVERTER - CSV TO EMBEDDED FORMAT")
     print("="*70)
     
-    # Path ke CSV Anda
-    csv_file = "Dengue Fever Hematological Dataset.csv"
+    parser = argparse.ArgumentParser(description="Convert dataset CSV ke case base")
+    parser.add_argument('inputs', nargs='*', default=["Dengue Fever Hematological Dataset.csv"],
+                        help="File CSV, direktori berisi *.csv, atau glob (mis. 'rs_*/*.csv')")
+    parser.add_argument('--input-root', default='.', metavar='DIR',
+                        help="Root untuk prefix case_id banyak file (path relatif, default: folder kerja)")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="Jumlah proses paralel untuk banyak file (default: jumlah CPU)")
+    parser.add_argument('--stream', metavar='OUTPUT.jsonl',
+                        help="Mode streaming per chunk ke JSON Lines (untuk CSV besar)")
+    parser.add_argument('--chunk-size', type=int, default=STREAM_CHUNK_ROWS,
+                        help="Jumlah baris per chunk pada mode --stream")
+    parser.add_argument('--json-output', default='case_base.json', metavar='PATH',
+                        help="Output JSON (.json / .json.gz / .json.xz)")
+    parser.add_argument('--compact', action='store_true',
+                        help="JSON tanpa indent/spasi (lebih kecil)")
+    parser.add_argument('--incremental', action='store_true',
+                        help="Konversi hanya baris baru sejak run terakhir (satu file CSV)")
+    args = parser.parse_args()
+    csv_file = ', '.join(args.inputs)
     
     try:
-        # Convert
-        cases = convert_csv_to_embedded_json(csv_file)
-        
-        # Save ke JSON
-        save_to_json(cases, 'case_base.json')
+        csv_paths = resolve_csv_paths(args.inputs)
+        if not csv_paths:
+            raise FileNotFoundError(csv_file)
         
-        # Generate Python code
-        generate_python_code(cases, 'case_base_embedded.py')
-        
-        print("\n" + "="*70)
-        print("✅ CONVERSION SUCCESSFUL!")
-        print("="*70)
-        print("\nNext steps:")
-        print("1. Open 'case_base_embedded.py'")
-        print("2. Copy fungsi get_case_base()")
-        print("3. Paste ke sistem pakar utama")
-        print("\nOr use 'case_base.json' untuk load dinamis")
+        if args.stream:
+            # Streaming per chunk (memori konstan)
+            stream_csv_to_jsonl(csv_paths, args.stream, args.chunk_size, args.input_root)
+        elif args.incremental:
+            # Hanya baris baru; rebuild penuh jika prefix CSV berubah
+            if len(csv_paths) != 1:
+                parser.error("--incremental hanya untuk satu file CSV")
+            convert_incremental(csv_paths[0], args.json_output, compact=args.compact)
+        else:
+            # Convert (paralel jika lebih dari satu file)
+            columns = convert_csv_files(csv_paths, args.workers, args.input_root)
+            cases = columns_to_cases(columns)
+            
+            # Save ke JSON
+            save_to_json(cases, args.json_output, compact=args.compact)
+            
+            # Save ke columnar .npz (dimuat langsung oleh app)
+            save_columnar(columns, 'case_base.npz', args.json_output)
+            
+            # Generate Python code (isi .npz dipakai ulang)
+            write_embedded_module(columns, 'case_base_embedded.py', npz_file='case_base.npz')
+            
+            # Watermark untuk run --incremental berikutnya
+            if len(csv_paths) == 1:
+                csv_size = os.path.getsize(csv_paths[0])
+                write_watermark(csv_paths[0], len(cases), csv_size, file_checksum(csv_paths[0]),
+                                args.json_output, args.compact)
+            
+            print("\n" + "="*70)
+            print("✅ CONVERSION SUCCESSFUL!")
+            print("="*70)
+            print("\nNext steps:")
+            print("1. Open 'case_base_embedded.py'")
+            print("2. Copy isi file (_DATA + get_case_base())")
+            print("3. Paste ke sistem pakar utama")
+            print("\nOr use 'case_base.json' / 'case_base.npz' untuk load dinamis")
         
     except FileNotFoundError:
         print(f"\n❌ ERROR: File '{csv_file}' tidak ditemukan!")